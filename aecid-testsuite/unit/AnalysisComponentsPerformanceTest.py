@@ -10,7 +10,7 @@ from aminer.analysis.TimestampsUnsortedDetector import TimestampsUnsortedDetecto
 from aminer.analysis import Rules
 from aminer.analysis.AllowlistViolationDetector import AllowlistViolationDetector
 from aminer.analysis.AtomFilters import MatchPathFilter, SubhandlerFilter, MatchValueFilter
-from aminer.analysis.EventTypeDetector import EventTypeDetector
+from aminer.analysis.EventTypeDetector import EventTypeDetector, ValueColumn
 from aminer.analysis.EventFrequencyDetector import EventFrequencyDetector
 from aminer.analysis.EventSequenceDetector import EventSequenceDetector
 from aminer.analysis.HistogramAnalysis import ModuloTimeBinDefinition, HistogramData, HistogramAnalysis
@@ -43,6 +43,8 @@ from time import process_time
 from _io import StringIO
 import timeit
 import pickle  # skipcq: BAN-B403
+import sys
+import numpy as np
 
 
 class AnalysisComponentsPerformanceTest(TestBase):
@@ -1000,6 +1002,91 @@ class AnalysisComponentsPerformanceTest(TestBase):
         type(self).result = self.result + self.result_string % (
             event_type_detector.__class__.__name__, avg, results, '%s different path(es).' % (str(number_of_paths)))
 
+    def run_event_type_detector_values(self, number_of_event_types, number_of_variables, number_of_values, numeric):
+        """
+        Run the performance tests for the storage of the values in the EventTypeDetector comparing lists with ValueColumns.
+        The memory is the size of the lists or arrays and the distinct stored value objects.
+        """
+        min_num_vals = number_of_values * 2 // 3
+        max_num_vals = number_of_values - 1
+        # The values are converted for every parsed value, so new value objects are created like in the EventTypeDetector.
+        if numeric:
+            lines = [[str(random.randint(0, 1000)) for _ in range(number_of_variables)] for _ in range(number_of_values)]
+        else:
+            lines = [["value%d" % random.randint(0, 20) for _ in range(number_of_variables)] for _ in range(number_of_values)]
+
+        def store_lists():
+            stored_values = []
+            for _ in range(number_of_event_types):
+                event_values = [[] for _ in range(number_of_variables)]
+                for line in lines:
+                    for var_index, value in enumerate(line):
+                        column = event_values[var_index]
+                        column.append(float(value) if numeric else value[:5] + value[5:])
+                        if len(column) > max_num_vals:
+                            event_values[var_index] = column[-min_num_vals:]
+                stored_values.append(event_values)
+            return stored_values
+
+        def store_value_columns():
+            # The values are stored like in EventTypeDetector.append_values.
+            stored_values = []
+            for _ in range(number_of_event_types):
+                event_values = [ValueColumn(min_num_vals, max_num_vals) if numeric else [] for _ in range(number_of_variables)]
+                for line_index, line in enumerate(lines):
+                    for var_index, value in enumerate(line):
+                        column = event_values[var_index]
+                        if numeric:
+                            column.pending.append(float(value))
+                            continue
+                        column.append(sys.intern(value[:5] + value[5:]))
+                        if len(column) > max_num_vals:
+                            event_values[var_index] = column[-min_num_vals:]
+                    if numeric and line_index % ValueColumn.block_size == ValueColumn.block_size - 1:
+                        for column in event_values:
+                            column.flush()
+                stored_values.append(event_values)
+            return stored_values
+
+        def get_size(stored_values):
+            size = 0
+            value_ids = set()
+            for event_values in stored_values:
+                for column in event_values:
+                    if isinstance(column, ValueColumn):
+                        size += sys.getsizeof(column) + sys.getsizeof(column.data)
+                        column = column.pending
+                    size += sys.getsizeof(column)
+                    if isinstance(column, list):
+                        for value in column:
+                            if id(value) not in value_ids:
+                                value_ids.add(id(value))
+                                size += sys.getsizeof(value)
+            return size
+
+        for name, store, read in (
+                ("lists", store_lists, lambda column: np.array(column[-min_num_vals:])),
+                ("ValueColumns", store_value_columns, lambda column: np.asarray(column)[-min_num_vals:] if numeric else np.array(
+                    column[-min_num_vals:]))):
+            t = time.time()
+            stored_values = store()
+            store_time = time.time() - t
+            # The first reading moves the pending values of the ValueColumns to their buffers.
+            read_times = []
+            for _ in range(2):
+                t = time.time()
+                for event_values in stored_values:
+                    for column in event_values:
+                        read(column)
+                read_times.append(time.time() - t)
+            type(self).result = self.result + "Storing %d values of %d %s variables of %d event types in %s needed %.2f seconds and " \
+                "%.1f MB. Reading the last %d values of all variables as arrays needed %.2f seconds the first time and %.2f seconds " \
+                "the second time.\n" % (
+                    number_of_values, number_of_variables, "numeric" if numeric else "discrete", number_of_event_types, name, store_time,
+                    get_size(stored_values) / 1024 ** 2, min_num_vals, read_times[0], read_times[1])
+            # The stored values are released before the next run, so it does not run with a bigger heap.
+            del stored_values
+
     def run_variable_type_detector(self, number_of_paths):
         """Run the performance tests for VariableTypeDetector."""
         with open('unit/data/vtd_data/uni_data_test6', 'rb') as f:
@@ -1368,6 +1455,11 @@ class AnalysisComponentsPerformanceTest(TestBase):
         self.run_event_type_detector(10)
         self.run_event_type_detector(100)
 
+    def test19event_type_detector_values(self):
+        """Start performance tests for the storage of the values in the EventTypeDetector with 10000 event types and 20 variables."""
+        self.run_event_type_detector_values(10000, 20, 100, True)
+        self.run_event_type_detector_values(10000, 20, 100, False)
+
     def test20variable_type_detector(self):
         """Start performance tests for VariableTypeDetector."""
         self.run_variable_type_detector(None)
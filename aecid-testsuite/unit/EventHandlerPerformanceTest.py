@@ -0,0 +1,99 @@
+import unittest
+import os
+import time
+import timeit
+from _io import StringIO
+from aminer.events.AsyncEventDispatcher import AsyncEventDispatcher
+from aminer.events.ScoringEventHandler import ScoringEventHandler
+from aminer.events.StreamPrinterEventHandler import StreamPrinterEventHandler
+from aminer.input.LogAtom import LogAtom
+from aminer.parsing.FixedDataModelElement import FixedDataModelElement
+from aminer.parsing.MatchContext import MatchContext
+from aminer.parsing.ParserMatch import ParserMatch
+from unit.TestBase import TestBase, ScoringEventSource
+
+
+class SlowStream(StringIO):
+    """Stream simulating a slow output target, which needs flush_time seconds for every flush."""
+
+    flush_time = 0.001
+
+    def flush(self):
+        """Wait for flush_time seconds."""
+        time.sleep(self.flush_time)
+
+
+class NullEventHandler:
+    """Event handler ignoring all events."""
+
+    def receive_event(self, _event_type, _event_message, _sorted_loglines, _event_data, _log_atom, _event_source):
+        """Ignore the event."""
+
+
+class EventHandlerPerformanceTest(TestBase):
+    """These unittests test the performance of the event output with a slow output target."""
+
+    result_string = 'The %s could in average handle %d events per second %s with %s\n'
+    result = ''
+    iterations = 2
+    number_of_events = 2000
+
+    @classmethod
+    def tearDownClass(cls):
+        """Run the TestBase tearDownClass method and print the results."""
+        super(EventHandlerPerformanceTest, cls).tearDownClass()
+        print(cls.result)
+
+    def get_config_file_path(self):
+        """Use the config file of the event handler unittests."""
+        return os.path.join(os.getcwd(), 'unit/data/parallel_configs/events_config.py')
+
+    def run_event_handler(self, event_handler, description, finish=None):
+        """Run the performance tests for the event_handler measuring the time until receive_event returned for all events."""
+        fixed_dme = FixedDataModelElement('s1', b' pid=')
+        log_atom = LogAtom(fixed_dme.fixed_data, ParserMatch(fixed_dme.get_match_element("match", MatchContext(b' pid='))), 1, self)
+
+        def receive_events():
+            for i in range(self.number_of_events):
+                event_handler.receive_event("Analysis.TestDetector", "event %d" % i, [" pid="], {}, log_atom, self)
+        results = [None] * self.iterations
+        for z in range(self.iterations):
+            results[z] = int(self.number_of_events / timeit.timeit(receive_events, number=1))
+            if finish is not None:
+                finish()
+        type(self).result = self.result + self.result_string % (
+            event_handler.__class__.__name__, int(sum(results) / self.iterations), results, description)
+
+    def test1slow_stream(self):
+        """Start performance tests comparing the synchronous StreamPrinterEventHandler with the AsyncEventDispatcher for a slow stream."""
+        description = 'a stream needing %d ms for every flush' % (SlowStream.flush_time * 1000)
+        self.run_event_handler(StreamPrinterEventHandler(self.analysis_context, SlowStream()), description + '.')
+        for block_when_full in (False, True):
+            stream = SlowStream()
+            dispatcher = AsyncEventDispatcher([StreamPrinterEventHandler(self.analysis_context, stream, auto_flush=False)],
+                                              self.analysis_context, queue_size=self.number_of_events, block_when_full=block_when_full)
+            self.run_event_handler(dispatcher, description + ' and block_when_full=%s.' % block_when_full, dispatcher.stop)
+            self.assertEqual(dispatcher.queued_events + dispatcher.dropped_events, self.number_of_events * self.iterations)
+            self.assertEqual(dispatcher.flushed_events, dispatcher.queued_events)
+            self.assertEqual(stream.getvalue().count('event 0\n'), dispatcher.flushed_events // self.number_of_events)
+
+    def test2scoring_event_handler(self):
+        """Start performance tests of the ScoringEventHandler with automatically calculated weights for different history lengths."""
+        event_source = ScoringEventSource()
+        id_values = [["user%d" % (i % 50), "host%d" % (i % 7), "10.0.0.%d" % (i % 200)] for i in range(self.number_of_events)]
+        for history_length in (10, 1000, 10000):
+            scoring_event_handler = ScoringEventHandler([NullEventHandler()], self.analysis_context, auto_weights=True,
+                                                        auto_weights_history_length=history_length)
+
+            def receive_events():
+                for values in id_values:
+                    scoring_event_handler.receive_event("Analysis.TestDetector", "event", [""], {"FrequencyData": {"IdValues": values}},
+                                                        None, event_source)
+            results = [int(self.number_of_events / timeit.timeit(receive_events, number=1)) for _ in range(self.iterations)]
+            type(self).result = self.result + self.result_string % (
+                scoring_event_handler.__class__.__name__, int(sum(results) / self.iterations), results,
+                "auto_weights_history_length=%d." % history_length)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,180 @@
+import unittest
+import timeit
+import importlib.util
+import os
+import tracemalloc
+from unittest.mock import patch
+from aminer.parsing.CompiledModelElement import CompiledModelElement
+from aminer.parsing.DateTimeModelElement import DateTimeModelElement
+from aminer.parsing.DecimalIntegerValueModelElement import DecimalIntegerValueModelElement
+from aminer.parsing.DelimitedDataModelElement import DelimitedDataModelElement
+from aminer.parsing.FirstMatchModelElement import FirstMatchModelElement
+from aminer.parsing.FixedDataModelElement import FixedDataModelElement
+from aminer.parsing.FixedWordlistDataModelElement import FixedWordlistDataModelElement
+from aminer.parsing.JsonModelElement import JsonModelElement
+from aminer.parsing.MatchContext import MatchContext
+from aminer.parsing.OptionalMatchModelElement import OptionalMatchModelElement
+from aminer.parsing.ParserMatch import ParserMatch
+from aminer.parsing.SequenceModelElement import SequenceModelElement
+from aminer.parsing.VariableByteDataModelElement import VariableByteDataModelElement
+
+
+class ParsingModelPerformanceTest(unittest.TestCase):
+    """These unittests test the performance of parsing models."""
+
+    result_string = 'The %s could in average parse %d log lines per second %s with %s\n'
+    result = ''
+    iterations = 2
+    number_of_lines = 10000
+    conf_available_path = "/etc/aminer/conf-available/generic"
+
+    @classmethod
+    def tearDownClass(cls):
+        """Print the results."""
+        print(cls.result)
+
+    @staticmethod
+    def get_branch_model(number_of_branches):
+        """Get a FirstMatchModelElement with number_of_branches syslog like branches, where every branch starts with another byte."""
+        branches = []
+        for i in range(number_of_branches):
+            branches.append(SequenceModelElement("branch%d" % i, [
+                FixedDataModelElement("program", bytes([0x21 + i]) + b"program["),
+                DecimalIntegerValueModelElement("pid"),
+                FixedDataModelElement("s0", b"]: user="),
+                DelimitedDataModelElement("user", b" "),
+                FixedDataModelElement("s1", b" status="),
+                DecimalIntegerValueModelElement("status"),
+                OptionalMatchModelElement("opt", SequenceModelElement("msg", [
+                    FixedDataModelElement("s0", b" msg="), DelimitedDataModelElement("msg", b";", consume_delimiter=True)]))]))
+        return FirstMatchModelElement("model", branches)
+
+    def run_parsing_model(self, parsing_model, lines, description):
+        """Run the performance tests for a parsing model with the given lines."""
+        def parse():
+            for line in lines:
+                parsing_model.get_match_element("", MatchContext(line))
+        results = [None] * self.iterations
+        avg = 0
+        z = 0
+        while z < self.iterations:
+            results[z] = int(len(lines) / timeit.timeit(parse, number=1))
+            avg = avg + results[z]
+            z = z + 1
+        avg = int(avg / self.iterations)
+        type(self).result = self.result + self.result_string % (parsing_model.__class__.__name__, avg, results, description)
+
+    def test01compiled_model_element(self):
+        """Start performance tests comparing the interpreted model and the CompiledModelElement."""
+        for number_of_branches in (1, 10, 100):
+            model = self.get_branch_model(number_of_branches)
+            # the last branches are the worst case for the interpreted FirstMatchModelElement.
+            lines = [bytes([0x21 + max(number_of_branches - 1 - i % 2, 0)]) + b"program[%d]: user=user%d status=%d msg=some message;" % (
+                i, i, i % 100) for i in range(self.number_of_lines)]
+            description = '%d branches in the FirstMatchModelElement.' % number_of_branches
+            self.run_parsing_model(model, lines, description)
+            self.run_parsing_model(CompiledModelElement(model), lines, description)
+
+    def test02fixed_wordlist_data_model_element(self):
+        """Start performance tests for the FixedWordlistDataModelElement."""
+        for number_of_words in (10, 100, 1000):
+            wordlist = [b"word%04d" % i for i in range(number_of_words)]
+            # the last words are the worst case for searching the wordlist in order.
+            lines = [wordlist[-1 - i % 2] + b" rest of the line" for i in range(self.number_of_lines)]
+            self.run_parsing_model(FixedWordlistDataModelElement("wordlist", wordlist), lines, '%d words.' % number_of_words)
+
+    def load_conf_available_model(self, name):
+        """Load the parsing model from the conf-available module with the given name."""
+        spec = importlib.util.spec_from_file_location(name, os.path.join(self.conf_available_path, name + ".py"))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.get_model()
+
+    def test03parser_match_lookup(self):
+        """Start performance tests comparing single path lookups with building the whole match dictionary of the ParserMatch."""
+        samples = {
+            "ApacheAccessModel": (b'83.149.9.216 - - [17/May/2015:10:05:03 +0000] "GET /presentations/logstash-monitorama-2013/images/'
+                                  b'kibana-search.png HTTP/1.1" 200 203023 "http://semicomplete.com/presentations/logstash-monitorama-2013/" '
+                                  b'"Mozilla/5.0 (Macintosh; Intel Mac OS X 10_9_1) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/32.0.1700.77 '
+                                  b'Safari/537.36"', ["/accesslog/status", "/accesslog/fm/request/request"]),
+            "AudispdParsingModel": (b"audispd: type=ADD_USER msg=audit(1525173583.670:2105): pid=45406 uid=0 auid=0 ses=160 subj=unconfined_u:"
+                                    b"unconfined_r:unconfined_t:s0-s0:c0.c1023 msg='op=adding user id=1003 exe=\"/usr/sbin/useradd\" hostname=? "
+                                    b"addr=? terminal=pts/1 res=success'", ["/audispd/msg/record/adduser/uid", "/audispd/msg/record/preamble/s0/1"]),
+            "SshdParsingModel": (b"sshd[35619]: Accepted password for someuser from 1.1.1.1 port 1372 ssh2", ["/sshd/pid", "/sshd/msg/failed/accept/user"])}
+        for name, (line, paths) in samples.items():
+            match_element = self.load_conf_available_model(name).get_match_element("", MatchContext(line))
+            self.assertIsNotNone(match_element)
+            for path in paths:
+                self.assertIsNotNone(ParserMatch(match_element).get(path), path)
+
+            def get_match_dictionary():
+                for _ in range(self.number_of_lines):
+                    match_dictionary = ParserMatch(match_element).get_match_dictionary()
+                    for path in paths:
+                        match_dictionary.get(path)
+
+            def get_paths():
+                for _ in range(self.number_of_lines):
+                    parser_match = ParserMatch(match_element)
+                    for path in paths:
+                        parser_match.get(path)
+            for function, description in ((get_match_dictionary, "get_match_dictionary()"), (get_paths, "get()")):
+                results = [int(self.number_of_lines / timeit.timeit(function, number=1)) for _ in range(self.iterations)]
+                type(self).result = self.result + self.result_string % (
+                    "ParserMatch", int(sum(results) / self.iterations), results, "%s for %d paths of the %s." % (description, len(paths), name))
+
+    def test04match_element_memory(self):
+        """Report the memory used by the MatchElements of an audit log atom."""
+        model = self.load_conf_available_model("AudispdParsingModel")
+        line = b'audispd: type=EXECVE msg=audit(1582934957.620:917519): argc=10 a0="find" a1="/usr/lib/php" a2="-mindepth" a3="1" ' \
+               b'a4="-maxdepth" a5="1" a6="-regex" a7=".*[0-9]\\.[0-9]" a8="-printf" a9="%f\\n"'
+        self.assertIsNotNone(model.get_match_element("", MatchContext(line)))
+        number_of_atoms = 1000
+        tracemalloc.start()
+        match_elements = [model.get_match_element("", MatchContext(line)) for _ in range(number_of_atoms)]
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        self.assertEqual(len(match_elements), number_of_atoms)
+        type(self).result = self.result + "The MatchElements of the AudispdParsingModel used %d bytes per log atom.\n" % (
+            memory / number_of_atoms)
+
+    def test05date_time_model_element(self):
+        """Start performance tests comparing the DateTimeModelElement with and without the cache of the prefix before the seconds."""
+        lines = [b"Mar  1 %02d:%02d:%02d host sshd[1001]: session opened" % (i // 3600 % 24, i // 60 % 60, i % 60) for i in range(
+            self.number_of_lines)]
+        for use_cache in (False, True):
+            model = DateTimeModelElement("time", b"%b %d %H:%M:%S", start_year=2021)
+            if not use_cache:
+                model.prefix_part_count = 0
+            self.run_parsing_model(model, lines, "syslog timestamps %s the prefix cache." % ("with" if use_cache else "without"))
+
+    def test06json_model_element(self):
+        """Start performance tests for the JsonModelElement with short and long values and check that the remaining data is not copied."""
+        key_parser_dict = {"menu": {"id": FixedDataModelElement("id", b"file"), "popup": {"menuitem": [{
+            "value": FirstMatchModelElement("value", [FixedDataModelElement("new", b"New"), FixedDataModelElement("open", b"Open")]),
+            "onclick": FirstMatchModelElement("onclick", [
+                FixedDataModelElement("new", b"CreateNewDoc()"), FixedDataModelElement("open", b"OpenDoc()")])}]}},
+            "count": DecimalIntegerValueModelElement("count"), "msg": VariableByteDataModelElement("msg", b"x")}
+        model = JsonModelElement("json", key_parser_dict)
+        for msg_length in (10, 1000):
+            lines = [b'{"menu": {"id": "file", "popup": {"menuitem": [{"value": "New", "onclick": "CreateNewDoc()"}, {"value": "Open", '
+                     b'"onclick": "OpenDoc()"}]}}, "count": %d, "msg": "%s"}' % (i, b"x" * msg_length) for i in range(
+                        self.number_of_lines // 10)]
+            # every access of MatchContext.match_data copies the remaining data. It must be read once for the preprocessing and once for
+            # the final update, but not for every search in the JSON data.
+            copy_count = 0
+
+            def get_match_data(match_context):
+                nonlocal copy_count
+                copy_count += 1
+                return match_context.data[match_context.offset:]
+            match_context = MatchContext(lines[0])
+            with patch.object(MatchContext, "match_data", property(get_match_data, MatchContext.match_data.fset)):
+                self.assertIsNotNone(model.get_match_element("", match_context))
+            self.assertEqual(match_context.offset, len(lines[0]))
+            self.assertLessEqual(copy_count, 2)
+            self.run_parsing_model(model, lines, "%d bytes long msg values." % msg_length)
+
+
+if __name__ == '__main__':
+    unittest.main()
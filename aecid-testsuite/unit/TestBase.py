@@ -5,13 +5,16 @@ import logging
 import sys
 import errno
 import inspect
+import threading
 from aminer.AminerConfig import KEY_LOG_DIR, DEFAULT_LOG_DIR, KEY_PERSISTENCE_DIR, DEFAULT_PERSISTENCE_DIR, DEBUG_LOG_NAME,\
     KEY_REMOTE_CONTROL_LOG_FILE, KEY_STAT_LOG_FILE, KEY_DEBUG_LOG_FILE, REMOTE_CONTROL_LOG_NAME, DEFAULT_REMOTE_CONTROL_LOG_FILE,\
     STAT_LOG_NAME, DEFAULT_STAT_LOG_FILE, DEBUG_LEVEL, load_config, build_persistence_file_name, DEFAULT_DEBUG_LOG_FILE
 from aminer.AnalysisChild import AnalysisContext
+from aminer.events.EventInterfaces import EventHandlerInterface, EventSourceInterface
 from aminer.events.StreamPrinterEventHandler import StreamPrinterEventHandler
 from aminer.parsing.ModelElementInterface import ModelElementInterface
 from aminer.parsing.MatchElement import MatchElement
+from aminer.parsing.MatchContext import MatchContext
 from aminer.util import PersistenceUtil
 from aminer.util import SecureOSFunctions
 from _io import StringIO
@@ -172,17 +175,17 @@ class TestBase(unittest.TestCase):
         self.assertEqual(match_context.match_data, data)
 
 
-class DummyMatchContext:
+class DummyMatchContext(MatchContext):
     """Dummy class for MatchContext."""
 
     def __init__(self, match_data: bytes):
         """Initiate the Dummy class."""
-        self.match_data = match_data
+        super().__init__(match_data)
         self.match_string = b''
 
     def update(self, match_string: bytes):
         """Update the data."""
-        self.match_data = self.match_data[len(match_string):]
+        super().update(match_string)
         self.match_string += match_string
 
 
@@ -272,6 +275,50 @@ class DummySequenceModelElement(ModelElementInterface):
                             start_data[:len(start_data) - len(match_context.match_data)], matches)
 
 
+class RecordingEventHandler(EventHandlerInterface):
+    """Event handler storing the messages and the event data of all received events and counting the flush calls."""
+
+    def __init__(self, blocking=False):
+        """
+        Initiate the handler.
+        @param blocking if True, received events are only stored after the released event was set.
+        """
+        self.messages = []
+        self.event_data = []
+        self.flush_count = 0
+        self.started = threading.Event()
+        self.released = threading.Event()
+        if not blocking:
+            self.released.set()
+
+    def receive_event(self, _event_type, event_message, _sorted_loglines, event_data, _log_atom, _event_source):
+        """Store the message and the event data after the handler was released."""
+        self.started.set()
+        self.released.wait()
+        self.messages.append(event_message)
+        self.event_data.append(event_data)
+
+    def flush(self):
+        """Count the flush calls."""
+        self.flush_count += 1
+
+
+class ScoringEventSource(EventSourceInterface):
+    """Event source with the analyzed values in event_data["FrequencyData"]["IdValues"]."""
+
+    def allowlist_event(self, event_type, event_data, allowlisting_data):
+        """Allowlisting is not supported."""
+        raise NotImplementedError
+
+    def get_weight_analysis_field_path(self):
+        """Return the path to the analyzed values."""
+        return ["FrequencyData", "IdValues"]
+
+    def get_weight_output_field_path(self):
+        """Return the path of the scoring in the output."""
+        return ["FrequencyData", "Scoring"]
+
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 import time
+import numpy as np
 from datetime import datetime
 from aminer.analysis.EntropyDetector import EntropyDetector
 from aminer.input.LogAtom import LogAtom
@@ -48,8 +49,7 @@ class EntropyDetectorTest(TestBase):
         self.assertEqual(self.output_stream.getvalue(), expected_string % (datetime.fromtimestamp(t + 1).strftime(dtf), ed.__class__.__name__, 1, "aminer"))
         self.reset_output_stream()
         self.add_data(log_atom1.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         # Second value should not generate an anomaly, because it contains substring "miner" which shares charpairs with "aminer"
         # Input: logdata-anomaly-miner
@@ -57,8 +57,7 @@ class EntropyDetectorTest(TestBase):
         ed.receive_atom(log_atom2)
         self.assertEqual(self.output_stream.getvalue(), "")
         self.add_data(log_atom2.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         # Third value should not generate an anomaly, since it is a normal string
         # Input: ait-aecid
@@ -66,8 +65,7 @@ class EntropyDetectorTest(TestBase):
         ed.receive_atom(log_atom3)
         self.assertEqual(self.output_stream.getvalue(), "")
         self.add_data(log_atom3.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         # Fourth value should not generate an anomaly, since it is a normal string
         # Input: austrian
@@ -75,8 +73,7 @@ class EntropyDetectorTest(TestBase):
         ed.receive_atom(log_atom4)
         self.assertEqual(self.output_stream.getvalue(), "")
         self.add_data(log_atom4.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         # Fifth value should not generate an anomaly, since it is a normal string
         # Input: institute
@@ -84,8 +81,7 @@ class EntropyDetectorTest(TestBase):
         ed.receive_atom(log_atom5)
         self.assertEqual(self.output_stream.getvalue(), "")
         self.add_data(log_atom5.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         # Sixth value should generate an anomaly, since it is a randomly generated string
         # Input: lfmvasacz
@@ -94,15 +90,13 @@ class EntropyDetectorTest(TestBase):
         self.assertEqual(self.output_stream.getvalue(), expected_string % (datetime.fromtimestamp(t + 6).strftime(dtf), ed.__class__.__name__, 1, "lfmvasacz"))
         self.reset_output_stream()
         self.add_data(log_atom6.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         # frequencies should change if skip_repetitions = False
         ed.receive_atom(log_atom6)
         self.assertEqual(self.output_stream.getvalue(), "")
         self.add_data(log_atom6.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         # prob_thresh 10%
         ed = EntropyDetector(self.aminer_config, [self.stream_printer_event_handler], ["/value"], prob_thresh=0.1, learn_mode=True, output_logline=False)
@@ -112,40 +106,34 @@ class EntropyDetectorTest(TestBase):
         self.assertEqual(self.output_stream.getvalue(), expected_string % (datetime.fromtimestamp(t + 1).strftime(dtf), ed.__class__.__name__, 1, "aminer"))
         self.reset_output_stream()
         self.add_data(log_atom1.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         ed.receive_atom(log_atom2)
         self.assertEqual(self.output_stream.getvalue(), "")
         self.add_data(log_atom2.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         ed.receive_atom(log_atom3)
         self.assertEqual(self.output_stream.getvalue(), "")
         self.add_data(log_atom3.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         ed.receive_atom(log_atom4)
         self.assertEqual(self.output_stream.getvalue(), expected_string % (datetime.fromtimestamp(t + 4).strftime(dtf), ed.__class__.__name__, 1, "austrian"))
         self.reset_output_stream()
         self.add_data(log_atom4.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         ed.receive_atom(log_atom5)
         self.assertEqual(self.output_stream.getvalue(), "")
         self.add_data(log_atom5.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         ed.receive_atom(log_atom6)
         self.assertEqual(self.output_stream.getvalue(), expected_string % (datetime.fromtimestamp(t + 6).strftime(dtf), ed.__class__.__name__, 1, "lfmvasacz"))
         self.reset_output_stream()
         self.add_data(log_atom6.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         # prob_thresh 50%
         ed = EntropyDetector(self.aminer_config, [self.stream_printer_event_handler], ["/value"], prob_thresh=0.5, learn_mode=True, output_logline=False)
@@ -155,43 +143,37 @@ class EntropyDetectorTest(TestBase):
         self.assertEqual(self.output_stream.getvalue(), expected_string % (datetime.fromtimestamp(t + 1).strftime(dtf), ed.__class__.__name__, 1, "aminer"))
         self.reset_output_stream()
         self.add_data(log_atom1.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         ed.receive_atom(log_atom2)
         self.assertEqual(self.output_stream.getvalue(), expected_string % (datetime.fromtimestamp(t + 2).strftime(dtf), ed.__class__.__name__, 1, "logdata-anomaly-miner"))
         self.reset_output_stream()
         self.add_data(log_atom2.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         ed.receive_atom(log_atom3)
         self.assertEqual(self.output_stream.getvalue(), expected_string % (datetime.fromtimestamp(t + 3).strftime(dtf), ed.__class__.__name__, 1, "ait-aecid"))
         self.reset_output_stream()
         self.add_data(log_atom3.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         ed.receive_atom(log_atom4)
         self.assertEqual(self.output_stream.getvalue(), expected_string % (datetime.fromtimestamp(t + 4).strftime(dtf), ed.__class__.__name__, 1, "austrian"))
         self.reset_output_stream()
         self.add_data(log_atom4.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         ed.receive_atom(log_atom5)
         self.assertEqual(self.output_stream.getvalue(), expected_string % (datetime.fromtimestamp(t + 5).strftime(dtf), ed.__class__.__name__, 1, "institute"))
         self.reset_output_stream()
         self.add_data(log_atom5.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         ed.receive_atom(log_atom6)
         self.assertEqual(self.output_stream.getvalue(), expected_string % (datetime.fromtimestamp(t + 6).strftime(dtf), ed.__class__.__name__, 1, "lfmvasacz"))
         self.reset_output_stream()
         self.add_data(log_atom6.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         # default_freqs = True
         ed = EntropyDetector(self.aminer_config, [self.stream_printer_event_handler], ["/value"], default_freqs=True, learn_mode=True, output_logline=False)
@@ -211,39 +193,33 @@ class EntropyDetectorTest(TestBase):
         ed.receive_atom(log_atom1)
         self.assertEqual(self.output_stream.getvalue(), "")
         self.add_data(log_atom1.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         ed.receive_atom(log_atom2)
         self.assertEqual(self.output_stream.getvalue(), "")
         self.add_data(log_atom2.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         ed.receive_atom(log_atom3)
         self.assertEqual(self.output_stream.getvalue(), "")
         self.add_data(log_atom3.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         ed.receive_atom(log_atom4)
         self.assertEqual(self.output_stream.getvalue(), "")
         self.add_data(log_atom4.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         ed.receive_atom(log_atom5)
         self.assertEqual(self.output_stream.getvalue(), "")
         self.add_data(log_atom5.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         ed.receive_atom(log_atom6)
         self.assertEqual(self.output_stream.getvalue(), expected_string % (datetime.fromtimestamp(t + 6).strftime(dtf), ed.__class__.__name__, 1, "lfmvasacz"))
         self.reset_output_stream()
         self.add_data(log_atom6.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         # skip_repetitions = True
         ed = EntropyDetector(self.aminer_config, [self.stream_printer_event_handler], ["/value"], skip_repetitions=True, learn_mode=True, output_logline=False)
@@ -253,45 +229,38 @@ class EntropyDetectorTest(TestBase):
         self.assertEqual(self.output_stream.getvalue(), expected_string % (datetime.fromtimestamp(t + 1).strftime(dtf), ed.__class__.__name__, 1, "aminer"))
         self.reset_output_stream()
         self.add_data(log_atom1.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         ed.receive_atom(log_atom2)
         self.assertEqual(self.output_stream.getvalue(), "")
         self.add_data(log_atom2.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         ed.receive_atom(log_atom3)
         self.assertEqual(self.output_stream.getvalue(), "")
         self.add_data(log_atom3.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         ed.receive_atom(log_atom4)
         self.assertEqual(self.output_stream.getvalue(), "")
         self.add_data(log_atom4.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         ed.receive_atom(log_atom5)
         self.assertEqual(self.output_stream.getvalue(), "")
         self.add_data(log_atom5.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         ed.receive_atom(log_atom6)
         self.assertEqual(self.output_stream.getvalue(), expected_string % (datetime.fromtimestamp(t + 6).strftime(dtf), ed.__class__.__name__, 1, "lfmvasacz"))
         self.reset_output_stream()
         self.add_data(log_atom6.raw_data.decode(), freq, total_freq)
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         # frequencies should not change if skip_repetitions = True
         ed.receive_atom(log_atom6)
         self.assertEqual(self.output_stream.getvalue(), "")
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         # stop_learning_time
         ed = EntropyDetector(self.aminer_config, [self.stream_printer_event_handler], ["/value"], learn_mode=True, output_logline=False, stop_learning_time=100)
@@ -393,19 +362,23 @@ class EntropyDetectorTest(TestBase):
         self.add_data(log_atom6.raw_data.decode(), freq, total_freq)
         ed.do_persist()
         with open(ed.persistence_file_name, "r") as f:
-            self.assertEqual(f.read(), '[[-1, [[97, 3], [108, 2], [105, 1]]], [97, [[109, 1], [116, 1], [45, 1], [110, 2], [108, 1], [105, 1], [101, 1], [117, 1], [115, 1], [99, 1]]], [109, [[105, 2], [97, 1], [118, 1]]], [105, [[110, 3], [116, 2], [100, 1], [97, 1]]], [110, [[101, 2], [111, 1], [-1, 1], [115, 1]]], [101, [[114, 2], [99, 1], [-1, 1]]], [114, [[-1, 2], [105, 1]]], [108, [[111, 1], [121, 1], [102, 1]]], [111, [[103, 1], [109, 1]]], [103, [[100, 1]]], [100, [[97, 1], [-1, 1]]], [116, [[97, 1], [45, 1], [114, 1], [105, 1], [117, 1], [101, 1]]], [45, [[97, 2], [109, 1]]], [121, [[45, 1]]], [99, [[105, 1], [122, 1]]], [117, [[115, 1], [116, 1]]], [115, [[116, 2], [97, 1]]], [102, [[109, 1]]], [118, [[97, 1]]], [122, [[-1, 1]]]]')
+            self.assertEqual(f.read(), '[[45, 97, 2], [45, 109, 1], [97, 45, 1], [97, 99, 1], [97, 101, 1], [97, 105, 1], [97, 108, 1], [97, 109, 1], [97, 110, 2], [97, 115, 1], [97, 116, 1], [97, 117, 1], [99, 105, 1], [99, 122, 1], [100, 97, 1], [100, -1, 1], [101, 99, 1], [101, 114, 2], [101, -1, 1], [102, 109, 1], [103, 100, 1], [105, 97, 1], [105, 100, 1], [105, 110, 3], [105, 116, 2], [108, 102, 1], [108, 111, 1], [108, 121, 1], [109, 97, 1], [109, 105, 2], [109, 118, 1], [110, 101, 2], [110, 111, 1], [110, 115, 1], [110, -1, 1], [111, 103, 1], [111, 109, 1], [114, 105, 1], [114, -1, 2], [115, 97, 1], [115, 116, 2], [116, 45, 1], [116, 97, 1], [116, 101, 1], [116, 105, 1], [116, 114, 1], [116, 117, 1], [117, 115, 1], [117, 116, 1], [118, 97, 1], [121, 45, 1], [122, -1, 1], [-1, 97, 3], [-1, 105, 1], [-1, 108, 2]]')
 
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
-        ed.total_freq = {}
-        ed.freq = {}
+        self.assert_frequencies(ed, freq, total_freq)
+        ed.total_freq[:] = 0
+        ed.freq[:] = 0
         ed.load_persistence_data()
-        self.assertEqual(ed.total_freq, total_freq)
-        self.assertEqual(ed.freq, freq)
+        self.assert_frequencies(ed, freq, total_freq)
 
         other = EntropyDetector(self.aminer_config, [self.stream_printer_event_handler], ["/value"], prob_thresh=0.05, learn_mode=True, output_logline=False)
-        self.assertEqual(other.total_freq, ed.total_freq)
-        self.assertEqual(other.freq, ed.freq)
+        self.assertTrue(np.array_equal(other.total_freq, ed.total_freq))
+        self.assertTrue(np.array_equal(other.freq, ed.freq))
+
+        # the frequency lists of the first characters persisted by older versions are converted.
+        with open(ed.persistence_file_name, "w") as f:
+            f.write('[[-1, [[97, 3], [108, 2], [105, 1]]], [97, [[109, 1], [116, 1], [45, 1], [110, 2], [108, 1], [105, 1], [101, 1], [117, 1], [115, 1], [99, 1]]], [109, [[105, 2], [97, 1], [118, 1]]], [105, [[110, 3], [116, 2], [100, 1], [97, 1]]], [110, [[101, 2], [111, 1], [-1, 1], [115, 1]]], [101, [[114, 2], [99, 1], [-1, 1]]], [114, [[-1, 2], [105, 1]]], [108, [[111, 1], [121, 1], [102, 1]]], [111, [[103, 1], [109, 1]]], [103, [[100, 1]]], [100, [[97, 1], [-1, 1]]], [116, [[97, 1], [45, 1], [114, 1], [105, 1], [117, 1], [101, 1]]], [45, [[97, 2], [109, 1]]], [121, [[45, 1]]], [99, [[105, 1], [122, 1]]], [117, [[115, 1], [116, 1]]], [115, [[116, 2], [97, 1]]], [102, [[109, 1]]], [118, [[97, 1]]], [122, [[-1, 1]]]]')
+        other = EntropyDetector(self.aminer_config, [self.stream_printer_event_handler], ["/value"], prob_thresh=0.05, learn_mode=True, output_logline=False)
+        self.assert_frequencies(other, freq, total_freq)
 
     def test6validate_parameters(self):
         """Test all initialization parameters for the detector. Input parameters must be validated in the class."""
@@ -551,6 +524,18 @@ class EntropyDetectorTest(TestBase):
 
         self.assertRaises(ValueError, EntropyDetector, self.aminer_config, [self.stream_printer_event_handler], ["/model/value"], learn_mode=True, stop_learning_time=100, stop_learning_no_anomaly_time=100)
 
+    def assert_frequencies(self, ed, freq, total_freq):
+        """Check if the frequency matrix and the total frequencies of the detector contain the frequencies of the dicts."""
+        freq_matrix = np.zeros((257, 257), dtype=np.int64)
+        for first_char, second_chars in freq.items():
+            for second_char, frequency in second_chars.items():
+                freq_matrix[first_char, second_char] = frequency
+        total_freq_array = np.zeros(257, dtype=np.int64)
+        for first_char, frequency in total_freq.items():
+            total_freq_array[first_char] = frequency
+        self.assertTrue(np.array_equal(ed.freq, freq_matrix))
+        self.assertTrue(np.array_equal(ed.total_freq, total_freq_array))
+
     @staticmethod
     def add_data(string, freq, total_freq):
         for i, x in enumerate(string):
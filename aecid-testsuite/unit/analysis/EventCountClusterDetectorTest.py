@@ -1,3 +1,4 @@
+import math
 import unittest
 import time
 from datetime import datetime
@@ -269,7 +270,49 @@ class EventCountClusterDetectorTest(TestBase):
         self.assertEqual(other.idf_total, eccd.idf_total)
         self.assertEqual(other.idf_counts, eccd.idf_counts)
 
-    def test6validate_parameters(self):
+    def test6check(self):
+        """Test if the count vectors are compared with all count vectors of the model stored in the CountVectorModel."""
+        eccd = EventCountClusterDetector(self.aminer_config, [self.stream_printer_event_handler], id_path_list=["/p/id"], num_windows=2,
+                                         confidence_factor=0.4, learn_mode=True)
+        self.assertEqual(eccd.check(("x",), {("a",): 1}), 1)
+        eccd.known_counts[("x",)] = []
+        eccd.add_to_model(("x",), {("a",): 1, ("b",): 1})
+        eccd.add_to_model(("x",), {("c",): 1})
+        # The first vector differs by 2 out of 4, the second vector by 5 out of 5.
+        self.assertEqual(eccd.check(("x",), {("a",): 1, ("b",): 3}), 0.5)
+        self.assertEqual(eccd.check(("x",), {("a",): 3, ("b",): 1}), 0.5)
+        self.assertEqual(eccd.check(("x",), {("a",): 1, ("b",): 1, ("d",): 1}), -1)
+        self.assertEqual(eccd.check(("x",), {}), 1)
+        # The oldest vector is removed together with the columns of the log events not occurring in the model anymore.
+        eccd.add_to_model(("x",), {("c",): 2})
+        self.assertEqual(eccd.known_counts[("x",)], [{("c",): 1}, {("c",): 2}])
+        self.assertEqual(eccd.count_models[("x",)].columns, {("c",): 0})
+        self.assertEqual(eccd.count_models[("x",)].matrix.tolist(), [[1], [2]])
+        self.assertEqual(eccd.check(("x",), {("c",): 3}), -1)
+        self.assertEqual(eccd.check(("x",), {("c",): 4, ("a",): 1}), 0.6)
+
+        # The normalized scores are exact, so the similarity threshold is not missed because of rounding errors.
+        eccd = EventCountClusterDetector(self.aminer_config, [self.stream_printer_event_handler], id_path_list=["/p/id"], confidence_factor=0.6,
+                                         norm=True, learn_mode=True)
+        eccd.known_counts[("x",)] = []
+        eccd.add_to_model(("x",), {("b",): 1, ("c",): 2})
+        self.assertEqual(eccd.check(("x",), {("a",): 3, ("b",): 1, ("c",): 3}), -1)
+        eccd.confidence_factor = 0.5
+        self.assertEqual(eccd.check(("x",), {("a",): 3, ("b",): 1, ("c",): 3}), 0.6)
+
+        # The idf factors are updated when the statistics change.
+        eccd = EventCountClusterDetector(self.aminer_config, [self.stream_printer_event_handler], id_path_list=["/p/id"], confidence_factor=0.5,
+                                         idf=True, learn_mode=True)
+        eccd.idf_total = {("x",), ("y",)}
+        eccd.idf_counts = {("a",): {("x",), ("y",)}, ("b",): {("x",)}, ("c",): {("x",)}}
+        eccd.known_counts[("x",)] = []
+        eccd.add_to_model(("x",), {("a",): 1, ("b",): 1})
+        self.assertAlmostEqual(eccd.check(("x",), {("c",): 1, ("b",): 1}), (math.log10(1.5) + math.log10(3)) / (math.log10(1.5) + 2 * math.log10(3)))
+        eccd.idf_counts[("b",)].add(("y",))
+        eccd.idf_version += 1
+        self.assertAlmostEqual(eccd.check(("x",), {("c",): 1, ("b",): 1}), (math.log10(1.5) + math.log10(3)) / (2 * math.log10(1.5) + math.log10(3)))
+
+    def test7validate_parameters(self):
         """Test all initialization parameters for the detector. Input parameters must be validated in the class."""
         self.assertRaises(TypeError, EventCountClusterDetector, self.aminer_config, ["default"])
         self.assertRaises(TypeError, EventCountClusterDetector, self.aminer_config, None)
@@ -1,6 +1,7 @@
 import time
 import unittest
-from aminer.analysis.EventTypeDetector import EventTypeDetector
+import numpy as np
+from aminer.analysis.EventTypeDetector import EventTypeDetector, ValueColumn
 from aminer.input.LogAtom import LogAtom
 from aminer.parsing.ParserMatch import ParserMatch
 from aminer.parsing.MatchElement import MatchElement
@@ -404,8 +405,76 @@ class EventTypeDetectorTest(TestBase):
         self.assertEqual(etd.id_path_list_tuples, other.id_path_list_tuples)
         self.assertEqual(etd.current_index, other.current_index)
         self.assertEqual(etd.num_event_lines, other.num_event_lines)
-
-    def test4validate_parameters(self):
+        self.assertEqual(etd.event_index_by_keys, other.event_index_by_keys)
+        self.assertEqual(other.event_index_by_id_tuple, {(" pid=",): 0, ("ddd ",): 1})
+
+        # the reloaded event types are found again.
+        other = EventTypeDetector(self.aminer_config, [self.stream_printer_event_handler], id_path_list=["/seq/s11"])
+        self.assertTrue(other.receive_atom(log_atom3))
+        self.assertTrue(other.receive_atom(log_atom1))
+        self.assertEqual(other.num_events, 2)
+        self.assertEqual(other.current_index, 0)
+        self.assertEqual(other.num_event_lines, [2, 3])
+
+    def test4value_column(self):
+        """Test if the ValueColumn stores the values like a list, which is reduced to the last min_num_vals values."""
+        column = ValueColumn(3, 5)
+        values = []
+        for value in [1.0, 2.5, 3.0, 4.0, 5.0, 6.0, 7.0]:
+            column.append(value)
+            values = (values + [value])[-3:] if len(values) == 5 else values + [value]
+            self.assertEqual(column, values)
+        self.assertEqual(len(column), 4)
+        self.assertEqual(column[-1], 7.0)
+        self.assertIs(type(column[0]), float)
+        self.assertEqual(column[-2:], [6.0, 7.0])
+        self.assertIn(5.0, column)
+        # the values are returned as view, which is not changed by appending values.
+        view = np.asarray(column)
+        self.assertFalse(view.flags.owndata)
+        for value in [8.0, 9.0, 10.0]:
+            column.append(value)
+        self.assertEqual(view.tolist(), [4.0, 5.0, 6.0, 7.0])
+        self.assertEqual(np.asarray(column).tolist(), [7.0, 8.0, 9.0, 10.0])
+        self.assertEqual(sorted([ValueColumn(3, 5, [2.0]), ValueColumn(3, 5, [1.0])]), [[1.0], [2.0]])
+
+        # the pending values are moved to the buffer in blocks and the column is reduced like a list, to which they were appended.
+        for number_of_values in range(1, 20):
+            column = ValueColumn(3, 5, [0.5])
+            values = [0.5]
+            for value in range(number_of_values):
+                column.pending.append(float(value))
+                values.append(float(value))
+                if len(values) > 5:
+                    values = values[-3:]
+            self.assertEqual(len(column), len(values))
+            self.assertEqual(column[-1], values[-1])
+            self.assertEqual(np.asarray(column).tolist(), values)
+
+        # the values are written into the ValueColumn by the EventTypeDetector and stored in a list with interned strings as soon as a
+        # value is no number.
+        etd = EventTypeDetector(self.aminer_config, [self.stream_printer_event_handler], min_num_vals=3, max_num_vals=5)
+        t = round(time.time(), 3)
+        for value in [b"1", b"2", b"3", b"a", "".join(["a", "b"]).encode(), "".join(["a", "b"]).encode()]:
+            match_element = MatchElement("/value", value, value, None)
+            etd.receive_atom(LogAtom(value, ParserMatch(match_element), t, etd))
+            if value == b"3":
+                self.assertIsInstance(etd.values[0][0], ValueColumn)
+                self.assertEqual(etd.get_value_array(0, 0, 2).tolist(), [2.0, 3.0])
+            if value == b"a":
+                self.assertIsInstance(etd.values[0][0], list)
+                self.assertEqual(etd.values[0][0], [1.0, 2.0, 3.0, "a"])
+        self.assertEqual(etd.values[0][0], ["a", "ab", "ab"])
+        self.assertIs(etd.values[0][0][-1], etd.values[0][0][-2])
+        self.assertEqual(etd.get_value_array(0, 0, 2).tolist(), ["ab", "ab"])
+        # the values are stored in a ValueColumn again as soon as all remaining values are numbers.
+        for value in [b"4", b"5", b"6", b"7"]:
+            match_element = MatchElement("/value", value, value, None)
+            etd.receive_atom(LogAtom(value, ParserMatch(match_element), t, etd))
+        self.assertIsInstance(etd.values[0][0], ValueColumn)
+        self.assertEqual(etd.values[0][0], [4.0, 5.0, 6.0, 7.0])
+
+    def test5validate_parameters(self):
         """Test all initialization parameters for the detector. Input parameters must be validated in the class."""
         self.assertRaises(TypeError, EventTypeDetector, self.aminer_config, ["default"])
         self.assertRaises(TypeError, EventTypeDetector, self.aminer_config, None)
@@ -240,7 +240,21 @@ class MinimalTransitionTimeDetectorTest(TestBase):
         mttd.remove_from_persistence_event("Analysis.MinimalTransitionTimeDetector", [["a"], ["1"]])
         self.assertEqual(mttd.time_matrix, {})
 
-    def test8validate_parameters(self):
+    def test8solidify_matrix(self):
+        """Test if the minimal transition times are reduced and added with the triangle inequality keeping the stored directions."""
+        mttd = MinimalTransitionTimeDetector(self.aminer_config, [self.stream_printer_event_handler], ["/model/value"])
+        mttd.time_matrix = {("a",): {("b",): 2}, ("c",): {("b",): 3, ("d",): 10}, ("d",): {("e",): 1}, ("x",): {("y",): 5}, ("e",): {("b",): 4}}
+        mttd.solidify_matrix()
+        self.assertEqual(mttd.time_matrix, {
+            ("a",): {("b",): 2, ("c",): 5, ("d",): 7, ("e",): 6}, ("c",): {("b",): 3, ("d",): 8, ("e",): 7}, ("d",): {("e",): 1, ("b",): 5},
+            ("x",): {("y",): 5}, ("e",): {("b",): 4}})
+        self.assertTrue(all(isinstance(t, int) for times in mttd.time_matrix.values() for t in times.values()))
+        mttd.time_matrix[("y",)] = {("z",): 0.5}
+        mttd.solidify_matrix()
+        self.assertEqual(mttd.time_matrix[("x",)], {("y",): 5, ("z",): 5.5})
+        self.assertEqual(mttd.time_matrix[("a",)], {("b",): 2, ("c",): 5, ("d",): 7, ("e",): 6})
+
+    def test9validate_parameters(self):
         """Test all initialization parameters for the detector. Input parameters must be validated in the class."""
         self.assertRaises(TypeError, MinimalTransitionTimeDetector, self.aminer_config, ["default"], ["/model/value"])
         self.assertRaises(TypeError, MinimalTransitionTimeDetector, self.aminer_config, None, ["/model/value"])
@@ -1,9 +1,10 @@
+import random
 import unittest
 from aminer.parsing.ParserMatch import ParserMatch
 from aminer.input.LogAtom import LogAtom
 from aminer.analysis.MissingMatchPathValueDetector import MissingMatchPathValueDetector, MissingMatchPathListValueDetector
 import time
-from unit.TestBase import TestBase, DummyMatchContext, DummyFixedDataModelElement, DummySequenceModelElement, DummyFirstMatchModelElement
+from unit.TestBase import TestBase, DummyMatchContext, DummyFixedDataModelElement, DummySequenceModelElement, DummyFirstMatchModelElement, RecordingEventHandler
 from datetime import datetime, timezone
 from aminer.AminerConfig import DEFAULT_PERSISTENCE_PERIOD
 
@@ -493,6 +494,68 @@ class MissingMatchPathValueDetectorTest(TestBase):
 
         self.assertRaises(ValueError, MissingMatchPathValueDetector, self.aminer_config, ["path"], [self.stream_printer_event_handler], learn_mode=True, stop_learning_time=100, stop_learning_no_anomaly_time=100)
 
+    def test8check_timeouts_after_allowlisting(self):
+        """Test if all overdue values are reported, when an earlier value in the expected_values_dict is not overdue yet."""
+        mmpvd = MissingMatchPathValueDetector(self.aminer_config, ["match/s1"], [self.stream_printer_event_handler], learn_mode=True,
+                                              default_interval=100, realert_interval=500, combine_values=False)
+        for value, t in ((b"a", 1000), (b"b", 1001)):
+            match_element = DummyFixedDataModelElement("s1", value).get_match_element("match", DummyMatchContext(value))
+            mmpvd.receive_atom(LogAtom(value, ParserMatch(match_element), t, mmpvd))
+        # the new interval of "a" resets the next check, but "a" is not overdue at the next atom.
+        mmpvd.allowlist_event("Analysis.%s" % mmpvd.__class__.__name__, ("a", "match/s1"), 200)
+        self.assertEqual(self.output_stream.getvalue(), "")
+        match_element = DummyFixedDataModelElement("s1", b"c").get_match_element("match", DummyMatchContext(b"c"))
+        mmpvd.receive_atom(LogAtom(b"c", ParserMatch(match_element), 1150, mmpvd))
+        self.assertEqual(self.output_stream.getvalue(), self.expected_string % (
+            datetime.fromtimestamp(1150).strftime(self.datetime_format_string), mmpvd.__class__.__name__, 1,
+            "match/s1: 'b' overdue 49s (interval 100)"))
+
+    def test9check_timeouts(self):
+        """Check if the scheduled timeouts report the same values as checking all expected values for every log atom."""
+        handler = RecordingEventHandler()
+        realert_interval = 500
+        mmpvd = MissingMatchPathValueDetector(self.aminer_config, ["match/s1"], [handler], learn_mode=True, default_interval=100,
+                                              realert_interval=realert_interval, combine_values=False)
+        rnd = random.Random(1)
+        expected_values_dict = {}
+        last_seen_timestamp = 0
+        t = 1000
+        for i in range(2000):
+            t += rnd.choice([1, 5, 20, 150])
+            value = "val%d" % rnd.randint(0, 30)
+            if i == 1000:
+                mmpvd.allowlist_event("Analysis.%s" % mmpvd.__class__.__name__, ["val1", "match/s1"], -2)
+                mmpvd.allowlist_event("Analysis.%s" % mmpvd.__class__.__name__, ["val2", "match/s1"], 20)
+                del expected_values_dict["val1"]
+                expected_values_dict["val2"] = [last_seen_timestamp, 20, 0]
+            data = value.encode()
+            match_element = DummyFixedDataModelElement("s1", data).get_match_element("match", DummyMatchContext(data))
+            mmpvd.receive_atom(LogAtom(data, ParserMatch(match_element), t, mmpvd))
+
+            # check all expected values like the detector before the heap was introduced.
+            if value not in expected_values_dict:
+                expected_values_dict[value] = [t, 100, 0]
+            old_last_seen_timestamp = last_seen_timestamp
+            last_seen_timestamp = t
+            missing_values = []
+            for expected_value, detector_info in expected_values_dict.items():
+                if last_seen_timestamp - detector_info[0] > detector_info[1] and last_seen_timestamp >= detector_info[2]:
+                    overdue_time = int(last_seen_timestamp - detector_info[0] - detector_info[1])
+                    if overdue_time <= 0:
+                        overdue_time = last_seen_timestamp - old_last_seen_timestamp - detector_info[1]
+                    missing_values.append((expected_value, str(overdue_time)))
+                    detector_info[2] = last_seen_timestamp + realert_interval
+            if value in expected_values_dict:
+                detector_info = expected_values_dict[value]
+                detector_info[0] = t
+                if detector_info[2] != 0 and t >= detector_info[2]:
+                    detector_info[2] = 0
+            if missing_values:
+                event_data = handler.event_data.pop(0)
+                self.assertEqual([(e["Value"], e["OverdueTime"]) for e in event_data["AnalysisComponent"]["AffectedLogAtomValues"]], missing_values)
+            self.assertEqual(handler.event_data, [])
+        self.assertEqual({key: value[:3] for key, value in mmpvd.expected_values_dict.items()}, expected_values_dict)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 import time
+import numpy as np
 from datetime import datetime
 from aminer.analysis.PCADetector import PCADetector
 from aminer.input.LogAtom import LogAtom
@@ -207,7 +208,66 @@ class PCADetectorTest(TestBase):
         other = PCADetector(self.aminer_config, ["/value"], [self.stream_printer_event_handler], 10, 2, 0.9, 3, learn_mode=True, output_logline=False)
         self.assertEqual(other.event_count_matrix, pcad.event_count_matrix)
 
-    def test6validate_parameters(self):
+    def test6incremental(self):
+        """Test the running sums, the anomaly detection and the persistence of the incremental mode."""
+        t = time.time()
+        # the counts of a and b are correlated in the first 20 time windows and not correlated in the last time window.
+        window_counts = [(i % 3 + 1, i % 3 + 1) for i in range(20)] + [(3, 0)]
+        log_atoms = []
+        for window, (count_a, count_b) in enumerate(window_counts + [(1, 0)]):
+            for i, value in enumerate([b"a"] * count_a + [b"b"] * count_b):
+                log_atoms.append(LogAtom(value, ParserMatch(MatchElement("/value", value, value, None)), t + window * 10 + i * 0.1, None))
+        pcad = PCADetector(self.aminer_config, ["/value"], [self.stream_printer_event_handler], 10, 3, 0.9, 5, learn_mode=True, output_logline=False, incremental=True)
+        anomaly_windows = []
+        for log_atom in log_atoms:
+            output_length = len(self.output_stream.getvalue())
+            pcad.receive_atom(log_atom)
+            if len(self.output_stream.getvalue()) > output_length:
+                anomaly_windows.append(int((log_atom.atom_time - t) // 10) - 1)
+        self.assertEqual(anomaly_windows, [20])
+        self.assertEqual(pcad.event_count_matrix, [])
+        self.assertEqual(pcad.feature_columns, {("/value", "a"): 0, ("/value", "b"): 1})
+        self.assertEqual(pcad.num_learned_windows, 21)
+        self.assertEqual(len(pcad.window_losses), 5)
+        decay = 1 - 1 / 5
+        weights = [decay**(20 - i) for i in range(21)]
+        counts = np.array(window_counts, dtype=float)
+        self.assertAlmostEqual(pcad.window_weight, sum(weights))
+        self.assertTrue(np.allclose(pcad.window_sums, np.sum([w * c for w, c in zip(weights, counts)], axis=0)))
+        self.assertTrue(np.allclose(pcad.window_products, np.sum([w * np.outer(c, c) for w, c in zip(weights, counts)], axis=0)))
+
+        # without decay the PCA is the same as on the count matrix.
+        batch = PCADetector(self.aminer_config, ["/value"], [self.stream_printer_event_handler], 10, 2, 0.9, 1000, learn_mode=True, output_logline=False, persistence_id="batch")
+        no_decay = PCADetector(self.aminer_config, ["/value"], [self.stream_printer_event_handler], 10, 2, 0.9, 10**12, learn_mode=True, output_logline=False, persistence_id="no_decay", incremental=True)
+        for log_atom in log_atoms:
+            batch.receive_atom(log_atom)
+            no_decay.receive_atom(log_atom)
+        self.assertAlmostEqual(no_decay.ecm_mean, batch.ecm_mean)
+        self.assertAlmostEqual(no_decay.ecm_std, batch.ecm_std)
+        self.assertEqual(no_decay.n_comp, batch.n_comp)
+        self.assertTrue(np.allclose(np.abs(no_decay.eigen_vectors), np.abs(batch.eigen_vectors)))
+
+        # only the running sums are persisted.
+        pcad.do_persist()
+        other = PCADetector(self.aminer_config, ["/value"], [self.stream_printer_event_handler], 10, 3, 0.9, 5, learn_mode=True, output_logline=False, incremental=True)
+        self.assertEqual(other.feature_columns, pcad.feature_columns)
+        self.assertEqual(other.event_count_vector, {"/value": {"a": 0, "b": 0}})
+        self.assertEqual(other.num_learned_windows, pcad.num_learned_windows)
+        self.assertAlmostEqual(other.window_weight, pcad.window_weight)
+        self.assertTrue(np.allclose(other.window_sums, pcad.window_sums))
+        self.assertTrue(np.allclose(other.window_products, pcad.window_products))
+        self.assertEqual(other.window_losses, pcad.window_losses)
+        self.assertTrue(np.allclose(other.eigen_vectors, pcad.eigen_vectors))
+
+        # a persisted count matrix is added to the running sums.
+        batch.do_persist()
+        other = PCADetector(self.aminer_config, ["/value"], [self.stream_printer_event_handler], 10, 2, 0.9, 10**12, learn_mode=True, output_logline=False, persistence_id="batch", incremental=True)
+        self.assertEqual(other.num_learned_windows, 21)
+        self.assertEqual(other.event_count_vector, {"/value": {"a": 0, "b": 0}})
+        self.assertTrue(np.allclose(other.window_sums, no_decay.window_sums))
+        self.assertTrue(np.allclose(other.window_products, no_decay.window_products))
+
+    def test7validate_parameters(self):
         """Test all initialization parameters for the detector. Input parameters must be validated in the class."""
         self.assertRaises(ValueError, PCADetector, self.aminer_config, [""], [self.stream_printer_event_handler], 10, 2, 0.9, 3)
         self.assertRaises(ValueError, PCADetector, self.aminer_config, None, [self.stream_printer_event_handler], 10, 2, 0.9, 3)
@@ -363,6 +423,11 @@ class PCADetectorTest(TestBase):
 
         self.assertRaises(ValueError, PCADetector, self.aminer_config, ["/value"], [self.stream_printer_event_handler], 10, 2, 0.9, 3, learn_mode=True, stop_learning_time=100, stop_learning_no_anomaly_time=100)
 
+        self.assertRaises(TypeError, PCADetector, self.aminer_config, ["/value"], [self.stream_printer_event_handler], 10, 2, 0.9, 3, incremental=None)
+        self.assertRaises(TypeError, PCADetector, self.aminer_config, ["/value"], [self.stream_printer_event_handler], 10, 2, 0.9, 3, incremental=1)
+        self.assertRaises(TypeError, PCADetector, self.aminer_config, ["/value"], [self.stream_printer_event_handler], 10, 2, 0.9, 3, incremental="True")
+        PCADetector(self.aminer_config, ["/value"], [self.stream_printer_event_handler], 10, 2, 0.9, 3, incremental=True)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -141,14 +141,14 @@ class SlidingEventFrequencyDetectorTest(TestBase):
         sefd.receive_atom(log_atom5)
         self.assertEqual(self.output_stream.getvalue(), "")
         self.assertEqual(list(sefd.counts[("a",)]), [t + 7, t + 13])
-        self.assertEqual(list(sefd.counts[("b",)]), [t + 3, t + 17])
+        self.assertEqual(list(sefd.counts[("b",)]), [t + 17])
 
         # Input: a; second time window is not finished
         # Expected output: frequency of a is 3 in new time window count, old count remains unchanged
         sefd.receive_atom(log_atom6)
         self.assertEqual(self.output_stream.getvalue(), "")
         self.assertEqual(list(sefd.counts[("a",)]), [t + 13, t + 18])
-        self.assertEqual(list(sefd.counts[("b",)]), [t + 3, t + 17])
+        self.assertEqual(list(sefd.counts[("b",)]), [t + 17])
 
         # Input: a; second time window is not finished
         # Expected output: frequency of a is 4 in new time window count, old count remains unchanged
@@ -156,7 +156,7 @@ class SlidingEventFrequencyDetectorTest(TestBase):
         self.assertEqual(self.output_stream.getvalue(), expected_string_first % (datetime.fromtimestamp(t+19).strftime(dtf), sefd.__class__.__name__, 1, "a"))
         self.reset_output_stream()
         self.assertEqual(list(sefd.counts[("a",)]), [t + 13, t + 18, t + 19])
-        self.assertEqual(list(sefd.counts[("b",)]), [t + 3, t + 17])
+        self.assertEqual(list(sefd.counts[("b",)]), [t + 17])
 
         # Time window 3 should create 2 anomalies since a drops from 3 to 0 and b increases from 1 to 2, which will be reported in window 4.
         # Anomalies are only reported when third time window is known to be completed, which will occur when subsequent atom is received.
@@ -212,7 +212,36 @@ class SlidingEventFrequencyDetectorTest(TestBase):
         self.assertTrue(sefd.receive_atom(log_atom1))
         self.assertFalse(sefd.learn_mode)
 
-    def test2validate_parameters(self):
+    def test2num_buckets(self):
+        """Test if the events are counted in sub-windows, which are removed when they fell out of the time window, if num_buckets is used."""
+        sefd = SlidingEventFrequencyDetector(aminer_config=self.aminer_config, anomaly_event_handlers=[self.stream_printer_event_handler], window_size=10, set_upper_limit=100, num_buckets=5, output_logline=False)
+        self.assertEqual(sefd.bucket_size, 2)
+        for atom_time, frequency, counts in [(0.5, 1, [[0, 1]]), (1.5, 2, [[0, 2]]), (3, 3, [[0, 2], [2, 1]]), (10.5, 4, [[0, 2], [2, 1], [10, 1]]), (12.5, 3, [[2, 1], [10, 1], [12, 1]]),
+                                             (9, 4, [[2, 1], [10, 1], [12, 2]]), (14, 4, [[10, 1], [12, 2], [14, 1]]), (30, 1, [[30, 1]])]:
+            log_atom = LogAtom(b"a", ParserMatch(MatchElement("/value", b"a", b"a", None)), atom_time, None)
+            sefd.receive_atom(log_atom)
+            self.assertEqual(sefd.frequencies[("/value",)], frequency)
+            self.assertEqual(list(sefd.counts[("/value",)]), counts)
+        self.assertEqual(self.output_stream.getvalue(), "")
+
+        # the memory is bounded independent of the event rate.
+        for i in range(1000):
+            sefd.receive_atom(LogAtom(b"a", ParserMatch(MatchElement("/value", b"a", b"a", None)), 100 + i / 10, None))
+            self.assertLessEqual(len(sefd.counts[("/value",)]), 6)
+        self.assertEqual(sefd.frequencies[("/value",)], sum(count for _, count in sefd.counts[("/value",)]))
+
+        # the same anomalies are found as without num_buckets if the events do not need to be removed from a sub-window.
+        outputs = []
+        for num_buckets in (None, 10):
+            self.reset_output_stream()
+            sefd = SlidingEventFrequencyDetector(aminer_config=self.aminer_config, anomaly_event_handlers=[self.stream_printer_event_handler], window_size=10, set_upper_limit=2, num_buckets=num_buckets, output_logline=False)
+            for atom_time in (1, 2, 3, 11, 11, 12, 13, 14, 30, 31):
+                sefd.receive_atom(LogAtom(b"a", ParserMatch(MatchElement("/value", b"a", b"a", None)), atom_time, None))
+            outputs.append(self.output_stream.getvalue())
+        self.assertNotEqual(outputs[0], "")
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test3validate_parameters(self):
         """Test all initialization parameters for the detector. Input parameters must be validated in the class."""
         self.assertRaises(TypeError, SlidingEventFrequencyDetector, self.aminer_config, ["default"], 300)
         self.assertRaises(TypeError, SlidingEventFrequencyDetector, self.aminer_config, None, 300)
@@ -373,6 +402,20 @@ class SlidingEventFrequencyDetectorTest(TestBase):
 
         self.assertRaises(ValueError, SlidingEventFrequencyDetector, self.aminer_config, [self.stream_printer_event_handler], 300, learn_mode=True, stop_learning_time=100, stop_learning_no_anomaly_time=100)
 
+        self.assertRaises(ValueError, SlidingEventFrequencyDetector, self.aminer_config, [self.stream_printer_event_handler], 300, num_buckets=-1)
+        self.assertRaises(ValueError, SlidingEventFrequencyDetector, self.aminer_config, [self.stream_printer_event_handler], 300, num_buckets=0)
+        self.assertRaises(TypeError, SlidingEventFrequencyDetector, self.aminer_config, [self.stream_printer_event_handler], 300, num_buckets=b"Default")
+        self.assertRaises(TypeError, SlidingEventFrequencyDetector, self.aminer_config, [self.stream_printer_event_handler], 300, num_buckets="123")
+        self.assertRaises(TypeError, SlidingEventFrequencyDetector, self.aminer_config, [self.stream_printer_event_handler], 300, num_buckets=True)
+        self.assertRaises(TypeError, SlidingEventFrequencyDetector, self.aminer_config, [self.stream_printer_event_handler], 300, num_buckets=12.5)
+        self.assertRaises(TypeError, SlidingEventFrequencyDetector, self.aminer_config, [self.stream_printer_event_handler], 300, num_buckets={"id": "Default"})
+        self.assertRaises(TypeError, SlidingEventFrequencyDetector, self.aminer_config, [self.stream_printer_event_handler], 300, num_buckets=["Default"])
+        self.assertRaises(TypeError, SlidingEventFrequencyDetector, self.aminer_config, [self.stream_printer_event_handler], 300, num_buckets=())
+        self.assertRaises(TypeError, SlidingEventFrequencyDetector, self.aminer_config, [self.stream_printer_event_handler], 300, num_buckets=set())
+        self.assertRaises(ValueError, SlidingEventFrequencyDetector, self.aminer_config, [self.stream_printer_event_handler], 300, num_buckets=10, scoring_path_list=["/value"])
+        SlidingEventFrequencyDetector(self.aminer_config, [self.stream_printer_event_handler], 300, num_buckets=10)
+        SlidingEventFrequencyDetector(self.aminer_config, [self.stream_printer_event_handler], 300, num_buckets=None)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,7 @@ import unittest
 import time
 from datetime import datetime
 from aminer.analysis.TSAArimaDetector import TSAArimaDetector
+from aminer.util.ModelRefitService import model_refit_service
 from aminer.analysis.EventTypeDetector import EventTypeDetector
 from aminer.input.LogAtom import LogAtom
 from aminer.parsing.MatchElement import MatchElement
@@ -427,6 +428,30 @@ class TSAArimaDetectorTest(TestBase):
 
         self.assertRaises(ValueError, TSAArimaDetector, self.aminer_config, [self.stream_printer_event_handler], etd, learn_mode=True, stop_learning_time=100, stop_learning_no_anomaly_time=100)
 
+    def test5model_refit_service(self):
+        """Test if the arima models fitted by the worker processes of the ModelRefitService in offline mode lead to the same predictions."""
+        rnd = random.Random(5)
+        counts = [rnd.randint(15, 25) + 10 * (i % 10 == 0) for i in range(200)]
+        prediction_histories = []
+        for max_workers in (0, 2):
+            etd = EventTypeDetector(self.aminer_config, [self.stream_printer_event_handler])
+            etd.receive_atom(self.data[0])
+            tad = TSAArimaDetector(self.aminer_config, [self.stream_printer_event_handler], etd, output_logline=False)
+            model_refit_service.configure(max_workers, True)
+            try:
+                for count in counts:
+                    tad.test_num_appearance(0, count, self.data[0])
+                    # the background fit is only waited for, when the model is needed.
+                    if max_workers != 0 and len(tad.time_window_history[0]) == 150 and tad.arima_models[0] is None:
+                        self.assertTrue(model_refit_service.has_pending_refits(tad))
+            finally:
+                model_refit_service.configure(0, False)
+            self.assertIsNotNone(tad.arima_models[0])
+            self.assertEqual(tad.pending_refit_values, {})
+            prediction_histories.append(tad.prediction_history)
+        self.assertNotEqual(prediction_histories[0][0][0], [])
+        self.assertEqual(prediction_histories[0], prediction_histories[1])
+
     @classmethod
     def setUpClass(cls):
         """Set up the data for the all tests."""
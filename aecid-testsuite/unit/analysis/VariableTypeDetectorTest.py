@@ -1,5 +1,6 @@
 from aminer.analysis.EventTypeDetector import EventTypeDetector
-from aminer.analysis.VariableTypeDetector import VariableTypeDetector, convert_to_floats, consists_of_ints, consists_of_floats
+from aminer.analysis.VariableTypeDetector import VariableTypeDetector, convert_to_floats, consists_of_ints, consists_of_floats, \
+    gof_test_statistics
 from aminer.input.LogAtom import LogAtom
 from aminer.parsing.ParserMatch import ParserMatch
 from aminer.parsing.MatchElement import MatchElement
@@ -9,6 +10,8 @@ from aminer.AminerConfig import DEFAULT_PERSISTENCE_PERIOD
 import time
 import pickle  # skipcq: BAN-B403
 import random
+import numpy as np
+from scipy.stats import kstest, distributions
 
 
 class VariableTypeDetectorTest(TestBase):
@@ -1646,3 +1649,40 @@ class VariableTypeDetectorTest(TestBase):
         VariableTypeDetector(self.aminer_config, [self.stream_printer_event_handler], etd, learn_mode=True, stop_learning_no_anomaly_time=100.22)
 
         self.assertRaises(ValueError, VariableTypeDetector, self.aminer_config, [self.stream_printer_event_handler], etd, learn_mode=True, stop_learning_time=100, stop_learning_no_anomaly_time=100)
+
+    def test11gof_test_statistics(self):
+        """Check if the vectorized gof-tests match the single scipy tests and the batched s_gof-tests match the single s_gof-tests."""
+        rng = np.random.default_rng(11)
+        cdf_list = [("uniform", (-1, 3)), ("norm", ()), ("norm", (0.5, 2)), ("beta", (0.5, 0.5)), ("beta", (5, 2)), ("beta", (1, 5, -1, 4))]
+        samples = rng.normal(0.2, 1, (len(cdf_list), 60))
+        sorted_samples = np.sort(samples, axis=1)
+        ks_statistics = gof_test_statistics(sorted_samples, cdf_list, "KS")
+        cm_statistics = gof_test_statistics(sorted_samples, cdf_list, "CM")
+        for i, (name, args) in enumerate(cdf_list):
+            self.assertAlmostEqual(ks_statistics[i], kstest(samples[i], name, args=args)[0])
+            cdfvals = getattr(distributions, name).cdf(sorted_samples[i], *args)
+            self.assertAlmostEqual(cm_statistics[i], 1 / 720 + sum(((2 * j + 1) / 120 - cdfvals[j]) ** 2 for j in range(60)))
+        # samples sorted before a decreasing transformation are reversed.
+        self.assertAlmostEqual(gof_test_statistics(-sorted_samples[:1], [("norm", ())], "KS")[0], kstest(-samples[0], "norm")[0])
+
+        var_types = [["uni", -2.0, 2.0], ["nor", 0.0, 1.0, -3.0, 3.0], ["beta", 0.0, 1.0, -2.0, 2.0, 1], ["beta", 0.0, 1.0, -2.0, 2.0, 2],
+                     ["beta", 0.0, 1.0, -2.0, 2.0, 3], ["beta", 0.3, 0.6, -0.5, 2.5, 4], ["beta", -0.3, 0.6, -2.5, 0.5, 5]]
+        for used_gof_test in ("KS", "CM"):
+            etd = EventTypeDetector(self.aminer_config, [self.stream_printer_event_handler])
+            vtd = VariableTypeDetector(self.aminer_config, [self.stream_printer_event_handler], etd, num_init=100, num_update=50,
+                                       used_gof_test=used_gof_test)
+            etd.values = [[list(rng.uniform(-1, 1, 50)) for _ in var_types]]
+            etd.check_variables = [[True] * len(var_types)]
+            vtd.var_type = [var_types]
+            s_gof_statistics = vtd.s_gof_test_statistics(0, range(len(var_types)))
+            for var_index in range(len(var_types)):
+                s_gof_result = vtd.s_gof_test(0, var_index, True)
+                if var_index in s_gof_statistics:
+                    self.assertAlmostEqual(s_gof_result[1], s_gof_statistics[var_index])
+                    self.assertEqual(vtd.s_gof_test(0, var_index, True, s_gof_statistics[var_index]), s_gof_result)
+                else:
+                    # the CM-test rejects the var type before calculating the statistic.
+                    self.assertEqual(used_gof_test, "CM")
+                    self.assertEqual(s_gof_result, [False, 1])
+            self.assertEqual(len(s_gof_statistics) == len(var_types), used_gof_test == "KS")
+            self.assertNotEqual(s_gof_statistics, {})
@@ -6,6 +6,7 @@ import re
 import aminer.AminerConfig as AminerConfig
 from datetime import datetime
 from aminer.AnalysisChild import AnalysisContext
+from aminer.AminerRemoteControlExecutionMethods import AminerRemoteControlExecutionMethods
 from aminer.analysis.AtomFilters import SubhandlerFilter
 from aminer.analysis.NewMatchPathDetector import NewMatchPathDetector
 from aminer.analysis.NewMatchPathValueDetector import NewMatchPathValueDetector
@@ -18,11 +19,13 @@ from aminer.analysis.MatchValueStreamWriter import MatchValueStreamWriter
 from aminer.analysis.TimeCorrelationViolationDetector import TimeCorrelationViolationDetector
 from aminer.analysis.TimestampsUnsortedDetector import TimestampsUnsortedDetector
 from aminer.analysis.AllowlistViolationDetector import AllowlistViolationDetector
+from aminer.events.AsyncEventDispatcher import AsyncEventDispatcher
 from aminer.events.StreamPrinterEventHandler import StreamPrinterEventHandler
 from aminer.events.SyslogWriterEventHandler import SyslogWriterEventHandler
 from aminer.events.DefaultMailNotificationEventHandler import DefaultMailNotificationEventHandler
 from aminer.events.JsonConverterHandler import JsonConverterHandler
 from aminer.input.SimpleByteStreamLineAtomizerFactory import SimpleByteStreamLineAtomizerFactory
+from aminer.input.BufferedMultisourceAtomSync import BufferedMultisourceAtomSync
 from aminer.input.SimpleMultisourceAtomSync import SimpleMultisourceAtomSync
 from aminer.parsing.AnyByteDataModelElement import AnyByteDataModelElement
 from aminer.parsing.FirstMatchModelElement import FirstMatchModelElement
@@ -36,6 +39,7 @@ from aminer.parsing.DecimalFloatValueModelElement import DecimalFloatValueModelE
 from aminer.parsing.RepeatedElementDataModelElement import RepeatedElementDataModelElement
 from aminer.parsing.OptionalMatchModelElement import OptionalMatchModelElement
 from aminer.parsing.ElementValueBranchModelElement import ElementValueBranchModelElement
+from aminer.parsing.CompiledModelElement import CompiledModelElement
 from aminer.parsing.MatchContext import MatchContext
 from aminer.parsing.ParserMatch import ParserMatch
 from aminer.input.LogAtom import LogAtom
@@ -775,5 +779,113 @@ class YamlConfigTest(TestBase):
         self.assertEqual(context.atomizer_factory.parsing_model.element_id, 'accesslog')
 
 
+    def test32_compile_model(self):
+        """Test if the parsing model of the atomizer is compiled when compile_model is set in the Input section."""
+        spec = importlib.util.spec_from_file_location('aminer_config', '/usr/lib/logdata-anomaly-miner/aminer/YamlConfig.py')
+        aminer_config = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(aminer_config)
+        aminer_config.load_yaml('unit/data/configfiles/multiple_components.yml')
+        self.assertFalse(aminer_config.yaml_data['Input']['compile_model'])
+        aminer_config.yaml_data['Input']['compile_model'] = True
+        context = AnalysisContext(aminer_config)
+        context.build_analysis_pipeline()
+        parsing_model = context.atomizer_factory.parsing_model
+        self.assertTrue(isinstance(parsing_model, CompiledModelElement))
+        self.assertTrue(isinstance(parsing_model.model_element, SequenceModelElement))
+        self.assertEqual(parsing_model.element_id, 'accesslog')
+        data = b'83.149.9.216 - - [17/May/2015:10:05:03 +0000] "GET /presentations/logstash-monitorama-2013/images/kibana-search.png ' \
+               b'HTTP/1.1" 200 203023 "-" "Mozilla/5.0 (X11; Linux x86_64)"'
+        match_element = parsing_model.get_match_element('', MatchContext(data))
+        expected_match_element = parsing_model.model_element.get_match_element('', MatchContext(data))
+        self.assertEqual(ParserMatch(match_element).get_match_dictionary().keys(),
+                         ParserMatch(expected_match_element).get_match_dictionary().keys())
+        self.assertEqual(match_element.match_string, data)
+
+    def test33_batch_mode(self):
+        """Test if the batch_mode in the Input section is passed to the atomizers."""
+        spec = importlib.util.spec_from_file_location('aminer_config', '/usr/lib/logdata-anomaly-miner/aminer/YamlConfig.py')
+        aminer_config = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(aminer_config)
+        aminer_config.load_yaml('unit/data/configfiles/multiple_components.yml')
+        self.assertFalse(aminer_config.yaml_data['Input']['batch_mode'])
+        aminer_config.yaml_data['Input']['batch_mode'] = True
+        context = AnalysisContext(aminer_config)
+        context.build_analysis_pipeline()
+        self.assertTrue(context.atomizer_factory.batch_mode)
+        self.assertTrue(context.atomizer_factory.get_atomizer_for_resource(None).batch_mode)
+
+    def test34_sync_queue_size(self):
+        """Test if a BufferedMultisourceAtomSync is created and registered for real time triggering, when the sync_queue_size is set."""
+        spec = importlib.util.spec_from_file_location('aminer_config', '/usr/lib/logdata-anomaly-miner/aminer/YamlConfig.py')
+        aminer_config = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(aminer_config)
+        aminer_config.load_yaml('unit/data/configfiles/multiple_components.yml')
+        self.assertEqual(aminer_config.yaml_data['Input']['sync_queue_size'], 0)
+        aminer_config.yaml_data['Input']['multi_source'] = True
+        context = AnalysisContext(aminer_config)
+        context.build_analysis_pipeline()
+        self.assertTrue(isinstance(context.atomizer_factory.atom_handler_list[0], SimpleMultisourceAtomSync))
+
+        aminer_config.yaml_data['Input']['sync_queue_size'] = 100
+        context = AnalysisContext(aminer_config)
+        context.build_analysis_pipeline()
+        atom_sync = context.atomizer_factory.atom_handler_list[0]
+        self.assertTrue(isinstance(atom_sync, BufferedMultisourceAtomSync))
+        self.assertEqual(atom_sync.queue_size, 100)
+        self.assertIn(atom_sync, context.real_time_triggered_components)
+
+    def test35_component_names_and_ids(self):
+        """Test if the names and ids of the components are found by the reverse indices after registering and renaming them."""
+        spec = importlib.util.spec_from_file_location('aminer_config', '/usr/lib/logdata-anomaly-miner/aminer/YamlConfig.py')
+        aminer_config = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(aminer_config)
+        aminer_config.load_yaml('unit/data/configfiles/suppress_config.yml')
+        context = AnalysisContext(aminer_config)
+        context.build_analysis_pipeline()
+        self.assertEqual(context.suppress_detector_list, {"VerboseUnparsedAtomHandler"})
+        for component_id, (component, component_name) in context.registered_components.items():
+            self.assertEqual(context.get_id_by_component(component), component_id)
+            self.assertEqual(context.get_name_by_component(component), component_name)
+        self.assertIsNone(context.get_name_by_component(self))
+        self.assertIsNone(context.get_id_by_component(self))
+
+        component = context.get_component_by_name("ValueComboDetector")
+        component_id = context.get_id_by_component(component)
+        remote_control = AminerRemoteControlExecutionMethods()
+        remote_control.rename_registered_analysis_component(context, "ValueComboDetector", "ValueComboDetectorRenamed")
+        self.assertEqual(remote_control.REMOTE_CONTROL_RESPONSE,
+                         "Component 'ValueComboDetector' renamed to 'ValueComboDetectorRenamed' successfully.")
+        self.assertIsNone(context.get_component_by_name("ValueComboDetector"))
+        self.assertEqual(context.get_component_by_name("ValueComboDetectorRenamed"), component)
+        self.assertEqual(context.get_name_by_component(component), "ValueComboDetectorRenamed")
+        self.assertEqual(context.get_id_by_component(component), component_id)
+        self.assertEqual(context.registered_components[component_id], (component, "ValueComboDetectorRenamed"))
+        remote_control.REMOTE_CONTROL_RESPONSE = ""
+        remote_control.rename_registered_analysis_component(context, "ValueComboDetector", "NewName")
+        self.assertEqual(remote_control.REMOTE_CONTROL_RESPONSE, "FAILURE: the component 'ValueComboDetector' does not exist.")
+
+
+    def test36_async_output(self):
+        """Test if the event handlers are wrapped by an AsyncEventDispatcher, when async_output is set."""
+        spec = importlib.util.spec_from_file_location('aminer_config', '/usr/lib/logdata-anomaly-miner/aminer/YamlConfig.py')
+        aminer_config = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(aminer_config)
+        aminer_config.load_yaml('unit/data/configfiles/multiple_components.yml')
+        self.assertFalse(aminer_config.yaml_data['EventHandlers'][0]['async_output'])
+        aminer_config.yaml_data['EventHandlers'][0]['async_output'] = True
+        aminer_config.yaml_data['EventHandlers'][0]['batch_size'] = 10
+        aminer_config.yaml_data['EventHandlers'][0]['block_when_full'] = True
+        context = AnalysisContext(aminer_config)
+        context.build_analysis_pipeline()
+        dispatcher = context.atomizer_factory.event_handler_list[0]
+        self.assertTrue(isinstance(dispatcher, AsyncEventDispatcher))
+        self.assertEqual(dispatcher.batch_size, 10)
+        self.assertEqual(dispatcher.linger_time, 0.1)
+        self.assertTrue(dispatcher.block_when_full)
+        self.assertTrue(isinstance(dispatcher.event_handlers[0], StreamPrinterEventHandler))
+        self.assertFalse(dispatcher.event_handlers[0].auto_flush)
+        self.assertTrue(isinstance(context.atomizer_factory.event_handler_list[1], SyslogWriterEventHandler))
+
+
 if __name__ == "__main__":
     unittest.main()
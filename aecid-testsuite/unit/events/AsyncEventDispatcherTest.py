@@ -0,0 +1,116 @@
+import threading
+import time
+import unittest
+from aminer.events.AsyncEventDispatcher import AsyncEventDispatcher
+from aminer.events.StreamPrinterEventHandler import StreamPrinterEventHandler
+from aminer.input.LogAtom import LogAtom
+from aminer.parsing.FixedDataModelElement import FixedDataModelElement
+from aminer.parsing.MatchContext import MatchContext
+from aminer.parsing.ParserMatch import ParserMatch
+from unit.TestBase import TestBase, RecordingEventHandler
+
+
+class AsyncEventDispatcherTest(TestBase):
+    """Unittests for the AsyncEventDispatcher."""
+
+    fixed_dme = FixedDataModelElement('s1', b' pid=')
+    match_element = fixed_dme.get_match_element("match", MatchContext(b' pid='))
+
+    def receive_events(self, event_handler, count, event_source=None):
+        """Send count events with the messages "event 0", "event 1", ... to the event_handler."""
+        if event_source is None:
+            event_source = self
+        log_atom = LogAtom(self.fixed_dme.fixed_data, ParserMatch(self.match_element), 1, event_source)
+        for i in range(count):
+            event_handler.receive_event("Analysis.TestDetector", "event %d" % i, [" pid="], {}, log_atom, event_source)
+
+    def test1forward_events_in_order(self):
+        """Check if the events are forwarded in order and written to the stream like without the AsyncEventDispatcher."""
+        self.analysis_context.register_component(self, "TestDetector")
+        self.receive_events(self.stream_printer_event_handler, 5)
+        expected_output = self.output_stream.getvalue()
+        self.reset_output_stream()
+
+        dispatcher = AsyncEventDispatcher([StreamPrinterEventHandler(self.analysis_context, self.output_stream, auto_flush=False)],
+                                          self.analysis_context, batch_size=2)
+        self.receive_events(dispatcher, 5)
+        dispatcher.stop()
+        self.assertEqual(self.output_stream.getvalue(), expected_output)
+        self.assertEqual((dispatcher.queued_events, dispatcher.dropped_events, dispatcher.flushed_events), (5, 0, 5))
+        self.assertIsNone(dispatcher.worker)
+
+    def test2batches(self):
+        """Check if the event handlers are flushed after every batch and the queued events are forwarded when stopping."""
+        handler = RecordingEventHandler()
+        dispatcher = AsyncEventDispatcher([handler], self.analysis_context, batch_size=3, linger_time=10)
+        self.receive_events(dispatcher, 4)
+        # the first batch is full and does not wait for the linger_time.
+        for _ in range(100):
+            if handler.flush_count == 1:
+                break
+            time.sleep(0.01)
+        self.assertEqual(handler.messages, ["event 0", "event 1", "event 2"])
+        self.assertEqual(handler.flush_count, 1)
+        dispatcher.stop()
+        self.assertEqual(handler.messages, ["event 0", "event 1", "event 2", "event 3"])
+        self.assertEqual(handler.flush_count, 2)
+        self.assertEqual(dispatcher.flushed_events, 4)
+
+    def test3drop_events_when_queue_is_full(self):
+        """Check if events are dropped, when the queue is full and block_when_full is False."""
+        handler = RecordingEventHandler(blocking=True)
+        dispatcher = AsyncEventDispatcher([handler], self.analysis_context, batch_size=1, queue_size=1)
+        self.receive_events(dispatcher, 1)
+        self.assertTrue(handler.started.wait(5))
+        # the first event is handled by the blocked handler, the second event is queued and the others are dropped.
+        self.receive_events(dispatcher, 3)
+        self.assertEqual((dispatcher.queued_events, dispatcher.dropped_events), (2, 2))
+        handler.released.set()
+        dispatcher.stop()
+        self.assertEqual(handler.messages, ["event 0", "event 0"])
+        self.assertEqual(dispatcher.flushed_events, 2)
+
+    def test4block_when_queue_is_full(self):
+        """Check if receive_event waits until the event can be queued, when block_when_full is True."""
+        handler = RecordingEventHandler(blocking=True)
+        dispatcher = AsyncEventDispatcher([handler], self.analysis_context, batch_size=1, queue_size=1, block_when_full=True)
+        self.receive_events(dispatcher, 1)
+        self.assertTrue(handler.started.wait(5))
+        self.receive_events(dispatcher, 1)
+        threading.Timer(0.1, handler.released.set).start()
+        self.receive_events(dispatcher, 1)
+        dispatcher.stop()
+        self.assertEqual(handler.messages, ["event 0", "event 0", "event 0"])
+        self.assertEqual((dispatcher.queued_events, dispatcher.dropped_events, dispatcher.flushed_events), (3, 0, 3))
+
+    def test5output_event_handlers_and_suppression(self):
+        """Check if the output_event_handlers of the event source and the suppressed detectors are considered."""
+        handler = RecordingEventHandler()
+        dispatcher = AsyncEventDispatcher([handler], self.analysis_context)
+        self.output_event_handlers = [self.stream_printer_event_handler]
+        self.receive_events(dispatcher, 1)
+        self.output_event_handlers = [dispatcher]
+        self.receive_events(dispatcher, 1)
+        self.assertEqual(self.output_event_handlers, [dispatcher, handler])
+        self.analysis_context.register_component(self, "TestDetector")
+        self.analysis_context.suppress_detector_list.add("TestDetector")
+        self.receive_events(dispatcher, 1)
+        dispatcher.stop()
+        self.assertEqual(handler.messages, ["event 0"])
+        self.assertEqual(dispatcher.queued_events, 1)
+
+    def test6validate_parameters(self):
+        """Check if the parameters are validated."""
+        self.assertRaises(TypeError, AsyncEventDispatcher, [], self.analysis_context, batch_size="1")
+        self.assertRaises(TypeError, AsyncEventDispatcher, [], self.analysis_context, batch_size=True)
+        self.assertRaises(ValueError, AsyncEventDispatcher, [], self.analysis_context, batch_size=0)
+        self.assertRaises(TypeError, AsyncEventDispatcher, [], self.analysis_context, linger_time="1")
+        self.assertRaises(ValueError, AsyncEventDispatcher, [], self.analysis_context, linger_time=-1)
+        self.assertRaises(TypeError, AsyncEventDispatcher, [], self.analysis_context, queue_size=1.5)
+        self.assertRaises(ValueError, AsyncEventDispatcher, [], self.analysis_context, queue_size=0)
+        self.assertRaises(TypeError, AsyncEventDispatcher, [], self.analysis_context, block_when_full=1)
+        AsyncEventDispatcher([], self.analysis_context, batch_size=1, linger_time=0, queue_size=1, block_when_full=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
+import json
 import time
 import unittest
+from aminer.events import JsonConverterHandler as JsonConverterHandlerModule
 from aminer.events.JsonConverterHandler import JsonConverterHandler
 from aminer.input.LogAtom import LogAtom
 from aminer.parsing.MatchContext import MatchContext
@@ -44,5 +46,68 @@ class JsonConverterHandlerTest(TestBase):
             self.__class__.__name__, self.description, self.event_message, self.persistence_id, round(self.t, 2), detection_timestamp, ""))
 
 
+    def receive_json_event(self, json_converter_handler, event_data=None):
+        """Send an event to the json_converter_handler and return the written json object."""
+        self.reset_output_stream()
+        log_atom = LogAtom(self.fixed_dme.fixed_data, ParserMatch(self.match_element), self.t, self)
+        if event_data is None:
+            event_data = {'AnalysisComponent': {'AffectedParserPaths': ['test/path/1', 'test/path/2']}}
+        json_converter_handler.receive_event(self.test_detector, self.event_message, self.sorted_log_lines, event_data, log_atom, self)
+        return self.output_stream.getvalue()
+
+    @unittest.skipIf(JsonConverterHandlerModule.orjson is None, "orjson is not installed.")
+    def test2orjson_serializer(self):
+        """Check if the orjson serializer writes the same pretty printed json as the json module."""
+        self.analysis_context.register_component(self, self.description)
+        output = self.receive_json_event(JsonConverterHandler([self.stream_printer_event_handler], self.analysis_context, serializer='orjson'))
+        detection_timestamp = json.loads(output)['LogData']['DetectionTimestamp']
+        self.assertEqual(output, self.expected_string % (
+            self.__class__.__name__, self.description, self.event_message, self.persistence_id, round(self.t, 2), detection_timestamp, ""))
+
+        # the compact output has no spaces and data not supported by orjson is serialized with the json module.
+        json_converter_handler = JsonConverterHandler([self.stream_printer_event_handler], self.analysis_context, pretty_print=False,
+                                                      serializer='orjson')
+        output = self.receive_json_event(json_converter_handler, {'StatusInfo': {1: 'a', 'b': [1.5, None, True]}})
+        self.assertEqual(output, '{"StatusInfo":{"1":"a","b":[1.5,null,true]}}\n')
+        output = self.receive_json_event(json_converter_handler, {'StatusInfo': {'big': 2**70}})
+        self.assertEqual(output, '{"StatusInfo": {"big": %d}}\n' % 2**70)
+
+    def test3annotated_match_paths(self):
+        """Check if only the annotated_match_paths are written to the AnnotatedMatchElement."""
+        self.analysis_context.register_component(self, self.description)
+        json_converter_handler = JsonConverterHandler([self.stream_printer_event_handler], self.analysis_context,
+                                                      annotated_match_paths=['match/s1', 'match/missing'])
+        output = json.loads(self.receive_json_event(json_converter_handler))
+        self.assertEqual(output['LogData']['AnnotatedMatchElement'], {'match/s1': ' pid='})
+        json_converter_handler.annotated_match_paths = ['match/missing']
+        output = json.loads(self.receive_json_event(json_converter_handler))
+        self.assertEqual(output['LogData']['AnnotatedMatchElement'], {})
+
+    def test4component_info(self):
+        """Check if the cached information of the component is written and the name of renamed components is updated."""
+        json_converter_handler = JsonConverterHandler([self.stream_printer_event_handler], self.analysis_context)
+        output = json.loads(self.receive_json_event(json_converter_handler))
+        self.assertEqual(output['AnalysisComponent']['AnalysisComponentIdentifier'], None)
+        self.assertEqual(json_converter_handler.component_info_cache, {})
+        self.analysis_context.register_component(self, self.description)
+        for _ in range(2):
+            output = json.loads(self.receive_json_event(json_converter_handler))
+            self.assertEqual(output['AnalysisComponent']['AnalysisComponentIdentifier'], 0)
+            self.assertEqual(output['AnalysisComponent']['AnalysisComponentType'], self.__class__.__name__)
+            self.assertEqual(output['AnalysisComponent']['AnalysisComponentName'], self.description)
+            self.assertEqual(output['AnalysisComponent']['PersistenceFileName'], self.persistence_id)
+        self.assertEqual(json_converter_handler.component_info_cache, {id(self): (0, self.__class__.__name__, self.persistence_id)})
+        self.analysis_context.rename_component(self.description, 'renamed')
+        output = json.loads(self.receive_json_event(json_converter_handler))
+        self.assertEqual(output['AnalysisComponent']['AnalysisComponentName'], 'renamed')
+
+    def test5validate_parameters(self):
+        """Check if the serializer and annotated_match_paths parameters are validated."""
+        self.assertRaises(ValueError, JsonConverterHandler, [], self.analysis_context, serializer='yaml')
+        self.assertRaises(TypeError, JsonConverterHandler, [], self.analysis_context, annotated_match_paths='match/s1')
+        self.assertRaises(TypeError, JsonConverterHandler, [], self.analysis_context, annotated_match_paths=[1])
+        JsonConverterHandler([], self.analysis_context, serializer='orjson', annotated_match_paths=[])
+
+
 if __name__ == '__main__':
     unittest.main()
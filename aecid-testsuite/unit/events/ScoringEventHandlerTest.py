@@ -0,0 +1,58 @@
+import random
+import unittest
+from aminer.events.ScoringEventHandler import ScoringEventHandler
+from unit.TestBase import TestBase, RecordingEventHandler, ScoringEventSource
+
+
+class ScoringEventHandlerTest(TestBase):
+    """Unittests for the ScoringEventHandler."""
+
+    def test1weights(self):
+        """Check if the configured weights and the default weight are used."""
+        handler = RecordingEventHandler()
+        scoring_event_handler = ScoringEventHandler([handler], self.analysis_context, weights={"a": 1, "b": 0})
+        scoring_event_handler.receive_event("Analysis.Test", "msg", [""], {"FrequencyData": {"IdValues": ["a", "b", "c"]}}, None,
+                                            ScoringEventSource())
+        self.assertEqual(handler.event_data[0]["FrequencyData"]["Scoring"], {"confidence_absolut": 1.5, "confidence_mean": 0.5})
+
+    def test2auto_weights(self):
+        """Check if the automatically calculated weights count the lists in the history containing the value."""
+        handler = RecordingEventHandler()
+        history_length = 5
+        scoring_event_handler = ScoringEventHandler([handler], self.analysis_context, auto_weights=True,
+                                                    auto_weights_history_length=history_length)
+        event_source = ScoringEventSource()
+        rnd = random.Random(1)
+        analysis_lists = [[rnd.choice("abcd") for _ in range(rnd.randint(1, 4))] for _ in range(50)]
+        for i, analysis_list in enumerate(analysis_lists):
+            scoring_event_handler.receive_event("Analysis.Test", "msg", [""], {"FrequencyData": {"IdValues": analysis_list}}, None,
+                                                event_source)
+            history = analysis_lists[max(0, i - history_length):i]
+            confidence_absolut = sum(10 / (10 + sum(value in value_list for value_list in history)) for value in analysis_list)
+            scoring = handler.event_data[i]["FrequencyData"]["Scoring"]
+            self.assertAlmostEqual(scoring["confidence_absolut"], confidence_absolut)
+            self.assertAlmostEqual(scoring["confidence_mean"], confidence_absolut / len(analysis_list))
+        history = analysis_lists[-history_length:]
+        self.assertEqual(scoring_event_handler.history_counts, {
+            value: sum(value in value_list for value_list in history) for value in "abcd" if any(value in value_list for value_list in history)})
+
+    def test3unhashable_values(self):
+        """Check if unhashable values are counted by their representation and later changes of the analyzed lists are ignored."""
+        handler = RecordingEventHandler()
+        scoring_event_handler = ScoringEventHandler([handler], self.analysis_context, weights={"a": 1}, auto_weights=True,
+                                                    auto_weights_history_length=2)
+        event_source = ScoringEventSource()
+        analysis_lists = [[{"id": 1}, "a"], [{"id": 1}, ["b"]], [{"id": 2}], [{"id": 1}]]
+        for analysis_list in analysis_lists:
+            scoring_event_handler.receive_event("Analysis.Test", "msg", [""], {"FrequencyData": {"IdValues": analysis_list}}, None,
+                                                event_source)
+            # the list is changed after the event was received.
+            analysis_list.append("c")
+        confidences = [scoring["FrequencyData"]["Scoring"]["confidence_absolut"] for scoring in handler.event_data]
+        for confidence, expected in zip(confidences, [2, 10 / 11 + 1, 1, 10 / 11]):
+            self.assertAlmostEqual(confidence, expected)
+        self.assertEqual(scoring_event_handler.history_counts, {repr({"id": 1}): 1, repr({"id": 2}): 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+from time import sleep
+from aminer.input.BufferedMultisourceAtomSync import BufferedMultisourceAtomSync
+from aminer.input.LogAtom import LogAtom
+from unit.TestBase import TestBase
+
+
+class RecordingAtomHandler:
+    """Atom handler storing the raw data of all received atoms."""
+
+    def __init__(self):
+        self.received = []
+
+    def receive_atom(self, log_atom):
+        """Store the raw data."""
+        self.received.append(log_atom.raw_data)
+        return True
+
+
+class BufferedMultisourceAtomSyncTest(TestBase):
+    """Unittests for the BufferedMultisourceAtomSync."""
+
+    sync_wait_time = 0.2
+
+    @staticmethod
+    def get_log_atom(source, timestamp):
+        """Create a LogAtom with the source and timestamp in the raw data."""
+        return LogAtom(b"%s %s" % (source.encode(), str(timestamp).encode()), None, timestamp, source)
+
+    def test1merge_sorted_log_atoms(self):
+        """Check if the atoms of all sources are accepted immediately and forwarded in timestamp order."""
+        handler = RecordingAtomHandler()
+        atom_sync = BufferedMultisourceAtomSync([handler], self.sync_wait_time)
+        for source, timestamps in (("a", [1, 4, 7]), ("b", [2, 3, 8]), ("c", [4, 5, 6])):
+            for timestamp in timestamps:
+                self.assertTrue(atom_sync.receive_atom(self.get_log_atom(source, timestamp)))
+        # nothing is forwarded before the atoms of all sources could be seen.
+        self.assertEqual(handler.received, [])
+        sleep(self.sync_wait_time)
+
+        # the atoms are forwarded until the source "a" has no pending atoms, as it might deliver atoms older than 8 afterwards.
+        self.assertTrue(atom_sync.receive_atom(self.get_log_atom("c", 9)))
+        self.assertEqual(handler.received, [b"a 1", b"b 2", b"b 3", b"a 4", b"c 4", b"c 5", b"c 6", b"a 7"])
+        self.assertEqual(atom_sync.idle_sources, {"a"})
+        self.assertTrue(atom_sync.receive_atom(self.get_log_atom("a", 10)))
+        self.assertEqual(handler.received[8:], [b"b 8"])
+        self.assertEqual(atom_sync.idle_sources, {"b"})
+
+        # the atoms of other sources are forwarded, when an idle source expired.
+        self.assertTrue(atom_sync.receive_atom(self.get_log_atom("c", 11)))
+        self.assertEqual(len(handler.received), 9)
+        sleep(self.sync_wait_time)
+        atom_sync.do_timer(0)
+        self.assertEqual(handler.received[9:], [b"c 9", b"a 10"])
+        self.assertEqual(sorted(atom_sync.sources_dict.keys()), ["a", "c"])
+        self.assertEqual(atom_sync.idle_sources, {"a"})
+        self.assertLessEqual(atom_sync.do_timer(0), self.sync_wait_time)
+
+    def test2no_timestamp_and_unsorted_log_atoms(self):
+        """Check if atoms without timestamp or older than the previous atom of the source are forwarded immediately."""
+        handler = RecordingAtomHandler()
+        atom_sync = BufferedMultisourceAtomSync([handler], self.sync_wait_time)
+        self.assertTrue(atom_sync.receive_atom(self.get_log_atom("a", 5)))
+        self.assertTrue(atom_sync.receive_atom(self.get_log_atom("a", None)))
+        self.assertTrue(atom_sync.receive_atom(self.get_log_atom("a", 3)))
+        self.assertEqual(handler.received, [b"a None", b"a 3"])
+        self.assertTrue(atom_sync.timestamps_unsorted_flag)
+
+    def test3full_queue(self):
+        """Check if atoms are refused, when the queue of the source is full and can not be merged."""
+        handler = RecordingAtomHandler()
+        atom_sync = BufferedMultisourceAtomSync([handler], self.sync_wait_time, queue_size=2)
+        self.assertTrue(atom_sync.receive_atom(self.get_log_atom("a", 1)))
+        self.assertTrue(atom_sync.receive_atom(self.get_log_atom("a", 2)))
+        self.assertFalse(atom_sync.receive_atom(self.get_log_atom("a", 3)))
+        self.assertTrue(atom_sync.receive_atom(self.get_log_atom("b", 2)))
+        sleep(self.sync_wait_time)
+        self.assertTrue(atom_sync.receive_atom(self.get_log_atom("a", 3)))
+        self.assertEqual(handler.received, [b"a 1", b"a 2", b"b 2"])
+
+    def test4flush(self):
+        """Check if all pending atoms are forwarded in timestamp order by flush, also in blocking mode and with idle sources."""
+        handler = RecordingAtomHandler()
+        atom_sync = BufferedMultisourceAtomSync([handler], 5)
+        for timestamp in range(1, 101):
+            self.assertTrue(atom_sync.receive_atom(self.get_log_atom("a", timestamp)))
+            if timestamp <= 50:
+                self.assertTrue(atom_sync.receive_atom(self.get_log_atom("b", timestamp)))
+        self.assertEqual(handler.received, [])
+        atom_sync.flush()
+        expected = [b"%s %d" % (source, timestamp) for timestamp in range(1, 51) for source in (b"a", b"b")]
+        expected += [b"a %d" % timestamp for timestamp in range(51, 101)]
+        self.assertEqual(handler.received, expected)
+        self.assertEqual(atom_sync.merge_heap, [])
+        self.assertEqual(atom_sync.idle_sources, {"a", "b"})
+
+        # the sources are idle again after flushing.
+        self.assertTrue(atom_sync.receive_atom(self.get_log_atom("a", 101)))
+        self.assertEqual(len(handler.received), 150)
+        atom_sync.flush()
+        self.assertEqual(handler.received[150:], [b"a 101"])
+
+    def test5input_validation(self):
+        """Check if the sync_wait_time and queue_size parameters are validated."""
+        self.assertRaises(TypeError, BufferedMultisourceAtomSync, [], "5")
+        self.assertRaises(TypeError, BufferedMultisourceAtomSync, [], True)
+        self.assertRaises(ValueError, BufferedMultisourceAtomSync, [], 0)
+        self.assertRaises(TypeError, BufferedMultisourceAtomSync, [], 5, 1.5)
+        self.assertRaises(TypeError, BufferedMultisourceAtomSync, [], 5, True)
+        self.assertRaises(ValueError, BufferedMultisourceAtomSync, [], 5, 0)
+        BufferedMultisourceAtomSync([], 0.5, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
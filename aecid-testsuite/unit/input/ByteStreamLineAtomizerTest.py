@@ -6,6 +6,48 @@ import sys
 from unit.TestBase import TestBase
 
 
+class RefusingAtomHandler:
+    """Atom handler storing the raw data of received atoms, which refuses every atom with the given raw data once."""
+
+    def __init__(self, refused_data):
+        self.refused_data = refused_data
+        self.received = []
+
+    def receive_atom(self, log_atom):
+        """Store the raw data or refuse the atom."""
+        if log_atom.raw_data == self.refused_data:
+            self.refused_data = None
+            return False
+        self.received.append(log_atom.raw_data)
+        return True
+
+
+class JsonDataRecordingModelElement(AnyByteDataModelElement):
+    """Model element storing the decoded JSON data of the MatchContext before matching all data."""
+
+    def __init__(self, element_id):
+        super().__init__(element_id)
+        self.json_data = []
+
+    def get_match_element(self, path, match_context):
+        """Store the decoded JSON data and match all data."""
+        self.json_data.append(match_context.get_json_data())
+        return super().get_match_element(path, match_context)
+
+
+class ParseCountingModelElement(AnyByteDataModelElement):
+    """Model element counting how often each data is parsed."""
+
+    def __init__(self, element_id):
+        super().__init__(element_id)
+        self.parse_counts = {}
+
+    def get_match_element(self, path, match_context):
+        """Count the parsed data and match all data."""
+        self.parse_counts[match_context.match_data] = self.parse_counts.get(match_context.match_data, 0) + 1
+        return super().get_match_element(path, match_context)
+
+
 class ByteStreamLineAtomizerTest(TestBase):
     """Unittests for the ByteStreamLineAtomizer."""
 
@@ -121,6 +163,76 @@ class ByteStreamLineAtomizerTest(TestBase):
             single_line_json_data.rsplit(b'}', 2)[0]) + 1)
         self.assertEqual(self.output_stream.getvalue(), '')
 
+    def test8batch_mode(self):
+        """Check if the batch mode consumes the same data and dispatches the same atoms and events as the line by line mode."""
+        data = b'line 1\nline 2\n' + b'x' * 30 + b'\nrefused line\nline 4\nincomplete'
+        results = []
+        for batch_mode in (False, True):
+            self.reset_output_stream()
+            atom_handler = RefusingAtomHandler(b'refused line')
+            byte_stream_line_atomizer = ByteStreamLineAtomizer(
+                AnyByteDataModelElement('s'), [atom_handler], [self.stream_printer_event_handler], 20, [], batch_mode=batch_mode)
+            consumed_length = byte_stream_line_atomizer.consume_data(data, False)
+            self.assertEqual(consumed_length, data.find(b'refused line'))
+            self.assertEqual(byte_stream_line_atomizer.consume_data(data[consumed_length:], True), len(data) - consumed_length)
+            results.append((atom_handler.received, self.output_stream.getvalue()))
+            self.assertEqual(atom_handler.received, [b'line 1', b'line 2', b'refused line', b'line 4'])
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[1][1], 'Overlong line detected (1 lines)\n  %s\n\nIncomplete last line (1 lines)\n  incomplete\n\n' % (
+            'x' * 30))
+
+        # overlong lines spanning multiple calls.
+        for batch_mode in (False, True):
+            self.reset_output_stream()
+            byte_stream_line_atomizer = ByteStreamLineAtomizer(
+                AnyByteDataModelElement('s'), [], [self.stream_printer_event_handler], 20, [], batch_mode=batch_mode)
+            self.assertEqual(byte_stream_line_atomizer.consume_data(b'x' * 30, False), 30)
+            self.assertEqual(byte_stream_line_atomizer.consume_data(b'xxx\nline', False), 4)
+            self.assertEqual(byte_stream_line_atomizer.consume_data(b'line', True), 4)
+            self.assertEqual(self.output_stream.getvalue(), 'Start of overlong line detected (1 lines)\n  %s\n\nIncomplete last line (1 lines)\n'
+                                                            '  line\n\n' % ('x' * 30))
+
+    def test9json_data_in_match_context(self):
+        """Check if the JSON objects decoded while framing the data are passed to the parsing model in the MatchContext."""
+        model = JsonDataRecordingModelElement('s')
+        byte_stream_line_atomizer = ByteStreamLineAtomizer(model, [], [self.stream_printer_event_handler], 300, [], json_format=True)
+        data = b'{"a": 1, "b": [2.5]}\n{\n\t"c": {"d": null}}{"e": "line\nbreak"}\nsome log line.\n'
+        self.assertEqual(byte_stream_line_atomizer.consume_data(data, True), len(data))
+        # the json_machine accepts the line break in the string, but json.loads does not decode it.
+        self.assertEqual(model.json_data, [{"a": 1, "b": [2.5]}, {"c": {"d": None}}, None, None])
+
+
+    def test10batch_mode_refused_atoms(self):
+        """Check if the batch mode parses every line only once and in order, when the downstream handlers refuse atoms."""
+        model = ParseCountingModelElement('s')
+        lines = [b'line %d' % i for i in range(10)]
+        data = b'\n'.join(lines) + b'\n'
+        received = []
+        refused = set(lines[1::2])
+
+        class AlternatingAtomHandler:
+            """Atom handler refusing every other atom once."""
+
+            @staticmethod
+            def receive_atom(log_atom):
+                """Refuse the atom once or store the raw data."""
+                if log_atom.raw_data in refused:
+                    refused.remove(log_atom.raw_data)
+                    return False
+                received.append(log_atom.raw_data)
+                return True
+
+        byte_stream_line_atomizer = ByteStreamLineAtomizer(
+            model, [AlternatingAtomHandler()], [self.stream_printer_event_handler], 20, [], batch_mode=True)
+        consumed_length = 0
+        while consumed_length < len(data):
+            result = byte_stream_line_atomizer.consume_data(data[consumed_length:], False)
+            if result > 0:
+                consumed_length += result
+        self.assertEqual(received, lines)
+        self.assertEqual(list(model.parse_counts.keys()), lines)
+        self.assertEqual(set(model.parse_counts.values()), {1})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 from aminer.input.JsonStateMachine import json_machine, constant_machine, string_machine, utf8_machine, hex_machine, number_machine,\
-    array_machine, object_machine
+    array_machine, object_machine, run_json_machine, find_json_object
 from unit.TestBase import TestBase
 
 
@@ -664,6 +664,26 @@ class ByteStreamLineAtomizerTest(TestBase):
         state = json_machine(raise_error)
         self.assertIsNotNone(state(ord('{')))
 
+    def test30find_json_object(self):
+        """Test if find_json_object finds the same objects and offsets as the json_machine, but only returns objects valid for json.loads."""
+        objects = [
+            b'{"a": 1, "b": [true, false, null], "c": {"d": "e\\"f"}}\n', b'\n {"a": "{\\"}"}\r\n', b'{"a": 1}{"b": 2}',
+            b'{\n  "a": 1,\n  "b": "}"\n}\n{"c": 3}', b'{"a": "line\nbreak"}\n', b'{"a": [0], "b": [1]}\n', b'{"a": [0]}\n',
+            b'{"a": 0\t}\n', b'{"a": NaN}\n', b'{"a": 1 2}\n', b'{"a": 1,}\n', b'{"a": "\xc3\xbc\xe2\x82\xac"}\n', b'{"a": "\xff"}\n',
+            b'{"a": {"b": ', b'{"a": {"b": "}', b'[1, 2]\n', b'garbage\n', b'{}', b'  ', b'']
+        for data in objects:
+            for max_line_length in (5, 20, 1000):
+                for start in range(min(len(data), 3)):
+                    i, finished, invalid, json_data = run_json_machine(data, start, max_line_length)
+                    if b"line\nbreak" in data or b"1 2" in data:
+                        # control characters in strings and separate numbers are accepted by the json_machine, but not by json.loads.
+                        json_data = None
+                    self.assertEqual(find_json_object(data, start, max_line_length), (i, finished, invalid, json_data))
+        self.assertEqual(find_json_object(b'{"a": 1}{"b": 2}', 8, 1000), (7, True, False, {"b": 2}))
+        self.assertEqual(find_json_object(b'{"a": {"b": ', 0, 1000), (11, False, False, None))
+        self.assertEqual(find_json_object(b'{"a": [0]}\n', 0, 1000), (8, False, True, None))
+        self.assertEqual(find_json_object(b'{"a": "line\nbreak"}\n', 0, 1000), (18, True, False, None))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+from aminer.parsing.CompiledModelElement import CompiledModelElement
+from aminer.parsing.DecimalFloatValueModelElement import DecimalFloatValueModelElement
+from aminer.parsing.DecimalIntegerValueModelElement import DecimalIntegerValueModelElement
+from aminer.parsing.DelimitedDataModelElement import DelimitedDataModelElement
+from aminer.parsing.FirstMatchModelElement import FirstMatchModelElement
+from aminer.parsing.FixedDataModelElement import FixedDataModelElement
+from aminer.parsing.FixedWordlistDataModelElement import FixedWordlistDataModelElement
+from aminer.parsing.IpAddressDataModelElement import IpAddressDataModelElement
+from aminer.parsing.MatchContext import MatchContext
+from aminer.parsing.OptionalMatchModelElement import OptionalMatchModelElement
+from aminer.parsing.RepeatedElementDataModelElement import RepeatedElementDataModelElement
+from aminer.parsing.SequenceModelElement import SequenceModelElement
+from aminer.parsing.VariableByteDataModelElement import VariableByteDataModelElement
+from unit.TestBase import TestBase, DummyMatchContext
+
+
+class CompiledModelElementTest(TestBase):
+    """Unittests for the CompiledModelElement."""
+
+    id_ = "model"
+    path = "path"
+    alphabet = b"abcdefghijklmnopqrstuvwxyz"
+
+    def get_model(self):
+        """Build a model using all compiled element types as well as elements, which are not compiled."""
+        return FirstMatchModelElement(self.id_, [
+            SequenceModelElement("login", [
+                FixedDataModelElement("s0", b"login user="),
+                DelimitedDataModelElement("user", b" "),
+                FixedDataModelElement("s1", b" from "),
+                IpAddressDataModelElement("ip"),
+                OptionalMatchModelElement("opt", SequenceModelElement("port", [
+                    FixedDataModelElement("s0", b":"), DecimalIntegerValueModelElement("port")]))]),
+            SequenceModelElement("logout", [
+                FixedDataModelElement("s0", b"logout user="),
+                VariableByteDataModelElement("user", self.alphabet)]),
+            SequenceModelElement("status", [
+                FixedWordlistDataModelElement("level", [b"INFO", b"WARN", b"ERROR"]),
+                FixedDataModelElement("s0", b": load "),
+                DecimalFloatValueModelElement("load", value_sign_type=DecimalFloatValueModelElement.SIGN_TYPE_OPTIONAL)]),
+            # this branch can start with any byte and has to be tried before the following branches.
+            SequenceModelElement("word", [
+                VariableByteDataModelElement("word", self.alphabet),
+                FixedDataModelElement("s0", b"!")]),
+            FirstMatchModelElement("number", [
+                DecimalIntegerValueModelElement("int"),
+                FixedDataModelElement("minus", b"-")]),
+            RepeatedElementDataModelElement("repeated", FixedDataModelElement("x", b"x"))])
+
+    def get_match_tree(self, match_element):
+        """Convert a match_element to comparable tuples."""
+        if match_element is None:
+            return None
+        children = None
+        if match_element.children is not None:
+            children = [self.get_match_tree(child) for child in match_element.children]
+        return match_element.path, match_element.match_string, match_element.match_object, children
+
+    def test1get_match_element_equals_model(self):
+        """Check if the compiled model returns the same MatchElements and offsets as the interpreted model."""
+        model = self.get_model()
+        compiled_model = CompiledModelElement(model)
+        for data in [
+                b"login user=alice from 10.0.0.1:22 rest", b"login user=alice from 10.0.0.1", b"login user=alice from x",
+                b"logout user=bob", b"logout", b"INFO: load 0.5", b"ERROR: load -12.25 high", b"WARN load", b"hello!", b"xyz!",
+                b"xx", b"123", b"-", b"-3", b"!", b"", b"\xff"]:
+            match_context = MatchContext(data)
+            compiled_match_context = MatchContext(data)
+            match_element = model.get_match_element(self.path, match_context)
+            compiled_match_element = compiled_model.get_match_element(self.path, compiled_match_context)
+            self.assertEqual(self.get_match_tree(match_element), self.get_match_tree(compiled_match_element))
+            self.assertEqual(match_context.offset, compiled_match_context.offset)
+            self.assertEqual(match_context.match_data, compiled_match_context.match_data)
+
+    def test2get_match_element_valid_match(self):
+        """Parse matching substring from MatchContext and check if the MatchContext was updated with all characters."""
+        data = b"logout user=bob"
+        match_context = DummyMatchContext(data)
+        compiled_model = CompiledModelElement(self.get_model())
+        match_element = compiled_model.get_match_element(self.path, match_context)
+        self.compare_match_results(data, match_element, match_context, self.id_ + "/logout", self.path, data, data, match_element.children)
+        self.assertEqual(match_element.children[1].path, self.path + "/" + self.id_ + "/logout/user")
+
+        # compiled matchers are cached for every parent path.
+        match_context = DummyMatchContext(data)
+        match_element = compiled_model.get_match_element("other", match_context)
+        self.compare_match_results(data, match_element, match_context, self.id_ + "/logout", "other", data, data, match_element.children)
+        self.assertEqual(sorted(compiled_model.compiled_matchers.keys()), ["other", self.path])
+
+    def test3get_match_element_no_match(self):
+        """Parse not matching substring from MatchContext and check if the MatchContext was not changed."""
+        compiled_model = CompiledModelElement(SequenceModelElement(self.id_, [
+            FixedDataModelElement("s0", b"logout user="), VariableByteDataModelElement("user", self.alphabet)]))
+        for data in [b"logout user=", b"login user=bob", b""]:
+            match_context = DummyMatchContext(data)
+            match_element = compiled_model.get_match_element(self.path, match_context)
+            self.compare_no_match_results(data, match_element, match_context)
+
+    def test4branch_hits(self):
+        """Check if the matches of the FirstMatchModelElement branches are counted by the compiled model."""
+        model = self.get_model()
+        compiled_model = CompiledModelElement(model)
+        for data in [b"logout user=bob", b"INFO: load 0.5", b"WARN: load 1", b"hello!", b"123", b"-", b"xx", b"unknown"]:
+            compiled_model.get_match_element(self.path, MatchContext(data))
+        self.assertEqual(model.branch_hits, [0, 1, 2, 1, 2, 1])
+        self.assertEqual(model.children[4].get_branch_hits(), [("int", 1), ("minus", 1)])
+        self.assertEqual(compiled_model.get_first_bytes(), model.get_first_bytes())
+
+    def test5element_input_validation(self):
+        """Check if element_id is taken from the model_element and the model_element is validated."""
+        model = self.get_model()
+        self.assertEqual(CompiledModelElement(model).element_id, model.element_id)
+        self.assertRaises(TypeError, CompiledModelElement, None)
+        self.assertRaises(TypeError, CompiledModelElement, b"model")
+        self.assertRaises(TypeError, CompiledModelElement, [model])
+
+
+if __name__ == "__main__":
+    unittest.main()
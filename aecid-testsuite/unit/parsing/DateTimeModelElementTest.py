@@ -684,5 +684,44 @@ def run():
             print("Date with %z parameter (18/Oct/2021:16:12:55 +0000): ", t)
 
 
+    def test26get_first_bytes(self):
+        """Check if the first bytes are derived from fixed strings and month names at the start of the date_format."""
+        self.assertEqual(DateTimeModelElement(self.id_, b"[%d/%b/%Y:%H:%M:%S +0000]").get_first_bytes(), frozenset(b"["))
+        self.assertEqual(DateTimeModelElement(self.id_, b"Date %%d: %d.%m.%Y").get_first_bytes(), frozenset(b"D"))
+        self.assertEqual(DateTimeModelElement(self.id_, b"%b %d %H:%M:%S").get_first_bytes(), frozenset(b"JFMASOND"))
+        self.assertIsNone(DateTimeModelElement(self.id_, b"%d.%m.%Y %H:%M:%S").get_first_bytes())
+        self.assertIsNone(DateTimeModelElement(self.id_, b"%s").get_first_bytes())
+
+    def test27prefix_cache(self):
+        """Check if the parsed prefix before the seconds is cached and the results are the same as without the cache."""
+        self.assertEqual(DateTimeModelElement(self.id_, b"%b %d %H:%M:%S").prefix_length, 13)
+        self.assertEqual(DateTimeModelElement(self.id_, b"[%d/%b/%Y:%H:%M:%S.%f%z").prefix_length, 19)
+        self.assertEqual(DateTimeModelElement(self.id_, b"%H:%M:%S").prefix_part_count, 0)
+        self.assertEqual(DateTimeModelElement(self.id_, b"%b %d %H:%M:%S %Y").prefix_part_count, 0)
+        self.assertEqual(DateTimeModelElement(self.id_, b"%s").prefix_part_count, 0)
+
+        date_time_model_element = DateTimeModelElement(self.id_, b"%d.%m %H:%M:%S", start_year=2020, max_time_jump_seconds=10)
+        date_time_model_element.get_match_element(self.path, MatchContext(b"31.12 23:59:50"))
+        self.assertEqual(date_time_model_element.cached_prefix, b"31.12 23:59:")
+        self.assertEqual(date_time_model_element.cached_prefix_seconds, 1609459140)
+
+        # invalid seconds, year wraps and time jumps over max_time_jump_seconds with the same prefix are parsed without the cache.
+        dates = [b"31.12 23:59:52", b"31.12 23:59:60", b"31.12 23:59:+5", b"01.01 00:00:01", b"01.01 00:00:02", b"01.01 00:00:40",
+                 b"01.01 00:00:45", b"29.02 10:00:00", b"29.02 10:00:01"]
+        uncached_model_element = DateTimeModelElement(self.id_, b"%d.%m %H:%M:%S", start_year=2020, max_time_jump_seconds=10)
+        uncached_model_element.prefix_part_count = 0
+        uncached_model_element.get_match_element(self.path, MatchContext(b"31.12 23:59:50"))
+        for date in dates:
+            match_element = date_time_model_element.get_match_element(self.path, MatchContext(date))
+            uncached_match_element = uncached_model_element.get_match_element(self.path, MatchContext(date))
+            if uncached_match_element is None:
+                self.assertIsNone(match_element)
+            else:
+                self.assertEqual(match_element.match_object, uncached_match_element.match_object)
+            self.assertEqual(date_time_model_element.last_parsed_seconds, uncached_model_element.last_parsed_seconds)
+            self.assertEqual(date_time_model_element.start_year, uncached_model_element.start_year)
+        self.assertEqual(date_time_model_element.start_year, 2021)
+        self.assertIsNone(uncached_model_element.cached_prefix)
+
 if __name__ == "__main__":
     unittest.main()
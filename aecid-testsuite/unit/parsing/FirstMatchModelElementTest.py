@@ -1,5 +1,9 @@
 import unittest
+from aminer.parsing.DecimalIntegerValueModelElement import DecimalIntegerValueModelElement
 from aminer.parsing.FirstMatchModelElement import FirstMatchModelElement
+from aminer.parsing.FixedDataModelElement import FixedDataModelElement
+from aminer.parsing.SequenceModelElement import SequenceModelElement
+from aminer.parsing.VariableByteDataModelElement import VariableByteDataModelElement
 from aminer.parsing.MatchContext import MatchContext
 from aminer.parsing.MatchElement import MatchElement
 from unit.TestBase import TestBase, DummyMatchContext, DummyFixedDataModelElement
@@ -115,5 +119,62 @@ class FirstDataModelElementTest(TestBase):
         self.assertRaises(AttributeError, model_element.get_match_element, self.path, model_element)
 
 
+    def test6get_match_element_first_byte_index(self):
+        """Check if only children that can match the first byte are tried and the order of the children is kept."""
+        fixed_me = FixedDataModelElement("fixed", b"Random string")
+        decimal_me = DecimalIntegerValueModelElement("decimal")
+        sequence_me = SequenceModelElement("sequence", [FixedDataModelElement("s0", b"Ran"), VariableByteDataModelElement("s1", b"dom")])
+        children = [sequence_me, self.me2, fixed_me, decimal_me]
+        first_match_me = FirstMatchModelElement(self.id_, children)
+        self.assertEqual(first_match_me.default_branches, ((1, self.me2),))
+        self.assertEqual(first_match_me.first_byte_index[ord("R")], ((0, sequence_me), (1, self.me2), (2, fixed_me)))
+        self.assertEqual(first_match_me.first_byte_index[ord("1")], ((1, self.me2), (3, decimal_me)))
+        self.assertIsNone(first_match_me.get_first_bytes())
+        self.assertEqual(FirstMatchModelElement(self.id_, [fixed_me, decimal_me]).get_first_bytes(), frozenset(b"R0123456789"))
+
+        data = b"Random string23."
+        value = b"Random"
+        match_context = DummyMatchContext(data)
+        match_element = first_match_me.get_match_element(self.path, match_context)
+        self.compare_match_results(data, match_element, match_context, self.id_ + "/sequence", self.path, value, value,
+                                   match_element.children)
+
+        data = b"Random string42."
+        value = b"Random"
+        match_context = DummyMatchContext(data)
+        match_element = first_match_me.get_match_element(self.path, match_context)
+        self.compare_match_results(data, match_element, match_context, self.id_ + "/sequence", self.path, value, value,
+                                   match_element.children)
+
+        first_match_me = FirstMatchModelElement(self.id_, [self.me2, fixed_me, decimal_me])
+        data = b"Random string42."
+        value = b"Random string"
+        match_context = DummyMatchContext(data)
+        match_element = first_match_me.get_match_element(self.path, match_context)
+        self.compare_match_results(data, match_element, match_context, self.id_ + "/fixed", self.path, value, value, None)
+
+        data = b"123"
+        match_context = DummyMatchContext(data)
+        match_element = first_match_me.get_match_element(self.path, match_context)
+        self.compare_match_results(data, match_element, match_context, self.id_ + "/decimal", self.path, data, 123, None)
+
+        data = b"string"
+        match_context = DummyMatchContext(data)
+        match_element = first_match_me.get_match_element(self.path, match_context)
+        self.compare_no_match_results(data, match_element, match_context)
+
+        data = b""
+        match_context = DummyMatchContext(data)
+        match_element = first_match_me.get_match_element(self.path, match_context)
+        self.compare_no_match_results(data, match_element, match_context)
+
+    def test7branch_hits(self):
+        """Check if the matches of every child are counted."""
+        first_match_me = FirstMatchModelElement(self.id_, self.children)
+        for data in [b"The first fixed string.", b"Random string23.", b"Random string2", b"Random string24.", b"Random string42"]:
+            first_match_me.get_match_element(self.path, DummyMatchContext(data))
+        self.assertEqual(first_match_me.branch_hits, [1, 1, 2])
+        self.assertEqual(first_match_me.get_branch_hits(), [("me1", 1), ("me2", 1), ("me3", 2)])
+
 if __name__ == "__main__":
     unittest.main()
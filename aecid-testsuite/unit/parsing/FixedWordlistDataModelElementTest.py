@@ -107,5 +107,28 @@ class FixedWordlistDataModelElementTest(TestBase):
         self.assertRaises(AttributeError, model_element.get_match_element, self.path, model_element)
 
 
+    def test6get_first_bytes(self):
+        """Check if the first bytes of all words are returned."""
+        self.assertEqual(FixedWordlistDataModelElement(self.id_, self.wordlist).get_first_bytes(), frozenset(b"w"))
+        self.assertEqual(FixedWordlistDataModelElement(self.id_, [b"GET", b"POST", b"PUT"]).get_first_bytes(), frozenset(b"GP"))
+
+    def test7get_match_element_word_trie(self):
+        """Check if the word_trie finds the same word_pos as searching the wordlist in order."""
+        wordlist = [b"SYSCALL", b"SYS", b"PATH", b"PROCTITLE", b"PROC", b"EXECVE", b"USER_AUTH", b"USER_ACCT", b"USER", b"U", b""]
+        fixed_wordlist_dme = FixedWordlistDataModelElement(self.id_, wordlist)
+        for data in [b"SYSCALL arch", b"SYSCAL", b"SYS", b"PROCTITLE", b"PROCTIT", b"USER_START", b"USER_AUTH", b"UID", b"EXEC", b"", b"x"]:
+            index = [word_pos for word_pos, word in enumerate(wordlist) if data.startswith(word)][0]
+            value = wordlist[index]
+            match_context = DummyMatchContext(data)
+            match_element = fixed_wordlist_dme.get_match_element(self.path, match_context)
+            self.compare_match_results(data, match_element, match_context, self.id_, self.path, value, index, None)
+
+        # words are matched at the current offset of the MatchContext.
+        match_context = MatchContext(b"type=PATH msg")
+        match_context.update(b"type=")
+        match_element = fixed_wordlist_dme.get_match_element(self.path, match_context)
+        self.assertEqual(match_element.match_object, 2)
+        self.assertEqual(match_context.match_data, b" msg")
+
 if __name__ == "__main__":
     unittest.main()
@@ -874,6 +874,31 @@ class JsonModelElementTest(TestBase):
         """Test if an exception is thrown if the optional_key_prefix is the same as the nullable_key_prefix."""
         self.assertRaises(ValueError, JsonModelElement, self.id_, self.key_parser_dict, optional_key_prefix="+", nullable_key_prefix="+")
 
+    def test19get_match_element_decoded_json_data(self):
+        """Check if the JSON data decoded by the atomizer is reused, when it is decoded the same way as by the JsonModelElement."""
+        json_model_element = JsonModelElement(self.id_, {
+            "a": DecimalFloatValueModelElement(self.id_, exponent_type=DecimalFloatValueModelElement.EXP_TYPE_OPTIONAL)},
+            allow_all_fields=True)
+        for data, reused in ((b'{"a": 1.5, "b": "x"}', True), (b'{"a": 1E-1, "b": "x"}', False), (b'{"a": 1.5, "b": "x\\\\y"}', False),
+                             (b'{"a": 1.5, "b": "x\\u00fc"}', False)):
+            json_data = json.loads(data)
+            match_context = MatchContext(data)
+            match_element = json_model_element.get_match_element(self.path, match_context)
+            decoded_match_context = MatchContext(data, json_data)
+            decoded_match_element = json_model_element.get_match_element(self.path, decoded_match_context)
+            self.assertEqual(decoded_match_context.offset, match_context.offset)
+            self.assertEqual(decoded_match_element.match_string, match_element.match_string)
+            self.assertEqual(decoded_match_element.match_object, match_element.match_object)
+            self.assertEqual([child.match_object for child in decoded_match_element.children],
+                             [child.match_object for child in match_element.children])
+            self.assertEqual(decoded_match_element.match_object is json_data, reused)
+
+        # the decoded data is not valid after the offset was moved.
+        data = b' {"a": 1.5, "b": "x"}'
+        match_context = MatchContext(data, json.loads(data))
+        match_context.update(b" ")
+        self.assertIsNot(json_model_element.get_match_element(self.path, match_context).match_object, match_context.json_data)
+
 
 if __name__ == "__main__":
     unittest.main()
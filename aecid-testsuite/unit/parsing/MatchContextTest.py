@@ -90,6 +90,48 @@ class MatchContextTest(TestBase):
         self.assertRaises(TypeError, match_context.update, 123)
         self.assertRaises(TypeError, match_context.update, 123.22)
 
+    def test7_match_context_offset(self):
+        """Check if the MatchContext only moves the offset and keeps the original data."""
+        data = b"this is an example of a log line."
+        match_context = MatchContext(data)
+        match_context.update(b"this is ")
+        self.assertEqual(match_context.offset, 8)
+        self.assertIs(match_context.data, data)
+        self.assertEqual(match_context.match_data, b"an example of a log line.")
+        start_offset = match_context.offset
+        match_context.update(b"an example")
+        self.assertEqual(match_context.get_match_string(start_offset), b"an example")
+        match_context.offset = start_offset
+        self.assertEqual(match_context.match_data, b"an example of a log line.")
+
+        # setting match_data to a suffix of the data only moves the offset.
+        match_context.match_data = b"of a log line."
+        self.assertEqual(match_context.offset, 19)
+        self.assertIs(match_context.data, data)
+        match_context.match_data = data
+        self.assertEqual(match_context.offset, 0)
+
+        # replacing the unmatched data keeps the already matched data.
+        match_context.update(b"this is ")
+        match_context.match_data = b"a new line."
+        self.assertEqual(match_context.data, b"this is a new line.")
+        self.assertEqual(match_context.offset, 8)
+        self.assertEqual(match_context.match_data, b"a new line.")
+
+    def test8_match_context_json_data(self):
+        """Check if the decoded JSON data is only returned as long as nothing was matched and the data was not replaced."""
+        data = b'{"a": 1}'
+        json_data = {"a": 1}
+        self.assertIsNone(MatchContext(data).get_json_data())
+        match_context = MatchContext(data, json_data)
+        self.assertIs(match_context.get_json_data(), json_data)
+        match_context.update(b"{")
+        self.assertIsNone(match_context.get_json_data())
+        match_context.offset = 0
+        self.assertIs(match_context.get_json_data(), json_data)
+        match_context.match_data = b'{"a": 2}'
+        self.assertIsNone(match_context.get_json_data())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -147,6 +147,17 @@ class MatchElementTest(TestBase):
         self.assertRaises(TypeError, match_element.annotate_match, ())
         self.assertRaises(TypeError, match_element.annotate_match, set())
 
+    def test14create_unchecked(self):
+        """Check if create_unchecked() creates the same MatchElement as the validating constructor without a __dict__."""
+        child = MatchElement.create_unchecked(self.path + "/child", self.match_string, self.match_object, None)
+        match_element = MatchElement.create_unchecked(self.path, self.match_string, self.match_object, [child])
+        expected = MatchElement(self.path, self.match_string, self.match_object, [
+            MatchElement(self.path + "/child", self.match_string, self.match_object, None)])
+        self.assertEqual(match_element.serialize_object(), expected.serialize_object())
+        self.assertEqual(match_element.annotate_match(""), expected.annotate_match(""))
+        self.assertFalse(hasattr(match_element, "__dict__"))
+        self.assertRaises(AttributeError, setattr, match_element, "other", 1)
+
 
 if __name__ == "__main__":
     unittest.main()
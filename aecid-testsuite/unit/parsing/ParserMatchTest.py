@@ -50,5 +50,64 @@ class ParserMatchTest(TestBase):
         self.assertRaises(TypeError, ParserMatch, set())
 
 
+    def test4get_match_dictionary_repeated_paths(self):
+        """Test if repeated paths in the same list of children are numbered and equal match objects get the same number."""
+        values = [b"a", b"b", 1, True, 1.0, b"a", b"c"]
+        children = [MatchElement("root/value", value if isinstance(value, bytes) else b"x", value, None) for value in values]
+        root_element = MatchElement("root", b"root", b"root", children + [MatchElement("root/single", b"s", b"s", None)])
+        dictionary = ParserMatch(root_element).get_match_dictionary()
+        self.assertEqual(dictionary["root/value"], children)
+        self.assertEqual(dictionary["root/value/0"], children[5])
+        self.assertEqual(dictionary["root/value/1"], children[1])
+        # True is equal to 1 and an instance of int, but 1.0 is no instance of int.
+        self.assertEqual(dictionary["root/value/2"], children[3])
+        self.assertEqual(dictionary["root/value/3"], children[4])
+        self.assertEqual(dictionary["root/value/4"], children[6])
+        self.assertNotIn("root/value/5", dictionary)
+        self.assertEqual(dictionary["root/single"], root_element.children[-1])
+
+        # unhashable match objects are compared one by one.
+        children = [MatchElement("root/list", b"x", value, None) for value in [[1], [2], [1]]]
+        dictionary = ParserMatch(MatchElement("root", b"root", b"root", children)).get_match_dictionary()
+        self.assertEqual(dictionary["root/list/0"], children[2])
+        self.assertEqual(dictionary["root/list/1"], children[1])
+
+    def test5get_single_path(self):
+        """Test if single paths are found without building the match dictionary and the results are equal to the match dictionary."""
+        a2 = MatchElement("root/a/a2", b"a2", b"a2", None)
+        a1 = MatchElement("root/a", b"a1", b"a1", [a2])
+        repeated = [MatchElement("root/b/value", b"1", 1, None), MatchElement("root/b/value", b"2", 2, None)]
+        b1 = MatchElement("root/b", b"b1", b"b1", repeated)
+        root_element = MatchElement("root", b"root", b"root", [a1, b1])
+        parser_match = ParserMatch(root_element)
+        self.assertEqual(parser_match.get("root/a/a2"), a2)
+        self.assertEqual(parser_match.get("root/b/value/1"), repeated[1])
+        self.assertEqual(parser_match.get("root/b/value"), repeated)
+        self.assertIsNone(parser_match.get("root/c"))
+        self.assertEqual(parser_match.get("root/c", a1), a1)
+        self.assertTrue("root/a" in parser_match)
+        self.assertFalse("root/a/a3" in parser_match)
+        self.assertIsNone(parser_match.match_dictionary)
+
+        dictionary = ParserMatch(root_element).get_match_dictionary()
+        for path in list(dictionary.keys()) + ["root/c", "root/a/a2/a3", "root/b/value/2"]:
+            parser_match = ParserMatch(root_element)
+            self.assertEqual(parser_match.get(path), dictionary.get(path))
+            self.assertEqual(path in parser_match, path in dictionary)
+        # the match dictionary is used, when it was built already.
+        self.assertEqual(parser_match.get_match_dictionary(), dictionary)
+        self.assertEqual(parser_match.get("root/a"), a1)
+
+    def test6get_match_dictionary_key_order(self):
+        """Test if the keys of repeated paths are ordered by the match lists and do not depend on the hash seed."""
+        names = ["p%d" % i for i in range(10)]
+        children = [MatchElement("root/" + name, b"x", value, None) for value in (1, 2) for name in names]
+        children.append(MatchElement("root/single", b"s", b"s", None))
+        dictionary = ParserMatch(MatchElement("root", b"root", b"root", children)).get_match_dictionary()
+        expected_keys = ["root"] + ["root/" + name for name in names]
+        expected_keys += ["root/%s/%d" % (name, pos) for pos in range(2) for name in names] + ["root/single"]
+        self.assertEqual(list(dictionary.keys()), expected_keys)
+
+
 if __name__ == "__main__":
     unittest.main()
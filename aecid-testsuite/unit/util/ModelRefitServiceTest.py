@@ -0,0 +1,110 @@
+import multiprocessing
+import time
+import unittest
+from aminer.util.ModelRefitService import ModelRefitService
+from unit.TestBase import TestBase
+
+
+def fit_square(value, delay=0):
+    """Return the square of the value after delay seconds."""
+    time.sleep(delay)
+    return value * value
+
+
+def fit_failing(value):
+    """Raise an error."""
+    raise ValueError(value)
+
+
+class ModelRefitServiceTest(TestBase):
+    """Unittests for the ModelRefitService."""
+
+    def test1inline_refits(self):
+        """Check if the results are applied immediately, when no worker processes are used."""
+        service = ModelRefitService()
+        results = []
+        service.submit(self, fit_square, (3,), results.append)
+        self.assertEqual(results, [9])
+        self.assertFalse(service.has_pending_refits(self))
+        self.assertIsNone(service.executor)
+
+    def test2online_mode(self):
+        """Check if the finished results are applied in the submission order of every component without waiting for the pending refits."""
+        service = ModelRefitService(max_workers=2)
+        other_component = object()
+        results = []
+        other_results = []
+        service.submit(self, fit_square, (2, 0.5), results.append)
+        service.submit(self, fit_square, (3,), results.append)
+        service.submit(other_component, fit_square, (4,), other_results.append)
+        # the second result is not applied before the first one.
+        service.apply_results(self)
+        self.assertEqual(results, [])
+        self.assertTrue(service.has_pending_refits(self))
+        for _ in range(100):
+            self.assertEqual(service.do_timer(time.time()), 1)
+            if not service.has_pending_refits(self) and not service.has_pending_refits(other_component):
+                break
+            time.sleep(0.05)
+        self.assertEqual(results, [4, 9])
+        self.assertEqual(other_results, [16])
+        service.shutdown()
+        self.assertIsNone(service.executor)
+
+    def test3offline_mode(self):
+        """Check if the results are only applied when the component asks for them, waiting for the pending refits."""
+        service = ModelRefitService(max_workers=2, offline_mode=True)
+        other_component = object()
+        results = []
+        other_results = []
+        service.submit(self, fit_square, (2, 0.2), results.append)
+        service.submit(other_component, fit_square, (4,), other_results.append)
+        service.submit(self, fit_square, (3,), results.append)
+        time.sleep(0.5)
+        service.do_timer(time.time())
+        self.assertEqual((results, other_results), ([], []))
+        service.apply_results(self)
+        self.assertEqual((results, other_results), ([4, 9], []))
+        self.assertFalse(service.has_pending_refits(self))
+        # the pending results are applied when shutting down.
+        service.shutdown()
+        self.assertEqual(other_results, [16])
+
+    def test4failed_refits(self):
+        """Check if the apply function is called with None, when the refit failed in a worker process."""
+        service = ModelRefitService(max_workers=1, offline_mode=True)
+        results = []
+        service.submit(self, fit_failing, (1,), results.append)
+        service.submit(self, fit_square, (5,), results.append)
+        service.shutdown()
+        self.assertEqual(results, [None, 25])
+
+    def test5validate_parameters(self):
+        """Check if the parameters are validated."""
+        self.assertRaises(TypeError, ModelRefitService, max_workers="1")
+        self.assertRaises(TypeError, ModelRefitService, max_workers=True)
+        self.assertRaises(TypeError, ModelRefitService, max_workers=1.5)
+        self.assertRaises(ValueError, ModelRefitService, max_workers=-1)
+        self.assertRaises(TypeError, ModelRefitService, offline_mode=1)
+        self.assertRaises(TypeError, ModelRefitService, offline_mode=None)
+        ModelRefitService(max_workers=4, offline_mode=True).shutdown()
+
+    def test6start_workers(self):
+        """Check if the worker processes are started when the service is configured and not forked when the first fit is submitted."""
+        service = ModelRefitService()
+        children = multiprocessing.active_children()
+        service.configure(2, False)
+        workers = [child for child in multiprocessing.active_children() if child not in children]
+        self.assertEqual(len(workers), 2)
+        results = []
+        service.submit(self, fit_square, (3,), results.append)
+        service.apply_results(self, wait=True)
+        self.assertEqual(results, [9])
+        self.assertEqual([child for child in multiprocessing.active_children() if child not in children], workers)
+        service.configure(0, False)
+        self.assertIsNone(service.executor)
+        self.assertEqual([child for child in multiprocessing.active_children() if child not in children], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -26,6 +26,8 @@ DEFAULT_PERSISTENCE_DIR = '/var/lib/aminer'
 DEFAULT_LOG_DIR = '/var/lib/aminer/log'
 KEY_PERSISTENCE_PERIOD = 'Core.PersistencePeriod'
 DEFAULT_PERSISTENCE_PERIOD = 600
+KEY_REFIT_WORKERS = 'Core.RefitWorkers'
+DEFAULT_REFIT_WORKERS = 0
 KEY_REMOTE_CONTROL_SOCKET_PATH = 'RemoteControlSocket'
 KEY_LOG_PREFIX = 'LogPrefix'
 KEY_RESOURCES_MAX_MEMORY_USAGE = 'Resources.MaxMemoryUsage'
@@ -182,12 +182,10 @@ class AminerRemoteControlExecutionMethods:
         if type(old_component_name) is not str or type(new_component_name) is not str:
             self.REMOTE_CONTROL_RESPONSE = "FAILURE: the parameters 'old_component_name' and 'new_component_name' must be of type str."
         else:
-            component = analysis_context.get_component_by_name(old_component_name)
+            component = analysis_context.rename_component(old_component_name, new_component_name)
             if component is None:
                 self.REMOTE_CONTROL_RESPONSE += f"FAILURE: the component '{old_component_name}' does not exist."
             else:
-                analysis_context.registered_components_by_name[old_component_name] = None
-                analysis_context.registered_components_by_name[new_component_name] = component
                 msg = f"Component '{old_component_name}' renamed to '{new_component_name}' successfully."
                 self.REMOTE_CONTROL_RESPONSE += msg
                 logging.getLogger(DEBUG_LOG_NAME).info(msg)
@@ -30,9 +30,10 @@ import shutil
 
 from aminer.AminerConfig import DEBUG_LOG_NAME, build_persistence_file_name, KEY_RESOURCES_MAX_MEMORY_USAGE, KEY_LOG_STAT_PERIOD,\
     DEFAULT_STAT_PERIOD, KEY_PERSISTENCE_DIR, DEFAULT_PERSISTENCE_DIR, REMOTE_CONTROL_LOG_NAME, KEY_PERSISTENCE_PERIOD,\
-    DEFAULT_PERSISTENCE_PERIOD
+    DEFAULT_PERSISTENCE_PERIOD, KEY_REFIT_WORKERS, DEFAULT_REFIT_WORKERS
 from aminer.events.StreamPrinterEventHandler import StreamPrinterEventHandler
 from aminer.events.JsonConverterHandler import JsonConverterHandler
+from aminer.events.AsyncEventDispatcher import AsyncEventDispatcher
 from aminer.input.LogStream import LogStream
 from aminer.util import PersistenceUtil
 from aminer.util import SecureOSFunctions
@@ -62,10 +63,13 @@ class AnalysisContext:
         self.registered_components = {}
         # Keep also a list of components by name.
         self.registered_components_by_name = {}
+        # Reverse indices from the identity of a component to its name and registry id. They are used by the event handlers for every event.
+        self.component_names_by_identity = {}
+        self.component_ids_by_identity = {}
         # Keep lists of components that should receive timer interrupts when real time or analysis time has elapsed.
         self.real_time_triggered_components = []
         self.analysis_time_triggered_components = []
-        self.suppress_detector_list = []
+        self.suppress_detector_list = set()
 
     def add_time_triggered_component(self, component, trigger_class=None):
         """Add a time-triggered component to the registry."""
@@ -112,6 +116,8 @@ class AnalysisContext:
         self.registered_components[self.next_registry_id] = (component, component_name)
         self.next_registry_id += 1
         self.registered_components_by_name[component_name] = component
+        self.component_names_by_identity.setdefault(id(component), component_name)
+        self.component_ids_by_identity.setdefault(id(component), self.next_registry_id - 1)
         if isinstance(component, TimeTriggeredComponentInterface):
             if register_time_trigger_class_override is None:
                 self.add_time_triggered_component(component)
@@ -152,20 +158,32 @@ class AnalysisContext:
         Get the name of a component.
         @return None if not found.
         """
-        for component_name, component_iter in self.registered_components_by_name.items():
-            if component_iter == component:
-                return component_name
-        return None
+        return self.component_names_by_identity.get(id(component))
 
     def get_id_by_component(self, component):
         """
         Get the name of a component.
         @return None if not found.
         """
-        for component_id, component_iter in self.registered_components.items():
-            if component_iter[0] == component:
-                return component_id
-        return None
+        return self.component_ids_by_identity.get(id(component))
+
+    def rename_component(self, old_component_name, new_component_name):
+        """
+        Rename a registered component.
+        @param old_component_name the current name of the component.
+        @param new_component_name the new name of the component.
+        @return the renamed component or None if no component with the old_component_name is registered.
+        """
+        component = self.registered_components_by_name.pop(old_component_name, None)
+        if component is None:
+            return None
+        self.registered_components_by_name[new_component_name] = component
+        component_id = self.component_ids_by_identity[id(component)]
+        if self.registered_components[component_id][1] == old_component_name:
+            self.registered_components[component_id] = (component, new_component_name)
+        if self.component_names_by_identity[id(component)] == old_component_name:
+            self.component_names_by_identity[id(component)] = new_component_name
+        return component
 
     def build_analysis_pipeline(self):
         """Create the pipeline."""
@@ -189,7 +207,16 @@ class AnalysisContext:
                     print(msg, file=sys.stderr)
                     sys.exit(1)
             elif isinstance(event_handler, JsonConverterHandler):
-                self.close_event_handler_streams(event_handler.json_event_handlers)
+                self.close_event_handler_streams(event_handler.json_event_handlers, reopen)
+            elif isinstance(event_handler, AsyncEventDispatcher):
+                if reopen:
+                    # Do not write to the streams while they are reopened.
+                    with event_handler.delivery_lock:
+                        self.close_event_handler_streams(event_handler.event_handlers, reopen)
+                else:
+                    # Write all queued events before closing the streams.
+                    event_handler.stop()
+                    self.close_event_handler_streams(event_handler.event_handlers)
 
 
 suspended_flag = False
@@ -254,13 +281,21 @@ class AnalysisChild(TimeTriggeredComponentInterface):
         os.close(master_fd)
         self.tracked_fds_dict[self.master_control_socket.fileno()] = self.master_control_socket
 
+        # The detectors submit their expensive model fits to the shared refit service, which applies the results on this loop. The worker
+        # processes are forked before building the analysis pipeline, so no other threads are running yet.
+        from aminer.util.ModelRefitService import model_refit_service
+        model_refit_service.configure(
+            self.analysis_context.aminer_config.config_properties.get(KEY_REFIT_WORKERS, DEFAULT_REFIT_WORKERS), self.offline_mode)
+
         # Locate the real analysis configuration.
         self.analysis_context.build_analysis_pipeline()
         if self.analysis_context.atomizer_factory is None:
             msg = 'build_analysis_pipeline() did not initialize atomizer_factory, terminating'
             print('FATAL: ' + msg, file=sys.stderr)
             logging.getLogger(DEBUG_LOG_NAME).critical(msg)
+            model_refit_service.shutdown()
             return 1
+        self.analysis_context.add_time_triggered_component(model_refit_service)
 
         real_time_triggered_components = self.analysis_context.real_time_triggered_components
         analysis_time_triggered_components = self.analysis_context.analysis_time_triggered_components
@@ -455,13 +490,24 @@ class AnalysisChild(TimeTriggeredComponentInterface):
             if len(self.tracked_fds_dict) == 1 and self.offline_mode:
                 self.run_analysis_loop_flag = False
 
-        # Analysis loop is only left on shutdown. Try to persist everything and leave.
+        # Analysis loop is only left on shutdown or when all streams reached EOF in offline mode. Forward the atoms pending in the atom
+        # syncs, apply the pending model fits, try to persist everything and leave.
+        self.flush_atom_syncs()
+        model_refit_service.shutdown()
         PersistenceUtil.persist_all()
         for sock in self.tracked_fds_dict.values():
             sock.close()
         self.analysis_context.close_event_handler_streams(self.analysis_context.atomizer_factory.event_handler_list)
         return delayed_return_status
 
+    def flush_atom_syncs(self):
+        """Forward the atoms pending in the buffered atom syncs of the atomizer factory."""
+        # Imported here as the BufferedMultisourceAtomSync imports this module.
+        from aminer.input.BufferedMultisourceAtomSync import BufferedMultisourceAtomSync
+        for atom_handler in getattr(self.analysis_context.atomizer_factory, "atom_handler_list", []):
+            if isinstance(atom_handler, BufferedMultisourceAtomSync):
+                atom_handler.flush()
+
     def handle_master_control_socket_receive(self):
         """
         Receive information from the parent process via the master control socket.
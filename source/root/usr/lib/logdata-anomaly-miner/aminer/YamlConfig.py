@@ -313,12 +313,20 @@ def build_input_pipeline(analysis_context, parsing_model, parser_model_dict):
         replace(b"\\\\", b"\\").replace(b"\\b", b"\b")
     json_format = yaml_data['Input']['json_format']
     if yaml_data['Input']['multi_source'] is True:
-        from aminer.input.SimpleMultisourceAtomSync import SimpleMultisourceAtomSync
         if yaml_data['Input']['adjust_timestamps'] is True:
             from aminer.analysis.TimestampCorrectionFilters import SimpleMonotonicTimestampAdjust
-            atom_handler_list = [SimpleMultisourceAtomSync([SimpleMonotonicTimestampAdjust([atom_filter])], sync_wait_time=sync_wait_time)]
+            sync_handler_list = [SimpleMonotonicTimestampAdjust([atom_filter])]
         else:
-            atom_handler_list = [SimpleMultisourceAtomSync([atom_filter], sync_wait_time=sync_wait_time)]
+            sync_handler_list = [atom_filter]
+        sync_queue_size = yaml_data['Input']['sync_queue_size']
+        if sync_queue_size > 0:
+            from aminer.input.BufferedMultisourceAtomSync import BufferedMultisourceAtomSync
+            atom_sync = BufferedMultisourceAtomSync(sync_handler_list, sync_wait_time=sync_wait_time, queue_size=sync_queue_size)
+            analysis_context.add_time_triggered_component(atom_sync)
+        else:
+            from aminer.input.SimpleMultisourceAtomSync import SimpleMultisourceAtomSync
+            atom_sync = SimpleMultisourceAtomSync(sync_handler_list, sync_wait_time=sync_wait_time)
+        atom_handler_list = [atom_sync]
     else:
         if yaml_data['Input']['adjust_timestamps'] is True:
             from aminer.analysis.TimestampCorrectionFilters import SimpleMonotonicTimestampAdjust
@@ -339,9 +347,13 @@ def build_input_pipeline(analysis_context, parsing_model, parser_model_dict):
         if isinstance(obj["url"], str):
             obj["url"] = decode_string_as_byte_string(obj["url"])
         log_resources[obj["url"]] = obj
+    if yaml_data['Input']['compile_model'] is True:
+        from aminer.parsing.CompiledModelElement import CompiledModelElement
+        parsing_model = CompiledModelElement(parsing_model)
     analysis_context.atomizer_factory = SimpleByteStreamLineAtomizerFactory(
         parsing_model, atom_handler_list, anomaly_event_handlers, default_timestamp_path_list=timestamp_paths, eol_sep=eol_sep,
-        json_format=json_format, parser_model_dict=parser_model_dict, log_resources=log_resources)
+        json_format=json_format, parser_model_dict=parser_model_dict, log_resources=log_resources,
+        batch_mode=yaml_data['Input']['batch_mode'])
     return anomaly_event_handlers, atom_filter
 
 
@@ -398,7 +410,7 @@ def build_analysis_components(analysis_context, anomaly_event_handlers, atom_fil
             if item['suppress']:
                 if comp_name is None:
                     raise ValueError(f'Config-Error: id must be specified for the analysis component {item["type"]} to enable suppression.')
-                suppress_detector_list.append(comp_name)
+                suppress_detector_list.add(comp_name)
             if item['type'].name == 'NewMatchPathValueDetector':
                 tmp_analyser = func(analysis_context.aminer_config, item['paths'], anomaly_event_handlers, learn_mode=learn,
                                     persistence_id=item['persistence_id'], output_logline=item['output_logline'])
@@ -441,7 +453,8 @@ def build_analysis_components(analysis_context, anomaly_event_handlers, atom_fil
                                     persistence_id=item['persistence_id'], window_size=item['window_size'],
                                     min_anomaly_score=item['min_anomaly_score'], min_variance=item['min_variance'],
                                     num_windows=item['num_windows'], learn_mode=learn, output_logline=item['output_logline'],
-                                    ignore_list=item['ignore_list'], constraint_list=item['constraint_list'])
+                                    ignore_list=item['ignore_list'], constraint_list=item['constraint_list'],
+                                    incremental=item['incremental'])
             elif item['type'].name == 'NewMatchPathValueComboDetector':
                 tmp_analyser = func(analysis_context.aminer_config, item['paths'], anomaly_event_handlers, learn_mode=learn,
                                     persistence_id=item['persistence_id'], allow_missing_values_flag=item['allow_missing_values'],
@@ -538,7 +551,7 @@ def build_analysis_components(analysis_context, anomaly_event_handlers, atom_fil
                                     window_size=item['window_size'], set_upper_limit=item['set_upper_limit'],
                                     local_maximum_threshold=item['local_maximum_threshold'], learn_mode=learn,
                                     output_logline=item['output_logline'], ignore_list=item['ignore_list'],
-                                    constraint_list=item['constraint_list'])
+                                    constraint_list=item['constraint_list'], num_buckets=item['num_buckets'])
             elif item['type'].name == 'LinearNumericBinDefinition':
                 if comp_name is None:
                     msg = f'The {item["type"].name} must have an id!'
@@ -923,19 +936,21 @@ def build_event_handlers(analysis_context, anomaly_event_handlers):
                 func = item['type'].func
                 ctx = None
                 if item['type'].name == 'StreamPrinterEventHandler':
+                    # the AsyncEventDispatcher flushes the stream after every batch of events.
+                    auto_flush = not item['async_output']
                     if 'output_file_path' in item:
                         try:
                             mode = 'w+'
                             if os.path.exists(item['output_file_path']) and stat.S_ISFIFO(os.stat(item['output_file_path']).st_mode):
                                 mode = 'w'
                             stream = open(item['output_file_path'], mode)
-                            ctx = func(analysis_context, stream)
+                            ctx = func(analysis_context, stream, auto_flush=auto_flush)
                         except OSError as e:
                             msg = f'Error occured when opening stream to output_file_path {item["output_file_path"]}. Error: {e}'
                             logging.getLogger(DEBUG_LOG_NAME).error(msg)
                             print(msg, file=sys.stderr)
                     else:
-                        ctx = func(analysis_context)
+                        ctx = func(analysis_context, auto_flush=auto_flush)
                 if item['type'].name == 'DefaultMailNotificationEventHandler':
                     ctx = func(analysis_context)
                 if item['type'].name == 'SyslogWriterEventHandler':
@@ -967,14 +982,16 @@ def build_event_handlers(analysis_context, anomaly_event_handlers):
                     ctx = func(analysis_context)
                 if item['json'] is True or item['type'].name == 'KafkaEventHandler' or item['type'].name == 'ZmqEventHandler':
                     from aminer.events.JsonConverterHandler import JsonConverterHandler
-                    if item['pretty'] is True:
-                        ctx = JsonConverterHandler([ctx], analysis_context, pretty_print=True)
-                    else:
-                        ctx = JsonConverterHandler([ctx], analysis_context, pretty_print=False)
+                    ctx = JsonConverterHandler([ctx], analysis_context, pretty_print=item['pretty'] is True, serializer=item['serializer'],
+                                               annotated_match_paths=item['annotated_match_paths'])
                 if item['score']:
                     from aminer.events.ScoringEventHandler import ScoringEventHandler
                     ctx = ScoringEventHandler([ctx], analysis_context, weights=item['weights'], auto_weights=item['auto_weights'],
                                               auto_weights_history_length=item['auto_weights_history_length'])
+                if item['async_output']:
+                    from aminer.events.AsyncEventDispatcher import AsyncEventDispatcher
+                    ctx = AsyncEventDispatcher([ctx], analysis_context, batch_size=item['batch_size'], linger_time=item['linger_time'],
+                                               queue_size=item['queue_size'], block_when_full=item['block_when_full'])
                 anomaly_event_handlers.append(ctx)
             return event_handler_id_list
         raise KeyError()
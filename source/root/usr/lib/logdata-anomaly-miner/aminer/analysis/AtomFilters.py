@@ -74,9 +74,8 @@ class MatchPathFilter(AtomHandlerInterface):
         self.log_total += 1
         if log_atom.parser_match is None:
             return False
-        match_dict = log_atom.parser_match.get_match_dictionary()
         for path_name, target_handler in self.parsed_atom_handler_lookup_list:
-            if path_name in match_dict:
+            if path_name in log_atom.parser_match:
                 if target_handler is not None:
                     target_handler.receive_atom(log_atom)
                 self.log_success += 1
@@ -107,7 +106,7 @@ class MatchValueFilter(AtomHandlerInterface):
         self.log_total += 1
         if log_atom.parser_match is None:
             return False
-        target_value = log_atom.parser_match.get_match_dictionary().get(self.target_path, None)
+        target_value = log_atom.parser_match.get(self.target_path, None)
         if target_value is not None:
             target_value = target_value.match_object
         target_handler = self.parsed_atom_handler_dict.get(target_value, self.default_parsed_atom_handler)
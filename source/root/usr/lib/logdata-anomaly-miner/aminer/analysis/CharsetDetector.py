@@ -81,7 +81,7 @@ class CharsetDetector(AtomHandlerInterface, TimeTriggeredComponentInterface, Eve
         values = []
         all_values_none = True
         for path in self.target_path_list:
-            match = parser_match.get_match_dictionary().get(path)
+            match = parser_match.get(path)
             if match is None:
                 continue
             matches = []
@@ -100,7 +100,7 @@ class CharsetDetector(AtomHandlerInterface, TimeTriggeredComponentInterface, Eve
         # Store all values from id paths in a list. Use empty list as default path if not applicable.
         id_vals = []
         for path in self.id_path_list:
-            match = parser_match.get_match_dictionary().get(path)
+            match = parser_match.get(path)
             if match is None:
                 continue
             matches = []
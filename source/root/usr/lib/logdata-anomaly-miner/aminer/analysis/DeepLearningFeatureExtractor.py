@@ -108,7 +108,7 @@ class DeepLearningFeatureExtractor(AtomHandlerInterface, TimeTriggeredComponentI
         values = []
         all_values_none = True
         for path in self.target_path_list:
-            match = parser_match.get_match_dictionary().get(path)
+            match = parser_match.get(path)
             if match is None:
                 continue
             matches = []
@@ -136,7 +136,7 @@ class DeepLearningFeatureExtractor(AtomHandlerInterface, TimeTriggeredComponentI
             g_values = []
             g_all_values_none = True
             for path in self.group_by_path_list:
-                match = parser_match.get_match_dictionary().get(path)
+                match = parser_match.get(path)
                 if match is None:
                     continue
                 matches = []
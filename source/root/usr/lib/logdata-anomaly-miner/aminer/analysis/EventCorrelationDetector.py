@@ -169,7 +169,7 @@ class EventCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentInter
             # Event is defined by the full path of log atom.
             constraint_path_flag = False
             for constraint_path in self.constraint_list:
-                if parser_match.get_match_dictionary().get(constraint_path) is not None:
+                if parser_match.get(constraint_path) is not None:
                     constraint_path_flag = True
                     break
             if not constraint_path_flag and self.constraint_list != []:
@@ -180,7 +180,7 @@ class EventCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentInter
             values = []
             all_values_none = True
             for path in self.target_path_list:
-                match = parser_match.get_match_dictionary().get(path)
+                match = parser_match.get(path)
                 if match is None:
                     continue
                 matches = []
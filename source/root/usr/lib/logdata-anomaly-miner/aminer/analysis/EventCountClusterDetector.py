@@ -13,6 +13,7 @@ this program. If not, see <http://www.gnu.org/licenses/>.
 import os
 import logging
 import math
+import numpy as np
 from aminer.AminerConfig import DEBUG_LOG_NAME, build_persistence_file_name, KEY_PERSISTENCE_PERIOD, DEFAULT_PERSISTENCE_PERIOD,\
     STAT_LOG_NAME, CONFIG_KEY_LOG_LINE_PREFIX, DEFAULT_LOG_LINE_PREFIX
 from aminer import AminerConfig
@@ -23,6 +24,58 @@ from aminer.util import PersistenceUtil
 from aminer.util.TimeTriggeredComponentInterface import TimeTriggeredComponentInterface
 
 
+class CountVectorModel:
+    """
+    This class stores the count vectors of the model of an id as rows of a dense matrix in the order they were added. The columns are given
+    by the vocabulary of the log events occurring in the count vectors. The row sums and the matrix weighted by the idf factors are cached.
+    """
+
+    __slots__ = ("columns", "matrix", "row_sums", "weighted_matrix", "weights_version")
+
+    def __init__(self, count_vectors=()):
+        """
+        Initialize the model.
+        @param count_vectors the initial count vectors of the model.
+        """
+        # The columns of the log events in the matrix.
+        self.columns = {}
+        self.matrix = np.zeros((0, 0))
+        self.row_sums = np.zeros(0)
+        # The matrix weighted by the idf factors and the version of the idf statistics it was computed with.
+        self.weighted_matrix = None
+        self.weights_version = None
+        for count_vector in count_vectors:
+            self.append(count_vector)
+
+    def append(self, count_vector):
+        """Append the count vector as last row of the matrix."""
+        for log_event in count_vector:
+            if log_event not in self.columns:
+                self.columns[log_event] = len(self.columns)
+        row = np.zeros(len(self.columns))
+        for log_event, count in count_vector.items():
+            row[self.columns[log_event]] = count
+        if self.matrix.shape[1] < len(row):
+            self.matrix = np.pad(self.matrix, ((0, 0), (0, len(row) - self.matrix.shape[1])))
+        self.matrix = np.vstack((self.matrix, row))
+        self.row_sums = np.append(self.row_sums, sum(count_vector.values()))
+        self.weighted_matrix = None
+
+    def remove_first(self):
+        """Remove the first (= oldest) row of the matrix and the columns of log events not occurring in the remaining rows."""
+        self.matrix = self.matrix[1:]
+        self.row_sums = self.row_sums[1:]
+        used_columns = self.matrix.any(axis=0)
+        if not used_columns.all():
+            new_columns = np.cumsum(used_columns) - 1
+            self.columns = {log_event: int(new_columns[column]) for log_event, column in self.columns.items() if used_columns[column]}
+            self.matrix = self.matrix[:, used_columns]
+        self.weighted_matrix = None
+
+    def __len__(self):
+        return len(self.row_sums)
+
+
 class EventCountClusterDetector(AtomHandlerInterface, TimeTriggeredComponentInterface, EventSourceInterface):
     """This class creates events when dissimilar event or value count vectors occur."""
 
@@ -67,8 +120,12 @@ class EventCountClusterDetector(AtomHandlerInterface, TimeTriggeredComponentInte
         self.next_check_time = {}
         self.counts = {}
         self.known_counts = {}
+        # The known count vectors of every id_tuple stored as CountVectorModel for the comparisons.
+        self.count_models = {}
         self.idf_total = set()
         self.idf_counts = {}
+        # The version of the idf statistics, which is increased every time they change.
+        self.idf_version = 0
         self.log_windows = 0
 
         self.persistence_file_name = build_persistence_file_name(aminer_config, self.__class__.__name__, persistence_id)
@@ -94,7 +151,7 @@ class EventCountClusterDetector(AtomHandlerInterface, TimeTriggeredComponentInte
             # Event is defined by the full path of log atom.
             constraint_path_flag = False
             for constraint_path in self.constraint_list:
-                if parser_match.get_match_dictionary().get(constraint_path) is not None:
+                if parser_match.get(constraint_path) is not None:
                     constraint_path_flag = True
                     break
             if not constraint_path_flag and self.constraint_list != []:
@@ -105,7 +162,7 @@ class EventCountClusterDetector(AtomHandlerInterface, TimeTriggeredComponentInte
             values = []
             all_values_none = True
             for path in self.target_path_list:
-                match = parser_match.get_match_dictionary().get(path)
+                match = parser_match.get(path)
                 if match is None:
                     continue
                 matches = []
@@ -129,7 +186,7 @@ class EventCountClusterDetector(AtomHandlerInterface, TimeTriggeredComponentInte
         # Otherwise, the empty tuple () is used as the only key of the current_sequences dict.
         id_tuple = ()
         for id_path in self.id_path_list:
-            id_match = parser_match.get_match_dictionary().get(id_path)
+            id_match = parser_match.get(id_path)
             if id_match is None:
                 if self.allow_missing_id is True:
                     # Insert placeholder for id_path that is not available
@@ -155,11 +212,16 @@ class EventCountClusterDetector(AtomHandlerInterface, TimeTriggeredComponentInte
 
         # Update statistics for idf computation
         if self.idf and self.id_path_list:
-            self.idf_total.add(id_tuple)
+            if id_tuple not in self.idf_total:
+                self.idf_total.add(id_tuple)
+                self.idf_version += 1
             if log_event in self.idf_counts:
-                self.idf_counts[log_event].add(id_tuple)
+                if id_tuple not in self.idf_counts[log_event]:
+                    self.idf_counts[log_event].add(id_tuple)
+                    self.idf_version += 1
             else:
                 self.idf_counts[log_event] = set([id_tuple])  # skipcq: PTC-W0018
+                self.idf_version += 1
 
         if id_tuple not in self.next_check_time:
             # First processed log atom, initialize next check time.
@@ -195,10 +257,14 @@ class EventCountClusterDetector(AtomHandlerInterface, TimeTriggeredComponentInte
         if count_vector in self.known_counts[id_tuple]:
             # Avoid that model has identical count vectors multiple times
             return
+        if id_tuple not in self.count_models:
+            self.count_models[id_tuple] = CountVectorModel(self.known_counts[id_tuple])
         if len(self.known_counts[id_tuple]) >= self.num_windows:
             # Drop first (= oldest) count vector
             self.known_counts[id_tuple] = self.known_counts[id_tuple][1:]
+            self.count_models[id_tuple].remove_first()
         self.known_counts[id_tuple].append(count_vector)
+        self.count_models[id_tuple].append(count_vector)
 
     def detect(self, log_atom, id_tuple, count_vector):
         """Create anomaly event when anomaly score is too high."""
@@ -235,45 +301,71 @@ class EventCountClusterDetector(AtomHandlerInterface, TimeTriggeredComponentInte
 
     def check(self, id_tuple, count_vector):
         """Computes the manhattan metric for the count vector and each count vector present in the model."""
-        min_score = 1
-        for known_count in self.known_counts[id_tuple]:
-            # Iterate over all count vectors in the model
-            manh = 0
-            manh_max = 0
-            for element in set(list(known_count.keys()) + list(count_vector.keys())):
-                # Iterate over each val that occurs in one of the vectors
-                idf_fact = 1
-                if self.idf and self.id_path_list:
-                    # Compute idf (weight rare value higher than ones that occur with many id_values)
-                    idf_fact = math.log10((1 + len(self.idf_total)) / len(self.idf_counts[element]))
-                norm_sum_known = 1
-                norm_sum_count = 1
-                if self.norm:
-                    # Normalize vectors by dividing through sum
-                    norm_sum_known = sum(known_count.values())
-                    norm_sum_count = sum(count_vector.values())
-                if element not in known_count:
-                    manh += count_vector[element] * idf_fact / norm_sum_count
-                    manh_max += count_vector[element] * idf_fact / norm_sum_count
-                elif element not in count_vector:
-                    manh += known_count[element] * idf_fact / norm_sum_known
-                    manh_max += known_count[element] * idf_fact / norm_sum_known
-                else:
-                    manh += abs(count_vector[element] * idf_fact / norm_sum_count - known_count[element] * idf_fact / norm_sum_known)
-                    manh_max += max(count_vector[element] * idf_fact / norm_sum_count, known_count[element] * idf_fact / norm_sum_known)
-            score = 0
-            if manh_max != 0:
-                # manh_max is zero when both vectors are empty, in this case, score remains at default 0, and normalize in all other cases
-                score = manh / manh_max
-            if score <= self.confidence_factor:
-                # Found similar vector; abort early to avoid spending time on more checks
-                # Return -1 since "true" score is unknown as not all vectors in the model were checked
-                return -1
-            if min_score is None:
-                min_score = score
+        model = self.count_models.get(id_tuple)
+        if model is None or len(model) == 0:
+            return 1
+        known, count, extra = self.get_comparison_vectors(model, count_vector)
+        manh = np.abs(count - known).sum(axis=1) + extra
+        manh_max = np.maximum(count, known).sum(axis=1) + extra
+        # manh_max is zero when both vectors are empty, in this case, score remains at default 0, and normalize in all other cases
+        min_score = float(np.divide(manh, manh_max, out=np.zeros(len(manh)), where=manh_max != 0).min())
+        if min_score <= self.confidence_factor:
+            # Found similar vector
+            return -1
+        return min(1, min_score)
+
+    def get_comparison_vectors(self, model, count_vector):
+        """
+        Return the weighted matrix of the model, the weighted count vector over the columns of the model and the sum of the weighted counts
+        of the log events not occurring in the model, which is added to the metrics of all rows. All count vectors of the model are compared
+        with one vectorized computation.
+        """
+        known = self.get_weighted_matrix(model)
+        count, extra = self.get_weighted_count_vector(model, count_vector)
+        if self.norm:
+            # Normalize the vectors by multiplying every row of the model with the sum of the count vector and the count vector with
+            # the sum of the row. This scales the metrics of every row by the product of both sums, which does not change the score,
+            # and keeps the scores exact if only counts are compared.
+            norm_sum_count = sum(count_vector.values()) or 1
+            norm_sum_known = np.where(model.row_sums == 0, 1, model.row_sums)
+            known = known * norm_sum_count
+            count = np.outer(norm_sum_known, count)
+            extra = norm_sum_known * extra
+        return known, count, extra
+
+    def get_idf_factor(self, log_event):
+        """Compute idf (weight rare value higher than ones that occur with many id_values)."""
+        return math.log10((1 + len(self.idf_total)) / len(self.idf_counts[log_event]))
+
+    def get_weighted_matrix(self, model):
+        """Return the matrix of the model weighted by the idf factors if idf is used."""
+        if not self.idf or not self.id_path_list:
+            return model.matrix
+        if model.weighted_matrix is None or model.weights_version != self.idf_version:
+            idf_factors = np.ones(model.matrix.shape[1])
+            for log_event, column in model.columns.items():
+                idf_factors[column] = self.get_idf_factor(log_event)
+            model.weighted_matrix = model.matrix * idf_factors
+            model.weights_version = self.idf_version
+        return model.weighted_matrix
+
+    def get_weighted_count_vector(self, model, count_vector):
+        """
+        Return the count vector over the columns of the model weighted by the idf factors if idf is used and the sum of the weighted counts
+        of the log events not occurring in the model.
+        """
+        count = np.zeros(model.matrix.shape[1])
+        extra = 0
+        for log_event, value in count_vector.items():
+            idf_fact = 1
+            if self.idf and self.id_path_list:
+                idf_fact = self.get_idf_factor(log_event)
+            column = model.columns.get(log_event)
+            if column is None:
+                extra += value * idf_fact
             else:
-                min_score = min(min_score, score)
-        return min_score
+                count[column] = value * idf_fact
+        return count, extra
 
     def do_timer(self, trigger_time):
         """Check if current ruleset should be persisted."""
@@ -324,6 +416,7 @@ class EventCountClusterDetector(AtomHandlerInterface, TimeTriggeredComponentInte
                         elem_dict[tuple(log_ev_elem[0])] = int(log_ev_elem[1])
                     window_list.append(elem_dict)
                 self.known_counts[tuple(elem[0])] = window_list
+                self.count_models[tuple(elem[0])] = CountVectorModel(window_list)
             for elem in persistence_data[1]:
                 self.idf_total.add(tuple(elem))
             for elem in persistence_data[2]:
@@ -331,6 +424,7 @@ class EventCountClusterDetector(AtomHandlerInterface, TimeTriggeredComponentInte
                 for id_elem in elem[1]:
                     id_elem_set.add(tuple(id_elem))
                 self.idf_counts[tuple(elem[0])] = id_elem_set
+            self.idf_version += 1
             logging.getLogger(DEBUG_LOG_NAME).debug("%s loaded persistence data.", self.__class__.__name__)
 
     def allowlist_event(self, event_type, event_data, allowlisting_data):
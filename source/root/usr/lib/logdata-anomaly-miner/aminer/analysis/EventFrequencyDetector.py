@@ -113,7 +113,7 @@ class EventFrequencyDetector(AtomHandlerInterface, TimeTriggeredComponentInterfa
             # Event is defined by the full path of log atom.
             constraint_path_flag = False
             for constraint_path in self.constraint_list:
-                if parser_match.get_match_dictionary().get(constraint_path) is not None:
+                if parser_match.get(constraint_path) is not None:
                     constraint_path_flag = True
                     break
             if not constraint_path_flag and self.constraint_list != []:
@@ -124,7 +124,7 @@ class EventFrequencyDetector(AtomHandlerInterface, TimeTriggeredComponentInterfa
             values = []
             all_values_none = True
             for path in self.target_path_list:
-                match = parser_match.get_match_dictionary().get(path)
+                match = parser_match.get(path)
                 if match is None:
                     continue
                 matches = []
@@ -149,7 +149,7 @@ class EventFrequencyDetector(AtomHandlerInterface, TimeTriggeredComponentInterfa
         if self.unique_path_list is not None and len(self.unique_path_list) != 0:
             values = []
             for path in self.unique_path_list:
-                match = parser_match.get_match_dictionary().get(path)
+                match = parser_match.get(path)
                 if match is None:
                     continue
                 matches = []
@@ -296,7 +296,7 @@ class EventFrequencyDetector(AtomHandlerInterface, TimeTriggeredComponentInterfa
         # Get the id list if the scoring_path_list is set and save it for the anomaly message
         if len(self.scoring_path_list) > 0:
             for scoring_path in self.scoring_path_list:
-                scoring_match = log_atom.parser_match.get_match_dictionary().get(scoring_path)
+                scoring_match = log_atom.parser_match.get(scoring_path)
                 if scoring_match is not None:
                     # Get the value of the current path
                     if isinstance(scoring_match.match_object, bytes):
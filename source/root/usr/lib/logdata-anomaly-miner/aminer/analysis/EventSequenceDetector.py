@@ -93,7 +93,7 @@ class EventSequenceDetector(AtomHandlerInterface, TimeTriggeredComponentInterfac
             # Event is defined by the full path of log atom.
             constraint_path_flag = False
             for constraint_path in self.constraint_list:
-                if parser_match.get_match_dictionary().get(constraint_path) is not None:
+                if parser_match.get(constraint_path) is not None:
                     constraint_path_flag = True
                     break
             if not constraint_path_flag and self.constraint_list != []:
@@ -104,7 +104,7 @@ class EventSequenceDetector(AtomHandlerInterface, TimeTriggeredComponentInterfac
             values = []
             all_values_none = True
             for path in self.target_path_list:
-                match = parser_match.get_match_dictionary().get(path)
+                match = parser_match.get(path)
                 if match is None:
                     continue
                 matches = []
@@ -129,7 +129,7 @@ class EventSequenceDetector(AtomHandlerInterface, TimeTriggeredComponentInterfac
         # Otherwise, the empty tuple () is used as the only key of the current_sequences dict.
         id_tuple = ()
         for id_path in self.id_path_list:
-            id_match = parser_match.get_match_dictionary().get(id_path)
+            id_match = parser_match.get(id_path)
             if id_match is None:
                 if self.allow_missing_id is True:
                     # Insert placeholder for id_path that is not available
@@ -13,6 +13,9 @@ You should have received a copy of the GNU General Public License along with
 this program. If not, see <http://www.gnu.org/licenses/>.
 """
 import logging
+import sys
+from array import array
+import numpy as np
 
 from aminer import AminerConfig
 from aminer.AminerConfig import build_persistence_file_name, KEY_PERSISTENCE_PERIOD, DEFAULT_PERSISTENCE_PERIOD, DEBUG_LOG_NAME
@@ -22,6 +25,118 @@ from aminer.util.TimeTriggeredComponentInterface import TimeTriggeredComponentIn
 from aminer.util import PersistenceUtil
 
 
+class ValueColumn:
+    """
+    This class stores the numeric values of a variable of an event type in a preallocated buffer.
+    New values are collected in the list pending and moved to the buffer in blocks of block_size values, so appending a value costs
+    as much as appending it to a list. The buffer grows up to max_num_vals values. If more values are stored, the column is reduced
+    to the last min_num_vals values like a list, which is reduced every time it exceeds max_num_vals values. The values in the buffer
+    are never changed, so numpy.asarray returns a view of the values without copying them, which is not changed by appending values.
+    The column behaves like the list of the values.
+    """
+
+    __slots__ = ("min_num_vals", "max_num_vals", "data", "length", "pending")
+    __hash__ = None
+    block_size = 64
+
+    def __init__(self, min_num_vals, max_num_vals, values=()):
+        """
+        Initialize the column.
+        @param min_num_vals number of the values which the column is being reduced to.
+        @param max_num_vals the maximum number of values before the column is being reduced to the last min_num_values.
+        @param values the initial numeric values of the column.
+        """
+        self.min_num_vals = min_num_vals
+        self.max_num_vals = max_num_vals
+        self.data = np.empty(0)
+        self.length = 0
+        self.pending = list(values)
+        self.flush()
+
+    def append(self, value):
+        """Append a numeric value."""
+        pending = self.pending
+        pending.append(value)
+        if len(pending) >= self.block_size:
+            self.flush()
+
+    def flush(self):
+        """Move the pending values to the buffer and reduce the column to the last min_num_vals values if it exceeded max_num_vals."""
+        pending = self.pending
+        if not pending:
+            return
+        self.pending = []
+        data = self.data
+        length = self.length
+        total = length + len(pending)
+        # The values are converted with an array, which numpy copies faster than a list.
+        if total <= len(data):
+            data[length:total] = array("d", pending)
+            self.length = total
+            return
+        if total > self.max_num_vals:
+            total = self.min_num_vals + (total - self.max_num_vals - 1) % (self.max_num_vals + 1 - self.min_num_vals)
+            capacity = self.max_num_vals
+        else:
+            capacity = min(max(2 * len(data), total, 16), self.max_num_vals)
+        # A new buffer is allocated, so the views of the stored values are not changed.
+        self.data = np.empty(capacity)
+        kept = max(total - len(pending), 0)
+        self.data[:kept] = data[length - kept:length]
+        self.data[kept:total] = array("d", pending[len(pending) - total + kept:])
+        self.length = total
+
+    def tolist(self):
+        """Return the list of the values."""
+        self.flush()
+        return self.data[:self.length].tolist()
+
+    def __len__(self):
+        if self.length + len(self.pending) > self.max_num_vals:
+            self.flush()
+        return self.length + len(self.pending)
+
+    def __getitem__(self, key):
+        # The last values are read from the pending values as long as the column does not need to be reduced.
+        if key.__class__ is int and -len(self.pending) <= key < 0 and self.length + len(self.pending) <= self.max_num_vals:
+            return self.pending[key]
+        self.flush()
+        values = self.data[:self.length][key]
+        if isinstance(key, slice):
+            return values.tolist()
+        return values.item()
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __contains__(self, value):
+        return value in self.tolist()
+
+    def __array__(self, dtype=None, copy=None):
+        self.flush()
+        values = self.data[:self.length]
+        if copy:
+            return np.array(values, dtype=dtype)
+        return values if dtype is None else values.astype(dtype, copy=False)
+
+    def __eq__(self, other):
+        if isinstance(other, ValueColumn):
+            other = other.tolist()
+        if not isinstance(other, list):
+            return NotImplemented
+        return self.tolist() == other
+
+    def __lt__(self, other):
+        if isinstance(other, ValueColumn):
+            other = other.tolist()
+        if not isinstance(other, list):
+            return NotImplemented
+        return self.tolist() < other
+
+    def __repr__(self):
+        return repr(self.tolist())
+
+
 class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
     """This class keeps track of the found event types and the values of each variable."""
 
@@ -58,7 +173,8 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
         self.longest_path = []  # List of the longest path of the events
         self.found_keys = []  # List of the keys corresponding to the events
         self.variable_key_list = []  # List of the keys, which take values in the log line
-        # List of the values of the log lines. If the length reaches max_num_vals the list gets reduced to min_num_vals values per variable
+        # List of the values of the log lines. Numeric values are stored in ValueColumns and other values in lists of interned strings.
+        # If the length reaches max_num_vals the column or list gets reduced to min_num_vals values
         self.values = []
         self.num_event_lines = []  # Saves the number of lines of the event types
         self.total_records = 0  # Saves the number of total log lines
@@ -73,6 +189,9 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
         self.num_event_lines_tsa_ref = []  # Reference containing the number of lines of the events for the TSA
         self.current_index = 0  # Index of the event type of the current log line
         self.id_path_list_tuples = []  # List of the id tuples
+        # Dictionaries of the indices of the event types with the frozensets of the found_keys or the id tuples as keys.
+        self.event_index_by_keys = {}
+        self.event_index_by_id_tuple = {}
 
         self.persistence_file_name = build_persistence_file_name(aminer_config, self.__class__.__name__, persistence_id)
         self.load_persistence_data()
@@ -80,10 +199,11 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
     def receive_atom(self, log_atom):
         """Receives a parsed atom and keeps track of the event types and the values of the variables of them."""
         self.log_total += 1
+        match_dict = log_atom.parser_match.get_match_dictionary()
         valid_log_atom = False
         if self.target_path_list:
             for path in self.target_path_list:
-                if path in log_atom.parser_match.get_match_dictionary().keys():
+                if path in match_dict:
                     valid_log_atom = True
                     break
         if self.target_path_list and not valid_log_atom:
@@ -97,7 +217,7 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
             # Otherwise, the empty tuple () is used as the only key of the current_sequences dict.
             id_tuple = ()
             for id_path in self.id_path_list:
-                id_match = log_atom.parser_match.get_match_dictionary().get(id_path)
+                id_match = log_atom.parser_match.get(id_path)
                 if id_match is None:
                     if self.allow_missing_id is True:
                         # Insert placeholder for id_path that is not available
@@ -117,31 +237,26 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
                 return False
 
             # Searches if the id_tuple has previously appeared
-            current_index = -1
-            for event_index, var_key in enumerate(self.id_path_list_tuples):
-                if id_tuple == var_key:
-                    current_index = event_index
+            current_index = self.event_index_by_id_tuple.get(id_tuple, -1)
         else:
             # Searches if the event type has previously appeared
-            current_index = -1
-            for event_index in range(self.num_events):
-                if self.longest_path[event_index] in log_atom.parser_match.get_match_dictionary() and set(
-                        log_atom.parser_match.get_match_dictionary()) == self.found_keys[event_index]:
-                    current_index = event_index
+            current_index = self.event_index_by_keys.get(frozenset(match_dict), -1)
+            if current_index != -1 and self.longest_path[current_index] not in match_dict:
+                current_index = -1
 
         # Initialize a new event type if the event type of the new line has not appeared
         if current_index == -1:
             current_index = self.num_events
             self.num_events += 1
-            self.found_keys.append(set(log_atom.parser_match.get_match_dictionary().keys()))
+            self.found_keys.append(set(match_dict.keys()))
+            self.event_index_by_keys[frozenset(self.found_keys[current_index])] = current_index
 
             # Initialize the list of the keys to the variables
             self.variable_key_list.append(list(self.found_keys[current_index]))
             # Delete the entries with value None or timestamps as values
             for var_index in range(len(self.variable_key_list[current_index]) - 1, -1, -1):
-                if (type(log_atom.parser_match.get_match_dictionary()[self.variable_key_list[current_index][var_index]]).__name__ !=
-                        "MatchElement") or (log_atom.parser_match.get_match_dictionary()[self.variable_key_list[
-                        current_index][var_index]].match_object is None):
+                if (type(match_dict[self.variable_key_list[current_index][var_index]]).__name__ != "MatchElement") or (
+                        match_dict[self.variable_key_list[current_index][var_index]].match_object is None):
                     del self.variable_key_list[current_index][var_index]
                 elif (self.target_path_list is not None) and self.variable_key_list[current_index][var_index] not in self.target_path_list:
                     del self.variable_key_list[current_index][var_index]
@@ -174,6 +289,7 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
                             tmp_int = count
             else:
                 self.id_path_list_tuples.append(id_tuple)
+                self.event_index_by_id_tuple[id_tuple] = current_index
         self.current_index = current_index
 
         if self.save_values:
@@ -201,7 +317,7 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
         for key in self.found_keys:
             tmp_list[0].append(list(key))
         tmp_list.append(self.variable_key_list)
-        tmp_list.append(self.values)
+        tmp_list.append([[list(column) for column in event_values] for event_values in self.values])
         tmp_list.append(self.longest_path)
         tmp_list.append(self.check_variables)
         tmp_list.append(self.num_event_lines)
@@ -217,12 +333,19 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
             for key in persistence_data[0]:
                 self.found_keys.append(set(key))
             self.variable_key_list = persistence_data[1]
-            self.values = persistence_data[2]
+            self.values = [[self.create_column(column) for column in event_values] for event_values in persistence_data[2]]
             self.longest_path = persistence_data[3]
             self.check_variables = persistence_data[4]
             self.num_event_lines = persistence_data[5]
             self.id_path_list_tuples = [tuple(tuple_list) for tuple_list in persistence_data[6]]
             self.num_events = len(self.found_keys)
+            self.build_event_indices()
+
+    def build_event_indices(self):
+        """Build the dictionaries of the indices of the event types from the found_keys and the id_path_list_tuples."""
+        # Later event types take precedence like in a linear search for the last matching event type.
+        self.event_index_by_keys = {frozenset(keys): event_index for event_index, keys in enumerate(self.found_keys)}
+        self.event_index_by_id_tuple = {id_tuple: event_index for event_index, id_tuple in enumerate(self.id_path_list_tuples)}
 
     def add_following_modules(self, following_module):
         """Add the given Module to the following module list."""
@@ -233,52 +356,80 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
     def init_values(self, current_index):
         """Initialize the variable_key_list and the list for the values."""
         # Initializes the value list
-        if not self.values:
-            self.values = [[[] for _ in range(len(self.variable_key_list[current_index]))]]
-        else:
-            self.values.append([[] for _ in range(len(self.variable_key_list[current_index]))])
+        self.values.append([ValueColumn(self.min_num_vals, self.max_num_vals) for _ in range(len(self.variable_key_list[current_index]))])
+
+    def create_column(self, values):
+        """Return a ValueColumn of the values if all of them are numbers and the list of the values with interned strings otherwise."""
+        if all(value.__class__ is float for value in values):
+            return ValueColumn(self.min_num_vals, self.max_num_vals, values)
+        return [sys.intern(value) if value.__class__ is str else value for value in values]
+
+    def get_value_array(self, event_index, var_index, num_values):
+        """
+        Return the last num_values values of a variable as an array.
+        The values of a ValueColumn are returned as a view without copying them. Only the last values of a list are converted.
+        """
+        column = self.values[event_index][var_index]
+        if column.__class__ is ValueColumn:
+            return np.asarray(column)[-num_values:]
+        return np.asarray(column[-num_values:])
 
     def append_values(self, log_atom, current_index):
         """Add the values of the variables of the current line to self.values."""
+        match_dict = log_atom.parser_match.get_match_dictionary()
+        event_values = self.values[current_index]
         for var_index, var_key in enumerate(self.variable_key_list[current_index]):
             # Skips the variable if check_variable is False, or if the var_key is not included in the match_dict
             if not self.check_variables[current_index][var_index]:
                 continue
-            if var_key not in log_atom.parser_match.get_match_dictionary():
-                self.values[current_index][var_index] = []
+            if var_key not in match_dict:
+                event_values[var_index] = []
                 self.check_variables[current_index][var_index] = False
                 continue
+            match_element = match_dict[var_key]
 
             raw_match_object = ""
-            if isinstance(log_atom.parser_match.get_match_dictionary()[var_key].match_object, bytearray):
-                raw_match_object = repr(
-                    bytes(log_atom.parser_match.get_match_dictionary()[var_key].match_object))[2:-1]
-            elif isinstance(log_atom.parser_match.get_match_dictionary()[var_key].match_object, bytes):
-                raw_match_object = repr(log_atom.parser_match.get_match_dictionary()[var_key].match_object)[2:-1]
+            if isinstance(match_element.match_object, bytearray):
+                raw_match_object = repr(bytes(match_element.match_object))[2:-1]
+            elif isinstance(match_element.match_object, bytes):
+                raw_match_object = repr(match_element.match_object)[2:-1]
 
-            # Try to convert the values to floats and add them as values
+            # Try to convert the values to floats
             try:
                 if raw_match_object != "":
-                    self.values[current_index][var_index].append(float(raw_match_object))
+                    value = float(raw_match_object)
                 else:
-                    self.values[current_index][var_index].append(
-                        float(log_atom.parser_match.get_match_dictionary()[var_key].match_object))
-            # Add the strings as values
+                    value = float(match_element.match_object)
+            # Use the strings as values
             except:  # skipcq: FLK-E722
-                if isinstance(log_atom.parser_match.get_match_dictionary()[var_key].match_string, bytes):
-                    self.values[current_index][var_index].append(
-                        repr(log_atom.parser_match.get_match_dictionary()[var_key].match_string)[2:-1])
+                if isinstance(match_element.match_string, bytes):
+                    value = sys.intern(repr(match_element.match_string)[2:-1])
                 else:
-                    self.values[current_index][var_index].append(log_atom.parser_match.get_match_dictionary()[var_key].match_string)
-
-        # Reduce the numbers of entries in the value list
-        if len(self.variable_key_list[current_index]) > 0 and len([i for i in self.check_variables[current_index] if i]) > 0 and \
-                len(self.values[current_index][self.check_variables[current_index].index(True)]) > self.max_num_vals:
-            for var_index in range(len(self.variable_key_list[current_index])):  # skipcq: PTC-W0060
-                # Skips the variable if check_variable is False
-                if not self.check_variables[current_index][var_index]:
+                    value = match_element.match_string
+                    if value.__class__ is str:
+                        value = sys.intern(value)
+
+            column = event_values[var_index]
+            if column.__class__ is ValueColumn:
+                if value.__class__ is float:
+                    column.pending.append(value)
                     continue
-                self.values[current_index][var_index] = self.values[current_index][var_index][-self.min_num_vals:]
+                # The value is no number, so the values are stored in a list from now on.
+                column = event_values[var_index] = column.tolist()
+            elif not column and value.__class__ is float:
+                # The values were reset by a following module.
+                event_values[var_index] = ValueColumn(self.min_num_vals, self.max_num_vals, (value,))
+                continue
+            column.append(value)
+            if len(column) > self.max_num_vals:
+                # The values are stored in a ValueColumn again as soon as all remaining values are numbers.
+                event_values[var_index] = self.create_column(column[-self.min_num_vals:])
+
+        # Move the pending numeric values to the buffers of the ValueColumns in blocks.
+        if self.num_event_lines[current_index] % ValueColumn.block_size == ValueColumn.block_size - 1:
+            for column in event_values:
+                if column.__class__ is ValueColumn:
+                    column.flush()
 
     def get_event_type(self, event_index):
         """Return a string which includes information about the event type."""
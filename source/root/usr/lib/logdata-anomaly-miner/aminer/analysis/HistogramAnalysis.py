@@ -372,9 +372,8 @@ class HistogramAnalysis(AtomHandlerInterface):
     def receive_atom(self, log_atom):
         """Receive a log atom from a source."""
         self.log_total += 1
-        match_dict = log_atom.parser_match.get_match_dictionary()
         for data_item in self.histogram_data:
-            match = match_dict.get(data_item.property_path, None)
+            match = log_atom.parser_match.get(data_item.property_path, None)
             if match is None:
                 continue
             self.log_success += 1
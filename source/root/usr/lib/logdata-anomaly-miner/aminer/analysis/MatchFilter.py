@@ -46,9 +46,9 @@ class MatchFilter(AtomHandlerInterface):
     def receive_atom(self, log_atom):
         """Forward all log atoms that involve specified path and optionally value."""
         self.log_total += 1
-        match_dict = log_atom.parser_match.get_match_dictionary()
+        parser_match = log_atom.parser_match
         for target_path in self.target_path_list:
-            match = match_dict.get(target_path)
+            match = parser_match.get(target_path)
             if match is None:
                 continue
             matches = []
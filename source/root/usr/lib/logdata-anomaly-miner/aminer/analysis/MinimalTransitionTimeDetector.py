@@ -13,6 +13,7 @@ this program. If not, see <http://www.gnu.org/licenses/>.
 """
 
 import logging
+import numpy as np
 from aminer.AminerConfig import DEBUG_LOG_NAME, build_persistence_file_name, CONFIG_KEY_LOG_LINE_PREFIX, DEFAULT_LOG_LINE_PREFIX,\
     KEY_PERSISTENCE_PERIOD, DEFAULT_PERSISTENCE_PERIOD
 from aminer import AminerConfig
@@ -99,7 +100,7 @@ class MinimalTransitionTimeDetector(AtomHandlerInterface, TimeTriggeredComponent
         # Use target_path_list to differentiate sequences by their id.
         event_value = ()
         for path in self.target_path_list:
-            match = log_atom.parser_match.get_match_dictionary().get(path)
+            match = log_atom.parser_match.get(path)
             if match is None:
                 if self.allow_missing_id is True:
                     # Insert placeholder for path that is not available
@@ -116,7 +117,7 @@ class MinimalTransitionTimeDetector(AtomHandlerInterface, TimeTriggeredComponent
         # Get current index from combination of values of paths of id_path_list
         id_tuple = ()
         for id_path in self.id_path_list:
-            id_match = log_atom.parser_match.get_match_dictionary().get(id_path)
+            id_match = log_atom.parser_match.get(id_path)
             if id_match is None:
                 if self.allow_missing_id is True:
                     # Insert placeholder for id_path that is not available
@@ -204,77 +205,41 @@ class MinimalTransitionTimeDetector(AtomHandlerInterface, TimeTriggeredComponent
 
     def solidify_matrix(self):
         """Solidify minimal time matrix with the trianlge inequality."""
-        # Initialize list old_pairs with all transitions and a list of all values
-        # The list of old_pairs includes the minimal times which can be used to reduce the minimal ransition times of other transitions
+        # Index all values and store the minimal times of the transitions in both directions of a distance matrix. Missing transitions
+        # have an infinite time. Integer times stay integers in the time matrix.
         values = list(self.time_matrix.keys())
+        value_ids = {value: i for i, value in enumerate(values)}
         for key1 in self.time_matrix:
-            values += [key for key in self.time_matrix[key1] if key not in values]
-        old_pairs = [[key1, key2] for key1 in self.time_matrix for key2 in self.time_matrix[key1]]
-
-        # Check the triangle inequality as long as values are corrected
-        while len(old_pairs) > 0:
-            new_pairs = []
-            for old_pair in old_pairs:
-                # Check triangle inequality value - old_pair[0] - old_pair[1] > value - old_pair[1] and
-                # old_pair[0] - old_pair[1] - value > value - old_pair[0]
-                for value in values:
-                    if value in (old_pair[0], old_pair[1]):
-                        continue
-
-                    # Check value - old_pair[0] - old_pair[1] > value - old_pair[1]
-                    if (old_pair[0] in self.time_matrix and value in self.time_matrix[old_pair[0]]) or (
-                           value in self.time_matrix and old_pair[0] in self.time_matrix[value]):
-
-                        if old_pair[0] in self.time_matrix and value in self.time_matrix[old_pair[0]]:
-                            key_1_1 = old_pair[0]
-                            key_1_2 = value
-                        else:
-                            key_1_1 = value
-                            key_1_2 = old_pair[0]
-
-                        if old_pair[1] in self.time_matrix and value in self.time_matrix[old_pair[1]]:
-                            key_2_1 = old_pair[1]
-                            key_2_2 = value
-                        else:
-                            key_2_1 = value
-                            key_2_2 = old_pair[1]
-
-                        if key_2_1 not in self.time_matrix:
-                            self.time_matrix[key_2_1] = {}
-                        if (key_2_2 not in self.time_matrix[key_2_1] or self.time_matrix[key_1_1][key_1_2] +
-                                self.time_matrix[old_pair[0]][old_pair[1]] < self.time_matrix[key_2_1][key_2_2]):
-                            self.time_matrix[key_2_1][key_2_2] = self.time_matrix[key_1_1][key_1_2] +\
-                                    self.time_matrix[old_pair[0]][old_pair[1]]
-                            if [key_2_1, key_2_2] not in new_pairs:
-                                new_pairs += [[key_2_1, key_2_2]]
-
-                    # Check old_pair[0] - old_pair[1] - value > value - old_pair[0]
-                    if (old_pair[1] in self.time_matrix and value in self.time_matrix[old_pair[1]]) or (
-                           value in self.time_matrix and old_pair[1] in self.time_matrix[value]):
-
-                        if old_pair[1] in self.time_matrix and value in self.time_matrix[old_pair[1]]:
-                            key_1_1 = old_pair[1]
-                            key_1_2 = value
-                        else:
-                            key_1_1 = value
-                            key_1_2 = old_pair[1]
-
-                        if old_pair[0] in self.time_matrix and value in self.time_matrix[old_pair[0]]:
-                            key_2_1 = old_pair[0]
-                            key_2_2 = value
-                        else:
-                            key_2_1 = value
-                            key_2_2 = old_pair[0]
-
-                        if key_2_1 not in self.time_matrix:
-                            self.time_matrix[key_2_1] = {}
-                        if (key_2_2 not in self.time_matrix[key_2_1] or self.time_matrix[key_1_1][key_1_2] +
-                                self.time_matrix[old_pair[0]][old_pair[1]] < self.time_matrix[key_2_1][key_2_2]):
-                            self.time_matrix[key_2_1][key_2_2] = self.time_matrix[key_1_1][key_1_2] +\
-                                    self.time_matrix[old_pair[0]][old_pair[1]]
-                            if [key_2_1, key_2_2] not in new_pairs:
-                                new_pairs += [[key_2_1, key_2_2]]
-            old_pairs = new_pairs
+            for key2 in self.time_matrix[key1]:
+                if key2 not in value_ids:
+                    value_ids[key2] = len(values)
+                    values.append(key2)
+        time_matrix = np.full((len(values), len(values)), np.inf)
+        np.fill_diagonal(time_matrix, 0)
+        time_type = int
+        for key1, transitions in self.time_matrix.items():
+            id1 = value_ids[key1]
+            for key2, transition_time in transitions.items():
+                id2 = value_ids[key2]
+                time_matrix[id1, id2] = time_matrix[id2, id1] = transition_time
+                if not isinstance(transition_time, int):
+                    time_type = float
+
+        # Reduce the minimal transition times with the triangle inequality value_1 - value - value_2 < value_1 - value_2 (Floyd-Warshall).
+        solid_matrix = time_matrix.copy()
+        for i in range(len(values)):
+            np.minimum(solid_matrix, solid_matrix[:, i, None] + solid_matrix[None, i, :], out=solid_matrix)
+
+        # Update the reduced and add the new transitions in the direction they are stored in the time matrix.
+        for id1, id2 in zip(*np.nonzero(np.triu(solid_matrix < time_matrix, 1))):
+            key1 = values[id1]
+            key2 = values[id2]
+            if key2 in self.time_matrix and key1 in self.time_matrix[key2]:
+                self.time_matrix[key2][key1] = time_type(solid_matrix[id1, id2])
+            else:
+                if key1 not in self.time_matrix:
+                    self.time_matrix[key1] = {}
+                self.time_matrix[key1][key2] = time_type(solid_matrix[id1, id2])
 
     def do_timer(self, trigger_time):
         """Check if current ruleset should be persisted."""
@@ -11,6 +11,7 @@ You should have received a copy of the GNU General Public License along with
 this program. If not, see <http://www.gnu.org/licenses/>.
 """
 
+import heapq
 import time
 import logging
 
@@ -31,6 +32,7 @@ class MissingMatchPathValueDetector(AtomHandlerInterface, TimeTriggeredComponent
     NewMatchPathValueDetector. For each unique value extracted by paths, a tracking record is added to expected_values_dict.
     It stores three numbers: the timestamp the extracted value was last seen, the maximum allowed gap between observations and the next
     alerting time when currently in error state. When in normal (alerting) state, the value is zero.
+    The values are indexed by the time when they have to be checked next in a heap, so only the overdue values are checked for every atom.
     """
 
     time_trigger_class = AnalysisContext.TIME_TRIGGER_CLASS_REALTIME
@@ -62,9 +64,6 @@ class MissingMatchPathValueDetector(AtomHandlerInterface, TimeTriggeredComponent
             output_logline=output_logline, combine_values=combine_values, stop_learning_time=stop_learning_time,
             stop_learning_no_anomaly_time=stop_learning_no_anomaly_time
         )
-        # This timestamp is compared with timestamp values from log atoms for activation of alerting logic. The first timestamp from logs
-        # above this value will trigger alerting.
-        self.next_check_timestamp = 0
         self.last_seen_timestamp = 0
         self.log_learned_values = 0
         self.log_new_learned_values = []
@@ -76,6 +75,13 @@ class MissingMatchPathValueDetector(AtomHandlerInterface, TimeTriggeredComponent
 
         self.persistence_file_name = build_persistence_file_name(aminer_config, self.__class__.__name__, persistence_id)
         self.expected_values_dict = {}
+        # The heap of (check time, insertion number, value) tuples. The check time is a lower bound of the time when the value can be
+        # reported missing. The heap may contain outdated tuples, only the tuple with the check time in check_time_dict is valid.
+        self.check_time_heap = []
+        self.check_time_dict = {}
+        # The insertion numbers of the values keep the order of the expected_values_dict when reporting values.
+        self.insertion_number_dict = {}
+        self.next_insertion_number = 0
         self.load_persistence_data()
         self.analysis_string = "Analysis.%s"
 
@@ -107,8 +113,7 @@ class MissingMatchPathValueDetector(AtomHandlerInterface, TimeTriggeredComponent
             value = value_list[i]
             detector_info = self.expected_values_dict.get(value)
             if detector_info is None and self.learn_mode:
-                self.expected_values_dict[value] = [timestamp, self.default_interval, 0, target_path]
-                self.next_check_timestamp = min(self.next_check_timestamp, timestamp + self.default_interval)
+                self.add_expected_value(value, [timestamp, self.default_interval, 0, target_path])
                 self.log_learned_values += 1
                 self.log_new_learned_values.append(value)
                 if self.stop_learning_timestamp is not None and self.stop_learning_no_anomaly_time is not None:
@@ -122,12 +127,13 @@ class MissingMatchPathValueDetector(AtomHandlerInterface, TimeTriggeredComponent
             detector_info = self.expected_values_dict.get(value)
             if detector_info is not None:
                 # Just update the last seen value and switch from non-reporting error state to normal state.
+                unsorted_flag = timestamp < detector_info[0]
                 detector_info[0] = timestamp
-                if detector_info[2] != 0:
-                    if timestamp >= detector_info[2]:
-                        detector_info[2] = 0
-                    # Delta of this detector might be lower than the default maximum recheck time.
-                    self.next_check_timestamp = min(self.next_check_timestamp, timestamp + detector_info[1])
+                if detector_info[2] != 0 and timestamp >= detector_info[2]:
+                    detector_info[2] = 0
+                # The check time only increases with sorted timestamps. Otherwise, the value has to be checked earlier.
+                if unsorted_flag:
+                    self.schedule_check(value, detector_info)
         self.log_success += 1
         return True
 
@@ -136,7 +142,7 @@ class MissingMatchPathValueDetector(AtomHandlerInterface, TimeTriggeredComponent
         value_list = []
         path_list = []
         for target_path in self.target_path_list:
-            match = log_atom.parser_match.get_match_dictionary().get(target_path)
+            match = log_atom.parser_match.get(target_path)
             if match is None:
                 if self.combine_values:
                     return None
@@ -158,45 +164,55 @@ class MissingMatchPathValueDetector(AtomHandlerInterface, TimeTriggeredComponent
             path_list = str(path_list)
         return path_list, value_list
 
+    def add_expected_value(self, value, detector_info):
+        """Add or replace the tracking record of a value and schedule its check."""
+        if value not in self.expected_values_dict:
+            self.insertion_number_dict[value] = self.next_insertion_number
+            self.next_insertion_number += 1
+        self.expected_values_dict[value] = detector_info
+        self.schedule_check(value, detector_info)
+
+    def schedule_check(self, value, detector_info):
+        """Add the time when the value can be reported missing next to the check_time_heap."""
+        check_time = detector_info[0] + detector_info[1]
+        if detector_info[2] > check_time:
+            check_time = detector_info[2]
+        self.check_time_dict[value] = check_time
+        heapq.heappush(self.check_time_heap, (check_time, self.insertion_number_dict[value], value))
+
     def check_timeouts(self, timestamp, log_atom):
         """Check if there was any timeout on a channel, thus triggering event dispatching."""
         old_last_seen_timestamp = self.last_seen_timestamp
         self.last_seen_timestamp = max(self.last_seen_timestamp, timestamp)
-        if self.last_seen_timestamp > self.next_check_timestamp:
+        last_seen_timestamp = self.last_seen_timestamp
+        check_time_heap = self.check_time_heap
+        if check_time_heap and check_time_heap[0][0] <= last_seen_timestamp:
             missing_value_list = []
-            # Start with a large recheck interval. It will be lowered if any of the expectation intervals is below that.
-            if self.next_check_timestamp == 0:
-                self.next_check_timestamp = self.last_seen_timestamp + self.realert_interval
-            for value, detector_info in self.expected_values_dict.items():
-                value_overdue_time = int(self.last_seen_timestamp - detector_info[0] - detector_info[1])
-                if detector_info[2] != 0:
-                    next_check_delta = detector_info[2] - self.last_seen_timestamp
-                    if next_check_delta > 0:
-                        # Already alerted but not ready for realerting yet.
-                        self.next_check_timestamp = min(self.next_check_timestamp, detector_info[2])
-                        continue
-                else:
-                    # No alerting yet, see if alerting is required.
-                    if value_overdue_time < 0:
-                        old = self.next_check_timestamp
-                        self.next_check_timestamp = min(self.next_check_timestamp, self.last_seen_timestamp - value_overdue_time)
-                        if old > self.next_check_timestamp or self.next_check_timestamp < detector_info[2]:
-                            break
-                # avoid early re-alerting
-                if value_overdue_time > 0:
-                    missing_value_list.append([detector_info[3], value, value_overdue_time, detector_info[1]])
-                    # Set the next alerting time.
-                    detector_info[2] = self.last_seen_timestamp + self.realert_interval
-                    self.expected_values_dict[value] = detector_info
+            rescheduled_values = []
+            while check_time_heap and check_time_heap[0][0] <= last_seen_timestamp:
+                check_time, insertion_number, value = heapq.heappop(check_time_heap)
+                detector_info = self.expected_values_dict.get(value)
+                if detector_info is None or self.check_time_dict.get(value) != check_time:
+                    # The value was removed or the tuple is outdated.
+                    continue
+                if last_seen_timestamp - detector_info[0] <= detector_info[1] or last_seen_timestamp < detector_info[2]:
+                    # The value was seen again or is already alerted but not ready for realerting yet.
+                    rescheduled_values.append((value, detector_info))
+                    continue
+                value_overdue_time = int(last_seen_timestamp - detector_info[0] - detector_info[1])
                 # Workaround:
                 # also check for long gaps between same tokens where the last_seen_timestamp gets updated
                 # on the arrival of tokens following a longer gap
-                elif self.last_seen_timestamp - detector_info[0] > detector_info[1]:
-                    value_overdue_time = self.last_seen_timestamp - old_last_seen_timestamp - detector_info[1]
-                    missing_value_list.append([detector_info[3], value, value_overdue_time, detector_info[1]])
-                    # Set the next alerting time.
-                    detector_info[2] = self.last_seen_timestamp + self.realert_interval
-                    self.expected_values_dict[value] = detector_info
+                if value_overdue_time <= 0:
+                    value_overdue_time = last_seen_timestamp - old_last_seen_timestamp - detector_info[1]
+                missing_value_list.append((insertion_number, [detector_info[3], value, value_overdue_time, detector_info[1]]))
+                # Set the next alerting time.
+                detector_info[2] = last_seen_timestamp + self.realert_interval
+                rescheduled_values.append((value, detector_info))
+            for value, detector_info in rescheduled_values:
+                self.schedule_check(value, detector_info)
+            # Report the values in the order of the expected_values_dict.
+            missing_value_list = [missing_value for _, missing_value in sorted(missing_value_list, key=lambda x: x[0])]
             if missing_value_list:
                 if self.stop_learning_timestamp is not None and self.stop_learning_no_anomaly_time is not None:
                     self.stop_learning_timestamp = max(
@@ -279,7 +295,7 @@ class MissingMatchPathValueDetector(AtomHandlerInterface, TimeTriggeredComponent
                 if value[1] != self.default_interval:
                     value[1] = self.default_interval
                     value[2] = value[0] + self.default_interval
-                self.expected_values_dict[key] = value
+                self.add_expected_value(key, value)
             logging.getLogger(DEBUG_LOG_NAME).debug("%s loaded persistence data.", self.__class__.__name__)
 
     def do_persist(self):
@@ -306,10 +322,11 @@ class MissingMatchPathValueDetector(AtomHandlerInterface, TimeTriggeredComponent
             new_interval = self.default_interval
         if new_interval < 0:
             del self.expected_values_dict[event_data[0]]
+            del self.check_time_dict[event_data[0]]
+            del self.insertion_number_dict[event_data[0]]
             logging.getLogger(DEBUG_LOG_NAME).debug("%s removed check value %s.", self.__class__.__name__, str(event_data[0]))
         else:
-            self.expected_values_dict[event_data[0]] = [self.last_seen_timestamp, new_interval, 0, event_data[1]]
-            self.next_check_timestamp = 0
+            self.add_expected_value(event_data[0], [self.last_seen_timestamp, new_interval, 0, event_data[1]])
         return f"Updated '{event_data[0]}' in '{event_data[1]}' to new interval {new_interval}."
 
     def log_statistics(self, component_name):
@@ -342,7 +359,7 @@ class MissingMatchPathListValueDetector(MissingMatchPathValueDetector):
     def get_channel_key(self, log_atom):
         """Get the key identifying the channel this log_atom is coming from."""
         for target_path in self.target_path_list:
-            match_element = log_atom.parser_match.get_match_dictionary().get(target_path)
+            match_element = log_atom.parser_match.get(target_path)
             if match_element is None:
                 continue
             if isinstance(match_element.match_object, bytes):
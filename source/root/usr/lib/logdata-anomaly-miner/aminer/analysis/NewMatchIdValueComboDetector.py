@@ -91,7 +91,7 @@ class NewMatchIdValueComboDetector(AtomHandlerInterface, TimeTriggeredComponentI
                 values were new or not.
         """
         self.log_total += 1
-        match_dict = log_atom.parser_match.get_match_dictionary()
+        parser_match = log_atom.parser_match
         if self.learn_mode is True and self.stop_learning_timestamp is not None and \
                 self.stop_learning_timestamp < log_atom.atom_time:
             logging.getLogger(DEBUG_LOG_NAME).info("Stopping learning in the %s.", self.__class__.__name__)
@@ -100,7 +100,7 @@ class NewMatchIdValueComboDetector(AtomHandlerInterface, TimeTriggeredComponentI
         id_match_element = None
         for id_path in self.id_path_list:
             # Get the id value and return if not found in this log atom.
-            id_match_element = match_dict.get(id_path)
+            id_match_element = parser_match.get(id_path)
             if id_match_element is not None:
                 break
         if id_match_element is None:
@@ -141,7 +141,7 @@ class NewMatchIdValueComboDetector(AtomHandlerInterface, TimeTriggeredComponentI
 
         for target_path in self.target_path_list:
             # Append values to the combo.
-            match_element = match_dict.get(target_path)
+            match_element = parser_match.get(target_path)
             if match_element is not None:
                 if isinstance(match_element, list):
                     values = []
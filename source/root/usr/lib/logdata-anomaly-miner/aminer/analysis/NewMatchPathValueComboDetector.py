@@ -87,10 +87,10 @@ class NewMatchPathValueComboDetector(AtomHandlerInterface, TimeTriggeredComponen
                 self.stop_learning_timestamp < log_atom.atom_time:
             logging.getLogger(DEBUG_LOG_NAME).info("Stopping learning in the %s.", self.__class__.__name__)
             self.learn_mode = False
-        match_dict = log_atom.parser_match.get_match_dictionary()
+        parser_match = log_atom.parser_match
         match_value_list = []
         for target_path in self.target_path_list:
-            match_element = match_dict.get(target_path)
+            match_element = parser_match.get(target_path)
             if match_element is None:
                 if not self.allow_missing_values_flag:
                     return False
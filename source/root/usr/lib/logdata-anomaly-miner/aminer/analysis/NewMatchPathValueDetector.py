@@ -67,14 +67,14 @@ class NewMatchPathValueDetector(AtomHandlerInterface, TimeTriggeredComponentInte
     def receive_atom(self, log_atom):
         """Receive a log atom from a source."""
         self.log_total += 1
-        match_dict = log_atom.parser_match.get_match_dictionary()
+        parser_match = log_atom.parser_match
         if self.learn_mode is True and self.stop_learning_timestamp is not None and \
                 self.stop_learning_timestamp < log_atom.atom_time:
             logging.getLogger(DEBUG_LOG_NAME).info("Stopping learning in the %s.", self.__class__.__name__)
             self.learn_mode = False
 
         for target_path in self.target_path_list:
-            match = match_dict.get(target_path)
+            match = parser_match.get(target_path)
             if match is None:
                 continue
             matches = []
@@ -99,10 +99,10 @@ class NewMatchPathValueDetector(AtomHandlerInterface, TimeTriggeredComponentInte
                         affected_log_atom_values.append(str(match.match_object))
             if len(affected_log_atom_values) > 0:
                 analysis_component = {"AffectedLogAtomPaths": [target_path], "AffectedLogAtomValues": affected_log_atom_values}
-                if isinstance(match_dict.get(target_path), list):
+                if isinstance(parser_match.get(target_path), list):
                     res = {target_path: affected_log_atom_values}
                 else:
-                    res = {target_path: match_dict.get(target_path).match_object}
+                    res = {target_path: parser_match.get(target_path).match_object}
                     if isinstance(res[target_path], bytes):
                         res[target_path] = res[target_path].decode(AminerConfig.ENCODING)
                 try:
@@ -16,6 +16,7 @@ You should have received a copy of the GNU General Public License along with
 this program. If not, see <http://www.gnu.org/licenses/>.
 """
 import copy
+from collections import deque
 import numpy as np
 import logging
 import os
@@ -35,7 +36,7 @@ class PCADetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
 
     def __init__(self, aminer_config, target_path_list, anomaly_event_handlers, window_size, min_anomaly_score, min_variance, num_windows,
                  persistence_id="Default", learn_mode=False, output_logline=True, ignore_list=None, constraint_list=None,
-                 stop_learning_time=None, stop_learning_no_anomaly_time=None):
+                 stop_learning_time=None, stop_learning_no_anomaly_time=None, incremental=False):
         """
         Initialize the detector. This will also trigger reading or creation of persistence storage location.
         @param aminer_config configuration from analysis_context.
@@ -55,6 +56,9 @@ class PCADetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
         @param constraint_list list of paths that have to be present in the log atom to be analyzed.
         @param stop_learning_time switch the learn_mode to False after the time.
         @param stop_learning_no_anomaly_time switch the learn_mode to False after no anomaly was detected for that time.
+        @param incremental if true, the PCA is computed from running sums of the count vectors instead of the count matrix. The weights of
+               older time windows decrease exponentially, so num_windows is the effective number of time windows. Every time window only
+               updates the sums and the persisted model does not grow with the number of time windows.
         """
         # avoid "defined outside init" issue
         self.learn_mode, self.stop_learning_timestamp, self.next_persist_time, self.log_success, self.log_total = [None]*5
@@ -63,7 +67,7 @@ class PCADetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
             anomaly_event_handlers=anomaly_event_handlers, window_size=window_size, min_anomaly_score=min_anomaly_score,
             min_variance=min_variance, num_windows=num_windows, persistence_id=persistence_id, learn_mode=learn_mode,
             output_logline=output_logline, ignore_list=ignore_list, constraint_list=constraint_list, stop_learning_time=stop_learning_time,
-            stop_learning_no_anomaly_time=stop_learning_no_anomaly_time
+            stop_learning_no_anomaly_time=stop_learning_no_anomaly_time, incremental=incremental
         )
         if not self.target_path_list:
             msg = "target_path_list must not be empty or None."
@@ -86,6 +90,16 @@ class PCADetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
         # Calculate Anomaly-Score (Reconstruction Error) for the whole dataset
         self.loss = None
         self.event_count_vector = {}
+        # mean and standard deviation of all counts used for the normalization
+        self.ecm_mean = None
+        self.ecm_std = None
+        # running sums of the incremental mode with the column of every (path, value) feature in the count vectors
+        self.feature_columns = {}
+        self.num_learned_windows = 0
+        self.window_weight = 0.0
+        self.window_sums = np.zeros(0)
+        self.window_products = np.zeros((0, 0))
+        self.window_losses = deque(maxlen=int(num_windows))
 
         self.persistence_file_name = AminerConfig.build_persistence_file_name(aminer_config, self.__class__.__name__, persistence_id)
         PersistenceUtil.add_persistable_component(self)
@@ -113,7 +127,12 @@ class PCADetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
         current_time = log_atom.get_timestamp()
         while current_time >= (self.start_time + self.window_size):
             # PCA computation only possible when at least 3 vectors are present
-            if len(self.event_count_matrix) >= 3 and all(all(len(x.values()) >= 2 for x in y.values()) for y in self.event_count_matrix):
+            if self.incremental:
+                model_ready = len(self.window_losses) >= 3
+            else:
+                model_ready = len(self.event_count_matrix) >= 3 and all(
+                    all(len(x.values()) >= 2 for x in y.values()) for y in self.event_count_matrix)
+            if model_ready:
                 anomaly_score = self.anomaly_score()
                 if anomaly_score > self.min_anomaly_score:
                     try:
@@ -144,13 +163,17 @@ class PCADetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
 
             # Add new values to matrix in learn mode
             if self.learn_mode is True:
-                if len(self.event_count_matrix) >= self.num_windows:
-                    del self.event_count_matrix[0]
-                self.event_count_matrix.append(copy.deepcopy(self.event_count_vector))
-                # PCA computation only possible when at least 3 vectors are present
-                if len(self.event_count_matrix) >= 3 and all(all(len(x.values()) > 1 for x in y.values()) for y in self.event_count_matrix):
-                    self.repair_dict()
-                    self.compute_pca()
+                if self.incremental:
+                    self.update_incremental_pca()
+                else:
+                    if len(self.event_count_matrix) >= self.num_windows:
+                        del self.event_count_matrix[0]
+                    self.event_count_matrix.append(copy.deepcopy(self.event_count_vector))
+                    # PCA computation only possible when at least 3 vectors are present
+                    if len(self.event_count_matrix) >= 3 and all(
+                            all(len(x.values()) > 1 for x in y.values()) for y in self.event_count_matrix):
+                        self.repair_dict()
+                        self.compute_pca()
                 if self.stop_learning_timestamp is not None and self.stop_learning_no_anomaly_time is not None:
                     self.stop_learning_timestamp = max(
                         self.stop_learning_timestamp, log_atom.atom_time + self.stop_learning_no_anomaly_time)
@@ -164,7 +187,7 @@ class PCADetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
             # Event is defined by the full path of log atom.
             constraint_path_flag = False
             for constraint_path in self.constraint_list:
-                if parser_match.get_match_dictionary().get(constraint_path) is not None:
+                if parser_match.get(constraint_path) is not None:
                     constraint_path_flag = True
                     break
             if not constraint_path_flag and self.constraint_list != []:
@@ -178,7 +201,7 @@ class PCADetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
             # Event is defined by values in target_path_list
             all_values_none = True
             for path in self.target_path_list:
-                match = parser_match.get_match_dictionary().get(path)
+                match = parser_match.get(path)
                 if match is None:
                     continue
                 matches = []
@@ -223,7 +246,9 @@ class PCADetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
         self.ecm = np.array(matrix)
 
         # Principal Component Analysis (PCA)
-        normalized_ecm = (self.ecm - self.ecm.mean()) / self.ecm.std()
+        self.ecm_mean = self.ecm.mean()
+        self.ecm_std = self.ecm.std()
+        normalized_ecm = (self.ecm - self.ecm_mean) / self.ecm_std
         covariance_matrix = np.cov(normalized_ecm.T)
         eigen_values, eigen_vectors = np.linalg.eigh(covariance_matrix)
         self.pca_ecm = normalized_ecm @ eigen_vectors
@@ -238,26 +263,72 @@ class PCADetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
         # Calculate Anomaly-Score (Reconstruction Error) for the whole dataset
         self.loss = np.sum((normalized_ecm - pca_inverse)**2, axis=1)
 
-    def anomaly_score(self):
-        """Calculate the anomalyscore for current event_count_vector."""
-        # convert the event_count_vector into an array
+    def update_incremental_pca(self):
+        """Add the current event_count_vector to the running sums of the incremental mode and carry out PCA when possible."""
+        num_features = len(self.feature_columns)
+        for path, events in self.event_count_vector.items():
+            for feature in events:
+                if (path, feature) not in self.feature_columns:
+                    self.feature_columns[(path, feature)] = len(self.feature_columns)
+        if len(self.feature_columns) > num_features:
+            # new features were counted 0 times in all previous time windows.
+            padding = len(self.feature_columns) - num_features
+            self.window_sums = np.pad(self.window_sums, (0, padding))
+            self.window_products = np.pad(self.window_products, (0, padding))
         ecv = self.vector2array()
-        # normalize the ecv with the mean and std of learned ecm
-        normalized_ecv = (ecv - self.ecm.mean()) / self.ecm.std()
-        # reshape array into a 1-dimensional array
-        normalized_ecv = normalized_ecv.reshape(1, -1)
+        decay = 1 - 1 / self.num_windows
+        self.window_weight = decay * self.window_weight + 1
+        self.window_sums = decay * self.window_sums + ecv
+        self.window_products = decay * self.window_products + np.outer(ecv, ecv)
+        self.num_learned_windows += 1
+        # PCA computation only possible when at least 3 vectors are present
+        if self.num_learned_windows >= 3 and all(len(x) > 1 for x in self.event_count_vector.values()):
+            self.compute_incremental_pca()
+            self.window_losses.append(float(self.get_loss(ecv)[0]))
+            self.loss = np.array(self.window_losses)
+
+    def compute_incremental_pca(self):
+        """Carry out PCA on the covariance matrix derived from the running sums of the incremental mode."""
+        num_features = len(self.window_sums)
+        mean_vector = self.window_sums / self.window_weight
+        self.ecm_mean = np.sum(mean_vector) / num_features
+        self.ecm_std = np.sqrt(max(np.trace(self.window_products) / (self.window_weight * num_features) - self.ecm_mean**2, 0))
+        # the covariance matrix of the counts normalized with the mean and std of all counts
+        covariance_matrix = (self.window_products - self.window_weight * np.outer(mean_vector, mean_vector)) / (
+            (self.window_weight - 1) * self.ecm_std**2)
+        eigen_values, self.eigen_vectors = np.linalg.eigh(covariance_matrix)
+        self.n_comp = self.get_n_comp(eigen_values)
+
+    def get_loss(self, ecv):
+        """Calculate the reconstruction error of the event count array ecv."""
+        # normalize the ecv with the mean and std of learned ecm and reshape array into a 1-dimensional array
+        normalized_ecv = ((ecv - self.ecm_mean) / self.ecm_std).reshape(1, -1)
         # calculate the reduced pca for current log-sequence with given eigen_vectors
         pca_ecv = normalized_ecv @ self.eigen_vectors
         # calculate the pca_inverse with reduced number of components / do reconstruction
         pca_inverse_ecv = pca_ecv[:, :self.n_comp] @ self.eigen_vectors[:self.n_comp, :]
         # calculate the reconstruction error / anomaly score
-        loss = np.sum((normalized_ecv - pca_inverse_ecv)**2, axis=1)
+        return np.sum((normalized_ecv - pca_inverse_ecv)**2, axis=1)
+
+    def anomaly_score(self):
+        """Calculate the anomalyscore for current event_count_vector."""
+        # convert the event_count_vector into an array. Features added to the running sums after the last PCA are not used.
+        ecv = self.vector2array()[:len(self.eigen_vectors)]
+        loss = self.get_loss(ecv)
         # scale the reconstruction error with the min, max of ecm-loss
         loss = (loss - np.min(self.loss)) / (np.max(self.loss) - np.min(self.loss))
         return loss
 
     def vector2array(self):
         """Extract only the values which were learned before from current self.event_count_vector and return an array."""
+        if self.incremental:
+            vector = np.zeros(len(self.feature_columns))
+            for path, events in self.event_count_vector.items():
+                for feature, value in events.items():
+                    column = self.feature_columns.get((path, feature))
+                    if column is not None:
+                        vector[column] = value
+            return vector
         vector = []
         for event in self.event_count_vector.values():
             for feature, value in event.items():
@@ -310,12 +381,42 @@ class PCADetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
 
     def do_persist(self):
         """Immediately write persistence data to storage."""
-        PersistenceUtil.store_json(self.persistence_file_name, list(self.event_count_matrix))
+        if self.incremental:
+            PersistenceUtil.store_json(self.persistence_file_name, {
+                "feature_columns": [list(feature) for feature in self.feature_columns], "num_learned_windows": self.num_learned_windows,
+                "window_weight": self.window_weight, "window_sums": self.window_sums.tolist(),
+                "window_products": self.window_products.tolist(), "window_losses": list(self.window_losses)})
+        else:
+            PersistenceUtil.store_json(self.persistence_file_name, list(self.event_count_matrix))
 
     def load_persistence_data(self):
         """Load the persistence data from storage."""
         persistence_data = PersistenceUtil.load_json(self.persistence_file_name)
-        if persistence_data is not None:
+        if isinstance(persistence_data, dict):
+            if not self.incremental:
+                msg = "The persisted running sums of the incremental mode can not be used without incremental. Starting with an empty " \
+                      "count matrix."
+                logging.getLogger(DEBUG_LOG_NAME).warning(msg)
+                return
+            for path, feature in persistence_data["feature_columns"]:
+                self.feature_columns[(path, feature)] = len(self.feature_columns)
+                self.event_count_vector.setdefault(path, {})[feature] = 0
+            self.num_learned_windows = persistence_data["num_learned_windows"]
+            self.window_weight = persistence_data["window_weight"]
+            self.window_sums = np.array(persistence_data["window_sums"], dtype=float)
+            n = len(self.window_sums)
+            self.window_products = np.array(persistence_data["window_products"], dtype=float).reshape(n, n)
+            self.window_losses.extend(persistence_data["window_losses"])
+            if self.window_losses:
+                self.compute_incremental_pca()
+                self.loss = np.array(self.window_losses)
+        elif persistence_data is not None and self.incremental:
+            # add the persisted count matrix to the running sums.
+            for event_count_vector in persistence_data:
+                self.event_count_vector = event_count_vector
+                self.update_incremental_pca()
+            self.reset_event_count_vector()
+        elif persistence_data is not None:
             self.event_count_matrix = list(persistence_data)
             self.compute_pca()
             # Copy feature list into event count vector and reset counts of each feature
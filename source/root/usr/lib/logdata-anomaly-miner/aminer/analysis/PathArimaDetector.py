@@ -13,7 +13,6 @@ this program. If not, see <http://www.gnu.org/licenses/>.
 """
 import logging
 import numpy as np
-import statsmodels
 import statsmodels.api as sm
 
 from aminer import AminerConfig
@@ -23,6 +22,8 @@ from aminer.AnalysisChild import AnalysisContext
 from aminer.input.InputInterfaces import AtomHandlerInterface
 from aminer.util.TimeTriggeredComponentInterface import TimeTriggeredComponentInterface
 from aminer.util import PersistenceUtil
+from aminer.util.ModelRefitService import model_refit_service
+from aminer.analysis.TSAArimaDetector import fit_arima_model
 from scipy import stats, version
 binomial_test = None
 v = [int(x) for x in version.full_version.split(".")]
@@ -101,6 +102,8 @@ class PathArimaDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
         self.period_length_list = []
         # List of the single arima_models (statsmodels)
         self.arima_models = []
+        # Values of the event types and variable indices, which occurred while their arima_models are fitted in the background
+        self.pending_refit_values = {}
         # List of the observed values and the predictions of the TSAArima
         self.prediction_history = []
         # List of the results if th value was in the limits of the one step predictions
@@ -265,10 +268,20 @@ class PathArimaDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
             affected_path = [self.event_type_detector.variable_key_list[event_index][count_index] for count_index in delete_indices]
             self.print(message, log_atom, affected_path)
 
+        # Apply the arima_models fitted in the background
+        model_refit_service.apply_results(self)
+
         # Initialize and update the arima_model if possible
         for count_index, var_index in enumerate(self.target_path_index_list[event_index]):
+            # Keep the new value until the arima_model fitted in the background is ready
+            if (event_index, var_index) in self.pending_refit_values:
+                self.prediction_history[event_index][count_index][0].append(0)
+                self.prediction_history[event_index][count_index][1].append(self.event_type_detector.values[event_index][var_index][-1])
+                self.prediction_history[event_index][count_index][2].append(0)
+                self.pending_refit_values[(event_index, var_index)].append(self.event_type_detector.values[event_index][var_index][-1])
+
             # Initialize the arima_model if possible
-            if self.learn_mode and self.arima_models[event_index][count_index] is None:
+            elif self.learn_mode and self.arima_models[event_index][count_index] is None:
                 if self.period_length_list[event_index][count_index] is not None:
 
                     # Add the current value to the lists
@@ -284,16 +297,13 @@ class PathArimaDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
                         affected_path = self.event_type_detector.variable_key_list[event_index][count_index]
                         self.print(message, log_atom, affected_path)
 
-                        # Add the arima_model to the list
-                        try:
-                            model = statsmodels.tsa.arima.model.ARIMA(
-                                    self.event_type_detector.values[event_index][var_index][
-                                        -self.num_periods_tsa_ini * self.period_length_list[event_index][count_index]:],
-                                    order=(self.period_length_list[event_index][count_index], 0, 0),
-                                    seasonal_order=(0, 0, 0, self.period_length_list[event_index][count_index]))
-                            self.arima_models[event_index][count_index] = model.fit()
-                        except:  # skipcq FLK-E722
-                            self.arima_models[event_index][count_index] = None
+                        # Fit the arima_model in the background and add it to the list, when it is ready
+                        self.pending_refit_values[(event_index, var_index)] = []
+                        model_refit_service.submit(self, fit_arima_model, (
+                            self.event_type_detector.get_value_array(
+                                event_index, var_index, self.num_periods_tsa_ini * self.period_length_list[event_index][count_index]),
+                            self.period_length_list[event_index][count_index]), lambda arima_model, event_index=event_index,
+                            var_index=var_index: self.apply_arima_model(event_index, var_index, arima_model))
                     if self.stop_learning_timestamp is not None and self.stop_learning_no_anomaly_time is not None:
                         self.stop_learning_timestamp = max(
                             self.stop_learning_timestamp, log_atom.atom_time + self.stop_learning_no_anomaly_time)
@@ -364,6 +374,16 @@ class PathArimaDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
                     # Update the model
                     self.arima_models[event_index][count_index] = self.arima_models[event_index][count_index].append([count])
 
+    def apply_arima_model(self, event_index, var_index, arima_model):
+        """Add the arima_model fitted in the background to the list and update it with the values, which occurred during the fit."""
+        values = self.pending_refit_values.pop((event_index, var_index))
+        # The target path may have been disabled during the fit
+        if var_index not in self.target_path_index_list[event_index]:
+            return
+        if arima_model is not None and values:
+            arima_model = arima_model.append(values)
+        self.arima_models[event_index][self.target_path_index_list[event_index].index(var_index)] = arima_model
+
     def one_step_prediction(self, event_index, count_index):
         """Make a one-step prediction with the Arima model"""
         prediction = self.arima_models[event_index][count_index].get_forecast(1)
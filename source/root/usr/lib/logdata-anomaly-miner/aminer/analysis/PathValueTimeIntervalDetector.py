@@ -105,7 +105,7 @@ class PathValueTimeIntervalDetector(AtomHandlerInterface, TimeTriggeredComponent
         # Get current index from combination of values of paths of target_path_list
         id_tuple = ()
         for id_path in self.target_path_list:
-            id_match = log_atom.parser_match.get_match_dictionary().get(id_path)
+            id_match = log_atom.parser_match.get(id_path)
             if id_match is None:
                 if self.allow_missing_values_flag is True:
                     # Insert placeholder for id_path that is not available
@@ -322,10 +322,10 @@ class ValueDependentDelegatedMatchRule(MatchRule):
         @return True when selected delegation rule matched.
         """
         self.log_total += 1
-        match_dict = log_atom.parser_match.get_match_dictionary()
+        parser_match = log_atom.parser_match
         value_list = []
         for path in self.target_path_list:
-            value_element = match_dict.get(path)
+            value_element = parser_match.get(path)
             if value_element is not None:
                 value_list.append(value_element.match_object)
         if len(value_list) > 0:
@@ -398,7 +398,7 @@ class PathExistsMatchRule(MatchRule):
     def match(self, log_atom):
         """Check if this rule matches. On match an optional match_action could be triggered."""
         self.log_total += 1
-        if self.target_path in log_atom.parser_match.get_match_dictionary():
+        if self.target_path in log_atom.parser_match:
             if self.match_action is not None:
                 self.match_action.match_action(log_atom)
             self.log_success += 1
@@ -436,7 +436,7 @@ class ValueMatchRule(MatchRule):
     def match(self, log_atom):
         """Check if this rule matches. On match an optional match_action could be triggered."""
         self.log_total += 1
-        test_value = log_atom.parser_match.get_match_dictionary().get(self.target_path, None)
+        test_value = log_atom.parser_match.get(self.target_path, None)
         if test_value is not None:
             if isinstance(self.value, bytes) and isinstance(test_value.match_object, str) and test_value.match_object is not None:
                 test_value.match_object = test_value.match_object.encode()
@@ -490,7 +490,7 @@ class ValueListMatchRule(MatchRule):
     def match(self, log_atom):
         """Check if this rule matches. On match an optional match_action could be triggered."""
         self.log_total += 1
-        test_value = log_atom.parser_match.get_match_dictionary().get(self.target_path)
+        test_value = log_atom.parser_match.get(self.target_path)
         if (test_value is not None) and (test_value.match_object in self.target_value_list):
             if self.match_action is not None:
                 self.match_action.match_action(log_atom)
@@ -538,7 +538,7 @@ class ValueRangeMatchRule(MatchRule):
     def match(self, log_atom):
         """Check if this rule matches. On match an optional match_action could be triggered."""
         self.log_total += 1
-        test_value = log_atom.parser_match.get_match_dictionary().get(self.target_path, None)
+        test_value = log_atom.parser_match.get(self.target_path, None)
         if test_value is None:
             return False
         test_value = test_value.match_object
@@ -581,7 +581,7 @@ class StringRegexMatchRule(MatchRule):
         """Check if this rule matches. On match an optional match_action could be triggered."""
         self.log_total += 1
         # Use the class object as marker for nonexisting entries
-        test_value = log_atom.parser_match.get_match_dictionary().get(self.target_path, None)
+        test_value = log_atom.parser_match.get(self.target_path, None)
         if (test_value is None) or (self.match_regex.match(test_value.match_string) is None):
             return False
         if self.match_action is not None:
@@ -669,7 +669,7 @@ class ModuloTimeMatchRule(MatchRule):
         if self.target_path is None:
             test_value = log_atom.get_timestamp()
         else:
-            time_match = log_atom.parser_match.get_match_dictionary().get(self.target_path, None)
+            time_match = log_atom.parser_match.get(self.target_path, None)
             if time_match is None:
                 return False
             test_value = time_match.match_object + datetime.now(self.tzinfo).utcoffset().total_seconds()
@@ -762,10 +762,10 @@ class ValueDependentModuloTimeMatchRule(MatchRule):
     def match(self, log_atom):
         """Check if this rule matches. On match an optional match_action could be triggered."""
         self.log_total += 1
-        match_dict = log_atom.parser_match.get_match_dictionary()
+        parser_match = log_atom.parser_match
         value_list = []
         for path in self.target_path_list:
-            value_element = match_dict.get(path)
+            value_element = parser_match.get(path)
             if value_element is not None:
                 value_list.append(value_element.match_object)
 
@@ -780,7 +780,7 @@ class ValueDependentModuloTimeMatchRule(MatchRule):
         if self.target_path is None:
             test_value = log_atom.get_timestamp()
         else:
-            time_match = log_atom.parser_match.get_match_dictionary().get(self.target_path, None)
+            time_match = log_atom.parser_match.get(self.target_path, None)
             if time_match is None:
                 return False
             test_value = time_match.match_object + datetime.now(self.tzinfo).utcoffset().total_seconds()
@@ -819,7 +819,7 @@ class IPv4InRFC1918MatchRule(MatchRule):
     def match(self, log_atom):
         """Check if this rule matches. On match an optional match_action could be triggered."""
         self.log_total += 1
-        match_element = log_atom.parser_match.get_match_dictionary().get(self.target_path)
+        match_element = log_atom.parser_match.get(self.target_path)
         if (match_element is None) or not isinstance(match_element.match_object, int):
             return False
         value = match_element.match_object
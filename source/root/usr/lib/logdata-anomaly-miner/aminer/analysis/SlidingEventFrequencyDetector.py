@@ -24,7 +24,7 @@ class SlidingEventFrequencyDetector(AtomHandlerInterface):
 
     def __init__(self, aminer_config, anomaly_event_handlers, set_upper_limit, target_path_list=None, scoring_path_list=None,
                  window_size=600, local_maximum_threshold=0.2, persistence_id="Default", learn_mode=False, output_logline=True,
-                 ignore_list=None, constraint_list=None, stop_learning_time=None, stop_learning_no_anomaly_time=None):
+                 ignore_list=None, constraint_list=None, stop_learning_time=None, stop_learning_no_anomaly_time=None, num_buckets=None):
         """
         Initialize the detector.
         @param aminer_config configuration from analysis_context.
@@ -43,6 +43,10 @@ class SlidingEventFrequencyDetector(AtomHandlerInterface):
         @param ignore_list list of paths that are not considered for analysis, i.e., events that contain one of these paths are omitted.
                The default value is [] as None is not iterable.
         @param constraint_list list of paths that have to be present in the log atom to be analyzed.
+        @param num_buckets if set, the time window is divided into num_buckets sub-windows and only the number of events in every
+               sub-window is stored instead of the times of all events. This bounds the memory independent of the event rate, but
+               events are only removed from the window when their whole sub-window fell out of it. Therefore, the frequency may
+               include the events of up to window_size / num_buckets seconds before the time window.
         """
         # Avoid "defined outside init" issue
         self.learn_mode, self.stop_learning_timestamp, self.next_persist_time, self.log_success, self.log_total = [None]*5
@@ -52,13 +56,30 @@ class SlidingEventFrequencyDetector(AtomHandlerInterface):
             scoring_path_list=scoring_path_list, set_upper_limit=set_upper_limit, local_maximum_threshold=local_maximum_threshold,
             persistence_id=persistence_id, learn_mode=learn_mode, output_logline=output_logline, ignore_list=ignore_list,
             constraint_list=constraint_list, stop_learning_time=stop_learning_time,
-            stop_learning_no_anomaly_time=stop_learning_no_anomaly_time
+            stop_learning_no_anomaly_time=stop_learning_no_anomaly_time, num_buckets=num_buckets
         )
         if not self.set_upper_limit:
             msg = "set_upper_limit must not be None."
             logging.getLogger(DEBUG_LOG_NAME).error(msg)
             raise TypeError(msg)
+        if self.num_buckets is not None:
+            if not isinstance(self.num_buckets, int):
+                msg = "num_buckets has to be of the type integer."
+                logging.getLogger(DEBUG_LOG_NAME).error(msg)
+                raise TypeError(msg)
+            if len(self.scoring_path_list) > 0:
+                msg = "The scoring_path_list can not be used with num_buckets, as the scoring values of all events in the time window " \
+                      "have to be stored."
+                logging.getLogger(DEBUG_LOG_NAME).error(msg)
+                raise ValueError(msg)
+            self.bucket_size = self.window_size / self.num_buckets
+        # The times of the events in the time window in the order of the log atoms or the [start time, count] lists of the sub-windows if
+        # num_buckets is used.
         self.counts = {}
+        # The number of events in the sub-windows of the counts if num_buckets is used.
+        self.frequencies = {}
+        # The number of times removed from the counts whose scoring values were not removed yet.
+        self.removed_counts = {}
         self.scoring_value_list = {}
         self.max_frequency = {}
         self.max_frequency_time = {}
@@ -87,7 +108,7 @@ class SlidingEventFrequencyDetector(AtomHandlerInterface):
             # Event is defined by the full path of log atom.
             constraint_path_flag = False
             for constraint_path in self.constraint_list:
-                if parser_match.get_match_dictionary().get(constraint_path) is not None:
+                if parser_match.get(constraint_path) is not None:
                     constraint_path_flag = True
                     break
             if not constraint_path_flag and self.constraint_list != []:
@@ -98,7 +119,7 @@ class SlidingEventFrequencyDetector(AtomHandlerInterface):
             values = []
             all_values_none = True
             for path in self.target_path_list:
-                match = parser_match.get_match_dictionary().get(path)
+                match = parser_match.get(path)
                 if match is None:
                     continue
                 matches = []
@@ -122,6 +143,8 @@ class SlidingEventFrequencyDetector(AtomHandlerInterface):
         if log_event not in self.counts:
             # Initialize counts, max_frequency, max_frequency_time exceeded_frequency_range and self.exceeded_frequency_range_time
             self.counts[log_event] = deque()
+            self.frequencies[log_event] = 0
+            self.removed_counts[log_event] = 0
             self.max_frequency[log_event] = 0
             self.max_frequency_time[log_event] = 0
             self.max_frequency_log_atom[log_event] = None
@@ -131,13 +154,23 @@ class SlidingEventFrequencyDetector(AtomHandlerInterface):
             if len(self.scoring_path_list) > 0:
                 self.scoring_value_list[log_event] = deque()
 
-        # Append current time to the counts list
-        self.counts[log_event].append(log_atom.atom_time)
+        # Append current time to the counts list or count it in the current sub-window
+        if self.num_buckets is None:
+            self.counts[log_event].append(log_atom.atom_time)
+        else:
+            counts = self.counts[log_event]
+            bucket_start = log_atom.atom_time - log_atom.atom_time % self.bucket_size
+            # Events with times before the current sub-window are counted in the current sub-window.
+            if len(counts) > 0 and counts[-1][0] >= bucket_start:
+                counts[-1][1] += 1
+            else:
+                counts.append([bucket_start, 1])
+            self.frequencies[log_event] += 1
 
         # Get the id list if the scoring_path_list is set and save it for the anomaly message
         if len(self.scoring_path_list) > 0:
             for scoring_path in self.scoring_path_list:
-                scoring_match = log_atom.parser_match.get_match_dictionary().get(scoring_path)
+                scoring_match = log_atom.parser_match.get(scoring_path)
                 if scoring_match is not None:
                     # Get the value of the current path
                     if isinstance(scoring_match.match_object, bytes):
@@ -245,14 +278,34 @@ class SlidingEventFrequencyDetector(AtomHandlerInterface):
 
     def reset_counter(self, log_atom, log_event):
         """Remove any times from counts and scoring_value_list that fell out of the time window"""
-        while len(self.counts[log_event]) > 0 and self.counts[log_event][0] < log_atom.atom_time - self.window_size:
-            self.counts[log_event].popleft()
-            if len(self.scoring_path_list) > 0:
-                self.scoring_value_list[log_event].popleft()
+        self.remove_old_counts(log_atom, log_event)
+        if len(self.scoring_path_list) > 0:
+            scoring_values = self.scoring_value_list[log_event]
+            for _ in range(min(self.removed_counts[log_event], len(scoring_values))):
+                scoring_values.popleft()
+        self.removed_counts[log_event] = 0
+
+    def remove_old_counts(self, log_atom, log_event):
+        """
+        Remove the times or sub-windows that fell out of the time window from the left of the counts. As the times are appended in the
+        order of the log atoms, this needs amortized constant time per log atom.
+        """
+        counts = self.counts[log_event]
+        window_start = log_atom.atom_time - self.window_size
+        if self.num_buckets is None:
+            while len(counts) > 0 and counts[0] < window_start:
+                counts.popleft()
+                self.removed_counts[log_event] += 1
+        else:
+            while len(counts) > 0 and counts[0][0] + self.bucket_size <= window_start:
+                self.frequencies[log_event] -= counts.popleft()[1]
 
     def get_current_frequency(self, log_atom, log_event):
         """Return current frequency of the current log event."""
-        return len([None for timestamp in self.counts[log_event] if timestamp >= log_atom.atom_time - self.window_size])
+        self.remove_old_counts(log_atom, log_event)
+        if self.num_buckets is None:
+            return len(self.counts[log_event])
+        return self.frequencies[log_event]
 
     def get_weight_analysis_field_path(self):
         """Return the path to the list in the output of the detector which is weighted by the ScoringEventHandler."""
@@ -22,6 +22,7 @@ from aminer.AnalysisChild import AnalysisContext
 from aminer.input.InputInterfaces import AtomHandlerInterface
 from aminer.util.TimeTriggeredComponentInterface import TimeTriggeredComponentInterface
 from aminer.util import PersistenceUtil
+from aminer.util.ModelRefitService import model_refit_service
 
 import numpy as np
 from statsmodels.tsa.arima.model import ARIMA
@@ -105,6 +106,7 @@ class TSAArimaDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
         self.num_event_lines_ref = []  # Reference containing the number of lines of the events for the TSA
         self.time_window_history = []  # History of the time windows
         self.arima_models = []  # List of the single arima_models (statsmodels)
+        self.pending_refit_values = {}  # Values of the event types, which occurred while their arima_models are fitted in the background
         self.prediction_history = []  # List of the observed values and the predictions of the TSAArima
         self.time_history = []  # List of the times of the observations
         self.result_list = []  # List of results if the value was in the limits of the one-step predictions
@@ -366,8 +368,11 @@ class TSAArimaDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
             self.time_history += [[] for _ in range(event_index + 1 - len(self.time_history))]
             self.result_list += [[1]*self.num_results_bt for _ in range(event_index + 1 - len(self.result_list))]
 
+        # Apply the arima_models fitted in the background
+        model_refit_service.apply_results(self)
+
         # Initialize the arima_model if needed
-        if self.learn_mode and self.arima_models[event_index] is None:
+        if self.learn_mode and self.arima_models[event_index] is None and event_index not in self.pending_refit_values:
             # Add the new count to the history and shorten it, if necessary
             self.time_window_history[event_index].append(count)
             if len(self.time_window_history[event_index]) > 2 * self.num_periods_tsa_ini * self.num_division_time_step:
@@ -381,30 +386,27 @@ class TSAArimaDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
                 self.print(message, log_atom, affected_path)
 
                 if not self.build_sum_over_values:
-                    # Add the arima_model to the list
-                    try:
-                        model = ARIMA(
-                                self.time_window_history[event_index][-self.num_periods_tsa_ini*self.num_division_time_step:],
-                                order=(self.num_division_time_step, 0, 0), seasonal_order=(0, 0, 0, self.num_division_time_step))
-                        self.arima_models[event_index] = model.fit()
-                    except:  # skipcq FLK-E722
-                        self.arima_models[event_index] = None
+                    time_series = self.time_window_history[event_index][-self.num_periods_tsa_ini*self.num_division_time_step:]
                 else:
-                    # Add the arima_model to the list
-                    try:
-                        model = ARIMA([sum(self.time_window_history[event_index][
-                                -self.num_periods_tsa_ini*self.num_division_time_step+i:
-                                -(self.num_periods_tsa_ini-1)*self.num_division_time_step+i]) for i in
-                                range((self.num_periods_tsa_ini-1)*self.num_division_time_step)]+[
-                                sum(self.time_window_history[event_index][-self.num_division_time_step:])],
-                                order=(self.num_division_time_step, 0, 0), seasonal_order=(0, 0, 0, self.num_division_time_step))
-                        self.arima_models[event_index] = model.fit()
-                    except:  # skipcq FLK-E722
-                        self.arima_models[event_index] = None
-                        self.time_window_history[event_index] = []
+                    time_series = [sum(self.time_window_history[event_index][
+                            -self.num_periods_tsa_ini*self.num_division_time_step+i:
+                            -(self.num_periods_tsa_ini-1)*self.num_division_time_step+i]) for i in
+                            range((self.num_periods_tsa_ini-1)*self.num_division_time_step)]+[
+                            sum(self.time_window_history[event_index][-self.num_division_time_step:])]
+                # Fit the arima_model in the background and add it to the list, when it is ready
+                self.pending_refit_values[event_index] = []
+                model_refit_service.submit(self, fit_arima_model, (time_series, self.num_division_time_step), lambda arima_model,
+                                           event_index=event_index: self.apply_arima_model(event_index, arima_model))
             if self.stop_learning_timestamp is not None and self.stop_learning_no_anomaly_time is not None:
                 self.stop_learning_timestamp = max(
                     self.stop_learning_timestamp, log_atom.atom_time + self.stop_learning_no_anomaly_time)
+        # Keep the new value until the arima_model fitted in the background is ready
+        elif event_index in self.pending_refit_values:
+            if not self.build_sum_over_values:
+                self.pending_refit_values[event_index].append(count)
+            else:
+                self.time_window_history[event_index].append(count)
+                self.pending_refit_values[event_index].append(sum(self.time_window_history[event_index][-self.num_division_time_step:]))
         # Add the new value and make a one-step prediction
         elif self.arima_models[event_index] is not None:
             if not self.build_sum_over_values:
@@ -498,6 +500,18 @@ class TSAArimaDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
                 # Update the model, for the next step
                 self.arima_models[event_index] = self.arima_models[event_index].append([count_sum])
 
+    def apply_arima_model(self, event_index, arima_model):
+        """Add the arima_model fitted in the background to the list and update it with the values, which occurred during the fit."""
+        values = self.pending_refit_values.pop(event_index)
+        if arima_model is None:
+            if not self.build_sum_over_values:
+                self.time_window_history[event_index] += values
+            else:
+                self.time_window_history[event_index] = []
+        elif values:
+            arima_model = arima_model.append(values)
+        self.arima_models[event_index] = arima_model
+
     def one_step_prediction(self, event_index):
         """Make a one step prediction with the Arima model"""
         prediction = self.arima_models[event_index].get_forecast(1)
@@ -555,3 +569,12 @@ class TSAArimaDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
         for listener in self.anomaly_event_handlers:
             # skipcq: PYL-C0209, FLK-E501
             listener.receive_event(f"Analysis.{self.__class__.__name__}", message, sorted_log_lines, event_data, log_atom, self)
+
+
+def fit_arima_model(time_series, num_division_time_step):
+    """Fit the arima model of the time series. This function is called by the model refit service. Return None if the fit failed."""
+    try:
+        model = ARIMA(time_series, order=(num_division_time_step, 0, 0), seasonal_order=(0, 0, 0, num_division_time_step))
+        return model.fit()
+    except:  # skipcq FLK-E722
+        return None
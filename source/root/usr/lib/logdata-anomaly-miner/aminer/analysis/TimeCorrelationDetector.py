@@ -171,7 +171,7 @@ class TimeCorrelationDetector(AtomHandlerInterface):
             key_pos = random.randint(0, len(all_keys) - 1)
             key_name = all_keys[key_pos]
             all_keys = all_keys[:key_pos] + all_keys[key_pos + 1:]
-            key_value = parser_match.get_match_dictionary().get(key_name).match_object
+            key_value = parser_match.get(key_name).match_object
             # Not much sense handling parsed date values in this implementation, so just ignore this attribute.
             if (isinstance(key_value, tuple)) and (isinstance(key_value[0], datetime)):
                 if not all_keys:
@@ -89,7 +89,7 @@ class ValueRangeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface,
         values = []
         all_values_none = True
         for path in self.target_path_list:
-            match = parser_match.get_match_dictionary().get(path)
+            match = parser_match.get(path)
             if match is None:
                 continue
             matches = []
@@ -108,7 +108,7 @@ class ValueRangeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface,
         # Store all values from id paths in a list. Use empty list as default path if not applicable.
         id_vals = []
         for path in self.id_path_list:
-            match = parser_match.get_match_dictionary().get(path)
+            match = parser_match.get(path)
             if match is None:
                 continue
             matches = []
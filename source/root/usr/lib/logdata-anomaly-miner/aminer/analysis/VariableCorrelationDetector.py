@@ -208,7 +208,7 @@ class VariableCorrelationDetector(AtomHandlerInterface, TimeTriggeredComponentIn
                 return False
         constraint_path_flag = False
         for constraint_path in self.constraint_list:
-            if parser_match.get_match_dictionary().get(constraint_path) is not None:
+            if parser_match.get(constraint_path) is not None:
                 constraint_path_flag = True
                 break
         if not constraint_path_flag and self.constraint_list != []:
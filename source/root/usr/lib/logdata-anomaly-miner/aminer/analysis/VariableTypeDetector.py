@@ -12,7 +12,7 @@ this program. If not, see <http://www.gnu.org/licenses/>.
 """
 import numpy as np
 import copy
-from scipy.stats import kstest, ks_2samp, norm, multinomial, distributions, chisquare
+from scipy.stats import ks_2samp, norm, multinomial, distributions, chisquare
 import os
 import logging
 import sys
@@ -408,7 +408,7 @@ class VariableTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface
         if self.target_path_list is None or len(self.target_path_list) == 0:
             constraint_path_flag = False
             for constraint_path in self.constraint_list:
-                if parser_match.get_match_dictionary().get(constraint_path) is not None:
+                if parser_match.get(constraint_path) is not None:
                     constraint_path_flag = True
                     break
             if not constraint_path_flag and self.constraint_list != []:
@@ -614,6 +614,9 @@ class VariableTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface
                 index_list = self.variable_path_num[event_index]
             self.log_updated += len(index_list)
 
+            # Calculate the test statistics of the continuous distributions of all variables together
+            s_gof_statistics = self.s_gof_test_statistics(event_index, index_list)
+
             # Update the variable types and history list
             for var_index in index_list:
                 # Skips the variable if check_variable is False
@@ -621,7 +624,7 @@ class VariableTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface
                     continue
 
                 # Update variable types
-                self.update_var_type(event_index, var_index, log_atom)
+                self.update_var_type(event_index, var_index, log_atom, s_gof_statistics.get(var_index))
 
                 # This section updates the history list of the variable types
                 if self.var_type[event_index][var_index][0] in self.var_type_history_list_order:
@@ -980,80 +983,40 @@ class VariableTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface
         values = np.array(values)
 
         if self.used_gof_test == 'KS':
-            # Test for uniform distribution
-            min_val = min(values)
-            max_val = max(values)
-            if self.gof_alpha in self.crit_val_ini_ks and self.num_init in self.crit_val_ini_ks[self.gof_alpha]:
-                significance.append(self.gof_alpha * self.crit_val_ini_ks[self.gof_alpha][self.num_init][
-                    'uni'] / kstest(values, 'uniform', args=(min_val, max_val - min_val))[0])
-                distribution.append(['uni', min_val, max_val])
-            else:
-                significance.append(kstest(values, 'uniform', args=(min_val, max_val - min_val))[1])
-                distribution.append(['uni', min_val, max_val])
+            # The values are sorted once and all transformations are increasing, so the transformed values stay sorted
+            sorted_values = np.sort(values)
+            min_val = sorted_values[0]
+            max_val = sorted_values[-1]
 
-            # Test for normal distribution
             # Getting the expected value and sigma
             [ev, sigma] = norm.fit(values)
 
-            # KS-test of the standardised values and the distribution
-            if self.gof_alpha in self.crit_val_ini_ks and self.num_init in self.crit_val_ini_ks[self.gof_alpha]:
-                significance.append(self.gof_alpha * self.crit_val_ini_ks[self.gof_alpha][self.num_init][
-                    'nor'] / kstest((values - ev) / sigma, 'norm')[0])
-                distribution.append(['nor', ev, sigma, min_val, max_val])
-            else:
-                significance.append(kstest((values - ev) / sigma, 'norm')[1])
-                distribution.append(['nor', ev, sigma, min_val, max_val])
-
-            # Test for beta distribution
             # (0.5*0.5/((0.5+0.5+1)(0.5+0.5)^2))^(1/2) = 2.82842712
             ev_tmp = (min_val + max_val) / 2
             sigma_tmp = (max_val - min_val) / 2.82842712
 
+            # KS-tests for the uniform, normal and beta distributions with the standardised values
+            test_statistics = gof_test_statistics(np.array([
+                sorted_values,
+                (sorted_values - ev) / sigma,
+                (sorted_values-min_val)/(max_val-min_val),
+                (sorted_values-ev)/sigma*pow(5*2/(5+2+1), 1/2)/(5+2)+5/(5+2),
+                (sorted_values-ev)/sigma*pow(5*2/(5+2+1), 1/2)/(5+2)+2/(5+2),
+                (sorted_values-ev)/sigma*pow(1*5/(1+5+1), 1/2)/(1+5)+1/(1+5),
+                (sorted_values-ev)/sigma*pow(1*5/(1+5+1), 1/2)/(1+5)+5/(1+5)]), [
+                ('uniform', (min_val, max_val - min_val)), ('norm', ()), ('beta', (0.5, 0.5)), ('beta', (5, 2)), ('beta', (2, 5)),
+                ('beta', (1, 5)), ('beta', (5, 1))], 'KS')
             if self.gof_alpha in self.crit_val_ini_ks and self.num_init in self.crit_val_ini_ks[self.gof_alpha]:
-                significance.append(self.gof_alpha * self.crit_val_ini_ks[self.gof_alpha][self.num_init][
-                    'beta1'] / kstest((values-min_val)/(max_val-min_val), 'beta', args=(0.5, 0.5))[0])
-                distribution.append(['beta', ev_tmp, sigma_tmp, min_val, max_val, 1])
-            else:
-                significance.append(kstest((values-min_val)/(max_val-min_val), 'beta', args=(0.5, 0.5))[1])
-                distribution.append(['beta', ev_tmp, sigma_tmp, min_val, max_val, 1])
-
-            # KS-test of the standardised values and the distribution
-            if self.gof_alpha in self.crit_val_ini_ks and self.num_init in self.crit_val_ini_ks[self.gof_alpha]:
-                # Beta 2
-                significance.append(self.gof_alpha * self.crit_val_ini_ks[self.gof_alpha][self.num_init][
-                    'beta2'] / kstest((values-ev)/sigma*pow(5*2/(5+2+1), 1/2)/(5+2)+5/(5+2), 'beta', args=(5, 2))[0])
-                distribution.append(['beta', ev, sigma, min_val, max_val, 2])
-
-                # Beta 3
-                significance.append(self.gof_alpha * self.crit_val_ini_ks[self.gof_alpha][self.num_init][
-                    'beta2'] / kstest((values-ev)/sigma*pow(5*2/(5+2+1), 1/2)/(5+2)+2/(5+2), 'beta', args=(2, 5))[0])
-                distribution.append(['beta', ev, sigma, min_val, max_val, 3])
-
-                # Beta 4
-                significance.append(self.gof_alpha * self.crit_val_ini_ks[self.gof_alpha][self.num_init][
-                    'beta4'] / kstest((values-ev)/sigma*pow(1*5/(1+5+1), 1/2)/(1+5)+1/(1+5), 'beta', args=(1, 5))[0])
-                distribution.append(['beta', ev, sigma, min_val, max_val, 4])
-
-                # Beta 5
-                significance.append(self.gof_alpha * self.crit_val_ini_ks[self.gof_alpha][self.num_init][
-                    'beta4'] / kstest((values-ev)/sigma*pow(1*5/(1+5+1), 1/2)/(1+5)+5/(1+5), 'beta', args=(5, 1))[0])
-                distribution.append(['beta', ev, sigma, min_val, max_val, 5])
+                crit_val_ini = self.crit_val_ini_ks[self.gof_alpha][self.num_init]
+                significance += list(self.gof_alpha * np.array([
+                    crit_val_ini['uni'], crit_val_ini['nor'], crit_val_ini['beta1'], crit_val_ini['beta2'], crit_val_ini['beta2'],
+                    crit_val_ini['beta4'], crit_val_ini['beta4']]) / test_statistics)
             else:
-                # Beta 2
-                significance.append(kstest((values-ev)/sigma*pow(5*2/(5+2+1), 1/2)/(5+2)+5/(5+2), 'beta', args=(5, 2))[1])
-                distribution.append(['beta', ev, sigma, min_val, max_val, 2])
-
-                # Beta 3
-                significance.append(kstest((values-ev)/sigma*pow(5*2/(5+2+1), 1/2)/(5+2)+2/(5+2), 'beta', args=(2, 5))[1])
-                distribution.append(['beta', ev, sigma, min_val, max_val, 3])
-
-                # Beta 4
-                significance.append(kstest((values-ev)/sigma*pow(1*5/(1+5+1), 1/2)/(1+5)+1/(1+5), 'beta', args=(1, 5))[1])
-                distribution.append(['beta', ev, sigma, min_val, max_val, 4])
-
-                # Beta 5
-                significance.append(kstest((values-ev)/sigma*pow(1*5/(1+5+1), 1/2)/(1+5)+5/(1+5), 'beta', args=(5, 1))[1])
-                distribution.append(['beta', ev, sigma, min_val, max_val, 5])
+                significance += list(np.clip(distributions.kstwo.sf(test_statistics, len(values)), 0, 1))
+            distribution += [['uni', min_val, max_val], ['nor', ev, sigma, min_val, max_val],
+                             ['beta', ev_tmp, sigma_tmp, min_val, max_val, 1], ['beta', ev, sigma, min_val, max_val, 2],
+                             ['beta', ev, sigma, min_val, max_val, 3], ['beta', ev, sigma, min_val, max_val, 4],
+                             ['beta', ev, sigma, min_val, max_val, 5]]
 
             # Crit value for the self generated or mixed distributions
             crit_val = pow(-np.log(self.gof_alpha) * 3 / self.num_init / 4, 1 / 2)
@@ -1103,50 +1066,41 @@ class VariableTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface
                 return distribution[sort_indices[-1]] + [sort_list]
 
         if self.used_gof_test == 'CM':
-            min_val = min(values)
-            max_val = max(values)
+            # The values are sorted once and all transformations are increasing, so the transformed values stay sorted
+            sorted_values = np.sort(values)
+            min_val = sorted_values[0]
+            max_val = sorted_values[-1]
             [ev, sigma] = norm.fit(values)
 
-            # Test for uniform distribution
-            significance.append(cramervonmises((values-min_val) / (max_val-min_val) * (1-self.min_mod_ini_uni-self.max_mod_ini_uni) +
-                                self.min_mod_ini_uni, 'uniform') / self.crit_val_ini_cm[self.gof_alpha][self.num_init]['uni'])
+            # CM-tests for the uniform, normal and beta distributions
+            test_statistics = gof_test_statistics(np.array([
+                (sorted_values-min_val) / (max_val-min_val) * (1-self.min_mod_ini_uni-self.max_mod_ini_uni) + self.min_mod_ini_uni,
+                (sorted_values-ev) / sigma,
+                (sorted_values-min_val) / (max_val-min_val) * (1-self.min_mod_ini_beta1-self.max_mod_ini_beta1) + self.min_mod_ini_beta1,
+                (sorted_values-min_val) / (max_val-min_val) * (1-self.max_mod_ini_beta2-self.min_mod_ini_beta2) + self.min_mod_ini_beta2,
+                (sorted_values-min_val) / (max_val-min_val) * (1-self.max_mod_ini_beta2-self.min_mod_ini_beta2) + self.max_mod_ini_beta2,
+                (sorted_values-min_val) / (ev-min_val) * (1/6-self.min_mod_ini_beta4) + self.min_mod_ini_beta4,
+                (sorted_values-max_val) / (max_val-ev) * (1/6-self.min_mod_ini_beta4) + 1 - self.min_mod_ini_beta4]), [
+                ('uniform', ()), ('norm', ()), ('beta', (0.5, 0.5)), ('beta', (5, 2)), ('beta', (2, 5)), ('beta', (1, 5)),
+                ('beta', (5, 1))], 'CM')
+            crit_val_ini = self.crit_val_ini_cm[self.gof_alpha][self.num_init]
+            significance += list(test_statistics / np.array([
+                crit_val_ini['uni'], crit_val_ini['nor'], crit_val_ini['beta1'], crit_val_ini['beta2'], crit_val_ini['beta2'],
+                crit_val_ini['beta4'], crit_val_ini['beta4']]))
+
             distribution.append(['uni', min_val - self.min_mod_ini_uni / (1-self.min_mod_ini_uni-self.max_mod_ini_uni) * (max_val-min_val),
                                 max_val + self.max_mod_ini_uni / (1-self.min_mod_ini_uni-self.max_mod_ini_uni) * (max_val-min_val)])
-
-            # Test for normal distribution
-            significance.append(cramervonmises((values-ev) / sigma, 'norm') / self.crit_val_ini_cm[self.gof_alpha][self.num_init]['nor'])
             distribution.append(['nor', ev, sigma, min_val, max_val])
-
-            # Test for beta1 distribution
-            significance.append(cramervonmises((values-min_val) / (max_val-min_val) * (1-self.min_mod_ini_beta1-self.max_mod_ini_beta1) +
-                                self.min_mod_ini_beta1, 'beta', args=(0.5, 0.5)) /
-                                self.crit_val_ini_cm[self.gof_alpha][self.num_init]['beta1'])
             distribution.append(['beta', ev, sigma, min_val - self.min_mod_ini_beta1 / (1-self.min_mod_ini_beta1-self.max_mod_ini_beta1) *
                                 (max_val-min_val), max_val + self.max_mod_ini_beta1 / (1-self.min_mod_ini_beta1-self.max_mod_ini_beta1) *
                                 (max_val-min_val), 1])
-
-            # Test for beta2 distribution
-            significance.append(cramervonmises((values-min_val) / (max_val-min_val) * (1-self.max_mod_ini_beta2-self.min_mod_ini_beta2) +
-                                self.min_mod_ini_beta2, 'beta', args=(5, 2)) / self.crit_val_ini_cm[self.gof_alpha][self.num_init]['beta2'])
             distribution.append(['beta', ev, sigma, min_val - self.min_mod_ini_beta2 / (1-self.min_mod_ini_beta2-self.max_mod_ini_beta2) *
                                 (max_val-min_val), max_val + self.max_mod_ini_beta2 / (1-self.min_mod_ini_beta2-self.max_mod_ini_beta2) *
                                 (max_val-min_val), 2])
-
-            # Test for beta3 distribution
-            significance.append(cramervonmises((values-min_val) / (max_val-min_val) * (1-self.max_mod_ini_beta2-self.min_mod_ini_beta2) +
-                                self.max_mod_ini_beta2, 'beta', args=(2, 5)) / self.crit_val_ini_cm[self.gof_alpha][self.num_init]['beta2'])
             distribution.append(['beta', ev, sigma, min_val - self.max_mod_ini_beta2 / (1-self.max_mod_ini_beta2-self.min_mod_ini_beta2) *
                                 (max_val-min_val), max_val + self.min_mod_ini_beta2 / (1-self.max_mod_ini_beta2-self.min_mod_ini_beta2) *
                                 (max_val-min_val), 3])
-
-            # Test for beta4 distribution
-            significance.append(cramervonmises((values-min_val) / (ev-min_val) * (1/6-self.min_mod_ini_beta4) + self.min_mod_ini_beta4,
-                                'beta', args=(1, 5)) / self.crit_val_ini_cm[self.gof_alpha][self.num_init]['beta4'])
             distribution.append(['beta', ev, sigma, min_val, max_val, 4])
-
-            # Test for beta5 distribution
-            significance.append(cramervonmises((values-max_val) / (max_val-ev) * (1/6-self.min_mod_ini_beta4) + 1 - self.min_mod_ini_beta4,
-                                'beta', args=(5, 1)) / self.crit_val_ini_cm[self.gof_alpha][self.num_init]['beta4'])
             distribution.append(['beta', ev, sigma, min_val, max_val, 5])
 
             # Check if one of the above tested continuous distribution fits
@@ -1196,10 +1150,17 @@ class VariableTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface
 
         return ['range', lower_limit, upper_limit, 0]
 
-    def update_var_type(self, event_index, var_index, log_atom):
-        """Test if the new num_update values fit the detected var type and updates the var type if the test fails."""
-        # Getting the new values and saving the old distribution for printing-purposes if the test fails
-        new_values = self.event_type_detector.values[event_index][var_index][-self.num_update:]
+    def update_var_type(self, event_index, var_index, log_atom, s_gof_statistic=None):
+        """
+        Test if the new num_update values fit the detected var type and updates the var type if the test fails.
+        @param s_gof_statistic the test statistic of the s_gof-test of the current var type, if it was already calculated.
+        """
+        # Getting the new values and saving the old distribution for printing-purposes if the test fails. The continuous distributions and
+        # the ranges are tested with a view of the values.
+        if self.var_type[event_index][var_index][0] in self.distr_list or self.var_type[event_index][var_index][0] == 'range':
+            new_values = self.event_type_detector.get_value_array(event_index, var_index, self.num_update)
+        else:
+            new_values = self.event_type_detector.values[event_index][var_index][-self.num_update:]
         VT_old = copy.deepcopy(self.var_type[event_index][var_index])
 
         # Test and update for continuous distribution
@@ -1216,7 +1177,7 @@ class VariableTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface
             # first_distr is used to test the current distribution with the BT and to discard the alternative distributions if they
             # fail the s_gof-test once
             first_distr = True
-            s_gof_result = self.s_gof_test(event_index, var_index, first_distr)
+            s_gof_result = self.s_gof_test(event_index, var_index, first_distr, s_gof_statistic)
             # Calculate the confidence as the stretched sigmaoid function of the maximal value of the step fct
             # 1 / (1 + np.exp(-2)) = 1.1353352832366128
             confidence = 1 / (1 + np.exp(-2 * s_gof_result[1])) * 1.1353352832366128
@@ -1270,10 +1231,8 @@ class VariableTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface
             self.var_type[event_index][var_index][3] += 1
             # Check if the sum of distances of all values outside the defined limits is greater than range_threshold times the range of
             # the limits
-            if sum(max(0, val - self.var_type[event_index][var_index][2]) for val in
-                    self.event_type_detector.values[event_index][var_index][-self.num_update:]) +\
-                    sum(max(0, self.var_type[event_index][var_index][1] - val) for val in
-                        self.event_type_detector.values[event_index][var_index][-self.num_update:]) >\
+            if np.maximum(new_values - self.var_type[event_index][var_index][2], 0).sum() +\
+                    np.maximum(self.var_type[event_index][var_index][1] - new_values, 0).sum() >\
                     self.range_threshold * (self.var_type[event_index][var_index][2] - self.var_type[event_index][var_index][1]):
                 # Do not update variable type
                 if not self.learn_mode:
@@ -1285,16 +1244,13 @@ class VariableTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface
                 self.var_type[event_index][var_index] = ['others', 0]
                 self.print_changed_var_type(event_index, VT_old, ['others'], var_index, log_atom)
             # Reset counter if at least one value lies outside of the limits
-            elif any(max(0, val - self.var_type[event_index][var_index][2]) for val in
-                     self.event_type_detector.values[event_index][var_index][-self.num_update:]) or\
-                    any(max(0, self.var_type[event_index][var_index][1] - val) for val in
-                        self.event_type_detector.values[event_index][var_index][-self.num_update:]):
+            elif np.any(new_values > self.var_type[event_index][var_index][2]) or\
+                    np.any(new_values < self.var_type[event_index][var_index][1]):
                 self.var_type[event_index][var_index][3] = 1
             # Reinitialize the range limits if no value was outside of the range in the last num_reinit_range update steps
             elif self.learn_mode and self.num_reinit_range != 0 and\
                     self.var_type[event_index][var_index][3] % self.num_reinit_range == 0:
-                self.var_type[event_index][var_index] = self.calculate_value_range(
-                    self.event_type_detector.values[event_index][var_index][-self.num_update:])
+                self.var_type[event_index][var_index] = self.calculate_value_range(new_values.tolist())
                 if self.stop_learning_timestamp is not None and self.stop_learning_no_anomaly_time is not None:
                     self.stop_learning_timestamp = max(
                         self.stop_learning_timestamp, log_atom.atom_time + self.stop_learning_no_anomaly_time)
@@ -1602,19 +1558,20 @@ class VariableTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface
             self.distr_val[event_index][var_index].sort()
             return
 
-    def s_gof_test(self, event_index, var_index, first_distr):
+    def s_gof_test(self, event_index, var_index, first_distr, test_statistic=None):
         """
         Make a gof-test.
+        @param test_statistic the test statistic of the current var type, if it was already calculated with s_gof_test_statistics.
         @return a list with the first entry True/False and as the second entry the maximal value of the step functions
         """
         num_distr_val = 2 * self.num_s_gof_values
 
+        # Calculate the critical value of the test
+        # The parameters are in the list of the critical values
+        distribution = self.var_type[event_index][var_index][0]
+        if distribution == 'beta':
+            distribution += str(self.var_type[event_index][var_index][-1])
         if self.used_gof_test == 'KS':
-            # Calculate the critical value for the KS-test
-            # The parameters are in the list of the critical values
-            distribution = self.var_type[event_index][var_index][0]
-            if distribution == 'beta':
-                distribution += str(self.var_type[event_index][var_index][-1])
             if self.s_gof_alpha in self.crit_val_upd_ks and self.num_init in self.crit_val_upd_ks[self.s_gof_alpha] \
                     and self.num_s_gof_values in self.crit_val_upd_ks[self.s_gof_alpha][self.num_init] \
                     and distribution in self.crit_val_upd_ks[self.s_gof_alpha][self.num_init][self.num_s_gof_values]:
@@ -1623,75 +1580,8 @@ class VariableTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface
             else:
                 crit_value = ((num_distr_val + self.num_s_gof_values) * (np.log(2 / self.s_gof_alpha)) / (
                     2 * num_distr_val * self.num_s_gof_values)) ** (1 / 2)
-
-            test_statistic = 0
-
-            # Scipy KS-test for uniformal distribution
-            if self.var_type[event_index][var_index][0] == 'uni':
-                test_statistic = kstest(
-                    self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:], 'uniform',
-                    args=(self.var_type[event_index][var_index][1], self.var_type[event_index][var_index][2]-self.var_type[event_index][
-                        var_index][1]))[0]
-
-            # Scipy KS-test for normal distribution
-            elif self.var_type[event_index][var_index][0] == 'nor':
-                test_statistic = kstest(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:], 'norm', args=(
-                    self.var_type[event_index][var_index][1], self.var_type[event_index][var_index][2]))[0]
-
-            # Scipy KS-test for beta distributions
-            elif self.var_type[event_index][var_index][0] == 'beta':
-                if self.var_type[event_index][var_index][5] == 1:
-                    test_statistic = kstest(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:], 'beta', args=(
-                        0.5, 0.5, self.var_type[event_index][var_index][3], self.var_type[event_index][var_index][4] - self.var_type[
-                            event_index][var_index][3]))[0]
-
-                elif self.var_type[event_index][var_index][5] == 2:
-                    # Mu and sigma of the desired distribution
-                    [mu, sigma] = [5 / (5 + 2), pow(5 * 2 / (5 + 2 + 1), 1 / 2) / (5 + 2)]
-                    test_statistic = kstest(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:], 'beta', args=(
-                            5, 2, self.var_type[event_index][var_index][1] - mu * self.var_type[event_index][var_index][2] / sigma,
-                            self.var_type[event_index][var_index][2] / sigma))[0]
-
-                elif self.var_type[event_index][var_index][5] == 3:
-                    # Mu and sigma of the desired distribution
-                    [mu, sigma] = [2 / (5 + 2), pow(5 * 2 / (5 + 2 + 1), 1 / 2) / (5 + 2)]
-                    test_statistic = kstest(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:], 'beta', args=(
-                            2, 5, self.var_type[event_index][var_index][1] - mu * self.var_type[event_index][var_index][2] / sigma,
-                            self.var_type[event_index][var_index][2] / sigma))[0]
-
-                elif self.var_type[event_index][var_index][5] == 4:
-                    # Mu and sigma of the desired distribution
-                    [mu, sigma] = [1 / (5 + 1), pow(5 * 1 / (5 + 1 + 1), 1 / 2) / (5 + 1)]
-                    test_statistic = kstest(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:], 'beta', args=(
-                            1, 5, self.var_type[event_index][var_index][1] - mu * self.var_type[event_index][var_index][2] / sigma,
-                            self.var_type[event_index][var_index][2] / sigma))[0]
-
-                elif self.var_type[event_index][var_index][5] == 5:
-                    # Mu and sigma of the desired distribution
-                    [mu, sigma] = [5 / (5 + 1), pow(5 * 1 / (5 + 1 + 1), 1 / 2) / (5 + 1)]
-                    test_statistic = kstest(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:], 'beta', args=(
-                            5, 1, self.var_type[event_index][var_index][1] - mu * self.var_type[event_index][var_index][2] / sigma,
-                            self.var_type[event_index][var_index][2] / sigma))[0]
-            else:
-                test_statistic = ks_2samp(self.distr_val[event_index][var_index], self.event_type_detector.values[event_index][var_index][
-                        -self.num_s_gof_values:])[0]
-
-            if first_distr:
-                if test_statistic > crit_value:
-                    return [False, test_statistic]
-                return [True, test_statistic]
-            if test_statistic > crit_value:
-                return [False, 1.0]
-            return [True, 0.0]
-
         # Else self.used_gof_test == 'CM'
-        # Calculate the critical value for the CM-test
-        # The parameters are in the list of the critical values
-        distribution = self.var_type[event_index][var_index][0]
-        if distribution == 'beta':
-            distribution += str(self.var_type[event_index][var_index][-1])
-
-        if distribution in ['uni', 'nor', 'beta1']:
+        elif distribution in ['uni', 'nor', 'beta1']:
             crit_value = self.crit_val_upd_cm[self.s_gof_alpha][self.num_init][self.num_s_gof_values][distribution]
         elif distribution in ['beta2', 'beta3']:
             crit_value = self.crit_val_upd_cm[self.s_gof_alpha][self.num_init][self.num_s_gof_values]['beta2']
@@ -1701,138 +1591,18 @@ class VariableTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface
             crit_value = self.crit_val_hom_cm[self.s_gof_alpha][max(self.num_init, self.num_s_gof_values)][
                     min(self.num_init, self.num_s_gof_values)]
 
-        test_statistic = 0
-
-        # Two sample CM-test for uniformal distribution
-        if self.var_type[event_index][var_index][0] == 'uni':
-            min_val = min(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
-            max_val = max(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
-            min_upd = min_val - self.min_mod_upd_uni / (1-self.min_mod_upd_uni-self.max_mod_upd_uni) * (max_val-min_val)
-            max_upd = max_val + self.max_mod_upd_uni / (1-self.min_mod_upd_uni-self.max_mod_upd_uni) * (max_val-min_val)
-
-            # Check if the estimated min and max differ more than the critical distance and return a negative test result
-            if abs(self.var_type[event_index][var_index][1] - min_upd) / (
-                    self.var_type[event_index][var_index][2] - self.var_type[event_index][var_index][1]) +\
-                    abs(self.var_type[event_index][var_index][2] - max_upd) / (
-                    self.var_type[event_index][var_index][2] - self.var_type[event_index][var_index][1]) >\
-                    self.crit_dist_upd_cm[self.s_gof_alpha][self.num_init][self.num_s_gof_values][distribution]:
+        if test_statistic is None:
+            values = self.event_type_detector.get_value_array(event_index, var_index, self.num_s_gof_values)
+            test_input = self.get_s_gof_test_input(event_index, var_index, np.sort(values))
+            if test_input is False:
                 return [False, 1]
-
-            estimated_min = min(self.var_type[event_index][var_index][1], min_upd)
-            estimated_max = max(self.var_type[event_index][var_index][2], max_upd)
-
-            test_statistic = cramervonmises((np.array(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:]) -
-                                            estimated_min) / (estimated_max - estimated_min), 'uniform')
-
-        # Two sample CM-test for normal distribution
-        elif self.var_type[event_index][var_index][0] == 'nor':
-            test_statistic = cramervonmises(np.array(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:]),
-                                            'norm', args=(self.var_type[event_index][var_index][1],
-                                                          self.var_type[event_index][var_index][2]))
-
-        # Two sample CM-test for beta distributions
-        elif self.var_type[event_index][var_index][0] == 'beta':
-            if self.var_type[event_index][var_index][5] == 1:
-                min_val = min(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
-                max_val = max(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
-                min_upd = min_val - self.min_mod_upd_beta1 / (1-self.min_mod_upd_beta1-self.max_mod_upd_beta1) * (max_val-min_val)
-                max_upd = max_val + self.max_mod_upd_beta1 / (1-self.min_mod_upd_beta1-self.max_mod_upd_beta1) * (max_val-min_val)
-
-                # Check if the estimated min and max differ more than the critical distance and return a negative test result
-                if abs(self.var_type[event_index][var_index][3] - min_upd) / (
-                        self.var_type[event_index][var_index][4] - self.var_type[event_index][var_index][3]) +\
-                        abs(self.var_type[event_index][var_index][4] - max_upd) / (
-                        self.var_type[event_index][var_index][4] - self.var_type[event_index][var_index][3]) >\
-                        self.crit_dist_upd_cm[self.s_gof_alpha][self.num_init][self.num_s_gof_values][distribution]:
-                    return [False, 1]
-
-                estimated_min = min(self.var_type[event_index][var_index][3], min_upd)
-                estimated_max = max(self.var_type[event_index][var_index][4], max_upd)
-
-                test_statistic = cramervonmises((np.array(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
-                                                - estimated_min) / (estimated_max - estimated_min), 'beta', args=(0.5, 0.5))
-
-            elif self.var_type[event_index][var_index][5] == 2:
-                min_val = min(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
-                max_val = max(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
-                min_upd = min_val - self.min_mod_upd_beta2 / (1-self.max_mod_upd_beta2-self.min_mod_upd_beta2) * (max_val-min_val)
-                max_upd = max_val + self.max_mod_upd_beta2 / (1-self.max_mod_upd_beta2-self.min_mod_upd_beta2) * (max_val-min_val)
-
-                # Check if the estimated min and max differ more than the critical distance and return a negative test result
-                if abs(self.var_type[event_index][var_index][3] - min_upd) / (
-                        self.var_type[event_index][var_index][4] - self.var_type[event_index][var_index][3]) +\
-                        abs(self.var_type[event_index][var_index][4] - max_upd) / (
-                        self.var_type[event_index][var_index][4] - self.var_type[event_index][var_index][3]) >\
-                        self.crit_dist_upd_cm[self.s_gof_alpha][self.num_init][self.num_s_gof_values]['beta2']:
-                    return [False, 1]
-
-                estimated_min = min(self.var_type[event_index][var_index][3], min_upd)
-                estimated_max = max(self.var_type[event_index][var_index][4], max_upd)
-
-                test_statistic = cramervonmises((np.array(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
-                                                - estimated_min) / (estimated_max - estimated_min), 'beta', args=(5, 2))
-
-            elif self.var_type[event_index][var_index][5] == 3:
-                min_val = min(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
-                max_val = max(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
-                min_upd = min_val - self.max_mod_upd_beta2 / (1-self.max_mod_upd_beta2-self.min_mod_upd_beta2) * (max_val-min_val)
-                max_upd = max_val + self.min_mod_upd_beta2 / (1-self.max_mod_upd_beta2-self.min_mod_upd_beta2) * (max_val-min_val)
-
-                # Check if the estimated min and max differ more than the critical distance and return a negative test result
-                if abs(self.var_type[event_index][var_index][3] - min_upd) / (
-                        self.var_type[event_index][var_index][4] - self.var_type[event_index][var_index][3]) +\
-                        abs(self.var_type[event_index][var_index][4] - max_upd) / (
-                        self.var_type[event_index][var_index][4] - self.var_type[event_index][var_index][3]) >\
-                        self.crit_dist_upd_cm[self.s_gof_alpha][self.num_init][self.num_s_gof_values]['beta2']:
-                    return [False, 1]
-
-                estimated_min = min(self.var_type[event_index][var_index][3], min_upd)
-                estimated_max = max(self.var_type[event_index][var_index][4], max_upd)
-
-                test_statistic = cramervonmises((np.array(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
-                                                - estimated_min) / (estimated_max - estimated_min), 'beta', args=(2, 5))
-
-            elif self.var_type[event_index][var_index][5] == 4:
-                ev_upd = (self.var_type[event_index][var_index][1] * self.num_init + np.mean(
-                        self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:]) *
-                        self.num_s_gof_values) / (self.num_init + self.num_s_gof_values)
-                estimated_min = min(min(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:]),
-                                    self.var_type[event_index][var_index][3])
-
-                # Check if the estimated min and max differ more than the critical distance and return a negative test result
-                if (abs(min(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:]) -
-                        self.var_type[event_index][var_index][3]) >
-                        self.crit_dist_upd_cm[self.s_gof_alpha][self.num_init][self.num_s_gof_values]['beta4'][0]) or (
-                        max(ev_upd / self.var_type[event_index][var_index][1], self.var_type[event_index][var_index][1] / ev_upd) >
-                        self.crit_dist_upd_cm[self.s_gof_alpha][self.num_init][self.num_s_gof_values]['beta4'][1]):
-                    return [False, 1]
-
-                test_statistic = cramervonmises((np.array(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
-                                                - estimated_min) / (ev_upd-estimated_min) * (1 / (5 + 1)-self.min_mod_upd_beta4) +
-                                                self.min_mod_upd_beta4, 'beta', args=(1, 5))
-
-            elif self.var_type[event_index][var_index][5] == 5:
-                ev_upd = (self.var_type[event_index][var_index][1] * self.num_init + np.mean(
-                        self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:]) *
-                        self.num_s_gof_values) / (self.num_init + self.num_s_gof_values)
-                estimated_max = max(max(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:]),
-                                    self.var_type[event_index][var_index][4])
-
-                # Check if the estimated min and max differ more than the critical distance and return a negative test result
-                if (abs(max(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:]) -
-                        self.var_type[event_index][var_index][4]) >
-                        self.crit_dist_upd_cm[self.s_gof_alpha][self.num_init][self.num_s_gof_values]['beta4'][0]) or (
-                        max(ev_upd / self.var_type[event_index][var_index][1], self.var_type[event_index][var_index][1] / ev_upd) >
-                        self.crit_dist_upd_cm[self.s_gof_alpha][self.num_init][self.num_s_gof_values]['beta4'][1]):
-                    return [False, 1]
-
-                test_statistic = cramervonmises((np.array(self.event_type_detector.values[event_index][var_index][-self.num_s_gof_values:])
-                                                - estimated_max) / (estimated_max - ev_upd) * (1 / (5 + 1)-self.min_mod_upd_beta4) + 1 -
-                                                self.min_mod_upd_beta4, 'beta', args=(5, 1))
-
-        else:
-            test_statistic = cramervonmises2(self.distr_val[event_index][var_index], self.event_type_detector.values[event_index][
-                    var_index][-self.num_s_gof_values:])
+            if test_input is not None:
+                test_statistic = gof_test_statistics(np.array([test_input[0]]), [test_input[1:]], self.used_gof_test)[0]
+            # Two sample tests for the empiric and the self generated distributions
+            elif self.used_gof_test == 'KS':
+                test_statistic = ks_2samp(self.distr_val[event_index][var_index], values)[0]
+            else:
+                test_statistic = cramervonmises2(self.distr_val[event_index][var_index], values)
 
         if first_distr:
             if test_statistic > crit_value:
@@ -1842,6 +1612,132 @@ class VariableTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface
             return [False, 1.0]
         return [True, 0.0]
 
+    def s_gof_test_statistics(self, event_index, index_list):
+        """
+        Calculate the test statistics of the s_gof-tests of all variables in the index_list with uniform, normal or beta var types.
+        The values of all variables are sorted at once and the statistics are calculated together in one vectorized pass.
+        @return a dictionary with the test statistics of the variable indices. Variables, which are not tested with a single sample test,
+                are missing.
+        """
+        var_indices = []
+        for var_index in index_list:
+            if self.event_type_detector.check_variables[event_index][var_index] and \
+                    self.var_type[event_index][var_index][0] in ('uni', 'nor', 'beta'):
+                values = self.event_type_detector.get_value_array(event_index, var_index, self.num_s_gof_values)
+                if len(values) == self.num_s_gof_values and consists_of_floats(values):
+                    var_indices.append(var_index)
+        if len(var_indices) == 0:
+            return {}
+
+        sorted_values = np.sort(np.array([self.event_type_detector.get_value_array(event_index, var_index, self.num_s_gof_values)
+                                          for var_index in var_indices]), axis=1)
+        tested_var_indices = []
+        test_inputs = []
+        for var_index, var_sorted_values in zip(var_indices, sorted_values):
+            test_input = self.get_s_gof_test_input(event_index, var_index, var_sorted_values)
+            if test_input:
+                tested_var_indices.append(var_index)
+                test_inputs.append(test_input)
+        if len(test_inputs) == 0:
+            return {}
+        test_statistics = gof_test_statistics(np.array([test_input[0] for test_input in test_inputs]), [
+            test_input[1:] for test_input in test_inputs], self.used_gof_test)
+        return dict(zip(tested_var_indices, test_statistics))
+
+    def get_s_gof_test_input(self, event_index, var_index, sorted_values):
+        """
+        Transform the sorted tested values for the s_gof-test and get the cdf of the var type.
+        @param sorted_values the sorted last num_s_gof_values values of the variable.
+        @return a list with the transformed sorted values, the name of the scipy distribution and the arguments of its cdf. None if the
+                var type is tested with a two sample test and False if the estimated parameters already differ more than the critical
+                distance.
+        """
+        var_type = self.var_type[event_index][var_index]
+        distribution = var_type[0]
+        if distribution == 'beta':
+            distribution += str(var_type[-1])
+
+        if self.used_gof_test == 'KS':
+            # KS-test for uniformal distribution
+            if var_type[0] == 'uni':
+                return [sorted_values, 'uniform', (var_type[1], var_type[2] - var_type[1])]
+
+            # KS-test for normal distribution
+            if var_type[0] == 'nor':
+                return [sorted_values, 'norm', (var_type[1], var_type[2])]
+
+            # KS-test for beta distributions
+            if distribution == 'beta1':
+                return [sorted_values, 'beta', (0.5, 0.5, var_type[3], var_type[4] - var_type[3])]
+            if distribution in ('beta2', 'beta3', 'beta4', 'beta5'):
+                # Shape parameters, mu and sigma of the desired distribution
+                [a, b] = {'beta2': [5, 2], 'beta3': [2, 5], 'beta4': [1, 5], 'beta5': [5, 1]}[distribution]
+                [mu, sigma] = [a / (a + b), pow(a * b / (a + b + 1), 1 / 2) / (a + b)]
+                return [sorted_values, 'beta', (a, b, var_type[1] - mu * var_type[2] / sigma, var_type[2] / sigma)]
+            return None
+
+        # Else self.used_gof_test == 'CM'
+        min_val = sorted_values[0]
+        max_val = sorted_values[-1]
+        crit_dist = self.crit_dist_upd_cm[self.s_gof_alpha][self.num_init][self.num_s_gof_values]
+
+        # CM-test for uniformal distribution
+        if var_type[0] == 'uni':
+            min_upd = min_val - self.min_mod_upd_uni / (1-self.min_mod_upd_uni-self.max_mod_upd_uni) * (max_val-min_val)
+            max_upd = max_val + self.max_mod_upd_uni / (1-self.min_mod_upd_uni-self.max_mod_upd_uni) * (max_val-min_val)
+
+            # Check if the estimated min and max differ more than the critical distance and return a negative test result
+            if abs(var_type[1] - min_upd) / (var_type[2] - var_type[1]) + abs(var_type[2] - max_upd) / (var_type[2] - var_type[1]) >\
+                    crit_dist[distribution]:
+                return False
+
+            estimated_min = min(var_type[1], min_upd)
+            estimated_max = max(var_type[2], max_upd)
+            return [(sorted_values - estimated_min) / (estimated_max - estimated_min), 'uniform', ()]
+
+        # CM-test for normal distribution
+        if var_type[0] == 'nor':
+            return [sorted_values, 'norm', (var_type[1], var_type[2])]
+
+        # CM-test for beta distributions
+        if distribution in ('beta1', 'beta2', 'beta3'):
+            if distribution == 'beta1':
+                [min_mod, max_mod, args, crit_dist_key] = [self.min_mod_upd_beta1, self.max_mod_upd_beta1, (0.5, 0.5), 'beta1']
+            elif distribution == 'beta2':
+                [min_mod, max_mod, args, crit_dist_key] = [self.min_mod_upd_beta2, self.max_mod_upd_beta2, (5, 2), 'beta2']
+            else:
+                [min_mod, max_mod, args, crit_dist_key] = [self.max_mod_upd_beta2, self.min_mod_upd_beta2, (2, 5), 'beta2']
+            min_upd = min_val - min_mod / (1-min_mod-max_mod) * (max_val-min_val)
+            max_upd = max_val + max_mod / (1-min_mod-max_mod) * (max_val-min_val)
+
+            # Check if the estimated min and max differ more than the critical distance and return a negative test result
+            if abs(var_type[3] - min_upd) / (var_type[4] - var_type[3]) + abs(var_type[4] - max_upd) / (var_type[4] - var_type[3]) >\
+                    crit_dist[crit_dist_key]:
+                return False
+
+            estimated_min = min(var_type[3], min_upd)
+            estimated_max = max(var_type[4], max_upd)
+            return [(sorted_values - estimated_min) / (estimated_max - estimated_min), 'beta', args]
+
+        if distribution in ('beta4', 'beta5'):
+            ev_upd = (var_type[1] * self.num_init + np.mean(sorted_values) * self.num_s_gof_values) / (
+                self.num_init + self.num_s_gof_values)
+
+            # Check if the estimated min or max and the ev differ more than the critical distance and return a negative test result
+            if (distribution == 'beta4' and abs(min_val - var_type[3]) > crit_dist['beta4'][0]) or (
+                    distribution == 'beta5' and abs(max_val - var_type[4]) > crit_dist['beta4'][0]) or (
+                    max(ev_upd / var_type[1], var_type[1] / ev_upd) > crit_dist['beta4'][1]):
+                return False
+
+            if distribution == 'beta4':
+                estimated_min = min(min_val, var_type[3])
+                return [(sorted_values - estimated_min) / (ev_upd-estimated_min) * (1 / (5 + 1)-self.min_mod_upd_beta4) +
+                        self.min_mod_upd_beta4, 'beta', (1, 5)]
+            estimated_max = max(max_val, var_type[4])
+            return [(sorted_values - estimated_max) / (estimated_max - ev_upd) * (1 / (5 + 1)-self.min_mod_upd_beta4) + 1 -
+                    self.min_mod_upd_beta4, 'beta', (5, 1)]
+        return None
+
     def d_test(self, event_index, var_index):
         """Make a test if the new variables follow the discrete distribution and append the result to the BT."""
         if self.used_multinomial_test == 'MT':
@@ -2316,6 +2212,8 @@ def convert_to_floats(list_in):
 
 def consists_of_floats(list_in):
     """Give back false if one entry of the list is no float or integer. True otherwise."""
+    if isinstance(list_in, np.ndarray):
+        return list_in.dtype.kind in "fiu"
     return all(isinstance(x, (float, int)) for x in list_in)
 
 
@@ -2376,14 +2274,49 @@ def cramervonmises(rvs, cdf, args=()):
     if vals.ndim > 1:
         raise ValueError('The sample must be one-dimensional.')
 
-    n = len(vals)
-    cdfvals = cdf(vals, *args)
-    sum_val = 0
+    return cramervonmises_statistics(np.array([cdf(vals, *args)]))[0]
 
-    for i in range(n):
-        sum_val += ((2*i+1)/(2*n)-cdfvals[i])**2
 
-    return 1/(12*n) + sum_val
+def gof_test_statistics(sorted_rvs, cdf_list, used_gof_test):
+    """
+    Return the KS or CM gof test statistics of multiple samples in one vectorized pass.
+    @param sorted_rvs two dimensional array with one sorted sample in every row.
+    @param cdf_list list with the name of the scipy distribution and the arguments of its cdf for every row.
+    @param used_gof_test the calculated test statistic. Implemented are the 'KS' and 'CM' tests.
+    @return an array with the test statistics of the rows.
+    """
+    # Samples sorted before a decreasing transformation are in reversed order
+    reversed_rows = sorted_rvs[:, 0] > sorted_rvs[:, -1]
+    if reversed_rows.any():
+        sorted_rvs = sorted_rvs.copy()
+        sorted_rvs[reversed_rows] = sorted_rvs[reversed_rows, ::-1]
+
+    # Evaluate the cdfs of all rows with the same distribution together by broadcasting the arguments
+    cdfvals = np.empty(sorted_rvs.shape)
+    rows_by_cdf = {}
+    for row, (name, args) in enumerate(cdf_list):
+        rows_by_cdf.setdefault((name, len(args)), []).append(row)
+    for (name, num_args), rows in rows_by_cdf.items():
+        args = [np.array([cdf_list[row][1][i] for row in rows])[:, np.newaxis] for i in range(num_args)]
+        cdfvals[rows] = getattr(distributions, name).cdf(sorted_rvs[rows], *args)
+
+    if used_gof_test == 'KS':
+        return ks_statistics(cdfvals)
+    return cramervonmises_statistics(cdfvals)
+
+
+def ks_statistics(cdfvals):
+    """Return the KS gof test statistics for the cdf values of sorted samples in the rows of cdfvals."""
+    n = cdfvals.shape[1]
+    dplus = (np.arange(1.0, n + 1) / n - cdfvals).max(axis=1)
+    dminus = (cdfvals - np.arange(0.0, n) / n).max(axis=1)
+    return np.maximum(dplus, dminus)
+
+
+def cramervonmises_statistics(cdfvals):
+    """Return the cramer von mises gof test statistics for the cdf values of sorted samples in the rows of cdfvals."""
+    n = cdfvals.shape[1]
+    return 1/(12*n) + (((2*np.arange(n)+1)/(2*n) - cdfvals)**2).sum(axis=1)
 
 
 def cramervonmises2(rvs1, rvs2):
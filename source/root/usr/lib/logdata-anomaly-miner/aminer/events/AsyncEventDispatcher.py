@@ -0,0 +1,178 @@
+"""
+This module defines an event handler that forwards the events to other event handlers from a background thread.
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+This program is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import logging
+import queue
+import threading
+import time
+from aminer.AminerConfig import DEBUG_LOG_NAME
+from aminer.events.EventInterfaces import EventHandlerInterface
+
+
+class AsyncEventDispatcher(EventHandlerInterface):
+    """
+    This class implements an event record listener, that queues the events and forwards them to the event handlers from a background
+    thread, so slow event handlers do not stall the analysis. The events are forwarded in batches of up to batch_size events, which are
+    collected for at most linger_time seconds. After every batch the event handlers providing a flush method are flushed.
+    When the queue is full, new events are dropped or the analysis is blocked until the background thread made room for them.
+    The events are forwarded as they are, so detectors must not modify the event data after emitting an event.
+    """
+
+    def __init__(self, event_handlers, analysis_context, batch_size=100, linger_time=0.1, queue_size=10000, block_when_full=False):
+        """
+        Initialize the event handler.
+        @param event_handlers the event handlers to which the events are forwarded.
+        @param analysis_context the analysis context used to get the component.
+        @param batch_size the maximum number of events forwarded before the event handlers are flushed.
+        @param linger_time the maximum number of seconds to wait for more events to fill a batch.
+        @param queue_size the maximum number of queued events.
+        @param block_when_full if true, the analysis is blocked until an event can be queued; otherwise events are dropped, when the queue
+               is full.
+        """
+        if isinstance(batch_size, bool) or not isinstance(batch_size, int):
+            msg = "batch_size has to be of the type int."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise TypeError(msg)
+        if batch_size < 1:
+            msg = "batch_size must be at least 1."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise ValueError(msg)
+        if isinstance(linger_time, bool) or not isinstance(linger_time, (int, float)):
+            msg = "linger_time has to be of the type int or float."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise TypeError(msg)
+        if linger_time < 0:
+            msg = "linger_time must not be negative."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise ValueError(msg)
+        if isinstance(queue_size, bool) or not isinstance(queue_size, int):
+            msg = "queue_size has to be of the type int."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise TypeError(msg)
+        if queue_size < 1:
+            msg = "queue_size must be at least 1."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise ValueError(msg)
+        if not isinstance(block_when_full, bool):
+            msg = "block_when_full has to be of the type bool."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise TypeError(msg)
+        self.event_handlers = event_handlers
+        self.analysis_context = analysis_context
+        self.batch_size = batch_size
+        self.linger_time = linger_time
+        self.block_when_full = block_when_full
+        self.event_queue = queue.Queue(queue_size)
+        # The lock is held while a batch is forwarded. It allows to modify the event handlers, e.g. to reopen their streams.
+        self.delivery_lock = threading.Lock()
+        self.worker = None
+        # The counters are only increased, the queued_events and dropped_events by the analysis thread, the flushed_events by the worker.
+        self.queued_events = 0
+        self.dropped_events = 0
+        self.flushed_events = 0
+
+    def receive_event(self, event_type, event_message, sorted_loglines, event_data, log_atom, event_source):
+        """
+        Receive information about a detected event and queue it.
+        @param event_type is a string with the event type class this event belongs to. This information can be used to interpret
+               type-specific event_data objects. Together with the eventMessage and sorted_loglines, this can be used to create generic log
+               messages.
+        @param event_message the first output line of the event.
+        @param sorted_loglines sorted list of log lines that were considered when generating the event, as far as available to the time
+               of the event. The list has to contain at least one line.
+        @param event_data type-specific event data object, should not be used unless listener really knows about the event_type.
+        @param log_atom the log atom which produced the event.
+        @param event_source reference to detector generating the event.
+        """
+        if hasattr(event_source, 'output_event_handlers') and event_source.output_event_handlers is not None:
+            if self not in event_source.output_event_handlers:
+                return
+            # Allow the event handlers to pass the same check in the worker thread.
+            for listener in self.event_handlers:
+                if listener not in event_source.output_event_handlers:
+                    event_source.output_event_handlers.append(listener)
+        component_name = self.analysis_context.get_name_by_component(event_source)
+        if component_name in self.analysis_context.suppress_detector_list:
+            return
+        if self.worker is None:
+            self.start()
+        event = (event_type, event_message, sorted_loglines, event_data, log_atom, event_source)
+        if self.block_when_full:
+            self.event_queue.put(event)
+        else:
+            try:
+                self.event_queue.put_nowait(event)
+            except queue.Full:
+                if self.dropped_events == 0:
+                    logging.getLogger(DEBUG_LOG_NAME).warning(
+                        "The event queue of the %s is full. Events are dropped.", self.__class__.__name__)
+                self.dropped_events += 1
+                return
+        self.queued_events += 1
+
+    def start(self):
+        """Start the worker thread forwarding the queued events. The thread is started with the first event by default."""
+        self.worker = threading.Thread(target=self.run_worker, name=self.__class__.__name__, daemon=True)
+        self.worker.start()
+
+    def stop(self):
+        """Forward all queued events and stop the worker thread."""
+        if self.worker is None:
+            return
+        self.event_queue.put(None)
+        self.worker.join()
+        self.worker = None
+
+    def run_worker(self):
+        """Forward the queued events in batches until None is received."""
+        event_queue = self.event_queue
+        while True:
+            event = event_queue.get()
+            if event is None:
+                return
+            batch = [event]
+            stop_flag = False
+            linger_end_time = time.time() + self.linger_time
+            while len(batch) < self.batch_size:
+                try:
+                    event = event_queue.get(timeout=max(0.0, linger_end_time - time.time()))
+                except queue.Empty:
+                    break
+                if event is None:
+                    stop_flag = True
+                    break
+                batch.append(event)
+            self.forward_batch(batch)
+            if stop_flag:
+                return
+
+    def forward_batch(self, batch):
+        """Forward a batch of events to all event handlers and flush them afterwards."""
+        with self.delivery_lock:
+            for event in batch:
+                for listener in self.event_handlers:
+                    try:
+                        listener.receive_event(*event)
+                    # skipcq: PYL-W0703
+                    except Exception as e:
+                        logging.getLogger(DEBUG_LOG_NAME).error("%s failed to handle an event: %s", listener.__class__.__name__, e)
+            for listener in self.event_handlers:
+                flush = getattr(listener, 'flush', None)
+                if flush is not None:
+                    try:
+                        flush()
+                    # skipcq: PYL-W0703
+                    except Exception as e:
+                        logging.getLogger(DEBUG_LOG_NAME).error("%s failed to flush the events: %s", listener.__class__.__name__, e)
+        self.flushed_events += len(batch)
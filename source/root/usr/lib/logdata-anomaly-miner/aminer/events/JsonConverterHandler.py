@@ -12,26 +12,58 @@ this program. If not, see <http://www.gnu.org/licenses/>.
 """
 
 import json
+import logging
 import time
-import copy
 
 from aminer.events.EventInterfaces import EventHandlerInterface
 from aminer import AminerConfig
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SERIALIZERS = ('json', 'orjson')
+MISSING = object()
 
 
 class JsonConverterHandler(EventHandlerInterface):
     """This class implements an event record listener, that will convert event data to JSON format."""
 
-    def __init__(self, json_event_handlers, analysis_context, pretty_print=True):
+    def __init__(self, json_event_handlers, analysis_context, pretty_print=True, serializer='json', annotated_match_paths=None):
         """
         Initialize the event handler.
         @param json_event_handlers the event handlers to which the json converted data is sent.
         @param analysis_context the analysis context used to get the component.
         @param pretty_print if true, the json is printed pretty; otherwise the json is printed with less space needed.
+        @param serializer the json library used to serialize the events. With "orjson" the events are serialized by the orjson module if
+               it is installed, which is much faster, but the output is not escaped to ASCII and has no spaces when pretty_print is false.
+               Data not supported by orjson is serialized with the json module.
+        @param annotated_match_paths if not None, only the matches of these paths are written to the AnnotatedMatchElement instead of all
+               paths of the parser match.
         """
+        if serializer not in SERIALIZERS:
+            msg = f"serializer must be one of {SERIALIZERS}."
+            logging.getLogger(AminerConfig.DEBUG_LOG_NAME).error(msg)
+            raise ValueError(msg)
+        if annotated_match_paths is not None and (not isinstance(annotated_match_paths, list) or not all(
+                isinstance(path, str) for path in annotated_match_paths)):
+            msg = "annotated_match_paths has to be a list of strings."
+            logging.getLogger(AminerConfig.DEBUG_LOG_NAME).error(msg)
+            raise TypeError(msg)
+        if serializer == 'orjson' and orjson is None:
+            logging.getLogger(AminerConfig.DEBUG_LOG_NAME).warning('orjson module not found. Using the json module instead.')
+            serializer = 'json'
         self.json_event_handlers = json_event_handlers
         self.analysis_context = analysis_context
         self.pretty_print = pretty_print
+        self.serializer = serializer
+        self.annotated_match_paths = annotated_match_paths
+        if serializer == 'orjson':
+            self.orjson_options = orjson.OPT_NON_STR_KEYS
+            if pretty_print:
+                self.orjson_options |= orjson.OPT_INDENT_2
+        # The identifier, type and persistence file name of the registered components by the identity of the component.
+        self.component_info_cache = {}
 
     def receive_event(self, event_type, event_message, sorted_loglines, event_data, log_atom, event_source):
         """
@@ -68,29 +100,13 @@ class JsonConverterHandler(EventHandlerInterface):
             log_data['DetectionTimestamp'] = round(time.time(), 2)
             log_data['LogLinesCount'] = len(sorted_loglines)
             if log_atom.parser_match is not None and hasattr(event_source, 'output_logline') and event_source.output_logline:
-                log_data['AnnotatedMatchElement'] = {}
-                for path, match in log_atom.parser_match.get_match_dictionary().items():
-                    if isinstance(match, list):
-                        for match_element_id, match_element in enumerate(match):
-                            if isinstance(match_element.match_object, bytes):
-                                log_data['AnnotatedMatchElement'][path + '/' + str(match_element_id)] = match_element.match_object.decode(
-                                    AminerConfig.ENCODING)
-                            else:
-                                log_data['AnnotatedMatchElement'][path + '/' + str(match_element_id)] = str(match_element.match_object)
-                    elif isinstance(match.match_object, bytes):
-                        log_data['AnnotatedMatchElement'][path] = match.match_object.decode(AminerConfig.ENCODING)
-                    else:
-                        log_data['AnnotatedMatchElement'][path] = str(match.match_object)
+                log_data['AnnotatedMatchElement'] = self.get_annotated_match_element(log_atom.parser_match)
 
-            analysis_component = {'AnalysisComponentIdentifier': self.analysis_context.get_id_by_component(event_source)}
-            if event_source.__class__.__name__ == 'ExtractedData_class':
-                analysis_component['AnalysisComponentType'] = 'DistributionDetector'
-            else:
-                analysis_component['AnalysisComponentType'] = str(event_source.__class__.__name__)
-            analysis_component['AnalysisComponentName'] = self.analysis_context.get_name_by_component(event_source)
-            analysis_component['Message'] = event_message
-            if hasattr(event_source, "persistence_id"):
-                analysis_component['PersistenceFileName'] = event_source.persistence_id
+            component_id, component_type, persistence_file_name = self.get_component_info(event_source)
+            analysis_component = {'AnalysisComponentIdentifier': component_id, 'AnalysisComponentType': component_type,
+                                  'AnalysisComponentName': component_name, 'Message': event_message}
+            if persistence_file_name is not MISSING:
+                analysis_component['PersistenceFileName'] = persistence_file_name
             if hasattr(event_source, 'learn_mode'):
                 analysis_component['TrainingMode'] = event_source.learn_mode
 
@@ -109,16 +125,77 @@ class JsonConverterHandler(EventHandlerInterface):
             if aminer_id is not None:
                 event_data['AminerId'] = aminer_id
 
-        if self.pretty_print is True:
-            json_data = json.dumps(event_data, indent=2)
-        else:
-            json_data = json.dumps(event_data)
+        json_data = self.serialize(event_data)
         res = [''] * len(sorted_loglines)
-        res[0] = str(json_data)
+        res[0] = json_data
 
         for listener in self.json_event_handlers:
             if hasattr(event_source, "output_event_handlers") and event_source.output_event_handlers is not None \
                     and listener not in event_source.output_event_handlers:
-                event_source = copy.copy(event_source)
                 event_source.output_event_handlers.append(listener)
             listener.receive_event(event_type, None, res, json_data, log_atom, event_source)
+
+    def serialize(self, event_data):
+        """Serialize the event_data with the configured json library."""
+        if self.serializer == 'orjson':
+            try:
+                return orjson.dumps(event_data, option=self.orjson_options).decode()
+            except TypeError:
+                # The data is not supported by orjson, e.g. integers bigger than 64 bits.
+                pass
+        if self.pretty_print is True:
+            return json.dumps(event_data, indent=2)
+        return json.dumps(event_data)
+
+    def get_annotated_match_element(self, parser_match):
+        """Get the decoded match objects of all paths or the annotated_match_paths of the parser_match."""
+        annotated_match_element = {}
+        if self.annotated_match_paths is None:
+            matches = parser_match.get_match_dictionary().items()
+        else:
+            matches = []
+            for path in self.annotated_match_paths:
+                match = parser_match.get(path)
+                if match is not None:
+                    matches.append((path, match))
+        encoding = AminerConfig.ENCODING
+        for path, match in matches:
+            if isinstance(match, list):
+                for match_element_id, match_element in enumerate(match):
+                    match_object = match_element.match_object
+                    if isinstance(match_object, bytes):
+                        annotated_match_element[f'{path}/{match_element_id}'] = match_object.decode(encoding)
+                    else:
+                        annotated_match_element[f'{path}/{match_element_id}'] = str(match_object)
+            else:
+                match_object = match.match_object
+                if isinstance(match_object, bytes):
+                    annotated_match_element[path] = match_object.decode(encoding)
+                else:
+                    annotated_match_element[path] = str(match_object)
+        return annotated_match_element
+
+    def get_component_info(self, event_source):
+        """
+        Get the identifier, type and persistence file name of the event_source. The persistence file name is MISSING if the event_source
+        has no persistence_id. The information of registered components is cached, as it does not change.
+        """
+        component_info = self.component_info_cache.get(id(event_source))
+        if component_info is not None:
+            return component_info
+        component_id = self.analysis_context.get_id_by_component(event_source)
+        if event_source.__class__.__name__ == 'ExtractedData_class':
+            component_type = 'DistributionDetector'
+        else:
+            component_type = str(event_source.__class__.__name__)
+        component_info = (component_id, component_type, getattr(event_source, 'persistence_id', MISSING))
+        # Unregistered event sources may be temporary objects, whose identity is reused.
+        if component_id is not None:
+            self.component_info_cache[id(event_source)] = component_info
+        return component_info
+
+    def flush(self):
+        """Flush the event handlers to which the json converted data is sent."""
+        for listener in self.json_event_handlers:
+            if hasattr(listener, 'flush'):
+                listener.flush()
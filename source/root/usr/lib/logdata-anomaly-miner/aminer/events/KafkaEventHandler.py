@@ -79,3 +79,8 @@ class KafkaEventHandler(EventHandlerInterface):
             self.producer = None
             return False
         return True
+
+    def flush(self):
+        """Wait until all events sent to the Kafka queue were delivered."""
+        if self.producer is not None:
+            self.producer.flush()
@@ -44,6 +44,9 @@ class ScoringEventHandler(EventHandlerInterface):
         if self.auto_weights:
             self.history_list = [[] for _ in range(self.auto_weights_history_length)]
             self.history_list_index = 0
+            # The number of lists in the history_list containing each value. It is updated when lists are added to or removed from the
+            # history_list, so the weights do not have to be counted in the whole history.
+            self.history_counts = {}
 
     def receive_event(self, event_type, event_message, sorted_log_lines, event_data, log_atom, event_source):
         """Receive information about a detected event."""
@@ -92,7 +95,7 @@ class ScoringEventHandler(EventHandlerInterface):
 
             # Update the history list and increase the count index
             if self.auto_weights:
-                self.history_list[self.history_list_index] = analyis_list
+                self.update_history(analyis_list)
                 self.history_list_index += 1
                 if self.history_list_index >= self.auto_weights_history_length:
                     self.history_list_index %= self.auto_weights_history_length
@@ -105,13 +108,47 @@ class ScoringEventHandler(EventHandlerInterface):
                 event_source.output_event_handlers.append(listener)
             listener.receive_event(event_type, event_message, sorted_log_lines, event_data, log_atom, event_source)
 
+    def flush(self):
+        """Flush the following event handlers."""
+        for listener in self.event_handlers:
+            if hasattr(listener, 'flush'):
+                listener.flush()
+
+    def update_history(self, analysis_list):
+        """
+        Replace the oldest list in the history_list with the analysis_list and update the history_counts.
+        The history_list stores a tuple of the distinct keys of the values, so later changes of the analysis_list do not affect the counts.
+        """
+        history_counts = self.history_counts
+        for key in self.history_list[self.history_list_index]:
+            count = history_counts[key] - 1
+            if count == 0:
+                del history_counts[key]
+            else:
+                history_counts[key] = count
+        keys = tuple({get_history_key(value) for value in analysis_list})
+        for key in keys:
+            history_counts[key] = history_counts.get(key, 0) + 1
+        self.history_list[self.history_list_index] = keys
+
     def get_weight(self, value):
         """Return the weight of the value parameter."""
-        if self.weights is not None and value in self.weights:
+        key = get_history_key(value)
+        # Unhashable values can not be in the weights dictionary.
+        if self.weights is not None and key is value and value in self.weights:
             # Return the specified weight if the value is in the weight list
             return self.weights[value]
         if not self.auto_weights:
             # Return 0.5 if the value is not in the weigth list and the weights are not automatically calculated
             return 0.5
         # Else calculate the weight through 10 / (10 + number of value appearances)
-        return 10 / (10 + sum(value in value_list for value_list in self.history_list))
+        return 10 / (10 + self.history_counts.get(key, 0))
+
+
+def get_history_key(value):
+    """Return the key of the value in the history_counts. Unhashable values like lists or dictionaries are counted by their repr."""
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
@@ -24,14 +24,17 @@ class StreamPrinterEventHandler(EventHandlerInterface):
     By default this is stdout.
     """
 
-    def __init__(self, analysis_context, stream=sys.stdout):
+    def __init__(self, analysis_context, stream=sys.stdout, auto_flush=True):
         """
         Initialize the event handler.
         @param analysis_context the analysis context used to get the component.
         @param stream the output stream of the event handler.
+        @param auto_flush if true, the stream is flushed after every event; otherwise flush has to be called, e.g. by the
+               AsyncEventDispatcher after every batch of events.
         """
         self.analysis_context = analysis_context
         self.stream = stream
+        self.auto_flush = auto_flush
 
     def receive_event(self, event_type, event_message, sorted_loglines, event_data, log_atom, event_source):
         """
@@ -58,4 +61,9 @@ class StreamPrinterEventHandler(EventHandlerInterface):
             self.stream.buffer.write(message.encode())
         else:
             self.stream.write(message)
+        if self.auto_flush:
+            self.stream.flush()
+
+    def flush(self):
+        """Flush the output stream."""
         self.stream.flush()
@@ -0,0 +1,180 @@
+"""
+This module defines a handler that synchronizes different streams by merging buffered atoms.
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+This program is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import heapq
+import logging
+import time
+from collections import deque
+from aminer.AminerConfig import DEBUG_LOG_NAME
+from aminer.AnalysisChild import AnalysisContext
+from aminer.input.InputInterfaces import AtomHandlerInterface
+from aminer.util.TimeTriggeredComponentInterface import TimeTriggeredComponentInterface
+
+
+class BufferedMultisourceAtomSync(AtomHandlerInterface, TimeTriggeredComponentInterface):
+    """
+    This class synchronizes different atom streams like the SimpleMultisourceAtomSync, but accepts the atoms immediately and keeps them in a
+    bounded queue per source. The queues are merged with a heap holding the oldest pending atom of each source, so atoms are forwarded in
+    timestamp order as soon as every active source has a pending atom. Atoms without a timestamp and atoms older than the previous atom of
+    the same source are forwarded immediately. When no atoms are received from a source for sync_wait_time seconds, no more atoms are
+    expected from that source. Atoms are only refused, when the queue of their source is full.
+    The component has to be registered for real time triggering to forward the pending atoms after sources became idle. The atoms still
+    pending, when no more atoms are received, e.g. on shutdown, have to be forwarded with flush().
+    """
+
+    time_trigger_class = AnalysisContext.TIME_TRIGGER_CLASS_REALTIME
+
+    def __init__(self, atom_handler_list, sync_wait_time=5, queue_size=1000):
+        """
+        @param atom_handler_list forward atoms to all handlers in the list, no matter if the log_atom was handled or not.
+        @param sync_wait_time the number of seconds to wait for atoms of idle sources before forwarding the atoms of other sources.
+        @param queue_size the maximum number of pending atoms per source.
+        """
+        if isinstance(sync_wait_time, bool) or not isinstance(sync_wait_time, (int, float)):
+            msg = "sync_wait_time has to be of the type int or float."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise TypeError(msg)
+        if sync_wait_time <= 0:
+            msg = "sync_wait_time must be bigger than 0."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise ValueError(msg)
+        if isinstance(queue_size, bool) or not isinstance(queue_size, int):
+            msg = "queue_size has to be of the type int."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise TypeError(msg)
+        if queue_size < 1:
+            msg = "queue_size must be at least 1."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise ValueError(msg)
+        self.atom_handler_list = atom_handler_list
+        self.sync_wait_time = sync_wait_time
+        self.queue_size = queue_size
+        # The dictionary containing the currently active sources. Each entry is a list with three values:
+        # * the largest timestamp of a LogAtom received from this source so far.
+        # * the queue of (timestamp, sequence number, LogAtom) tuples pending to be forwarded.
+        # * the local clock time when the last atom was received or the queue became empty.
+        self.sources_dict = {}
+        # The active sources without pending atoms. No atoms can be forwarded until they were expired.
+        self.idle_sources = set()
+        # The heap of (timestamp, sequence number, source) tuples for the oldest pending atom of every source. The sequence number of each
+        # received atom keeps atoms with the same timestamp in the order of arrival.
+        self.merge_heap = []
+        self.sequence_number = 0
+        # Start in blocking mode to have chance to see atoms from each available source before forwarding the first ones.
+        self.blocking_end_time = time.time() + self.sync_wait_time
+        self.timestamps_unsorted_flag = False
+
+    def receive_atom(self, log_atom):
+        """
+        Receive a log atom from a source.
+        @return false only when the queue of the source is full and no atoms can be forwarded.
+        """
+        timestamp = log_atom.atom_time
+        if timestamp is None:
+            self.forward_atom(log_atom)
+            return True
+
+        current_time = time.time()
+        source_info = self.sources_dict.get(log_atom.source)
+        if source_info is None:
+            source_info = [timestamp, deque(), current_time]
+            self.sources_dict[log_atom.source] = source_info
+        else:
+            if timestamp < source_info[0]:
+                # Atoms not sorted, not our problem. Forward it immediately.
+                self.timestamps_unsorted_flag = True
+                self.forward_atom(log_atom)
+                return True
+            if len(source_info[1]) >= self.queue_size:
+                self.merge_queues(current_time)
+                if len(source_info[1]) >= self.queue_size:
+                    return False
+            source_info[0] = timestamp
+            source_info[2] = current_time
+
+        queue = source_info[1]
+        self.sequence_number += 1
+        queue.append((timestamp, self.sequence_number, log_atom))
+        if len(queue) == 1:
+            self.idle_sources.discard(log_atom.source)
+            heapq.heappush(self.merge_heap, (timestamp, self.sequence_number, log_atom.source))
+        self.merge_queues(current_time)
+        return True
+
+    def merge_queues(self, current_time):
+        """Forward the pending atoms in timestamp order as long as every active source has a pending atom."""
+        if self.blocking_end_time != 0:
+            # We cannot do anything while blocking to catch more atoms.
+            if self.blocking_end_time > current_time:
+                return
+            self.blocking_end_time = 0
+        if self.idle_sources:
+            expired_sources = [source for source in self.idle_sources if current_time - self.sources_dict[source][2] >= self.sync_wait_time]
+            for source in expired_sources:
+                self.idle_sources.remove(source)
+                del self.sources_dict[source]
+
+        merge_heap = self.merge_heap
+        while merge_heap and not self.idle_sources:
+            source = merge_heap[0][2]
+            source_info = self.sources_dict[source]
+            queue = source_info[1]
+            log_atom = queue.popleft()[2]
+            if queue:
+                timestamp, sequence_number, _ = queue[0]
+                heapq.heapreplace(merge_heap, (timestamp, sequence_number, source))
+            else:
+                heapq.heappop(merge_heap)
+                # The source may still deliver atoms older than the pending atoms of other sources.
+                source_info[2] = current_time
+                self.idle_sources.add(source)
+            self.forward_atom(log_atom)
+
+    def flush(self):
+        """Forward all pending atoms in timestamp order without waiting for idle sources or the end of the blocking mode."""
+        current_time = time.time()
+        self.blocking_end_time = 0
+        merge_heap = self.merge_heap
+        while merge_heap:
+            source = merge_heap[0][2]
+            queue = self.sources_dict[source][1]
+            log_atom = queue.popleft()[2]
+            if queue:
+                timestamp, sequence_number, _ = queue[0]
+                heapq.heapreplace(merge_heap, (timestamp, sequence_number, source))
+            else:
+                heapq.heappop(merge_heap)
+            self.forward_atom(log_atom)
+        # All sources may still deliver atoms older than the forwarded atoms.
+        for source, source_info in self.sources_dict.items():
+            source_info[2] = current_time
+            self.idle_sources.add(source)
+
+    def forward_atom(self, log_atom):
+        """Forward atom to all atom handlers."""
+        for handler in self.atom_handler_list:
+            handler.receive_atom(log_atom)
+
+    def do_timer(self, trigger_time):
+        """
+        Forward the pending atoms, which are not blocked by idle sources any more.
+        @return the number of seconds until the next idle source expires or sync_wait_time if no source is idle.
+        """
+        current_time = time.time()
+        self.merge_queues(current_time)
+        if self.blocking_end_time != 0:
+            return self.blocking_end_time - current_time
+        if self.idle_sources:
+            return max(0, min(self.sources_dict[source][2] for source in self.idle_sources) + self.sync_wait_time - current_time)
+        return self.sync_wait_time
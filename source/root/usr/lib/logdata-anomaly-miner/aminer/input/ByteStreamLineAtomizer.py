@@ -14,27 +14,15 @@ this program. If not, see <http://www.gnu.org/licenses/>.
 
 import logging
 import sys
+from collections import deque
 from aminer.AminerConfig import DEBUG_LOG_NAME
 from aminer.input.LogAtom import LogAtom
 from aminer.input.InputInterfaces import StreamAtomizer
-from aminer.input.JsonStateMachine import json_machine
+from aminer.input.JsonStateMachine import find_json_object
 from aminer.parsing.MatchContext import MatchContext
 from aminer.parsing.ParserMatch import ParserMatch
 
 
-breakout = False
-data = None
-line = None
-
-
-def found_json(_data):
-    """Set the breakout variable if the JsonStateMachine finished."""
-    global breakout  # skipcq: PYL-W0603
-    breakout = True
-    global data  # skipcq: PYL-W0603
-    data = _data
-
-
 class ByteStreamLineAtomizer(StreamAtomizer):
     """
     This atomizer consumes binary data from a stream to break it into lines, removing the line separator at the end.
@@ -46,12 +34,14 @@ class ByteStreamLineAtomizer(StreamAtomizer):
     COUNTER = 0
 
     def __init__(self, parsing_model, atom_handler_list, event_handler_list, max_line_length, default_timestamp_path_list, eol_sep=b'\n',
-                 json_format=False):
+                 json_format=False, batch_mode=False):
         """
         Create the atomizer.
         @param event_handler_list when not None, send events to those handlers. The list might be empty at invocation and populated
         later on.
         @param max_line_length the maximal line length including the final line separator.
+        @param batch_mode if True, all complete lines of the stream data are split in one pass before they are parsed and dispatched.
+        The batch mode is not used with json_format.
         """
         self.parsing_model = parsing_model
         self.atom_handler_list = atom_handler_list
@@ -65,11 +55,14 @@ class ByteStreamLineAtomizer(StreamAtomizer):
             sys.exit(-1)
         self.eol_sep = eol_sep
         self.json_format = json_format
+        self.batch_mode = batch_mode
 
         self.in_overlong_line_flag = False
         # If consuming of data was already attempted but the downstream handlers refused to handle it, keep the data and the parsed
         # object to avoid expensive duplicate parsing operation. The data does not include the line separators any more.
         self.last_unconsumed_log_atom = None
+        # The split lines after the last unconsumed log atom in batch mode. They are dispatched before splitting the stream data again.
+        self.unconsumed_lines = None
 
     def consume_data(self, stream_data, end_of_stream_flag=False):
         """
@@ -77,6 +70,8 @@ class ByteStreamLineAtomizer(StreamAtomizer):
         @return the number of consumed bytes, 0 if the atomizer would need more data for a complete atom or -1 when no data was
         consumed at the moment but data might be consumed later on.
         """
+        if self.batch_mode and not self.json_format:
+            return self.consume_data_batch(stream_data, end_of_stream_flag)
         # Loop until as much streamData as possible was processed and then return a result. The correct processing of endOfStreamFlag
         # is tricky: by default, even when all data was processed, do one more iteration to handle also the flag.
         consumed_length = 0
@@ -93,22 +88,13 @@ class ByteStreamLineAtomizer(StreamAtomizer):
                 break
 
             line_end = None
-            global breakout  # skipcq: PYL-W0603
-            breakout = False
-            global data  # skipcq: PYL-W0603
-            data = None
             valid_json = False
             if self.json_format:
-                state = json_machine(found_json)
-                i = 0
-                for i, char in enumerate(stream_data[consumed_length:]):
-                    state = state(char)
-                    if breakout or state is None or i > self.max_line_length:
-                        break
+                i, breakout, invalid, json_data = find_json_object(stream_data, consumed_length, self.max_line_length)
                 # check if the json is still valid, but the stream_data is at the end
-                if not breakout and state is not None and i + consumed_length == len(stream_data) - 1 and not end_of_stream_flag:
+                if not breakout and not invalid and i + consumed_length == len(stream_data) - 1 and not end_of_stream_flag:
                     return consumed_length
-                if 0 < i <= self.max_line_length and b'{' in stream_data[consumed_length:consumed_length+i+1] and data is not None:
+                if 0 < i <= self.max_line_length and b'{' in stream_data[consumed_length:consumed_length+i+1] and breakout:
                     line_end = consumed_length + i + 1
                     valid_json = True
                 elif i > self.max_line_length:
@@ -149,18 +135,7 @@ class ByteStreamLineAtomizer(StreamAtomizer):
                 continue
 
             # This is a normal line.
-            line_data = stream_data[consumed_length:line_end]
-            log_atom = LogAtom(line_data, None, None, self)
-            if self.parsing_model is not None:
-                match_context = MatchContext(line_data)
-                match_element = self.parsing_model.get_match_element('', match_context)
-                if (match_element is not None) and not match_context.match_data:
-                    log_atom.parser_match = ParserMatch(match_element)
-                    for default_timestamp_path in self.default_timestamp_path_list:
-                        ts_match = log_atom.parser_match.get_match_dictionary().get(default_timestamp_path, None)
-                        if ts_match is not None:
-                            log_atom.set_timestamp(ts_match.match_object)
-                            break
+            log_atom = self.parse_line(stream_data[consumed_length:line_end], json_data if valid_json else None)
             if self.dispatch_atom(log_atom):
                 consumed_length = line_end + len(self.eol_sep) - (
                         valid_json and stream_data[line_end:line_end+len(self.eol_sep)] != self.eol_sep)
@@ -171,6 +146,85 @@ class ByteStreamLineAtomizer(StreamAtomizer):
             break
         return consumed_length
 
+    def consume_data_batch(self, stream_data, end_of_stream_flag):
+        """
+        Consume data from the underlying stream like consume_data, but split all complete lines in one pass before parsing and dispatching
+        them one by one. When an atom is not consumed by the downstream handlers, the atom and the remaining split lines are kept for the
+        next call, which gets the same data again.
+        @return the number of consumed bytes, 0 if the atomizer would need more data for a complete atom or -1 when no data was
+        consumed at the moment but data might be consumed later on.
+        """
+        eol_sep_length = len(self.eol_sep)
+        consumed_length = 0
+        if self.last_unconsumed_log_atom is not None:
+            # Keep length before dispatching: dispatch will reset the field.
+            data_length = len(self.last_unconsumed_log_atom.raw_data)
+            if not self.dispatch_atom(self.last_unconsumed_log_atom):
+                return -1
+            consumed_length = data_length + eol_sep_length
+
+        lines = self.unconsumed_lines
+        while True:
+            if not lines:
+                # The last part is the incomplete tail after the last line separator.
+                lines = stream_data[consumed_length:].split(self.eol_sep)
+                del lines[-1]
+                if self.in_overlong_line_flag:
+                    if not lines:
+                        if end_of_stream_flag:
+                            self.dispatch_event('Overlong line terminated by end of stream', stream_data)
+                            self.in_overlong_line_flag = False
+                        return len(stream_data)
+                    # The first line is the end of the overlong line.
+                    consumed_length += len(lines[0]) + eol_sep_length
+                    del lines[0]
+                    self.in_overlong_line_flag = False
+                if not lines:
+                    break
+                lines = deque(lines)
+            line_data = lines.popleft()
+            if len(line_data) + eol_sep_length > self.max_line_length:
+                self.dispatch_event('Overlong line detected', line_data)
+            elif not self.dispatch_atom(self.parse_line(line_data)):
+                self.unconsumed_lines = lines
+                if consumed_length == 0:
+                    # Downstream did not want the data, so tell upstream to block for a while.
+                    consumed_length = -1
+                return consumed_length
+            consumed_length += len(line_data) + eol_sep_length
+        self.unconsumed_lines = None
+
+        tail_length = len(stream_data) - consumed_length
+        if tail_length > self.max_line_length:
+            self.dispatch_event('Start of overlong line detected', stream_data[consumed_length:])
+            consumed_length = len(stream_data)
+            if end_of_stream_flag:
+                self.dispatch_event('Overlong line terminated by end of stream', stream_data)
+            else:
+                self.in_overlong_line_flag = True
+        elif end_of_stream_flag and (tail_length != 0):
+            self.dispatch_event('Incomplete last line', stream_data[consumed_length:])
+            consumed_length = len(stream_data)
+        return consumed_length
+
+    def parse_line(self, line_data, json_data=None):
+        """
+        Create the LogAtom of a line and parse it with the parsing model.
+        @param json_data the object already decoded from the line_data or None. It is passed to the JSON model elements in the MatchContext.
+        """
+        log_atom = LogAtom(line_data, None, None, self)
+        if self.parsing_model is not None:
+            match_context = MatchContext(line_data, json_data)
+            match_element = self.parsing_model.get_match_element('', match_context)
+            if (match_element is not None) and not match_context.match_data:
+                log_atom.parser_match = ParserMatch(match_element)
+                for default_timestamp_path in self.default_timestamp_path_list:
+                    ts_match = log_atom.parser_match.get(default_timestamp_path, None)
+                    if ts_match is not None:
+                        log_atom.set_timestamp(ts_match.match_object)
+                        break
+        return log_atom
+
     def dispatch_atom(self, log_atom):
         """Dispatch the data using the appropriate handlers. Also clean or set lastUnconsumed fields depending on outcome of dispatching."""
         type(self).COUNTER = type(self).COUNTER + 1
@@ -101,7 +101,8 @@ class AtomHandlerInterface(metaclass=abc.ABCMeta):
             "num_stat_stop_update", "num_updates_until_var_reduction", "var_reduction_thres", "num_skipped_ind_for_weights",
             "num_ind_for_weights", "used_multinomial_test", "use_empiric_distr", "used_range_test", "range_alpha", "range_threshold",
             "num_reinit_range", "range_limits_factor", "dw_alpha", "save_statistics", "idf", "norm", "add_normal", "check_empty_windows",
-            "unique_path_list", "default_freqs", "var_factor", "avg_factor"
+            "unique_path_list", "default_freqs", "var_factor", "avg_factor", "num_buckets",
+            "incremental"
         ]
         self.log_success = 0
         self.log_total = 0
@@ -121,7 +122,8 @@ class AtomHandlerInterface(metaclass=abc.ABCMeta):
                      "use_path_match", "use_value_match", "check_rules_flag", "empty_window_warnings", "early_exceeding_anomaly_output",
                      "default_freqs", "skip_repetitions", "idf", "norm", "add_normal", "check_empty_windows", "force_period_length",
                      "acf_auto_pause_interval", "build_sum_over_values", "intersect_presel_meth", "test_gof_int", "num_stop_update",
-                     "silence_output_without_confidence", "silence_output_except_indicator", "use_empiric_distr", "save_statistics"):
+                     "silence_output_without_confidence", "silence_output_except_indicator", "use_empiric_distr", "save_statistics",
+                     "incremental"):
             if hasattr(self, attr) and (attr in kwargs or attr == "learn_mode"):
                 attr_val = self.__getattribute__(attr)
                 if not isinstance(attr_val, bool):
@@ -196,7 +198,7 @@ class AtomHandlerInterface(metaclass=abc.ABCMeta):
             "time_period_length", "max_time_diff", "num_reduce_time_list", "min_anomaly_score", "num_update", "new_vals_alarm_thres",
             "num_bt", "num_update_unq", "num_s_gof_values", "num_s_gof_bt", "num_d_bt", "num_pause_discrete", "num_var_type_hist_ref",
             "num_update_var_type_hist_ref", "num_var_type_considered_ind", "num_stat_stop_update", "num_updates_until_var_reduction",
-            "num_skipped_ind_for_weights", "num_ind_for_weights", "num_reinit_range", "range_limits_factor", "dw_alpha"]
+            "num_skipped_ind_for_weights", "num_ind_for_weights", "num_reinit_range", "range_limits_factor", "dw_alpha", "num_buckets"]
         zero_to_one = [
             "generation_probability", "generation_factor", "p0", "alpha", "confidence_factor", "prob_thresh", "anomaly_threshold",
             "alpha", "alpha_bt", "acf_pause_interval_percentage", "acf_threshold", "round_time_interval_threshold", "min_variance",
@@ -205,7 +207,7 @@ class AtomHandlerInterface(metaclass=abc.ABCMeta):
             "match_disc_distr_threshold", "validate_cor_cover_vals_thres", "validate_cor_distinct_thres", "gof_alpha", "s_gof_alpha",
             "s_gof_bt_alpha", "d_alpha", "d_bt_alpha", "div_thres", "sim_thres", "indicator_thres", "var_reduction_thres", "range_alpha",
             "range_threshold", "dw_alpha"]
-        nullable = ["stop_learning_time", "stop_learning_no_anomaly_time", "set_lower_limit", "set_upper_limit", "timeout"]
+        nullable = ["stop_learning_time", "stop_learning_no_anomaly_time", "set_lower_limit", "set_upper_limit", "timeout", "num_buckets"]
         for attr in set([] + integer_only + non_negative + non_zero_or_negative + zero_to_one):
             if hasattr(self, attr):
                 attr_val = self.__getattribute__(attr)
@@ -4,7 +4,9 @@
 # A streaming byte oriented JSON parser.  Feed it a single byte at a time and
 # it will emit complete objects as it comes across them.  Whitespace within and
 # between objects is ignored.  This means it can parse newline delimited JSON.
+import json
 import math
+import re
 
 
 def json_machine(emit, next_func=None):  # skipcq: PY-D0003
@@ -368,3 +370,95 @@ def object_machine(emit):  # skipcq: PY-D0003
         return None
 
     return _object
+
+
+# Bytes, which may start the next token after a number starting with 0, but are rejected by the json_machine.
+ZERO_NUMBER_QUIRK_RE = re.compile(rb'0[\]\t\r]')
+JSON_WHITESPACE_RE = re.compile(rb'[\t\n\r ]*')
+JSON_STRUCTURE_RE = re.compile(rb'[{}"]')
+JSON_STRING_RE = re.compile(rb'"(?:[^"\\]|\\.)*"', re.DOTALL)
+
+
+def run_json_machine(stream_data, start, max_line_length):
+    """
+    Feed the stream_data from the start offset byte by byte into a json_machine until an object was found, the data is invalid or more
+    than max_line_length bytes were read.
+    @return a tuple of the index of the last fed byte relative to start, if the object was complete, if the data was invalid and the
+    found object or None.
+    """
+    found_objects = []
+    state = json_machine(found_objects.append)
+    i = 0
+    for i in range(len(stream_data) - start):
+        state = state(stream_data[start + i])
+        if found_objects or state is None or i > max_line_length:
+            break
+    if found_objects:
+        return i, True, state is None, found_objects[0]
+    return i, False, state is None, None
+
+
+def raise_value_error(constant):
+    """Reject the NaN and Infinity constants, which are not accepted by the json_machine."""
+    raise ValueError(f"Invalid JSON constant {constant}")
+
+
+def decode_json_object(json_data):
+    """
+    Decode a complete json object, which is parsed the same way by the json_machine.
+    @return the decoded object or None if the json_data is invalid or might be handled differently by the json_machine.
+    """
+    if ZERO_NUMBER_QUIRK_RE.search(json_data) is not None:
+        return None
+    try:
+        return json.loads(json_data.decode(), parse_constant=raise_value_error)
+    except (ValueError, RecursionError):
+        return None
+
+
+def find_json_object(stream_data, start, max_line_length):
+    """
+    Find the json object starting at the start offset with the same result as run_json_machine. Objects ending at the end of the line
+    are validated with json.loads directly. Otherwise, objects are framed by searching the braces outside of strings. Data, which is
+    incomplete, invalid or not parsed the same way by the json_machine, is fed into the json_machine instead.
+    @return the same tuple as run_json_machine, but the found object is always decoded with json.loads. It is None, if the object can
+    not be decoded with json.loads, even if the json_machine found a complete object.
+    """
+    object_start = JSON_WHITESPACE_RE.match(stream_data, start).end()
+    if object_start < len(stream_data) and stream_data[object_start] == 0x7b:  # {
+        max_end = start + max_line_length
+        line_end = stream_data.find(b"\n", object_start, max_end + 2)
+        if line_end != -1:
+            json_data = stream_data[object_start:line_end].rstrip(b"\t\r ")
+            if json_data.endswith(b"}"):
+                value = decode_json_object(json_data)
+                if value is not None:
+                    return object_start + len(json_data) - 1 - start, True, False, value
+        depth = 0
+        pos = object_start
+        while True:
+            match = JSON_STRUCTURE_RE.search(stream_data, pos)
+            if match is None or match.start() > max_end:
+                break
+            pos = match.start()
+            byte_data = stream_data[pos]
+            if byte_data == 0x22:  # "
+                match = JSON_STRING_RE.match(stream_data, pos)
+                if match is None:
+                    break
+                pos = match.end()
+                continue
+            pos += 1
+            if byte_data == 0x7b:  # {
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 0:
+                value = decode_json_object(stream_data[object_start:pos])
+                if value is None:
+                    break
+                return pos - 1 - start, True, False, value
+    i, finished, invalid, value = run_json_machine(stream_data, start, max_line_length)
+    if finished:
+        value = decode_json_object(stream_data[start:start + i + 1])
+    return i, finished, invalid, value
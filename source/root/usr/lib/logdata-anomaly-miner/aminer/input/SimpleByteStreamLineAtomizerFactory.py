@@ -23,11 +23,12 @@ class SimpleByteStreamLineAtomizerFactory(AtomizerFactory):
     """
 
     def __init__(self, parsing_model, atom_handler_list, event_handler_list, default_timestamp_path_list=None, eol_sep=b'\n',
-                 json_format=False, parser_model_dict=None, log_resources=None):
+                 json_format=False, parser_model_dict=None, log_resources=None, batch_mode=False):
         """
         Create the factory to forward data and events to the given lists for each newly created atomizer.
         @param default_timestamp_path_list if not empty list, the value of this timestamp field is extracted from parsed atoms and stored
         as default timestamp for that atom.
+        @param batch_mode if True, the atomizers split the lines of the stream data in batches before parsing and dispatching them.
         """
         self.parsing_model = parsing_model
         self.atom_handler_list = atom_handler_list
@@ -40,6 +41,7 @@ class SimpleByteStreamLineAtomizerFactory(AtomizerFactory):
         self.json_format = json_format
         self.parser_model_dict = parser_model_dict
         self.log_resources = log_resources
+        self.batch_mode = batch_mode
 
     def get_atomizer_for_resource(self, resource_name):  # skipcq: PYL-W0613
         """
@@ -56,6 +58,6 @@ class SimpleByteStreamLineAtomizerFactory(AtomizerFactory):
             if resource["parser_id"] is not None:
                 parser = self.parser_model_dict[resource["parser_id"]]
             return ByteStreamLineAtomizer(parser, self.atom_handler_list, self.event_handler_list, 1 << 16,
-                                          self.default_timestamp_path_list, self.eol_sep, json)
+                                          self.default_timestamp_path_list, self.eol_sep, json, self.batch_mode)
         return ByteStreamLineAtomizer(self.parsing_model, self.atom_handler_list, self.event_handler_list, 1 << 16,
-                                      self.default_timestamp_path_list, self.eol_sep, self.json_format)
+                                      self.default_timestamp_path_list, self.eol_sep, self.json_format, self.batch_mode)
@@ -0,0 +1,144 @@
+"""
+This module defines a model element that compiles a parsing model tree into nested matcher functions.
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+This program is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import logging
+from aminer.AminerConfig import DEBUG_LOG_NAME
+from aminer.parsing.FirstMatchModelElement import FirstMatchModelElement
+from aminer.parsing.FixedDataModelElement import FixedDataModelElement
+from aminer.parsing.MatchElement import MatchElement
+from aminer.parsing.ModelElementInterface import ModelElementInterface
+from aminer.parsing.OptionalMatchModelElement import OptionalMatchModelElement
+from aminer.parsing.SequenceModelElement import SequenceModelElement
+
+
+class CompiledModelElement(ModelElementInterface):
+    """
+    This class wraps a parsing model and matches it with precompiled matcher functions instead of walking the element tree.
+    Fixed, Sequence, FirstMatch and Optional elements are compiled into closures with precomputed paths and FirstMatch branches
+    are selected by the first byte index of the FirstMatchModelElement. All other elements are called directly. The resulting
+    MatchElement tree is identical to the one of the wrapped model.
+    """
+
+    def __init__(self, model_element: ModelElementInterface):
+        """
+        Initialize the ModelElement.
+        @param model_element the root of the parsing model to be compiled. The element_id of the model_element is used.
+        """
+        if not isinstance(model_element, ModelElementInterface):
+            msg = "model_element has to be of the type ModelElementInterface."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise TypeError(msg)
+        super().__init__(model_element.element_id)
+        self.model_element = model_element
+        # The compiled matchers by the path of the parent element. The matchers are compiled lazily on first use.
+        self.compiled_matchers = {}
+
+    def get_first_bytes(self):
+        """Return the first bytes of the wrapped model element."""
+        return self.model_element.get_first_bytes()
+
+    def get_match_element(self, path: str, match_context):
+        """
+        Try to find a match on given data for the compiled model.
+        @param path the model path to the parent model element invoking this method.
+        @param match_context an instance of MatchContext class holding the data context to match against.
+        @return the match_element or None if model did not match.
+        """
+        matcher = self.compiled_matchers.get(path)
+        if matcher is None:
+            matcher = compile_model_element(self.model_element, path)
+            self.compiled_matchers[path] = matcher
+        return matcher(match_context)
+
+
+def compile_model_element(model_element, path):
+    """
+    Compile the model_element and all its children into a matcher function.
+    @param model_element the model element to be compiled.
+    @param path the model path to the parent model element.
+    @return a function taking a MatchContext and returning the same MatchElement as model_element.get_match_element(path, ...).
+    """
+    element_type = type(model_element)
+    current_path = f"{path}/{model_element.element_id}"
+
+    if element_type is FixedDataModelElement:
+        fixed_data = model_element.fixed_data
+
+        def match_fixed(match_context):
+            if not match_context.data.startswith(fixed_data, match_context.offset):
+                return None
+            match_context.update(fixed_data)
+            return MatchElement.create_unchecked(current_path, fixed_data, fixed_data, None)
+        return match_fixed
+
+    if element_type is SequenceModelElement:
+        child_matchers = tuple(compile_model_element(child, current_path) for child in model_element.children)
+
+        def match_sequence(match_context):
+            start_offset = match_context.offset
+            matches = []
+            for child_matcher in child_matchers:
+                child_match = child_matcher(match_context)
+                if child_match is None:
+                    match_context.offset = start_offset
+                    return None
+                matches.append(child_match)
+            match_string = match_context.get_match_string(start_offset)
+            return MatchElement.create_unchecked(current_path, match_string, match_string, matches)
+        return match_sequence
+
+    if element_type is FirstMatchModelElement:
+        # Use the first byte index of the model_element with compiled matchers instead of the children.
+        child_matchers = [compile_model_element(child, current_path) for child in model_element.children]
+        default_branches = tuple((child_index, child_matchers[child_index]) for child_index, _ in model_element.default_branches)
+        first_byte_index = {byte: tuple((child_index, child_matchers[child_index]) for child_index, _ in branches) for byte, branches in
+                            model_element.first_byte_index.items()}
+        branch_hits = model_element.branch_hits
+
+        def match_first(match_context):
+            start_offset = match_context.offset
+            data = match_context.data
+            if start_offset < len(data):
+                branches = first_byte_index.get(data[start_offset], default_branches)
+            else:
+                branches = default_branches
+            for child_index, child_matcher in branches:
+                child_match = child_matcher(match_context)
+                if child_match is not None:
+                    branch_hits[child_index] += 1
+                    return child_match
+                match_context.offset = start_offset
+            return None
+        return match_first
+
+    if element_type is OptionalMatchModelElement:
+        optional_matcher = compile_model_element(model_element.optional_element, current_path)
+        empty_match_element = model_element.empty_match_element
+
+        def match_optional(match_context):
+            start_offset = match_context.offset
+            match = optional_matcher(match_context)
+            if match is None:
+                empty_match_element.path = current_path
+                return empty_match_element
+            match_string = match_context.get_match_string(start_offset)
+            return MatchElement.create_unchecked(current_path, match_string, match_string, [match])
+        return match_optional
+
+    # All other elements are matched by their own implementation.
+    get_match_element = model_element.get_match_element
+
+    def match_element(match_context):
+        return get_match_element(path, match_context)
+    return match_element
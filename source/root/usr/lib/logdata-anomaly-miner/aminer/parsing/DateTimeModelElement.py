@@ -128,6 +128,15 @@ class DateTimeModelElement(ModelElementInterface):
         self.last_parsed_seconds = 0
         self.epoch_start_time = datetime.fromtimestamp(0, self.time_zone)
 
+        # Consecutive timestamps usually only differ in the seconds. When all date fields are parsed from a fixed length prefix before the
+        # seconds, the seconds since the epoch of the prefix are cached and only the remaining parts are parsed when the prefix is equal.
+        self.prefix_part_count = 0
+        self.prefix_length = 0
+        self.cached_prefix = None
+        self.cached_prefix_seconds = 0
+        self.cached_start_year = None
+        self.scan_prefix()
+
     def scan_date_format(self, date_format: bytes):
         """Scan the date format."""
         if len(self.date_format_parts) > 0:
@@ -199,6 +208,37 @@ class DateTimeModelElement(ModelElementInterface):
             raise ValueError(msg)
         self.date_format_parts = date_format_parts
 
+    def scan_prefix(self):
+        """Find the fixed length prefix of the date format parts before the seconds, which contains all other date fields."""
+        prefix_length = 0
+        prefix_types = set()
+        for part_pos, date_format_part in enumerate(self.date_format_parts):
+            if isinstance(date_format_part, bytes):
+                prefix_length += len(date_format_part)
+                continue
+            if date_format_part[0] == 5:
+                remaining_types = {part[0] for part in self.date_format_parts[part_pos + 1:] if not isinstance(part, bytes)}
+                # Without month and day, the current date is used, so the seconds of the prefix may change over time.
+                if {1, 2}.issubset(prefix_types) and (0 in prefix_types or not self.format_has_year_flag) and remaining_types <= {6}:
+                    self.prefix_part_count = part_pos
+                    self.prefix_length = prefix_length
+                return
+            if date_format_part[1] < 0:
+                return
+            prefix_length += date_format_part[1]
+            prefix_types.add(date_format_part[0])
+
+    def get_first_bytes(self):
+        """Return the first bytes of the date format, if it starts with a fixed string or month names."""
+        if not self.date_format_parts:
+            return None
+        first_part = self.date_format_parts[0]
+        if isinstance(first_part, bytes):
+            return frozenset(first_part[:1])
+        if isinstance(first_part[2], dict) and b"" not in first_part[2]:
+            return frozenset(name[0] for name in first_part[2])
+        return None
+
     def get_match_element(self, path: str, match_context):
         """
         Try to find a match on given data for this model element and all its children.
@@ -208,12 +248,19 @@ class DateTimeModelElement(ModelElementInterface):
         @return None when there is no match, MatchElement otherwise. The match_object returned is a tuple containing the datetime
                 object and the seconds since 1970.
         """
-        parse_pos = 0
+        data = match_context.data
+        offset = match_context.offset
+        parse_pos = offset
         # Year, month, day, hour, minute, second, fraction, gmt-seconds:
         result: List = [0, 0, 0, 0, 0, 0, 0, 0]
-        for part_pos, date_format_part in enumerate(self.date_format_parts):
+        start_part = 0
+        if self.cached_prefix is not None and self.cached_start_year == self.start_year and data.startswith(self.cached_prefix, offset):
+            start_part = self.prefix_part_count
+            parse_pos += self.prefix_length
+        for part_pos in range(start_part, len(self.date_format_parts)):
+            date_format_part = self.date_format_parts[part_pos]
             if isinstance(date_format_part, bytes):
-                if not match_context.match_data[parse_pos:].startswith(date_format_part):
+                if not data.startswith(date_format_part, parse_pos):
                     return None
                 parse_pos += len(date_format_part)
                 continue
@@ -224,22 +271,20 @@ class DateTimeModelElement(ModelElementInterface):
                 if (part_pos + 1) < len(self.date_format_parts):
                     next_part = self.date_format_parts[part_pos + 1]
                     if isinstance(next_part, bytes):
-                        end_pos = match_context.match_data.find(next_part, parse_pos)
+                        end_pos = data.find(next_part, parse_pos)
                         if end_pos < 0:
                             return None
                         next_length = end_pos - parse_pos
                 if next_length < 0:
                     # No separator, so get the number of decimal digits.
                     next_length = 0
-                    for digit_ord in match_context.match_data[parse_pos:]:
-                        if (digit_ord < 0x30) or (digit_ord > 0x39):
-                            break
+                    while parse_pos + next_length < len(data) and 0x30 <= data[parse_pos + next_length] <= 0x39:
                         next_length += 1
                     if next_length == 0:
                         return None
-                next_data = match_context.match_data[parse_pos:parse_pos + next_length]
+                next_data = data[parse_pos:parse_pos + next_length]
             else:
-                next_data = match_context.match_data[parse_pos:parse_pos + next_length]
+                next_data = data[parse_pos:parse_pos + next_length]
                 if len(next_data) != next_length:
                     return None
             parse_pos += next_length
@@ -260,21 +305,32 @@ class DateTimeModelElement(ModelElementInterface):
                     # Parsing failed, most likely due to wrong format.
                     return None
 
-        date_str = match_context.match_data[:parse_pos]
+        date_str = data[offset:parse_pos]
         result[7] /= self.timestamp_scale
 
         # Now combine the values and build the final value.
         parsed_date_time = None
         total_seconds = result[7]
-        if total_seconds != 0:  # skipcq: PTC-W0048
+        if start_part != 0:
+            total_seconds = self.cached_prefix_seconds + result[5]
+            # Invalid seconds and time jumps, which might be year wraps, are handled by parsing the whole value again.
+            if not 0 <= result[5] <= 59 or (not self.format_has_year_flag and self.last_parsed_seconds != 0 and abs(
+                    self.last_parsed_seconds - total_seconds) > self.max_time_jump_seconds):
+                self.cached_prefix = None
+                return self.get_match_element(path, match_context)
+            if not self.format_has_year_flag:
+                self.last_parsed_seconds = total_seconds
+            total_seconds += result[6]
+        elif total_seconds != 0:  # skipcq: PTC-W0048
             total_seconds += result[6]
         # For epoch second formats, the datetime value usually is not important. So stay with parsed_date_time to none.
         else:
             if not self.format_has_year_flag:
                 result[0] = self.start_year
             microseconds = int(result[6] * 1000000)
+            use_current_date = 0 in (result[0], result[1], result[2])
             try:
-                if 0 in (result[0], result[1], result[2]):
+                if use_current_date:
                     current_date = datetime.now()
                     if result[0] == 0:
                         result[0] = current_date.year
@@ -292,6 +348,10 @@ class DateTimeModelElement(ModelElementInterface):
             # Avoid timedelta.total_seconds(), not supported in Python 2.6.
             delta = parsed_date_time - self.epoch_start_time
             total_seconds = (delta.days * 86400 + delta.seconds)
+            if self.prefix_part_count != 0 and not use_current_date:
+                self.cached_prefix = data[offset:offset + self.prefix_length]
+                self.cached_prefix_seconds = total_seconds - result[5]
+                self.cached_start_year = self.start_year
 
             # See if this is change from one year to next.
             if not self.format_has_year_flag:
@@ -348,14 +408,14 @@ class DateTimeModelElement(ModelElementInterface):
             valid_tz_specifier = True
             offset_allowed = True
             tz_specifier_offset = 0.
-            if match_context.match_data[parse_pos] == ord(b" "):
+            if data[parse_pos] == ord(b" "):
                 parse_pos += 1
                 resulting_key = None
                 # only if the next character is in A-Z, a valid resulting_key can exist.
-                if match_context.match_data[parse_pos] in search_tz_dict:
+                if data[parse_pos] in search_tz_dict:
                     # search the first fitting resulting_key in the sorted tz_dict and break the loop.
-                    for key in search_tz_dict[match_context.match_data[parse_pos]]:
-                        if match_context.match_data[parse_pos:].startswith(key):
+                    for key in search_tz_dict[data[parse_pos]]:
+                        if data.startswith(key, parse_pos):
                             resulting_key = key
                             break
                     # an offset is only allowed with UTC and GMT.
@@ -366,21 +426,21 @@ class DateTimeModelElement(ModelElementInterface):
                         tz_specifier_offset = timezone_info[resulting_key.decode()]
                         parse_pos += len(resulting_key)
 
-            if match_context.match_data[parse_pos] in (ord(b"+"), ord(b"-")) and offset_allowed and valid_tz_specifier:
+            if data[parse_pos] in (ord(b"+"), ord(b"-")) and offset_allowed and valid_tz_specifier:
                 sign = -1
-                if match_context.match_data[parse_pos] == ord(b"+"):
+                if data[parse_pos] == ord(b"+"):
                     sign = 1
                 parse_pos += 1
                 cnt_digits = 0
                 colon_shift = 0
                 # parse data as long as there is more data.
-                while parse_pos < len(match_context.match_data):
+                while parse_pos < len(data):
                     # shift the position and count to the next position, if the current character is a digit.
-                    if chr(match_context.match_data[parse_pos]).isdigit():
+                    if chr(data[parse_pos]).isdigit():
                         cnt_digits += 1
                         parse_pos += 1
                     # if the current character is no digit and cnt_digits is 2, a colon is allowed.
-                    elif cnt_digits == 2 and match_context.match_data[parse_pos] == ord(b":"):
+                    elif cnt_digits == 2 and data[parse_pos] == ord(b":"):
                         parse_pos += 1
                         colon_shift = 1
                     else:
@@ -396,21 +456,21 @@ class DateTimeModelElement(ModelElementInterface):
                 else:
                     # only one hour position was found.
                     if cnt_digits == 1:
-                        tz_specifier_offset = sign * int(chr(match_context.match_data[parse_pos-1])) * 3600
+                        tz_specifier_offset = sign * int(chr(data[parse_pos-1])) * 3600
                     # two hours specifiers were found.
                     elif cnt_digits == 2:
-                        tz_specifier_offset = sign * int(match_context.match_data[parse_pos-2:parse_pos].decode()) * 3600
+                        tz_specifier_offset = sign * int(data[parse_pos-2:parse_pos].decode()) * 3600
                     # four time specifiers were found with an optional colon.
                     elif cnt_digits == 4:
-                        tz_specifier_offset = sign * int(match_context.match_data[parse_pos-4-colon_shift:parse_pos-2-colon_shift]) * \
-                                              3600 + int(match_context.match_data[parse_pos-2:parse_pos] * 60)
+                        tz_specifier_offset = sign * int(data[parse_pos-4-colon_shift:parse_pos-2-colon_shift]) * \
+                                              3600 + int(data[parse_pos-2:parse_pos] * 60)
 
             if valid_tz_specifier:
-                date_str = match_context.match_data[:parse_pos]
+                date_str = data[offset:parse_pos]
                 # the offset must be subtracted, because the timestamp should always be UTC.
                 total_seconds -= tz_specifier_offset
         match_context.update(date_str)
-        return MatchElement(f"{path}/{self.element_id}", date_str, total_seconds, None)
+        return MatchElement.create_unchecked(f"{path}/{self.element_id}", date_str, total_seconds, None)
 
     @staticmethod
     def parse_fraction(value_str: bytes):
@@ -56,6 +56,10 @@ class DecimalIntegerValueModelElement(ModelElementInterface):
             raise ValueError(msg)
         self.digits = set(b"0123456789")
 
+    def get_first_bytes(self):
+        """Return the allowed start characters defined by the value_sign_type."""
+        return frozenset(self.start_characters)
+
     def get_match_element(self, path: str, match_context):
         """
         Find the maximum number of bytes forming a integer number according to the parameters specified.
@@ -63,33 +67,31 @@ class DecimalIntegerValueModelElement(ModelElementInterface):
         @param match_context the match_context to be analyzed.
         @return a match when at least one byte being a digit was found.
         """
-        data = match_context.match_data
+        data = match_context.data
+        offset = match_context.offset
+        data_len = len(data) - offset
 
-        if not data or (data[0] not in self.start_characters):
+        if not data_len or (data[offset] not in self.start_characters):
             return None
         match_len = 1
 
-        if self.pad_characters == b"" and data.startswith(b"0") and not data.startswith(b"0.") and len(data) > 1 and \
-                data[1] in self.digits:
+        if self.pad_characters == b"" and data.startswith(b"0", offset) and not data.startswith(b"0.", offset) and data_len > 1 and \
+                data[offset + 1] in self.digits:
             return None
 
-        for test_byte in data[match_len:]:
-            if test_byte not in self.pad_characters:
-                break
+        while match_len < data_len and data[offset + match_len] in self.pad_characters:
             match_len += 1
         num_start_pos = match_len
-        for test_byte in data[match_len:]:
-            if test_byte not in self.digits:
-                break
+        while match_len < data_len and data[offset + match_len] in self.digits:
             match_len += 1
 
         if match_len == 1:  # skipcq: PTC-W0048
-            if data[0] not in self.digits:
+            if data[offset] not in self.digits:
                 return None
         elif num_start_pos == match_len and match_len == 1:  # only return None if match_len is 1 to allow 00 with zero padding.
             return None
 
-        match_string = data[:match_len]
+        match_string = data[offset:offset + match_len]
         try:
             if self.pad_characters == b" " and match_string[0] in b"+-":
                 match_value = int(match_string.replace(b" ", b"", 1))
@@ -98,4 +100,4 @@ class DecimalIntegerValueModelElement(ModelElementInterface):
         except ValueError:
             return None
         match_context.update(match_string)
-        return MatchElement(f"{path}/{self.element_id}", match_string, match_value, None)
+        return MatchElement.create_unchecked(f"{path}/{self.element_id}", match_string, match_value, None)
@@ -29,24 +29,27 @@ class DelimitedDataModelElement(ModelElementInterface):
         @param consume_delimiter True if the delimiter character should also be consumed.
         """
         super().__init__(element_id, delimiter=delimiter, escape=escape, consume_delimiter=consume_delimiter)
+        if escape is not None:
+            self.regex = re.compile(rb"(?<!" + re.escape(self.escape) + rb")" + re.escape(self.delimiter))
 
     def get_match_element(self, path: str, match_context):
         """
         Find the maximum number of bytes before encountering the non-escaped delimiter.
         @return a match when at least one byte was found but not the delimiter itself.
         """
-        data = match_context.match_data
+        data = match_context.data
+        offset = match_context.offset
+        if data.startswith(self.delimiter, offset):
+            return None
         match_len = -1
         if self.escape is None:
-            search = re.search(re.escape(self.delimiter), data)
-            if search is not None:
-                match_len = search.start()
+            match_len = data.find(self.delimiter, offset + 1)
         else:
-            search = re.search(rb"(?<!" + re.escape(self.escape) + rb")" + re.escape(self.delimiter), data)
+            search = self.regex.search(data, offset + 1)
             if search is not None:
                 match_len = search.start()
-        if match_len < 1:
+        if match_len < 0:
             return None
-        match_data = data[:match_len + len(self.delimiter) * (self.consume_delimiter is True)]
+        match_data = data[offset:match_len + len(self.delimiter) * (self.consume_delimiter is True)]
         match_context.update(match_data)
-        return MatchElement(f"{path}/{self.element_id}", match_data, match_data, None)
+        return MatchElement.create_unchecked(f"{path}/{self.element_id}", match_data, match_data, None)
@@ -38,6 +38,10 @@ class ElementValueBranchModelElement(ModelElementInterface):
         super().__init__(
             element_id, value_model=value_model, value_path=value_path, branch_model_dict=branch_model_dict, default_branch=default_branch)
 
+    def get_first_bytes(self):
+        """Return the first bytes of the value_model."""
+        return self.value_model.get_first_bytes()
+
     def get_match_element(self, path: str, match_context):
         """
         Try to find a match on given data for the test model and the selected branch.
@@ -46,7 +50,7 @@ class ElementValueBranchModelElement(ModelElementInterface):
         @return the matchElement or None if the test model did not match, no branch was selected or the branch did not match.
         """
         current_path = f"{path}/{self.element_id}"
-        start_data = match_context.match_data
+        start_offset = match_context.offset
         model_match = self.value_model.get_match_element(current_path, match_context)
         if model_match is None:
             return None
@@ -82,7 +86,7 @@ class ElementValueBranchModelElement(ModelElementInterface):
             if branch_model is not None:
                 branch_match = branch_model.get_match_element(current_path, match_context)
         if branch_match is None:
-            match_context.match_data = start_data
+            match_context.offset = start_offset
             return None
-        return MatchElement(current_path, start_data[:len(start_data) - len(match_context.match_data)],
-                            start_data[:len(start_data) - len(match_context.match_data)], [model_match, branch_match])
+        match_string = match_context.get_match_string(start_offset)
+        return MatchElement.create_unchecked(current_path, match_string, match_string, [model_match, branch_match])
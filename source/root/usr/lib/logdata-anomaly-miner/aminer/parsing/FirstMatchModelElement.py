@@ -15,7 +15,10 @@ from aminer.parsing.ModelElementInterface import ModelElementInterface
 
 
 class FirstMatchModelElement(ModelElementInterface):
-    """This class defines a model element to return the match from the the first matching child model within a given list."""
+    """
+    This class defines a model element to return the match from the the first matching child model within a given list.
+    Children are indexed by the bytes their matches can start with, so only children that can possibly match are tried.
+    """
 
     def __init__(self, element_id: str, children: list):
         """
@@ -24,15 +27,51 @@ class FirstMatchModelElement(ModelElementInterface):
         @param children a list of child elements to be iterated through.
         """
         super().__init__(element_id, children=children)
+        # The number of matches of every child in the same order as the children list.
+        self.branch_hits = [0] * len(self.children)
+        self.first_byte_index, self.default_branches = self.build_first_byte_index()
+
+    def build_first_byte_index(self):
+        """
+        Build an index from the first byte of the data to all (child_index, child) tuples, which can match data starting with it.
+        Children with unknown first bytes are tried for every byte. The order of the children is kept in all branch tuples.
+        @return a tuple with the index dictionary and the default branches for bytes not in the index or empty data.
+        """
+        branches = list(enumerate(self.children))
+        child_first_bytes = [child.get_first_bytes() for child in self.children]
+        default_branches = tuple(branch for branch, first_bytes in zip(branches, child_first_bytes) if first_bytes is None)
+        first_byte_index = {}
+        for first_bytes in child_first_bytes:
+            for byte in first_bytes or ():
+                if byte not in first_byte_index:
+                    first_byte_index[byte] = tuple(branch for branch, child_bytes in zip(branches, child_first_bytes) if (
+                        child_bytes is None or byte in child_bytes))
+        return first_byte_index, default_branches
+
+    def get_first_bytes(self):
+        """Return the first bytes of all children or None if any child can start with any byte."""
+        if self.default_branches:
+            return None
+        return frozenset(self.first_byte_index)
+
+    def get_branch_hits(self):
+        """Return a list of (element_id, hits) tuples with the number of matches of every child."""
+        return [(child.element_id, hits) for child, hits in zip(self.children, self.branch_hits)]
 
     def get_match_element(self, path: str, match_context):
         """@return None when there is no match, MatchElement otherwise."""
         current_path = f"{path}/{self.element_id}"
 
-        match_data = match_context.match_data
-        for child_element in self.children:
+        start_offset = match_context.offset
+        data = match_context.data
+        if start_offset < len(data):
+            branches = self.first_byte_index.get(data[start_offset], self.default_branches)
+        else:
+            branches = self.default_branches
+        for child_index, child_element in branches:
             child_match = child_element.get_match_element(current_path, match_context)
             if child_match is not None:
+                self.branch_hits[child_index] += 1
                 return child_match
-            match_context.match_data = match_data
+            match_context.offset = start_offset
         return None
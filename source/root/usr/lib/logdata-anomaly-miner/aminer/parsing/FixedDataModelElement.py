@@ -30,9 +30,13 @@ class FixedDataModelElement(ModelElementInterface):
         """
         super().__init__(element_id, fixed_data=fixed_data)
 
+    def get_first_bytes(self):
+        """Return the first byte of the fixed string."""
+        return frozenset(self.fixed_data[:1])
+
     def get_match_element(self, path: str, match_context):
         """@return None when there is no match, MatchElement otherwise."""
-        if not match_context.match_data.startswith(self.fixed_data):
+        if not match_context.data.startswith(self.fixed_data, match_context.offset):
             return None
         match_context.update(self.fixed_data)
-        return MatchElement(f"{path}/{self.element_id}", self.fixed_data, self.fixed_data, None)
+        return MatchElement.create_unchecked(f"{path}/{self.element_id}", self.fixed_data, self.fixed_data, None)
@@ -15,6 +15,9 @@ this program. If not, see <http://www.gnu.org/licenses/>.
 from aminer.parsing.ModelElementInterface import ModelElementInterface
 from aminer.parsing.MatchElement import MatchElement
 
+# Key of the word_pos in the nodes of the word trie. Byte values are integers from 0 to 255, so -1 cannot collide with them.
+END_OF_WORD = -1
+
 
 class FixedWordlistDataModelElement(ModelElementInterface):
     """
@@ -31,20 +34,45 @@ class FixedWordlistDataModelElement(ModelElementInterface):
                an Exception will be raised.
         """
         super().__init__(element_id, wordlist=wordlist)
+        # Byte trie of all words. Every node is a dictionary mapping the next byte to the child node and END_OF_WORD to the word_pos.
+        self.word_trie: dict = {}
+        for word_pos, word in enumerate(self.wordlist):
+            node = self.word_trie
+            for byte in word:
+                node = node.setdefault(byte, {})
+            node[END_OF_WORD] = word_pos
+
+    def get_first_bytes(self):
+        """Return the first bytes of all words."""
+        if b"" in self.wordlist:
+            return None
+        return frozenset(word[0] for word in self.wordlist)
 
     def get_match_element(self, path: str, match_context):
-        """@return None when there is no match, MatchElement otherwise."""
-        data = match_context.match_data
-        match_data = None
-        word_pos = 0
-        for word in self.wordlist:
-            if data.startswith(word):
-                match_data = word
+        """
+        Find the longest word in the word_trie matching the data.
+        As no word may be the beginning of a word later in the wordlist, the longest match is also the first match in the wordlist.
+        @return None when there is no match, MatchElement otherwise.
+        """
+        data = match_context.data
+        offset = match_context.offset
+        data_len = len(data)
+        node = self.word_trie
+        word_pos = None
+        pos = offset
+        while True:
+            if END_OF_WORD in node:
+                word_pos = node[END_OF_WORD]
+            if pos == data_len:
+                break
+            node = node.get(data[pos])
+            if node is None:
                 break
-            word_pos += 1
+            pos += 1
 
-        if match_data is None:
+        if word_pos is None:
             return None
 
+        match_data = self.wordlist[word_pos]
         match_context.update(match_data)
-        return MatchElement(f"{path}/{self.element_id}", match_data, word_pos, None)
+        return MatchElement.create_unchecked(f"{path}/{self.element_id}", match_data, word_pos, None)
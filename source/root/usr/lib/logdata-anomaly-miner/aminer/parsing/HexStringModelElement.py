@@ -27,17 +27,22 @@ class HexStringModelElement(ModelElementInterface):
         """
         super().__init__(element_id, upper_case=upper_case)
 
+    def get_first_bytes(self):
+        """Return all bytes of the hex alphabet."""
+        if self.upper_case:
+            return frozenset(b"0123456789ABCDEF")
+        return frozenset(b"0123456789abcdef")
+
     def get_match_element(self, path: str, match_context):
         """
         Find the maximum number of bytes forming a integer number according to the parameters specified.
         @return a match when at least one byte being a digit was found
         """
-        m = self.hex_regex.match(match_context.match_data)
+        m = self.hex_regex.match(match_context.data, match_context.offset)
         if m is None:
             return None
-        match_len = m.span(0)[1]
 
-        match_object = match_context.match_data[:match_len]
+        match_object = m.group()
         try:
             pad = ""
             if len(match_object.decode(AminerConfig.ENCODING)) % 2 != 0:
@@ -46,4 +51,4 @@ class HexStringModelElement(ModelElementInterface):
         except ValueError:
             return None
         match_context.update(match_object)
-        return MatchElement(f"{path}/{self.element_id}", match_string, match_object, None)
+        return MatchElement.create_unchecked(f"{path}/{self.element_id}", match_string, match_object, None)
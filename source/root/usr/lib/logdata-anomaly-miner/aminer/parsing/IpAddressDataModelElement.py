@@ -15,6 +15,8 @@ import re
 from aminer.parsing.MatchElement import MatchElement
 from aminer.parsing.ModelElementInterface import ModelElementInterface
 
+ipv4_regex = re.compile(br"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}")
+
 
 class IpAddressDataModelElement(ModelElementInterface):
     """This class defines a model element that matches an IP address."""
@@ -45,27 +47,33 @@ class IpAddressDataModelElement(ModelElementInterface):
                 br")))(%.+)?")
             self.extract = extract_ipv6_address
 
+    def get_first_bytes(self):
+        """Return all bytes an IPv4 or IPv6 address can start with."""
+        if self.ipv6:
+            return frozenset(b"0123456789ABCDEFabcdef:")
+        return frozenset(b"0123456789")
+
     def get_match_element(self, path: str, match_context):
         """
         Read an IP address at the current data position. When found, the match_object will be.
         Allowed formats for IPv6 addresses are defined in RFC4291 section 2.2.
         However, trailing IPv4 addresses (for example ::FFFF:129.144.52.38) are not allowed.
         """
-        data = match_context.match_data
-        m = self.regex.match(data)
+        data = match_context.data
+        offset = match_context.offset
+        m = self.regex.match(data, offset)
         if m is None:
             return None
-        match_len = m.span(0)[1]
-        if self.extract is extract_ipv6_address and (b"." in m.group()[:match_len].split(b":")[-1] or (len(data) > match_len and (
-                re.compile(br"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}").match(data[data.rfind(b":", 0, match_len) + 1:]) is not None or (
-                data.find(b"::", match_len) == match_len and b"::" in data)))):
+        end_pos = m.end()
+        match_string = m.group()
+        if self.extract is extract_ipv6_address and (b"." in match_string.split(b":")[-1] or (len(data) > end_pos and (
+                ipv4_regex.match(data, data.rfind(b":", offset, end_pos) + 1) is not None or data.find(b"::", end_pos) == end_pos))):
             return None
-        extracted_address = self.extract(m.group(), match_len)
+        extracted_address = self.extract(match_string, len(match_string))
         if extracted_address is None:
             return None
-        match_string = data[:match_len]
         match_context.update(match_string)
-        return MatchElement(f"{path}/{self.element_id}", match_string, extracted_address, None)
+        return MatchElement.create_unchecked(f"{path}/{self.element_id}", match_string, extracted_address, None)
 
 
 def extract_ipv4_address(data: bytes, match_len: int):
@@ -13,6 +13,7 @@ this program. If not, see <http://www.gnu.org/licenses/>.
 """
 
 import json
+import re
 import warnings
 import logging
 from typing import List, Union, Any
@@ -25,6 +26,8 @@ from aminer.AminerConfig import DEBUG_LOG_NAME
 
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 debug_log_prefix = "JsonModelElement: "
+# Numbers with an exponent are formatted by format_float. The expression also matches some strings, but never misses such a number.
+JSON_EXPONENT_RE = re.compile(rb"[0-9][eE]")
 
 
 def format_float(val):
@@ -50,6 +53,27 @@ def format_float(val):
     return float(val)
 
 
+class JsonMatchContext:
+    """
+    This class stores the remaining data of the JSON data matched by the JsonModelElement.
+    Unlike the MatchContext, the data is sliced on every update instead of on every access of match_data, as the JsonModelElement
+    searches the remaining data many times between two updates.
+    """
+
+    __slots__ = ("match_data",)
+
+    def __init__(self, match_data: bytes):
+        """
+        Create a JsonMatchContext.
+        @param match_data the data that will be tested by the JsonModelElement.
+        """
+        self.match_data = match_data
+
+    def update(self, match_string: bytes):
+        """Remove the given matched string data from the data still to be matched."""
+        self.match_data = self.match_data[len(match_string):]
+
+
 class JsonModelElement(ModelElementInterface):
     """Parse single- or multi-lined JSON data."""
 
@@ -132,8 +156,15 @@ class JsonModelElement(ModelElementInterface):
         @return the matchElement or None if model did not match.
         """
         current_path = f"{path}/{self.element_id}"
-        old_match_data = match_context.match_data
-        matches: Union[List[Union[MatchElement, None]]] = []
+        # The JSON data is preprocessed and matched on a copy of the remaining data, so the offsets of the parent context stay valid.
+        parent_match_context = match_context
+        match_context = JsonMatchContext(parent_match_context.match_data)
+        json_match_data = parent_match_context.get_json_data()
+        # The object decoded by the atomizer can only be reused, if the data is not changed by the preprocessing of escapes and all
+        # floats are decoded the same way as with format_float.
+        if isinstance(json_match_data, dict) and b"\\" not in match_context.match_data and JSON_EXPONENT_RE.search(
+                match_context.match_data) is None:
+            return self.get_decoded_match_element(current_path, json_match_data, parent_match_context, match_context)
         try:
             index = 0
             # There can be a valid case in which the text contains for example \x2d, \\x2d or \\\\x2d, which basically should be decoded
@@ -160,6 +191,18 @@ class JsonModelElement(ModelElementInterface):
         except JSONDecodeError as e:
             logging.getLogger(debug_log_prefix + DEBUG_LOG_NAME).debug(e)
             return None
+        return self.get_decoded_match_element(current_path, json_match_data, parent_match_context, match_context)
+
+    def get_decoded_match_element(self, current_path: str, json_match_data: dict, parent_match_context, match_context):
+        """
+        Match the decoded JSON data against the key_parser_dict.
+        @param current_path the model path of this element.
+        @param json_match_data the object decoded from the preprocessed data of the match_context.
+        @param parent_match_context the MatchContext, which is updated when a match is found.
+        @param match_context the MatchContext with the preprocessed copy of the remaining data of the parent_match_context.
+        @return the matchElement or None if model did not match.
+        """
+        matches: Union[List[Union[MatchElement, None]]] = []
         self.dec_escapes = True
         if self.is_escaped_unicode(match_context.match_data.decode()):
             match_context.match_data = match_context.match_data.decode("unicode-escape").encode()
@@ -172,10 +215,9 @@ class JsonModelElement(ModelElementInterface):
         if None in matches or (match_data != b"" and len(matches) > 0):
             logging.getLogger(DEBUG_LOG_NAME).debug(
                 debug_log_prefix + "get_match_element_main NONE RETURNED\n" + match_context.match_data.strip(b' }]"\r\n').decode())
-            match_context.match_data = old_match_data
             return None
         # remove all remaining spaces and brackets.
-        match_context.update(match_context.match_data)
+        parent_match_context.update(parent_match_context.match_data)
         if len(matches) == 0:
             resulting_matches = None
         else:
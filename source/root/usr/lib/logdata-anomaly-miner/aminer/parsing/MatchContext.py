@@ -22,18 +22,51 @@ class MatchContext:
     This class allows storage of data relevant during the matching process, e.g. the root node and the remaining unmatched data.
     Then searching for non-atomic matches, e.g. sequences, the context might be modified by model subelements, even if the main model
     element will not return a match. In that case, those non-atomic model elements have to care to restore the context before returning.
+    The context keeps the original data and an integer cursor (offset) pointing to the first unmatched byte. Model elements should match
+    at the cursor and backtrack by resetting the offset, so no copies of the remaining data are created while parsing. The match_data
+    property is kept for model elements working on the remaining data directly, but it has to copy the data on every access.
+    When the data was already decoded as JSON by the atomizer, the decoded object is kept, so JSON model elements do not have to decode
+    the same data again.
     """
 
-    def __init__(self, match_data: bytes):
+    def __init__(self, match_data: bytes, json_data=None):
         """
         Create a MatchContext with the full unmatched string data.
         @param match_data the data that will be tested by the next model element.
+        @param json_data the object decoded from the whole match_data with json.loads or None if the data was not decoded.
         """
         if not isinstance(match_data, bytes):
             msg = "match_data has to be of the type bytes."
             logging.getLogger(DEBUG_LOG_NAME).error(msg)
             raise TypeError(msg)
-        self.match_data = match_data
+        self.data = match_data
+        self.offset = 0
+        self.json_data = json_data
+
+    @property
+    def match_data(self):
+        """Get the remaining data still to be matched."""
+        return self.data[self.offset:]
+
+    @match_data.setter
+    def match_data(self, match_data: bytes):
+        """
+        Set the remaining data still to be matched.
+        When the new data is a suffix of the original data, only the offset is moved. Otherwise, the unmatched part of the data is replaced
+        and the already matched part is kept, so the offsets stored by parent model elements stay valid.
+        """
+        consumed = len(self.data) - len(match_data)
+        if consumed >= 0 and self.data.endswith(match_data):
+            self.offset = consumed
+        else:
+            self.data = self.data[:self.offset] + match_data
+            self.json_data = None
+
+    def get_json_data(self):
+        """Get the object decoded from the remaining data, if the data was decoded and nothing was matched yet, otherwise None."""
+        if self.offset == 0:
+            return self.json_data
+        return None
 
     def update(self, match_string: bytes):
         """
@@ -41,7 +74,11 @@ class MatchContext:
         This method does not check, if the removed data is the same as the trailing match data for performance reasons. This is done
         only in the DebugMatchContext class.
         """
-        self.match_data = self.match_data[len(match_string):]
+        self.offset += len(match_string)
+
+    def get_match_string(self, start_offset: int):
+        """Get the data matched since the start_offset position."""
+        return self.data[start_offset:self.offset]
 
 
 class DebugMatchContext(MatchContext):
@@ -72,12 +109,12 @@ class DebugMatchContext(MatchContext):
             if self.debug_info != "":
                 self.debug_info += "  "
             self.debug_info += f'Starting match update on "{match_data}"\n'
-        if not self.match_data.startswith(match_string):
+        if not self.data.startswith(match_string, self.offset):
             self.debug_info += f'  Current data {match_data} does not start with "{m_string}"\n'
             msg = "Illegal state"
             logging.getLogger(DEBUG_LOG_NAME).error(msg)
             raise ValueError(msg)
-        self.match_data = self.match_data[len(match_string):]
+        self.offset += len(match_string)
         self.last_match_data = self.match_data
         if (self.shortest_unmatched_data is None) or (len(self.match_data) < len(self.shortest_unmatched_data)):
             self.shortest_unmatched_data = self.match_data
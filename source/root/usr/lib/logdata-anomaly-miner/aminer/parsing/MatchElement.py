@@ -20,6 +20,9 @@ from aminer import AminerConfig
 class MatchElement:
     """This class allows storage and handling of data related to a match found by a model element."""
 
+    # Match elements are created for every parsed part of every log line, so they are stored without a __dict__.
+    __slots__ = ("path", "match_string", "match_object", "children")
+
     def __init__(self, path: Union[str, None], match_string: bytes, match_object: Any, children: Union[List["MatchElement"], None]):
         """
         Initialize the MatchElement.
@@ -62,6 +65,23 @@ class MatchElement:
                     raise TypeError(msg)
         self.children = children
 
+    @classmethod
+    def create_unchecked(cls, path: str, match_string: bytes, match_object: Any, children: Union[List["MatchElement"], None]):
+        """
+        Create a MatchElement without validating the parameters. This is only meant to be used by model elements, which always create
+        valid match elements. All other code should use the validating constructor.
+        @param path the path of the element, which must not be anonymous.
+        @param match_string the part of the input bytes string covered by the given match.
+        @param match_object the matchString converted to an object.
+        @param children a non-empty list of MatchElements or None.
+        """
+        match_element = cls.__new__(cls)
+        match_element.path = path
+        match_element.match_string = match_string
+        match_element.match_object = match_object
+        match_element.children = children
+        return match_element
+
     def get_path(self):
         """Get the path of this element."""
         return self.path
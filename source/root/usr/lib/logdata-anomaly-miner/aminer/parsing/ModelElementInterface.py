@@ -422,6 +422,14 @@ class ModelElementInterface(metaclass=abc.ABCMeta):
             logging.getLogger(DEBUG_LOG_NAME).error(msg)
             raise TypeError(msg)
 
+    def get_first_bytes(self):
+        """
+        Get all bytes a match of this model element can start with. Model elements with a known set of leading bytes overwrite this
+        method, which allows the FirstMatchModelElement to skip children that cannot match.
+        @return a frozenset of byte values or None if the model element might match data starting with any byte or an empty string.
+        """
+        return None
+
     @abc.abstractmethod
     def get_match_element(self, path, match_context):
         """
@@ -42,11 +42,11 @@ class OptionalMatchModelElement(ModelElementInterface):
         """@return the embedded child match or an empty match."""
         current_path = f"{path}/{self.element_id}"
 
-        start_data = match_context.match_data
+        start_offset = match_context.offset
         match = self.optional_element.get_match_element(current_path, match_context)
         if match is None:
             self.empty_match_element.path = current_path
             return self.empty_match_element
 
-        return MatchElement(current_path, start_data[:len(start_data) - len(match_context.match_data)],
-                            start_data[:len(start_data) - len(match_context.match_data)], [match])
+        match_string = match_context.get_match_string(start_offset)
+        return MatchElement.create_unchecked(current_path, match_string, match_string, [match])
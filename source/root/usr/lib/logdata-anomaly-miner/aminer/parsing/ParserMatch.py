@@ -14,7 +14,9 @@ this program. If not, see <http://www.gnu.org/licenses/>.
 import logging
 from aminer.AminerConfig import DEBUG_LOG_NAME
 from aminer.parsing.MatchElement import MatchElement
-from collections import deque
+
+# Marker for paths that were searched but not found in the match_element tree.
+MISSING = object()
 
 
 class ParserMatch:
@@ -34,6 +36,8 @@ class ParserMatch:
             raise TypeError(msg)
         self.match_element = match_element
         self.match_dictionary = None
+        # Results of single path lookups, which are used as long as the match_dictionary was not built.
+        self.path_cache = {}
 
     def get_match_element(self):
         """Return the matching element."""
@@ -41,37 +45,142 @@ class ParserMatch:
 
     def get_match_dictionary(self):
         """Return a dictionary of all children matches."""
+        if self.match_dictionary is None:
+            self.match_dictionary = self.build_match_dictionary()
+        return self.match_dictionary
+
+    def get(self, path, default=None):
+        """
+        Get the match of a single path without building the whole match dictionary.
+        @param path the path to be searched.
+        @param default the value returned if the path does not exist.
+        @return the same value as get_match_dictionary().get(path, default).
+        """
         if self.match_dictionary is not None:
-            return self.match_dictionary
-        stack = deque()
-        stack.append([self.match_element])
+            return self.match_dictionary.get(path, default)
+        match = self.path_cache.get(path)
+        if match is None:
+            match = self.find_path(path)
+            self.path_cache[path] = match
+        if match is MISSING:
+            return default
+        return match
+
+    def __contains__(self, path):
+        """Check if the path exists without building the whole match dictionary."""
+        return self.get(path, MISSING) is not MISSING
+
+    def find_path(self, search_path):
+        """
+        Search the match of a single path by only descending into matches with paths being a prefix of the search_path. Paths of
+        children always extend the path of their parent. If a relevant path is repeated, the numbering of build_match_dictionary is needed.
+        @return the match, the list of repeated matches or MISSING if the search_path does not exist.
+        """
+        match_lists = [[self.match_element]]
+        path_prefixes = get_path_prefixes(search_path)
+        while match_lists:
+            relevant_matches = [test_match for match_list in match_lists for test_match in match_list if test_match.path in path_prefixes]
+            if len(relevant_matches) > 1 and len({test_match.path for test_match in relevant_matches}) < len(relevant_matches):
+                return self.build_match_dictionary(search_path, match_lists).get(search_path, MISSING)
+            match_lists = []
+            for test_match in relevant_matches:
+                if test_match.path == search_path:
+                    return test_match
+                if test_match.children is not None:
+                    match_lists.append(test_match.children)
+        return MISSING
+
+    def build_match_dictionary(self, search_path=None, match_lists=None):
+        """
+        Build the dictionary of all children matches. Paths of repeated matches in the same list of children are numbered, where equal
+        match objects get the same number.
+        @param search_path if not None, only matches with paths being a prefix of the search_path are added and descended into. Paths of
+               children always extend the path of their parent and repeated paths are numbered independently of other paths, so the
+               resulting dictionary contains the correct value of the search_path.
+        @param match_lists the lists of children to start with. If None, the root match_element is used.
+        """
+        if match_lists is None:
+            match_lists = [[self.match_element]]
+        stack = list(match_lists)
+        path_prefixes = None
+        if search_path is not None:
+            path_prefixes = get_path_prefixes(search_path)
         result_dict = {}
         while stack:
             match_list = stack.pop()
-            counter_dict = {}
+            if path_prefixes is not None:
+                match_list = [test_match for test_match in match_list if test_match.path in path_prefixes]
+            # A dictionary keeps the repeated paths in the order of their second occurrence, so the order of the result_dict keys does not
+            # depend on the hash seed.
+            repeated_paths = {}
+            seen_paths = set()
             for test_match in match_list:
-                if test_match.path in counter_dict.keys():  # skipcq: PYL-C0201
-                    counter_dict[test_match.path] = 0
-                    result_dict[test_match.path] = []
+                if test_match.path in seen_paths:
+                    repeated_paths.setdefault(test_match.path, None)
                 else:
-                    counter_dict[test_match.path] = None
+                    seen_paths.add(test_match.path)
+            # The number of different values, the list of matches and the index of the first equal match object of every repeated path.
+            repeated_counters = {}
+            for path in repeated_paths:
+                result_dict[path] = []
+                repeated_counters[path] = [0, result_dict[path], {}]
             for test_match in match_list:
                 path = test_match.path
-                if counter_dict[path] is not None:
-                    try:
-                        pos = next(i for i, x in enumerate(result_dict[test_match.path]) if not isinstance(x, list) and isinstance(
-                            test_match.match_object, type(x.match_object)) and test_match.match_object == x.match_object)
-                        path += f"/{pos}"
-                    except StopIteration:
-                        path += "/%d" % counter_dict[path]
-                        counter_dict[test_match.path] += 1
-                    result_dict[test_match.path].append(test_match)
+                if path in repeated_paths:
+                    counter = repeated_counters[path]
+                    pos = get_first_equal_match_pos(test_match.match_object, counter[1], counter[2])
+                    if pos is None:
+                        pos = counter[0]
+                        counter[0] += 1
+                    add_repeated_match(test_match, counter[1], counter[2])
+                    path += f"/{pos}"
                 result_dict[path] = test_match
                 children = test_match.children
                 if children is not None:
                     stack.append(children)
-        self.match_dictionary = result_dict
         return result_dict
 
     def __str__(self):
         return f'ParserMatch: {self.match_element.annotate_match("  ")}'
+
+
+def get_path_prefixes(search_path: str):
+    """Get the set containing the search_path and the paths of all its parents."""
+    path_prefixes = {search_path}
+    pos = search_path.find("/", 1)
+    while pos != -1:
+        path_prefixes.add(search_path[:pos])
+        pos = search_path.find("/", pos + 1)
+    return path_prefixes
+
+
+def get_first_equal_match_pos(match_object, match_list: list, first_pos_dict: dict):
+    """
+    Get the position of the first match in the match_list with a match_object equal to the given match_object and match_object being an
+    instance of its type.
+    @param first_pos_dict a dictionary with the position of the first match in the match_list for every hashable (type, match_object).
+    @return the position or None if no equal match_object was found.
+    """
+    try:
+        hash(match_object)
+    except TypeError:
+        for pos, match in enumerate(match_list):
+            if isinstance(match_object, type(match.match_object)) and match_object == match.match_object:
+                return pos
+        return None
+    result = None
+    # The match_object is an instance of all types in its method resolution order.
+    for match_type in type(match_object).__mro__:
+        pos = first_pos_dict.get((match_type, match_object))
+        if pos is not None and (result is None or pos < result):
+            result = pos
+    return result
+
+
+def add_repeated_match(match: MatchElement, match_list: list, first_pos_dict: dict):
+    """Append the match to the match_list and store its position in the first_pos_dict, if it is the first one with its match_object."""
+    try:
+        first_pos_dict.setdefault((type(match.match_object), match.match_object), len(match_list))
+    except TypeError:
+        pass
+    match_list.append(match)
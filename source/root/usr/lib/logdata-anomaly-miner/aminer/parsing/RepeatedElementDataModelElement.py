@@ -27,11 +27,17 @@ class RepeatedElementDataModelElement(ModelElementInterface):
         """
         super().__init__(element_id, repeated_element=repeated_element, min_repeat=min_repeat, max_repeat=max_repeat)
 
+    def get_first_bytes(self):
+        """Return the first bytes of the repeated_element, if at least one repeat is required."""
+        if self.min_repeat < 1:
+            return None
+        return self.repeated_element.get_first_bytes()
+
     def get_match_element(self, path, match_context):
         """Find a suitable number of repeats."""
         current_path = f"{path}/{self.element_id}"
 
-        start_data = match_context.match_data
+        start_offset = match_context.offset
         matches = []
         match_count = 0
         while match_count != self.max_repeat + 1:
@@ -41,8 +47,8 @@ class RepeatedElementDataModelElement(ModelElementInterface):
             matches += [child_match]
             match_count += 1
         if match_count < self.min_repeat or match_count > self.max_repeat:
-            match_context.match_data = start_data
+            match_context.offset = start_offset
             return None
 
-        return MatchElement(current_path, start_data[:len(start_data) - len(match_context.match_data)],
-                            start_data[:len(start_data) - len(match_context.match_data)], matches)
+        match_string = match_context.get_match_string(start_offset)
+        return MatchElement(current_path, match_string, match_string, matches)
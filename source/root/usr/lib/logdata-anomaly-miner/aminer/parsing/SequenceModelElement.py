@@ -27,6 +27,10 @@ class SequenceModelElement(ModelElementInterface):
         """
         super().__init__(element_id, children=children)
 
+    def get_first_bytes(self):
+        """Return the first bytes of the first child element."""
+        return self.children[0].get_first_bytes()
+
     def get_match_element(self, path, match_context):
         """
         Try to find a match on given data for this model element and all its children.
@@ -36,14 +40,14 @@ class SequenceModelElement(ModelElementInterface):
         @return the matchElement or None if model did not match.
         """
         current_path = f"{path}/{self.element_id}"
-        start_data = match_context.match_data
+        start_offset = match_context.offset
         matches = []
         for child_element in self.children:
             child_match = child_element.get_match_element(current_path, match_context)
             if child_match is None:
-                match_context.match_data = start_data
+                match_context.offset = start_offset
                 return None
             matches += [child_match]
 
-        return MatchElement(current_path, start_data[:len(start_data) - len(match_context.match_data)],
-                            start_data[:len(start_data) - len(match_context.match_data)], matches)
+        match_string = match_context.get_match_string(start_offset)
+        return MatchElement.create_unchecked(current_path, match_string, match_string, matches)
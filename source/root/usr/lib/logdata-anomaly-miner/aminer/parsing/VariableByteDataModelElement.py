@@ -26,20 +26,24 @@ class VariableByteDataModelElement(ModelElementInterface):
         """
         super().__init__(element_id, alphabet=alphabet)
 
+    def get_first_bytes(self):
+        """Return all bytes of the alphabet."""
+        return frozenset(self.alphabet)
+
     def get_match_element(self, path, match_context):
         """
         Find the maximum number of bytes matching the given alphabet.
         @return a match when at least one byte was found within alphabet.
         """
-        data = match_context.match_data
-        match_len = 0
-        for test_byte in data:
-            if test_byte not in self.alphabet:
-                break
-            match_len += 1
+        data = match_context.data
+        offset = match_context.offset
+        end_pos = offset
+        data_len = len(data)
+        while end_pos < data_len and data[end_pos] in self.alphabet:
+            end_pos += 1
 
-        if match_len == 0:
+        if end_pos == offset:
             return None
-        match_data = data[:match_len]
+        match_data = data[offset:end_pos]
         match_context.update(match_data)
-        return MatchElement(f"{path}/{self.element_id}", match_data, match_data, None)
+        return MatchElement.create_unchecked(f"{path}/{self.element_id}", match_data, match_data, None)
@@ -38,6 +38,12 @@
             'default': 600,
             'min': 1
         },
+        'Core.RefitWorkers': {
+            'required': False,
+            'type': 'integer',
+            'default': 0,
+            'min': 0
+        },
         'MailAlerting.TargetAddress': {
             'required': False,
             'type': 'string',
@@ -161,8 +167,11 @@
                 'timestamp_paths': {'type': ['string', 'list'], 'empty': False},
                 'adjust_timestamps': {'type': 'boolean', 'required': False, 'default': False},
                 'sync_wait_time': {'type': ['integer', 'float'], 'min': 1, 'default': 5},
+                'sync_queue_size': {'type': 'integer', 'min': 0, 'default': 0},
                 'eol_sep': {'type': 'string', 'required': False, 'default': '\n', 'empty': False},
-                'json_format': {'type': 'boolean', 'required': False, 'default': False}
+                'json_format': {'type': 'boolean', 'required': False, 'default': False},
+                'compile_model': {'type': 'boolean', 'required': False, 'default': False},
+                'batch_mode': {'type': 'boolean', 'required': False, 'default': False}
             }
         }
 }
@@ -18,9 +18,16 @@
                 'options': {'type': 'dict', 'schema': {'id': {'type': 'string'}, 'type': {'type': ['string', 'list', 'integer']}}},
                 'output_file_path': {'type': 'string'},
                 'pretty': {'type': 'boolean', 'default': True},
+                'serializer': {'type': 'string', 'allowed': ['json', 'orjson'], 'default': 'json'},
+                'annotated_match_paths': {'type': 'list', 'schema': {'type': 'string'}, 'nullable': True, 'default': None},
                 'weights': {'type': 'dict', 'nullable': True, 'default': None},
                 'auto_weights': {'type': 'boolean', 'default': False},
-                'auto_weights_history_length': {'type': 'integer', 'default': 1000, 'min': 1}
+                'auto_weights_history_length': {'type': 'integer', 'default': 1000, 'min': 1},
+                'async_output': {'type': 'boolean', 'default': False},
+                'batch_size': {'type': 'integer', 'default': 100, 'min': 1},
+                'linger_time': {'type': ['integer', 'float'], 'default': 0.1, 'min': 0},
+                'queue_size': {'type': 'integer', 'default': 10000, 'min': 1},
+                'block_when_full': {'type': 'boolean', 'default': False}
             }
         }
     }
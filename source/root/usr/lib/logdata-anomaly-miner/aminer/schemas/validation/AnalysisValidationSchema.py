@@ -67,6 +67,7 @@
                     'output_event_handlers': {'type': 'list', 'schema': {'type': 'string', 'empty': False}, 'nullable': True},
                     'stop_learning_time': {'type': ['integer', 'float'], 'nullable': True, 'min': 0.000001},
                     'stop_learning_no_anomaly_time': {'type': ['integer', 'float'], 'nullable': True, 'min': 0.000001},
+                    'incremental': {'type': 'boolean'},
                 },
                 {
                     'id': {'type': 'string', 'nullable': True, 'empty': False},
@@ -240,6 +241,7 @@
                     'paths': {'type': 'list', 'schema': {'type': 'string', 'empty': False}, 'nullable': True},
                     'scoring_path_list': {'type': 'list', 'schema': {'type': 'string', 'empty': False}, 'nullable': True},
                     'window_size': {'type': ['integer', 'float'], 'min': 0.001},
+                    'num_buckets': {'type': 'integer', 'nullable': True, 'min': 1},
                     'set_upper_limit': {'type': ['integer', 'float'], 'min': 0},
                     'local_maximum_threshold': {'type': 'float', 'min': 0.000001, 'max': 1.0},
                     'persistence_id': {'type': 'string', 'empty': False},
@@ -13,14 +13,28 @@
                     'type': {'type': 'string', 'forbidden': [
                         'KafkaEventHandler', 'ZmqEventHandler', 'StreamPrinterEventHandler', 'SyslogWriterEventHandler'], 'required': True},
                     'json': {'type': 'boolean'},
-                    'score': {'type': 'boolean'}
+                    'serializer': {'type': 'string', 'allowed': ['json', 'orjson']},
+                    'annotated_match_paths': {'type': 'list', 'schema': {'type': 'string'}, 'nullable': True},
+                    'score': {'type': 'boolean'},
+                    'async_output': {'type': 'boolean'},
+                    'batch_size': {'type': 'integer', 'min': 1},
+                    'linger_time': {'type': ['integer', 'float'], 'min': 0},
+                    'queue_size': {'type': 'integer', 'min': 1},
+                    'block_when_full': {'type': 'boolean'}
                 },
                 {
                     'id': {'type': 'string', 'required': True, 'empty': False},
                     'type': {'type': 'string', 'allowed': ['ZmqEventHandler'], 'required': True},
                     'json': {'type': 'boolean'},
+                    'serializer': {'type': 'string', 'allowed': ['json', 'orjson']},
+                    'annotated_match_paths': {'type': 'list', 'schema': {'type': 'string'}, 'nullable': True},
                     'pretty': {'type': 'boolean'},
                     'score': {'type': 'boolean'},
+                    'async_output': {'type': 'boolean'},
+                    'batch_size': {'type': 'integer', 'min': 1},
+                    'linger_time': {'type': ['integer', 'float'], 'min': 0},
+                    'queue_size': {'type': 'integer', 'min': 1},
+                    'block_when_full': {'type': 'boolean'},
                     'weights': {'type': 'dict', 'nullable': True},
                     'auto_weights': {'type': 'boolean'},
                     'auto_weights_history_length': {'type': 'integer', 'default': 1000, 'min': 1},
@@ -31,8 +45,15 @@
                     'id': {'type': 'string', 'required': True, 'empty': False},
                     'type': {'type': 'string', 'allowed': ['KafkaEventHandler'], 'required': True},
                     'json': {'type': 'boolean'},
+                    'serializer': {'type': 'string', 'allowed': ['json', 'orjson']},
+                    'annotated_match_paths': {'type': 'list', 'schema': {'type': 'string'}, 'nullable': True},
                     'pretty': {'type': 'boolean'},
                     'score': {'type': 'boolean'},
+                    'async_output': {'type': 'boolean'},
+                    'batch_size': {'type': 'integer', 'min': 1},
+                    'linger_time': {'type': ['integer', 'float'], 'min': 0},
+                    'queue_size': {'type': 'integer', 'min': 1},
+                    'block_when_full': {'type': 'boolean'},
                     'weights': {'type': 'dict', 'nullable': True},
                     'auto_weights': {'type': 'boolean'},
                     'auto_weights_history_length': {'type': 'integer', 'default': 1000, 'min': 1},
@@ -45,8 +66,15 @@
                     'id': {'type': 'string', 'required': True, 'empty': False},
                     'type': {'type': 'string', 'allowed': ['StreamPrinterEventHandler'], 'required': True},
                     'json': {'type': 'boolean'},
+                    'serializer': {'type': 'string', 'allowed': ['json', 'orjson']},
+                    'annotated_match_paths': {'type': 'list', 'schema': {'type': 'string'}, 'nullable': True},
                     'pretty': {'type': 'boolean'},
                     'score': {'type': 'boolean'},
+                    'async_output': {'type': 'boolean'},
+                    'batch_size': {'type': 'integer', 'min': 1},
+                    'linger_time': {'type': ['integer', 'float'], 'min': 0},
+                    'queue_size': {'type': 'integer', 'min': 1},
+                    'block_when_full': {'type': 'boolean'},
                     'weights': {'type': 'dict', 'nullable': True},
                     'auto_weights': {'type': 'boolean'},
                     'auto_weights_history_length': {'type': 'integer', 'default': 1000, 'min': 1},
@@ -56,8 +84,15 @@
                     'id': {'type': 'string', 'required': True, 'empty': False},
                     'type': {'type': 'string', 'allowed': ['SyslogWriterEventHandler'], 'required': True},
                     'json': {'type': 'boolean'},
+                    'serializer': {'type': 'string', 'allowed': ['json', 'orjson']},
+                    'annotated_match_paths': {'type': 'list', 'schema': {'type': 'string'}, 'nullable': True},
                     'pretty': {'type': 'boolean'},
                     'score': {'type': 'boolean'},
+                    'async_output': {'type': 'boolean'},
+                    'batch_size': {'type': 'integer', 'min': 1},
+                    'linger_time': {'type': ['integer', 'float'], 'min': 0},
+                    'queue_size': {'type': 'integer', 'min': 1},
+                    'block_when_full': {'type': 'boolean'},
                     'weights': {'type': 'dict', 'nullable': True},
                     'auto_weights': {'type': 'boolean'},
                     'auto_weights_history_length': {'type': 'integer', 'default': 1000, 'min': 1},
@@ -0,0 +1,147 @@
+"""
+This module defines a service running the expensive model fits of the detectors in a pool of worker processes.
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+This program is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import logging
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from aminer.AminerConfig import DEBUG_LOG_NAME
+from aminer.AnalysisChild import AnalysisContext
+from aminer.util.TimeTriggeredComponentInterface import TimeTriggeredComponentInterface
+
+
+class ModelRefitService(TimeTriggeredComponentInterface):
+    """
+    This class runs the model fits submitted by the detectors in a pool of worker processes, so the parsing does not stall during refits.
+    The detectors submit a snapshot of their data together with a module level fit function and a function applying the result. The results
+    are always applied on the analysis loop in the submission order of every detector: in online mode as soon as they are ready, in offline
+    mode only when the detector asks for them, waiting for the pending fits. This way offline runs are deterministic.
+    Without worker processes the fits are calculated and applied immediately when they are submitted.
+    """
+
+    time_trigger_class = AnalysisContext.TIME_TRIGGER_CLASS_REALTIME
+
+    def __init__(self, max_workers=0, offline_mode=False):
+        """
+        Initialize the service.
+        @param max_workers the number of worker processes. If 0, the fits are calculated in the analysis process when they are submitted.
+        @param offline_mode if true, the results are only applied when the detectors ask for them, waiting for the pending fits.
+        """
+        self.max_workers = 0
+        self.offline_mode = False
+        self.executor = None
+        # The queues of the submitted fits with their apply functions by the identity of the submitting components.
+        self.pending_refits = {}
+        self.configure(max_workers, offline_mode)
+
+    def configure(self, max_workers, offline_mode):
+        """
+        Change the number of worker processes and the mode. The pending fits are finished first.
+        @param max_workers the number of worker processes. If 0, the fits are calculated in the analysis process when they are submitted.
+        @param offline_mode if true, the results are only applied when the detectors ask for them, waiting for the pending fits.
+        """
+        if isinstance(max_workers, bool) or not isinstance(max_workers, int):
+            msg = "max_workers has to be of the type int."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise TypeError(msg)
+        if max_workers < 0:
+            msg = "max_workers must not be negative."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise ValueError(msg)
+        if not isinstance(offline_mode, bool):
+            msg = "offline_mode has to be of the type bool."
+            logging.getLogger(DEBUG_LOG_NAME).error(msg)
+            raise TypeError(msg)
+        self.shutdown()
+        self.max_workers = max_workers
+        self.offline_mode = offline_mode
+        if max_workers > 0:
+            self.start_workers()
+
+    def start_workers(self):
+        """
+        Start the worker processes. They are forked from the analysis process, so the detectors and their fit functions do not have to be
+        imported again and the main script is not executed again in the workers. Forking a process with running threads is not safe,
+        so the service has to be configured before any thread is started, e.g. the worker thread of the AsyncEventDispatcher.
+        """
+        self.executor = ProcessPoolExecutor(self.max_workers, mp_context=multiprocessing.get_context("fork"))
+        # With the fork context, all worker processes are started with the first task and no processes are forked afterwards.
+        self.executor.submit(int).result()
+
+    def submit(self, component, fit_function, args, apply_function):
+        """
+        Submit a model fit.
+        @param component the detector submitting the fit.
+        @param fit_function a module level function calculating the model from the args. Exceptions should be handled by the function.
+        @param args a tuple with the snapshot of the data needed by fit_function. It is copied to the worker process and must not be
+               modified by the detector afterwards.
+        @param apply_function the function called with the result of fit_function on the analysis loop. It is called with None, if the
+               fit failed.
+        """
+        if self.max_workers == 0:
+            apply_function(fit_function(*args))
+            return
+        if self.executor is None:
+            self.start_workers()
+        future = self.executor.submit(fit_function, *args)
+        self.pending_refits.setdefault(id(component), deque()).append((future, apply_function))
+
+    def has_pending_refits(self, component):
+        """Check if the component has submitted fits, whose results were not applied yet."""
+        return id(component) in self.pending_refits
+
+    def apply_results(self, component=None, wait=None):
+        """
+        Apply the results of the finished fits in the submission order of every component.
+        @param component the component whose results are applied. If None, the results of all components are applied.
+        @param wait if true, wait until all fits are finished. If None, only wait in offline mode.
+        """
+        if wait is None:
+            wait = self.offline_mode
+        if component is None:
+            component_ids = list(self.pending_refits)
+        elif id(component) in self.pending_refits:
+            component_ids = [id(component)]
+        else:
+            return
+        for component_id in component_ids:
+            pending_refits = self.pending_refits[component_id]
+            while pending_refits and (wait or pending_refits[0][0].done()):
+                future, apply_function = pending_refits.popleft()
+                try:
+                    result = future.result()
+                # skipcq: PYL-W0703
+                except Exception as e:
+                    logging.getLogger(DEBUG_LOG_NAME).error("A model fit failed in the %s: %s", self.__class__.__name__, e)
+                    result = None
+                apply_function(result)
+            if not pending_refits:
+                del self.pending_refits[component_id]
+
+    def shutdown(self):
+        """Apply the results of all pending fits and stop the worker processes."""
+        self.apply_results(wait=True)
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def do_timer(self, trigger_time):
+        """Apply the results of the finished fits in online mode."""
+        if not self.offline_mode:
+            self.apply_results()
+        return 1
+
+
+# The service shared by all detectors of the analysis process. It is configured by the AnalysisChild.
+model_refit_service = ModelRefitService()